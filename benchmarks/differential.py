@@ -0,0 +1,81 @@
+"""Pruebas diferenciales y benchmark de los motores de cálculo.
+
+Uso:
+    python -m benchmarks.differential [--rows 100000] [--seed 0]
+    python -m benchmarks.differential --roster roster.csv
+    python -m benchmarks.differential --engines scalar,dedup --dump diff.csv
+
+Ejecuta el corpus de casos límite más registros aleatorios (o un roster
+existente) en cada motor, reporta filas distintas de la referencia y la
+velocidad relativa. Con ``--dump`` escribe los registros con diferencias
+como roster CSV, para reproducirlos con ``python -m src.cli batch``. Termina
+con código 1 si algún motor difiere.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from src.batch.differential import (
+    default_engines,
+    edge_case_records,
+    random_records,
+    run_differential,
+)
+from src.batch.mmap_roster_reader import open_roster
+from src.batch.roster_reader import ROSTER_HEADER, format_roster_line
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Ejecuta la comparación e imprime el reporte."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--roster", help="Usa un roster existente como corpus")
+    parser.add_argument("--engines", help="Motores separados por comas")
+    parser.add_argument("--dump", help="Roster CSV con los registros distintos")
+    options = parser.parse_args(argv)
+
+    if options.roster:
+        with open_roster(options.roster) as roster:
+            records = list(roster.records())
+    else:
+        records = edge_case_records() + random_records(options.rows, options.seed)
+
+    engines = default_engines()
+    if options.engines:
+        selected = options.engines.split(",")
+        unknown = sorted(set(selected) - set(engines))
+        if unknown:
+            parser.error(f"motores desconocidos: {', '.join(unknown)}")
+        engines = {name: engines[name] for name in selected}
+
+    report = run_differential(records, engines)
+    print(f"Filas: {report.rows} (semilla {options.seed})")
+    print(f"{'motor':>10} {'filas/s':>12} {'vs. ref.':>9} {'diferencias':>12}")
+    reference_rate = report.rows / report.reference_seconds
+    print(f"{'reference':>10} {reference_rate:>12.0f} {1:>8.2f}x")
+    for run in report.runs:
+        print(
+            f"{run.engine:>10} {run.rows_per_second:>12.0f} "
+            f"{report.speedup(run):>8.2f}x {len(run.mismatches):>12}"
+        )
+        for mismatch in run.mismatches[:5]:
+            print(f"    esperado: {mismatch.expected}")
+            print(f"    obtenido: {mismatch.actual}")
+
+    if options.dump and report.total_mismatches:
+        indices = sorted(
+            {m.index for run in report.runs for m in run.mismatches if m.index >= 0}
+        )
+        with open(options.dump, "w", encoding="utf-8") as dump:
+            dump.write(ROSTER_HEADER + "\n")
+            for index in indices:
+                dump.write(format_roster_line(records[index]) + "\n")
+        print(f"Registros con diferencias escritos en {options.dump}")
+    if report.total_mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
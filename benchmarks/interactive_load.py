@@ -0,0 +1,470 @@
+"""Generador de carga concurrente para el flujo interactivo del CLI.
+
+Uso:
+    python -m benchmarks.interactive_load [--sessions 200] [--concurrency 50]
+    python -m benchmarks.interactive_load --think-time 0.5 --typo-rate 0.1
+
+Lanza sesiones simultáneas de ``python -m src.cli`` (por defecto
+MAX_CONCURRENT_USERS a la vez) y las conduce por la secuencia real de
+preguntas (estudiante, evaluaciones, asistencia, tardanzas, votos y puntos
+extra) escribiendo las respuestas por stdin. Sin una terminal, input()
+escribe la pregunta en stdout y la vacía, por lo que alcanza con pipes: cada
+sesión espera la pregunta esperada antes de responder.
+
+Las respuestas son aleatorias pero realistas y reproducibles con
+``--seed``: pesos enteros que suman 100, notas concentradas en el rango
+habitual, asistencia mayoritariamente cumplida y, con ``--typo-rate``,
+respuestas inválidas que ejercitan los reintentos de cada pregunta. La nota
+final impresa se compara con la de GradeCalculator para los mismos datos.
+
+Reporta, por paso, los percentiles de latencia (desde la respuesta anterior
+hasta la pregunta siguiente; en ``inicio``, desde el lanzamiento del
+proceso) y las fallas: pregunta que no llega a tiempo, proceso que termina
+antes, resultado distinto o código de salida distinto de 0. Termina con
+código 1 si alguna sesión falla.
+"""
+
+import argparse
+import math
+import os
+import queue
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.calculator.grade_calculator import GradeCalculator
+from src.constants import MAX_CONCURRENT_USERS, MAX_EVALUATIONS, MAX_GRADE, MIN_GRADE
+from src.exceptions import GradeCalculatorError
+from src.models.evaluation import Evaluation
+
+STEP_START = "inicio"
+STEP_EVALUATIONS = "evaluaciones"
+STEP_ATTENDANCE = "asistencia"
+STEP_TARDINESS = "tardanzas"
+STEP_VOTES = "votos"
+STEP_EXTRA_POINTS = "puntos_extra"
+STEP_RESULT = "resultado"
+STEP_SESSION = "sesión"
+STEPS = (
+    STEP_START,
+    STEP_EVALUATIONS,
+    STEP_ATTENDANCE,
+    STEP_TARDINESS,
+    STEP_VOTES,
+    STEP_EXTRA_POINTS,
+    STEP_RESULT,
+)
+DEFAULT_STEP_TIMEOUT = 30.0
+
+# Preguntas del flujo interactivo (src.cli); los votos se reconocen por el
+# final de la pregunta, que no depende del número de profesor
+PROMPT_STUDENT = "Ingrese el código o identificador del estudiante: "
+PROMPT_GRADE = "  Nota obtenida (0-20): "
+PROMPT_WEIGHT = "  Peso (%): "
+PROMPT_MORE = "¿Desea registrar otra evaluación? (s/n): "
+PROMPT_ATTENDANCE = "¿El estudiante alcanzó la asistencia mínima? (s/n): "
+PROMPT_TARDINESS = "Ingrese el porcentaje de tardanzas (0-100): "
+PROMPT_VOTE = "(s/n, o 'fin' para terminar): "
+PROMPT_EXTRA_POINTS = "Ingrese los puntos extra a aplicar (0 o más): "
+RESULT_ERROR = "✗ Error al calcular la nota final:"
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CLI_COMMAND = (sys.executable, "-m", "src.cli")
+_READ_SIZE = 4096
+
+
+class Exchange(NamedTuple):
+    """Pregunta esperada y respuesta que se escribe al recibirla."""
+
+    step: str
+    prompt: str
+    answer: str
+
+
+class SessionScript(NamedTuple):
+    """Secuencia completa de una sesión y el resultado que debe imprimir."""
+
+    student_id: str
+    exchanges: List[Exchange]
+    expected: str
+
+
+class SessionResult(NamedTuple):
+    """Resultado de ejecutar una sesión."""
+
+    student_id: str
+    timings: List[Tuple[str, float]]
+    seconds: float
+    failed_step: Optional[str]
+    error: Optional[str]
+
+
+class StepStats(NamedTuple):
+    """Latencias (en segundos) y fallas de un paso."""
+
+    step: str
+    samples: int
+    failures: int
+    p50: float
+    p90: float
+    p99: float
+    maximum: float
+
+
+class _SessionFailure(Exception):
+    """Falla de una sesión en un paso."""
+
+    def __init__(self, step: str, message: str) -> None:
+        super().__init__(message)
+        self.step = step
+
+
+def build_script(rng: random.Random, student_id: str, typo_rate: float = 0.0) -> SessionScript:
+    """
+    Arma una sesión aleatoria con respuestas realistas.
+
+    Args:
+        rng: Generador de números aleatorios
+        student_id: Identificador del estudiante de la sesión
+        typo_rate: Probabilidad de una respuesta inválida antes de cada dato
+
+    Returns:
+        Secuencia de preguntas y respuestas con el resultado esperado
+    """
+    exchanges = [Exchange(STEP_START, PROMPT_STUDENT, student_id)]
+
+    count = rng.randint(1, MAX_EVALUATIONS)
+    evaluations: List[Evaluation] = []
+    for position, weight in enumerate(_split_weights(rng, count), start=1):
+        grade = round(rng.triangular(MIN_GRADE, MAX_GRADE, 13.0), 1)
+        if rng.random() < typo_rate:
+            exchanges.append(Exchange(STEP_EVALUATIONS, PROMPT_GRADE, "abc"))
+            exchanges.append(Exchange(STEP_EVALUATIONS, PROMPT_WEIGHT, str(weight)))
+        exchanges.append(Exchange(STEP_EVALUATIONS, PROMPT_GRADE, str(grade)))
+        exchanges.append(Exchange(STEP_EVALUATIONS, PROMPT_WEIGHT, str(weight)))
+        evaluations.append(Evaluation(grade, weight))
+        if position < MAX_EVALUATIONS:
+            more = "s" if position < count else "n"
+            exchanges.append(Exchange(STEP_EVALUATIONS, PROMPT_MORE, more))
+
+    has_reached_minimum = rng.random() < 0.8
+    if rng.random() < typo_rate:
+        exchanges.append(Exchange(STEP_ATTENDANCE, PROMPT_ATTENDANCE, "x"))
+    exchanges.append(
+        Exchange(STEP_ATTENDANCE, PROMPT_ATTENDANCE, "s" if has_reached_minimum else "n")
+    )
+
+    tardiness_percentage = 0.0
+    if not has_reached_minimum:
+        tardiness_percentage = float(rng.randint(0, 100))
+        if rng.random() < typo_rate:
+            exchanges.append(Exchange(STEP_TARDINESS, PROMPT_TARDINESS, "150"))
+        exchanges.append(
+            Exchange(STEP_TARDINESS, PROMPT_TARDINESS, str(tardiness_percentage))
+        )
+
+    agree = rng.random() < 0.6
+    votes = [agree or rng.random() < 0.7 for _ in range(rng.randint(0, 6))]
+    for vote in votes:
+        if rng.random() < typo_rate:
+            exchanges.append(Exchange(STEP_VOTES, PROMPT_VOTE, "tal vez"))
+        exchanges.append(Exchange(STEP_VOTES, PROMPT_VOTE, "s" if vote else "n"))
+    exchanges.append(Exchange(STEP_VOTES, PROMPT_VOTE, "fin"))
+
+    extra_points = 0.0
+    if votes and all(votes):
+        extra_points = rng.choice((0.0, 0.5, 1.0, 1.5, 2.0))
+        if rng.random() < typo_rate:
+            exchanges.append(Exchange(STEP_EXTRA_POINTS, PROMPT_EXTRA_POINTS, "-1"))
+        exchanges.append(Exchange(STEP_EXTRA_POINTS, PROMPT_EXTRA_POINTS, str(extra_points)))
+
+    try:
+        result = GradeCalculator.calculate_final_grade(
+            evaluations, has_reached_minimum, tardiness_percentage, votes, extra_points
+        )
+        expected = f"NOTA FINAL: {result['final_grade']}\n"
+    except GradeCalculatorError:
+        expected = RESULT_ERROR
+    return SessionScript(student_id, exchanges, expected)
+
+
+def run_session(
+    script: SessionScript,
+    timeout: float = DEFAULT_STEP_TIMEOUT,
+    think_time: float = 0.0,
+    seed: int = 0,
+    command: Sequence[str] = _CLI_COMMAND,
+) -> SessionResult:
+    """
+    Conduce una sesión del CLI interactivo por stdin/stdout.
+
+    Args:
+        script: Preguntas, respuestas y resultado esperado
+        timeout: Espera máxima por cada pregunta, en segundos
+        think_time: Pausa media antes de cada respuesta (distribución
+            exponencial); no se cuenta en la latencia de los pasos
+        seed: Semilla de las pausas
+        command: Comando que inicia el CLI
+
+    Returns:
+        Latencia de cada pregunta y, si falló, el paso y el motivo
+    """
+    rng = random.Random(seed)
+    timings: List[Tuple[str, float]] = []
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        list(command),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        cwd=_PROJECT_ROOT,
+        env=dict(os.environ, PYTHONIOENCODING="utf-8"),
+    )
+    assert process.stdin is not None and process.stdout is not None
+    output = _Output(process.stdout)
+    try:
+        sent = start
+        next_steps = [exchange.step for exchange in script.exchanges[1:]] + [STEP_RESULT]
+        for exchange, next_step in zip(script.exchanges, next_steps):
+            output.wait_for(exchange.step, exchange.prompt, timeout)
+            timings.append((exchange.step, time.perf_counter() - sent))
+            if think_time > 0:
+                time.sleep(rng.expovariate(1 / think_time))
+            _send(process.stdin, exchange.answer, next_step)
+            sent = time.perf_counter()
+        output.wait_for(STEP_RESULT, script.expected, timeout)
+        timings.append((STEP_RESULT, time.perf_counter() - sent))
+        try:
+            returncode = process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            raise _SessionFailure(STEP_RESULT, "el proceso no terminó") from None
+        if returncode != 0:
+            raise _SessionFailure(STEP_RESULT, f"código de salida {returncode}")
+    except _SessionFailure as e:
+        return SessionResult(
+            script.student_id, timings, time.perf_counter() - start, e.step, str(e)
+        )
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdin.close()
+        output.close()
+    return SessionResult(script.student_id, timings, time.perf_counter() - start, None, None)
+
+
+def run_load(
+    sessions: int,
+    concurrency: int = MAX_CONCURRENT_USERS,
+    seed: int = 0,
+    typo_rate: float = 0.0,
+    think_time: float = 0.0,
+    timeout: float = DEFAULT_STEP_TIMEOUT,
+    command: Sequence[str] = _CLI_COMMAND,
+) -> List[SessionResult]:
+    """
+    Ejecuta sesiones aleatorias con ``concurrency`` de ellas simultáneas.
+
+    Args:
+        sessions: Cantidad total de sesiones
+        concurrency: Sesiones simultáneas como máximo
+        seed: Semilla de las respuestas y las pausas
+        typo_rate: Probabilidad de una respuesta inválida antes de cada dato
+        think_time: Pausa media antes de cada respuesta, en segundos
+        timeout: Espera máxima por cada pregunta, en segundos
+        command: Comando que inicia el CLI
+
+    Returns:
+        Resultado de cada sesión, en el orden en que se generaron
+    """
+    rng = random.Random(seed)
+    scripts = [build_script(rng, f"LOAD{index:05d}", typo_rate) for index in range(sessions)]
+    with ThreadPoolExecutor(
+        max_workers=max(1, concurrency), thread_name_prefix="load-session"
+    ) as pool:
+        futures = [
+            pool.submit(run_session, script, timeout, think_time, seed + index, command)
+            for index, script in enumerate(scripts)
+        ]
+        return [future.result() for future in futures]
+
+
+def summarize(results: Sequence[SessionResult]) -> List[StepStats]:
+    """
+    Agrupa las latencias y las fallas por paso.
+
+    Args:
+        results: Resultados de las sesiones
+
+    Returns:
+        Estadísticas de cada paso con muestras o fallas, en el orden del
+        flujo, y al final la duración de las sesiones completas
+    """
+    latencies: Dict[str, List[float]] = {step: [] for step in STEPS + (STEP_SESSION,)}
+    failures: Dict[str, int] = dict.fromkeys(latencies, 0)
+    for result in results:
+        for step, seconds in result.timings:
+            latencies[step].append(seconds)
+        if result.failed_step is None:
+            latencies[STEP_SESSION].append(result.seconds)
+        else:
+            failures[result.failed_step] += 1
+            failures[STEP_SESSION] += 1
+    stats = []
+    for step, values in latencies.items():
+        if not values and not failures[step]:
+            continue
+        values.sort()
+        stats.append(
+            StepStats(
+                step,
+                len(values),
+                failures[step],
+                percentile(values, 50),
+                percentile(values, 90),
+                percentile(values, 99),
+                values[-1] if values else 0.0,
+            )
+        )
+    return stats
+
+
+def percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """
+    Percentil por rango más cercano.
+
+    Args:
+        sorted_values: Valores ordenados de menor a mayor
+        percent: Percentil (0-100)
+
+    Returns:
+        Valor del percentil, o 0.0 si no hay valores
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _split_weights(rng: random.Random, count: int) -> List[int]:
+    """Pesos enteros positivos que suman 100."""
+    cuts = sorted(rng.sample(range(1, 100), count - 1))
+    bounds = [0] + cuts + [100]
+    return [bounds[i + 1] - bounds[i] for i in range(count)]
+
+
+def _send(stdin: IO[bytes], answer: str, next_step: str) -> None:
+    """Escribe una respuesta; una pipe rota es una falla del paso siguiente."""
+    try:
+        stdin.write(answer.encode("utf-8") + b"\n")
+        stdin.flush()
+    except OSError:
+        raise _SessionFailure(next_step, "el proceso cerró la entrada") from None
+
+
+class _Output:
+    """Salida del proceso leída por un hilo, para esperar con timeout."""
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        """Inicia el hilo que lee la salida."""
+        self._stream = stream
+        self._chunks: "queue.Queue[bytes]" = queue.Queue()
+        self._buffer = b""
+        self._eof = False
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def wait_for(self, step: str, text: str, timeout: float) -> None:
+        """
+        Espera a que aparezca ``text`` y descarta la salida hasta ese punto.
+
+        Raises:
+            _SessionFailure: Si vence el timeout o el proceso termina antes
+        """
+        marker = text.encode("utf-8")
+        deadline = time.perf_counter() + timeout
+        while True:
+            position = self._buffer.find(marker)
+            if position != -1:
+                self._buffer = self._buffer[position + len(marker) :]
+                return
+            if self._eof:
+                raise _SessionFailure(step, f"el proceso terminó sin mostrar {text!r}")
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise _SessionFailure(step, f"sin respuesta en {timeout:g} s")
+            try:
+                chunk = self._chunks.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if chunk:
+                self._buffer += chunk
+            else:
+                self._eof = True
+
+    def close(self) -> None:
+        """Espera al hilo lector y cierra la salida."""
+        self._reader.join()
+        self._stream.close()
+
+    def _read(self) -> None:
+        """Lee la salida hasta el fin; un bloque vacío marca el fin."""
+        read = getattr(self._stream, "read1", self._stream.read)
+        while True:
+            chunk = read(_READ_SIZE)
+            self._chunks.put(chunk)
+            if not chunk:
+                return
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Ejecuta la carga e imprime las latencias por paso."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=4 * MAX_CONCURRENT_USERS)
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENT_USERS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--typo-rate", type=float, default=0.05)
+    parser.add_argument("--think-time", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_STEP_TIMEOUT)
+    options = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_load(
+        options.sessions,
+        options.concurrency,
+        options.seed,
+        options.typo_rate,
+        options.think_time,
+        options.timeout,
+    )
+    elapsed = time.perf_counter() - start
+    failed = [result for result in results if result.failed_step is not None]
+
+    print(
+        f"Sesiones: {len(results)} (concurrencia {options.concurrency}, "
+        f"semilla {options.seed})"
+    )
+    print(f"Sesiones fallidas: {len(failed)}")
+    print(f"Tiempo total: {elapsed:.2f} s ({len(results) / elapsed:.1f} sesiones/s)")
+    print(
+        f"{'paso':>13} {'muestras':>9} {'fallas':>7} {'p50 ms':>9} "
+        f"{'p90 ms':>9} {'p99 ms':>9} {'máx ms':>9}"
+    )
+    for stats in summarize(results):
+        print(
+            f"{stats.step:>13} {stats.samples:>9} {stats.failures:>7} "
+            f"{stats.p50 * 1000:>9.1f} {stats.p90 * 1000:>9.1f} "
+            f"{stats.p99 * 1000:>9.1f} {stats.maximum * 1000:>9.1f}"
+        )
+    for result in failed[:10]:
+        print(f"✗ {result.student_id} ({result.failed_step}): {result.error}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
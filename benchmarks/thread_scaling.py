@@ -0,0 +1,108 @@
+"""Benchmark de escalamiento de grade_batch_threaded de 1 a N hilos.
+
+Uso:
+    python -m benchmarks.thread_scaling [--rows 200000] [--max-threads 8]
+
+Reporta filas por segundo y aceleración respecto a 1 hilo, junto con el
+tipo de build de CPython. En un build estándar (con GIL) se espera una
+aceleración cercana a 1x; en un build free-threaded (``python3.13t`` o
+posterior, con el GIL desactivado) el cálculo escala con los núcleos.
+También verifica que todas las ejecuciones produzcan el mismo resultado.
+"""
+
+import argparse
+import sys
+import sysconfig
+import time
+from typing import List, NamedTuple, Optional
+
+from src.batch.parallel import DEFAULT_CHUNK_SIZE, grade_batch_threaded
+from src.batch.synthetic import generate_records
+
+
+class ScalingPoint(NamedTuple):
+    """Medición para una cantidad de hilos."""
+
+    threads: int
+    seconds: float
+    rows_per_second: float
+    speedup: float
+
+
+def build_description() -> str:
+    """
+    Describe el build de CPython en ejecución.
+
+    Returns:
+        Versión y si el GIL está activo
+    """
+    free_threaded_build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    gil_enabled = True if is_gil_enabled is None else is_gil_enabled()
+    build = "free-threaded" if free_threaded_build else "estándar"
+    return (
+        f"CPython {sys.version.split()[0]} ({build}, "
+        f"GIL {'activo' if gil_enabled else 'desactivado'})"
+    )
+
+
+def measure_scaling(
+    rows: int,
+    max_threads: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    repeats: int = 3,
+) -> List[ScalingPoint]:
+    """
+    Mide el throughput de 1 a max_threads hilos (mejor de ``repeats``).
+
+    Args:
+        rows: Cantidad de registros sintéticos
+        max_threads: Máxima cantidad de hilos
+        chunk_size: Registros por tarea
+        repeats: Repeticiones por punto
+
+    Returns:
+        Una medición por cantidad de hilos
+
+    Raises:
+        AssertionError: Si alguna ejecución difiere del resultado de 1 hilo
+    """
+    records = generate_records(rows)
+    reference: Optional[list] = None
+    points: List[ScalingPoint] = []
+    for threads in range(1, max_threads + 1):
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            results = grade_batch_threaded(records, threads, chunk_size)
+            best = min(best, time.perf_counter() - start)
+            if reference is None:
+                reference = results
+            assert results == reference, f"Resultado distinto con {threads} hilos"
+        baseline = points[0].seconds if points else best
+        points.append(ScalingPoint(threads, best, rows / best, baseline / best))
+    return points
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Ejecuta el benchmark e imprime la tabla de resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--max-threads", type=int, default=8)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--repeats", type=int, default=3)
+    options = parser.parse_args(argv)
+
+    print(build_description())
+    print(f"{'hilos':>6} {'segundos':>10} {'filas/s':>12} {'aceleración':>12}")
+    for point in measure_scaling(
+        options.rows, options.max_threads, options.chunk_size, options.repeats
+    ):
+        print(
+            f"{point.threads:>6} {point.seconds:>10.3f} "
+            f"{point.rows_per_second:>12.0f} {point.speedup:>11.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Procesamiento por lotes de notas finales."""
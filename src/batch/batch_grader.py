@@ -0,0 +1,192 @@
+"""Cálculo de notas finales por lotes."""
+
+import math
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from src.calculator.grade_calculator import GradeCalculator
+from src.exceptions import GradeCalculatorError
+from src.models.evaluation import Evaluation
+from src.models.grade_result import RESULT_DECIMALS, RESULT_FIELDS, GradeResult
+from src.models.student_record import StudentRecord
+from src.models.weight_scheme import WeightScheme
+
+
+class GradedRow(NamedTuple):
+    """Resultado del cálculo de un estudiante dentro de un lote."""
+
+    student_id: str
+    result: Optional[GradeResult]
+    error: Optional[str]
+
+
+def grade_record(record: StudentRecord) -> GradeResult:
+    """
+    Calcula la nota final de un registro usando GradeCalculator.
+
+    Los pesos se resuelven a su WeightScheme internado, de modo que los
+    estudiantes con los mismos pesos comparten una sola validación.
+
+    Args:
+        record: Registro del estudiante
+
+    Returns:
+        Resultado del cálculo (se usa como el diccionario de GradeCalculator)
+
+    Raises:
+        GradeCalculatorError: Si los datos del registro son inválidos
+    """
+    if len(record.grades) == len(record.weights):
+        return GradeCalculator.calculate_with_scheme(
+            record.grades,
+            WeightScheme.intern(record.weights),
+            record.has_reached_minimum,
+            record.tardiness_percentage,
+            list(record.all_years_teachers),
+            record.extra_points,
+        )
+    evaluations = [
+        Evaluation(grade, weight) for grade, weight in zip(record.grades, record.weights)
+    ]
+    return GradeCalculator.calculate_result(
+        evaluations,
+        record.has_reached_minimum,
+        record.tardiness_percentage,
+        list(record.all_years_teachers),
+        record.extra_points,
+    )
+
+
+class BatchGrader:
+    """
+    Calcula la nota final de cada registro de un lote.
+
+    Los errores de validación de un registro se reportan en su fila y no
+    detienen el procesamiento del resto del lote.
+    """
+
+    @staticmethod
+    def grade(records: Iterable[StudentRecord]) -> Iterator[GradedRow]:
+        """
+        Calcula la nota final de cada registro en orden.
+
+        Args:
+            records: Registros de estudiantes
+
+        Yields:
+            Un GradedRow por registro, en el mismo orden de entrada
+        """
+        for record in records:
+            yield BatchGrader.grade_one(record)
+
+    @staticmethod
+    def grade_one(record: StudentRecord) -> GradedRow:
+        """
+        Calcula la nota final de un registro capturando errores de validación.
+
+        Args:
+            record: Registro del estudiante
+
+        Returns:
+            GradedRow con el resultado o el mensaje de error
+        """
+        try:
+            return GradedRow(record.student_id, grade_record(record), None)
+        except GradeCalculatorError as e:
+            return GradedRow(record.student_id, None, str(e))
+
+    @staticmethod
+    def grade_columns(records: Iterable[StudentRecord]) -> "GradeResults":
+        """
+        Calcula un lote guardando los resultados por columnas.
+
+        Args:
+            records: Registros de estudiantes
+
+        Returns:
+            Resultados columnares, en el mismo orden de entrada
+        """
+        results = GradeResults()
+        for record in records:
+            results.append(BatchGrader.grade_one(record))
+        return results
+
+
+class GradeResults:
+    """
+    Resultados de un lote almacenados por columnas.
+
+    Cada campo se guarda sin redondear en un ``array`` de floats (NaN en las
+    filas con error), sin un objeto por estudiante; los GradeResult y los
+    valores redondeados se construyen solo al leerlos.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa un conjunto de resultados vacío."""
+        self.student_ids: List[str] = []
+        self.errors: Dict[int, str] = {}
+        self._columns: Dict[str, array] = {name: array("d") for name in RESULT_FIELDS}
+
+    def append(self, row: GradedRow) -> None:
+        """
+        Agrega el resultado de un estudiante.
+
+        Args:
+            row: Resultado del estudiante
+        """
+        if row.result is None:
+            self.errors[len(self.student_ids)] = row.error or ""
+            for column in self._columns.values():
+                column.append(math.nan)
+        else:
+            for name, column in self._columns.items():
+                column.append(getattr(row.result, "raw_" + name))
+        self.student_ids.append(row.student_id)
+
+    def raw_column(self, name: str) -> array:
+        """
+        Retorna una columna sin redondear.
+
+        Args:
+            name: Nombre del campo (ver RESULT_FIELDS)
+
+        Returns:
+            Arreglo de floats con NaN en las filas con error
+        """
+        return self._columns[name]
+
+    def column(self, name: str) -> List[Optional[float]]:
+        """
+        Retorna una columna redondeada.
+
+        Args:
+            name: Nombre del campo (ver RESULT_FIELDS)
+
+        Returns:
+            Valores redondeados, con None en las filas con error
+        """
+        return [
+            None if math.isnan(value) else round(value, RESULT_DECIMALS)
+            for value in self._columns[name]
+        ]
+
+    def __len__(self) -> int:
+        """Cantidad de estudiantes."""
+        return len(self.student_ids)
+
+    def __getitem__(self, index: int) -> GradedRow:
+        """Materializa el resultado de la fila indicada."""
+        student_id = self.student_ids[index]
+        if index < 0:
+            index += len(self)
+        if index in self.errors:
+            return GradedRow(student_id, None, self.errors[index])
+        result = GradeResult(
+            *(self._columns[name][index] for name in RESULT_FIELDS)
+        )
+        return GradedRow(student_id, result, None)
+
+    def __iter__(self) -> Iterator[GradedRow]:
+        """Itera los resultados en orden."""
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,160 @@
+"""Utilidades compartidas por los formatos binarios columnares.
+
+Todos los formatos binarios del paquete usan orden de bytes little-endian y
+secciones contiguas por columna, de modo que una columna puede leerse con
+``memoryview.cast`` directamente sobre el archivo mapeado en memoria.
+"""
+
+import sys
+from array import array
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union, overload
+
+IS_LITTLE_ENDIAN = sys.byteorder == "little"
+
+NumericColumn = Union[array, memoryview]
+
+
+def column_view(buffer: memoryview, offset: int, typecode: str, count: int) -> NumericColumn:
+    """
+    Retorna una vista de solo lectura de una columna numérica.
+
+    En plataformas little-endian la vista no copia datos (cero copias sobre
+    el mmap); en plataformas big-endian se retorna una copia con los bytes
+    invertidos.
+
+    Args:
+        buffer: Buffer completo del archivo
+        offset: Posición en bytes donde comienza la columna
+        typecode: Código de tipo de ``array`` (``d``, ``q``, ``b``)
+        count: Cantidad de elementos
+
+    Returns:
+        Vista o arreglo indexable con los valores de la columna
+    """
+    size = array(typecode).itemsize * count
+    view = buffer[offset : offset + size]
+    if IS_LITTLE_ENDIAN:
+        return view.cast(typecode)
+
+    values = array(typecode)
+    values.frombytes(view)
+    values.byteswap()
+    view.release()
+    return values
+
+
+def column_bytes(values: array) -> bytes:
+    """
+    Serializa un arreglo numérico en orden little-endian.
+
+    Args:
+        values: Arreglo a serializar
+
+    Returns:
+        Bytes de la columna
+    """
+    if IS_LITTLE_ENDIAN:
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def pack_strings(strings: Iterable[str]) -> Tuple[array, bytes]:
+    """
+    Empaqueta cadenas en una tabla de offsets y bytes UTF-8 concatenados.
+
+    Args:
+        strings: Cadenas a empaquetar
+
+    Returns:
+        Tupla (offsets int64 con n+1 elementos, datos UTF-8)
+    """
+    offsets = array("q", [0])
+    chunks: List[bytes] = []
+    position = 0
+    for value in strings:
+        encoded = value.encode("utf-8")
+        chunks.append(encoded)
+        position += len(encoded)
+        offsets.append(position)
+    return offsets, b"".join(chunks)
+
+
+class StringTable(Sequence[str]):
+    """
+    Tabla de cadenas de solo lectura respaldada por un buffer.
+
+    Las cadenas se decodifican solo al accederse, por lo que leer una
+    columna numérica no requiere materializar los identificadores.
+    """
+
+    def __init__(self, offsets: Sequence[int], data: memoryview) -> None:
+        """
+        Inicializa la tabla.
+
+        Args:
+            offsets: Offsets de inicio de cada cadena (n+1 elementos)
+            data: Bytes UTF-8 concatenados
+        """
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        """Cantidad de cadenas en la tabla."""
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index):
+        """Decodifica la cadena (o cadenas) en la posición indicada."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice fuera de rango en la tabla de cadenas")
+        start = self._offsets[index]
+        end = self._offsets[index + 1]
+        return str(self._data[start:end], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        """Itera las cadenas en orden."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def byte_range(self, start: int, end: int) -> memoryview:
+        """
+        Retorna los bytes UTF-8 de las cadenas en [start, end) sin decodificarlas.
+
+        Args:
+            start: Posición de la primera cadena
+            end: Posición siguiente a la última cadena
+
+        Returns:
+            Vista de los bytes concatenados de esas cadenas
+        """
+        return self._data[self._offsets[start] : self._offsets[end]]
+
+    def offset_range(self, start: int, end: int) -> Sequence[int]:
+        """
+        Retorna los offsets de las cadenas en [start, end] sin copiarlos.
+
+        Args:
+            start: Posición de la primera cadena
+            end: Posición siguiente a la última cadena
+
+        Returns:
+            Vista de los end - start + 1 offsets (int64)
+        """
+        return self._offsets[start : end + 1]
+
+    def release(self) -> None:
+        """Libera las vistas sobre el buffer que respalda la tabla."""
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._data.release()
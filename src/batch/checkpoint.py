@@ -0,0 +1,186 @@
+"""Checkpoints para reanudar lotes de larga duración.
+
+Un checkpoint registra la siguiente fila del roster a procesar, la cantidad
+de bytes del archivo de resultados que ya son consistentes y el estado de
+las estadísticas incrementales. Se escribe de forma atómica (archivo
+temporal, fsync y os.replace) desde un hilo en segundo plano para no
+detener el cálculo.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+
+from src.exceptions import CheckpointMismatchError
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_SUFFIX = ".ckpt"
+
+
+class CheckpointState(NamedTuple):
+    """Estado persistido de un lote en curso."""
+
+    input_fingerprint: str
+    next_row: int
+    output_bytes: int
+    statistics: Dict[str, Any]
+    dedup: Optional[Dict[str, int]] = None
+
+
+def input_fingerprint(path: str) -> str:
+    """
+    Identifica la versión del archivo de entrada (tamaño y fecha de modificación).
+
+    Args:
+        path: Ruta del roster
+
+    Returns:
+        Huella del archivo
+    """
+    status = os.stat(path)
+    return f"{status.st_size}:{status.st_mtime_ns}"
+
+
+def default_checkpoint_path(output_path: str) -> str:
+    """
+    Retorna la ruta de checkpoint asociada a un archivo de resultados.
+
+    Args:
+        output_path: Ruta del archivo de resultados
+
+    Returns:
+        Ruta del checkpoint
+    """
+    return output_path + CHECKPOINT_SUFFIX
+
+
+def load_checkpoint(path: str) -> Optional[CheckpointState]:
+    """
+    Lee un checkpoint si existe.
+
+    Args:
+        path: Ruta del checkpoint
+
+    Returns:
+        Estado persistido, o None si no hay checkpoint
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as checkpoint_file:
+            data = json.load(checkpoint_file)
+    except FileNotFoundError:
+        return None
+
+    if data.get("version") != CHECKPOINT_VERSION:
+        raise CheckpointMismatchError(f"Versión de checkpoint no soportada: {path}")
+    return CheckpointState(
+        input_fingerprint=data["input_fingerprint"],
+        next_row=data["next_row"],
+        output_bytes=data["output_bytes"],
+        statistics=data["statistics"],
+        dedup=data.get("dedup"),
+    )
+
+
+def write_checkpoint(path: str, state: CheckpointState) -> None:
+    """
+    Escribe un checkpoint de forma atómica.
+
+    Args:
+        path: Ruta del checkpoint
+        state: Estado a persistir
+    """
+    write_json_atomically(path, {"version": CHECKPOINT_VERSION, **state._asdict()})
+
+
+def write_json_atomically(path: str, data: Dict[str, Any]) -> None:
+    """
+    Escribe un JSON de forma atómica: archivo temporal, fsync y os.replace.
+
+    Un lector nunca observa un archivo a medio escribir: ve la versión
+    anterior completa o la nueva completa.
+
+    Args:
+        path: Ruta del archivo
+        data: Contenido serializable en JSON
+    """
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8") as json_file:
+        json.dump(data, json_file)
+        json_file.flush()
+        os.fsync(json_file.fileno())
+    os.replace(temporary_path, path)
+
+
+class CheckpointWriter:
+    """
+    Escribe checkpoints en un hilo en segundo plano.
+
+    submit() nunca bloquea el cálculo: si el hilo aún está escribiendo el
+    checkpoint anterior, el nuevo estado reemplaza al pendiente y solo se
+    persiste el más reciente. Antes de cada checkpoint se hace fsync del
+    archivo de resultados, de modo que los bytes registrados ya están en
+    disco cuando el checkpoint se publica.
+    """
+
+    def __init__(self, path: str, output_fd: int) -> None:
+        """
+        Inicia el hilo escritor.
+
+        Args:
+            path: Ruta del checkpoint
+            output_fd: Descriptor del archivo de resultados
+        """
+        self._path = path
+        self._output_fd = output_fd
+        self._condition = threading.Condition()
+        self._pending: Optional[CheckpointState] = None
+        self._closing = False
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="checkpoint-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, state: CheckpointState) -> None:
+        """
+        Programa la escritura de un checkpoint.
+
+        Args:
+            state: Estado a persistir (los bytes de salida ya deben estar
+                escritos en el archivo, es decir, después de flush())
+        """
+        with self._condition:
+            self._pending = state
+            self._condition.notify()
+
+    def close(self) -> None:
+        """
+        Espera a que se escriba el último checkpoint pendiente.
+
+        Raises:
+            OSError: Si falló la escritura de algún checkpoint
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        """Bucle del hilo: persiste el estado pendiente más reciente."""
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closing:
+                    self._condition.wait()
+                state = self._pending
+                self._pending = None
+                if state is None:
+                    return
+            try:
+                os.fsync(self._output_fd)
+                write_checkpoint(self._path, state)
+            except OSError as e:
+                self._error = e
+                return
@@ -0,0 +1,378 @@
+"""Índices secundarios para consultar la cohorte sin recorrer todos los resultados.
+
+Cada estudiante ocupa una posición (slot) fija. Sobre esas posiciones se
+mantienen:
+
+- Bitmaps (un bit por slot) para la penalización por asistencia, los puntos
+  extra y las filas con error: agregar o quitar un estudiante toca un byte y
+  ajusta la cantidad de miembros, que se consulta en tiempo constante. Para
+  listar los miembros, los bytes en cero se saltan con una búsqueda en C.
+- Un índice ordenado por nota final: la lista ordenada de las notas
+  distintas (en centésimas, a lo sumo unas dos mil) y, por cada nota, los
+  slots que la tienen. Un rango de notas (desaprobados, cerca del aprobado)
+  se resuelve con dos búsquedas binarias y solo se recorren los estudiantes
+  del resultado; actualizar una nota no desplaza el resto del índice.
+
+Los índices se actualizan incrementalmente con update() y remove(), por
+ejemplo con cada fila que emite el GradebookWatcher.
+"""
+
+import math
+import re
+from array import array
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.batch.batch_grader import GradedRow
+
+NEAR_THRESHOLD_MARGIN = 0.5
+_NO_GRADE = -1
+_NONZERO_BYTE = re.compile(rb"[^\x00]")
+# Posiciones de los bits en 1 de cada valor de byte
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)
+)
+
+
+class _Bitmap:
+    """Conjunto de slots representado con un bit por slot."""
+
+    __slots__ = ("_bits", "_count")
+
+    def __init__(self) -> None:
+        """Inicializa el bitmap vacío."""
+        self._bits = bytearray()
+        self._count = 0
+
+    def add(self, slot: int) -> None:
+        """Marca el slot."""
+        index = slot >> 3
+        if index >= len(self._bits):
+            self._bits.extend(bytes(index + 1 - len(self._bits)))
+        mask = 1 << (slot & 7)
+        if not self._bits[index] & mask:
+            self._bits[index] |= mask
+            self._count += 1
+
+    def discard(self, slot: int) -> None:
+        """Desmarca el slot si estaba marcado."""
+        index = slot >> 3
+        mask = 1 << (slot & 7)
+        if index < len(self._bits) and self._bits[index] & mask:
+            self._bits[index] &= ~mask & 0xFF
+            self._count -= 1
+
+    def __contains__(self, slot: int) -> bool:
+        """Indica si el slot está marcado."""
+        index = slot >> 3
+        return index < len(self._bits) and bool(self._bits[index] >> (slot & 7) & 1)
+
+    def __len__(self) -> int:
+        """Cantidad de slots marcados."""
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        """Slots marcados de menor a mayor, recorriendo solo los bytes no nulos."""
+        byte_bits = _BYTE_BITS
+        for match in _NONZERO_BYTE.finditer(self._bits):
+            index = match.start()
+            base = index << 3
+            for bit in byte_bits[self._bits[index]]:
+                yield base + bit
+
+
+class CohortIndex:
+    """
+    Resultados de la cohorte con índices por indicador y por nota final.
+
+    Las consultas por indicador retornan los estudiantes en orden de slot;
+    las consultas por nota, ordenados de menor a mayor nota. Las consultas
+    de desaprobados requieren la nota mínima aprobatoria de la cohorte.
+    """
+
+    def __init__(self, passing_grade: Optional[float] = None) -> None:
+        """
+        Inicializa un índice vacío.
+
+        Args:
+            passing_grade: Nota mínima aprobatoria (None si no se consultan
+                desaprobados)
+        """
+        self.passing_grade = passing_grade
+        self._slots: Dict[str, int] = {}
+        self._student_ids: List[Optional[str]] = []
+        self._free_slots: List[int] = []
+        # Nota final en centésimas por slot (_NO_GRADE si no tiene nota)
+        self._grades = array("q")
+        self._grade_keys: List[int] = []
+        self._by_grade: Dict[int, Dict[int, None]] = {}
+        self._penalized = _Bitmap()
+        self._extra_points = _Bitmap()
+        self._errors = _Bitmap()
+
+    @staticmethod
+    def build(
+        rows: Iterable[GradedRow], passing_grade: Optional[float] = None
+    ) -> "CohortIndex":
+        """
+        Construye el índice a partir de los resultados de un lote.
+
+        Si un estudiante aparece más de una vez, prevalece la última fila.
+
+        Args:
+            rows: Resultados por estudiante
+            passing_grade: Nota mínima aprobatoria (None si no se consultan
+                desaprobados)
+
+        Returns:
+            Índice de la cohorte
+        """
+        index = CohortIndex(passing_grade)
+        for row in rows:
+            index.update(row)
+        return index
+
+    def __len__(self) -> int:
+        """Cantidad de estudiantes indexados."""
+        return len(self._slots)
+
+    def __contains__(self, student_id: object) -> bool:
+        """Indica si el estudiante está en el índice."""
+        return student_id in self._slots
+
+    def update(self, row: GradedRow) -> None:
+        """
+        Agrega el resultado de un estudiante o reemplaza el anterior.
+
+        Args:
+            row: Resultado del estudiante
+        """
+        slot = self._slots.get(row.student_id)
+        if slot is None:
+            slot = self._allocate(row.student_id)
+        else:
+            self._clear(slot)
+
+        if row.result is None:
+            self._errors.add(slot)
+            return
+        hundredths = round(row.result["final_grade"] * 100)
+        self._grades[slot] = hundredths
+        bucket = self._by_grade.get(hundredths)
+        if bucket is None:
+            bucket = self._by_grade[hundredths] = {}
+            insort(self._grade_keys, hundredths)
+        bucket[slot] = None
+        if row.result["penalty_applied"] > 0:
+            self._penalized.add(slot)
+        if row.result["extra_points_applied"] > 0:
+            self._extra_points.add(slot)
+
+    def remove(self, student_id: str) -> bool:
+        """
+        Quita a un estudiante de todos los índices.
+
+        Args:
+            student_id: Identificador del estudiante
+
+        Returns:
+            True si el estudiante estaba indexado
+        """
+        slot = self._slots.pop(student_id, None)
+        if slot is None:
+            return False
+        self._clear(slot)
+        self._student_ids[slot] = None
+        self._free_slots.append(slot)
+        return True
+
+    def grade_of(self, student_id: str) -> Optional[float]:
+        """
+        Retorna la nota final indexada de un estudiante.
+
+        Args:
+            student_id: Identificador del estudiante
+
+        Returns:
+            Nota final, o None si no está indexado o su fila tiene error
+        """
+        slot = self._slots.get(student_id)
+        if slot is None or self._grades[slot] == _NO_GRADE:
+            return None
+        return self._grades[slot] / 100
+
+    def failing(self) -> List[str]:
+        """
+        Estudiantes con nota final menor a la nota aprobatoria.
+
+        Raises:
+            ValueError: Si el índice no tiene nota aprobatoria
+        """
+        return self.grade_range(None, self._passing_grade())
+
+    def near_threshold(self, margin: float = NEAR_THRESHOLD_MARGIN) -> List[str]:
+        """
+        Estudiantes desaprobados a menos de ``margin`` puntos de aprobar.
+
+        Args:
+            margin: Distancia máxima a la nota aprobatoria
+
+        Returns:
+            Estudiantes con nota en [passing_grade - margin, passing_grade)
+
+        Raises:
+            ValueError: Si el índice no tiene nota aprobatoria
+        """
+        passing_grade = self._passing_grade()
+        return self.grade_range(passing_grade - margin, passing_grade)
+
+    def grade_range(
+        self, minimum: Optional[float] = None, maximum: Optional[float] = None
+    ) -> List[str]:
+        """
+        Estudiantes con nota final en [minimum, maximum).
+
+        Args:
+            minimum: Nota mínima incluida (None para no acotar)
+            maximum: Nota máxima excluida (None para no acotar)
+
+        Returns:
+            Estudiantes ordenados por nota final ascendente
+        """
+        ids = self._student_ids
+        return [ids[slot] for slot in self._range_slots(minimum, maximum)]  # type: ignore[misc]
+
+    def count_grade_range(
+        self, minimum: Optional[float] = None, maximum: Optional[float] = None
+    ) -> int:
+        """Cantidad de estudiantes con nota final en [minimum, maximum)."""
+        by_grade = self._by_grade
+        return sum(len(by_grade[key]) for key in self._range_keys(minimum, maximum))
+
+    def penalized(self) -> List[str]:
+        """Estudiantes con penalización por asistencia."""
+        return self._members(self._penalized)
+
+    def with_extra_points(self) -> List[str]:
+        """Estudiantes que recibieron puntos extra."""
+        return self._members(self._extra_points)
+
+    def with_errors(self) -> List[str]:
+        """Estudiantes cuya fila tiene error."""
+        return self._members(self._errors)
+
+    def select(
+        self,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None,
+        penalized: Optional[bool] = None,
+        extra_points: Optional[bool] = None,
+    ) -> List[str]:
+        """
+        Combina un rango de notas con los indicadores.
+
+        Args:
+            minimum: Nota mínima incluida (None para no acotar)
+            maximum: Nota máxima excluida (None para no acotar)
+            penalized: True/False para exigir o excluir la penalización
+            extra_points: True/False para exigir o excluir los puntos extra
+
+        Returns:
+            Estudiantes ordenados por nota final ascendente
+        """
+        flags = ((self._penalized, penalized), (self._extra_points, extra_points))
+        filters = [(bitmap, wanted) for bitmap, wanted in flags if wanted is not None]
+        ids = self._student_ids
+        return [
+            ids[slot]  # type: ignore[misc]
+            for slot in self._range_slots(minimum, maximum)
+            if all((slot in bitmap) == wanted for bitmap, wanted in filters)
+        ]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Cantidades por categoría sin materializar las listas.
+
+        Returns:
+            Diccionario con total, failing y near_threshold (solo si el
+            índice tiene nota aprobatoria), penalized, extra_points y errors
+        """
+        counts = {"total": len(self)}
+        if self.passing_grade is not None:
+            counts["failing"] = self.count_grade_range(None, self.passing_grade)
+            counts["near_threshold"] = self.count_grade_range(
+                self.passing_grade - NEAR_THRESHOLD_MARGIN, self.passing_grade
+            )
+        counts["penalized"] = len(self._penalized)
+        counts["extra_points"] = len(self._extra_points)
+        counts["errors"] = len(self._errors)
+        return counts
+
+    def _passing_grade(self) -> float:
+        """Nota aprobatoria del índice, requerida por las consultas de desaprobados."""
+        if self.passing_grade is None:
+            raise ValueError("La consulta requiere la nota mínima aprobatoria")
+        return self.passing_grade
+
+    def _allocate(self, student_id: str) -> int:
+        """Asigna un slot al estudiante, reutilizando los liberados."""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._student_ids[slot] = student_id
+        else:
+            slot = len(self._student_ids)
+            self._student_ids.append(student_id)
+            self._grades.append(_NO_GRADE)
+        self._slots[student_id] = slot
+        return slot
+
+    def _clear(self, slot: int) -> None:
+        """Quita el slot de todos los índices."""
+        hundredths = self._grades[slot]
+        if hundredths != _NO_GRADE:
+            bucket = self._by_grade[hundredths]
+            del bucket[slot]
+            if not bucket:
+                del self._by_grade[hundredths]
+                del self._grade_keys[bisect_left(self._grade_keys, hundredths)]
+            self._grades[slot] = _NO_GRADE
+        self._penalized.discard(slot)
+        self._extra_points.discard(slot)
+        self._errors.discard(slot)
+
+    def _range_keys(self, minimum: Optional[float], maximum: Optional[float]) -> List[int]:
+        """Notas distintas (en centésimas) dentro de [minimum, maximum)."""
+        keys = self._grade_keys
+        start = 0 if minimum is None else bisect_left(keys, _hundredths_ceil(minimum))
+        end = len(keys) if maximum is None else bisect_left(keys, _hundredths_ceil(maximum))
+        return keys[start:end]
+
+    def _range_slots(
+        self, minimum: Optional[float], maximum: Optional[float]
+    ) -> Iterator[int]:
+        """Slots con nota en [minimum, maximum), de menor a mayor nota."""
+        by_grade = self._by_grade
+        for key in self._range_keys(minimum, maximum):
+            yield from by_grade[key]
+
+    def _members(self, bitmap: _Bitmap) -> List[str]:
+        """Identificadores de los slots marcados en el bitmap."""
+        ids = self._student_ids
+        return [ids[slot] for slot in bitmap]  # type: ignore[misc]
+
+
+# Consultas con nombre, para la línea de comandos
+COHORT_QUERIES: Dict[str, Callable[[CohortIndex], List[str]]] = {
+    "failing": CohortIndex.failing,
+    "near-threshold": CohortIndex.near_threshold,
+    "penalized": CohortIndex.penalized,
+    "extra-points": CohortIndex.with_extra_points,
+    "errors": CohortIndex.with_errors,
+}
+
+
+def _hundredths_ceil(grade: float) -> int:
+    """Menor cantidad entera de centésimas mayor o igual a la nota."""
+    # El redondeo previo evita que 9.95 * 100 = 994.999... se lea como 995+ε
+    return math.ceil(round(grade * 100, 6))
+
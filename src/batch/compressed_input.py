@@ -0,0 +1,189 @@
+"""Lectura de archivos comprimidos con descompresión en un hilo propio.
+
+Los rosters exportados llegan comprimidos con gzip o zstd. En lugar de
+descomprimirlos a disco, un hilo descomprime el archivo por bloques y los
+entrega por una cola acotada mientras el hilo principal parsea los bloques
+anteriores: la descompresión queda fuera del camino crítico (zlib y
+zstandard liberan el GIL mientras descomprimen), la memoria usada es la de
+unos pocos bloques y no se escribe nada en disco.
+
+gzip se lee con zlib de la biblioteca estándar (incluidos archivos con
+varios miembros concatenados). zstd requiere el paquete opcional
+``zstandard``; sin él, los archivos zstd se rechazan con un mensaje claro.
+"""
+
+import queue
+import threading
+import zlib
+from typing import BinaryIO, Iterator, Optional, Union
+
+from src.exceptions import InvalidRosterError
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependencia opcional
+    zstandard = None
+
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_MAX_BUFFERED_CHUNKS = 8
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_GZIP_WBITS = zlib.MAX_WBITS | 16
+# Espera máxima de cada intento de encolar; permite detectar que el
+# consumidor abandonó la lectura
+_PUT_TIMEOUT = 0.1
+
+
+class _End:
+    """Marca de fin de la cola de bloques."""
+
+
+_END = _End()
+
+
+def detect_compression(path: str) -> Optional[str]:
+    """
+    Detecta la compresión de un archivo por sus primeros bytes.
+
+    Args:
+        path: Ruta del archivo
+
+    Returns:
+        ``gzip``, ``zstd`` o None si el archivo no está comprimido
+    """
+    with open(path, "rb") as source:
+        magic = source.read(len(_ZSTD_MAGIC))
+    if magic.startswith(_GZIP_MAGIC):
+        return COMPRESSION_GZIP
+    if magic == _ZSTD_MAGIC:
+        return COMPRESSION_ZSTD
+    return None
+
+
+def decompressed_chunks(
+    path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_buffered_chunks: int = DEFAULT_MAX_BUFFERED_CHUNKS,
+) -> Iterator[bytes]:
+    """
+    Descomprime un archivo gzip o zstd en un hilo y entrega los bloques.
+
+    El hilo se detiene si el consumidor deja de iterar (por ejemplo, por un
+    error de parseo) y sus errores se relanzan en el consumidor.
+
+    Args:
+        path: Ruta del archivo comprimido
+        chunk_size: Tamaño aproximado de cada bloque descomprimido
+        max_buffered_chunks: Bloques descomprimidos en espera como máximo
+
+    Yields:
+        Bloques de bytes descomprimidos, en orden
+
+    Raises:
+        InvalidRosterError: Si el archivo no está comprimido, está dañado o
+            es zstd y el paquete ``zstandard`` no está instalado
+    """
+    compression = detect_compression(path)
+    if compression is None:
+        raise InvalidRosterError(f"El archivo no está comprimido: {path}")
+    if compression == COMPRESSION_ZSTD and zstandard is None:
+        raise InvalidRosterError(
+            "Leer rosters zstd requiere el paquete opcional 'zstandard'"
+        )
+
+    chunks: "queue.Queue[Union[bytes, _End, BaseException]]" = queue.Queue(
+        max_buffered_chunks
+    )
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            with open(path, "rb") as source:
+                if compression == COMPRESSION_GZIP:
+                    pieces = _gzip_pieces(source, chunk_size)
+                else:
+                    pieces = _zstd_pieces(source, chunk_size)
+                for piece in pieces:
+                    if not _put(chunks, piece, stop):
+                        return
+            _put(chunks, _END, stop)
+        except BaseException as e:  # se relanza en el consumidor
+            _put(chunks, e, stop)
+
+    producer = threading.Thread(target=produce, name="roster-decompress", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = chunks.get()
+            if isinstance(item, _End):
+                return
+            if isinstance(item, BaseException):
+                if isinstance(item, zlib.error) or _is_zstd_error(item):
+                    raise InvalidRosterError(f"Archivo comprimido dañado: {item}") from item
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _gzip_pieces(source: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Descomprime gzip (uno o más miembros) en bloques."""
+    decompressor = zlib.decompressobj(_GZIP_WBITS)
+    member_open = False
+    while True:
+        data = source.read(chunk_size)
+        if not data:
+            break
+        while data:
+            member_open = True
+            # max_length acota cada bloque; el resto queda en unconsumed_tail
+            piece = decompressor.decompress(data, chunk_size)
+            if piece:
+                yield piece
+            data = decompressor.unconsumed_tail
+            if decompressor.eof:
+                # Lo que sigue es otro miembro (gzip concatenado) o relleno
+                member_open = False
+                data = decompressor.unused_data.lstrip(b"\x00")
+                decompressor = zlib.decompressobj(_GZIP_WBITS)
+    if member_open:
+        # Salida que quedó en el descompresor al acotar max_length
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+        if not decompressor.eof:
+            raise zlib.error("el archivo gzip está truncado")
+
+
+def _zstd_pieces(source: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Descomprime zstd (uno o más frames) en bloques."""
+    reader = zstandard.ZstdDecompressor().stream_reader(source, read_across_frames=True)
+    with reader:
+        while True:
+            piece = reader.read(chunk_size)
+            if not piece:
+                return
+            yield piece
+
+
+def _is_zstd_error(error: BaseException) -> bool:
+    """Indica si el error proviene de zstandard."""
+    return zstandard is not None and isinstance(error, zstandard.ZstdError)
+
+
+def _put(
+    chunks: "queue.Queue[Union[bytes, _End, BaseException]]",
+    item: Union[bytes, _End, BaseException],
+    stop: threading.Event,
+) -> bool:
+    """Encola un elemento salvo que el consumidor haya terminado."""
+    while not stop.is_set():
+        try:
+            chunks.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
@@ -0,0 +1,463 @@
+"""Configuración de cursos y su snapshot binario precompilado.
+
+Cada curso define los pesos de sus evaluaciones y los votos de los
+profesores del año. Al cargarla, los pesos se validan (positivos, suman
+100%) y los votos se resuelven en un solo indicador: si el curso puede
+asignar puntos extra (ExtraPointsPolicy). Con muchos cursos, leer y validar
+los archivos en cada inicio domina el arranque, por lo que la configuración
+ya validada se guarda en un snapshot binario que los inicios siguientes
+mapean en memoria sin volver a validar.
+
+Formato de los archivos de configuración (CSV, una fila por curso; la
+cabecera y las líneas vacías o con ``#`` se ignoran; pesos y votos
+separados por ``;``):
+
+    course_id,weights,teacher_votes
+    CS101,30;30;40,s;s;s
+
+Formato del snapshot (little-endian):
+
+    Cabecera (48 bytes): magic ``GRCFG001``, versión (uint32), reservado
+    (uint32), huella de las fuentes (16 bytes), cursos n, pesos m y bytes de
+    identificadores (uint64).
+
+    Secciones, en este orden y contiguas:
+        id_offsets            int64[n+1]
+        weight_offsets        int64[n+1]
+        weights               float64[m]
+        extra_points_allowed  int8[n]
+        ids                   UTF-8
+
+Los cursos se guardan ordenados por course_id: una consulta es una búsqueda
+binaria sobre la tabla de identificadores y abrir el snapshot no decodifica
+ningún identificador. La huella combina la versión del formato con el
+contenido de cada archivo fuente y de los módulos que deciden qué es una
+configuración válida (constantes, evaluaciones, esquema de pesos, política
+de puntos extra y este parser); si alguno cambia, el snapshot se descarta y
+se regenera desde las fuentes. Se usa el contenido y no el tamaño y la
+fecha de modificación, que no cambian en una edición del mismo largo dentro
+de la resolución del reloj del sistema de archivos o al restaurar un
+archivo con su fecha original.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from src import constants
+from src.batch.binary_format import StringTable, column_bytes, column_view, pack_strings
+from src.exceptions import GradeCalculatorError, InvalidCourseConfigError
+from src.models import evaluation, weight_scheme
+from src.models.weight_scheme import WeightScheme
+from src.policies import extra_points_policy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+COURSE_CONFIG_HEADER = "course_id,weights,teacher_votes"
+SNAPSHOT_MAGIC = b"GRCFG001"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<8sII16sQQQ")
+SNAPSHOT_SUFFIX = ".gcfg"
+_COURSE_CONFIG_FIELDS = 3
+_VOTES = {"s": True, "n": False}
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+class CourseConfig(NamedTuple):
+    """Configuración validada de un curso."""
+
+    course_id: str
+    weights: Tuple[float, ...]
+    extra_points_allowed: bool
+
+    @property
+    def scheme(self) -> WeightScheme:
+        """Esquema de pesos compartido del curso."""
+        return WeightScheme.intern(self.weights)
+
+
+class CourseCatalog(Mapping[str, CourseConfig]):
+    """
+    Configuraciones de cursos ordenadas por course_id.
+
+    Las columnas pueden ser arreglos en memoria (recién compiladas desde las
+    fuentes) o vistas sobre un snapshot mapeado en memoria; en ambos casos
+    una consulta solo decodifica los identificadores de la búsqueda binaria.
+    """
+
+    def __init__(
+        self,
+        course_ids: Sequence[str],
+        weight_offsets: Sequence[int],
+        weights: Sequence[float],
+        extra_points_allowed: Sequence[int],
+        from_snapshot: bool = False,
+        backing: Optional[mmap.mmap] = None,
+        buffer: Optional[memoryview] = None,
+    ) -> None:
+        """
+        Inicializa el catálogo.
+
+        Args:
+            course_ids: Identificadores ordenados
+            weight_offsets: Inicio de los pesos de cada curso (n+1 elementos)
+            weights: Pesos de todos los cursos, concatenados
+            extra_points_allowed: 1 si el curso puede asignar puntos extra
+            from_snapshot: Si las columnas provienen de un snapshot
+            backing: Archivo mapeado que respalda las columnas, si lo hay
+            buffer: Vista completa del archivo mapeado, si lo hay
+        """
+        self._course_ids = course_ids
+        self._weight_offsets = weight_offsets
+        self._weights = weights
+        self._extra_points_allowed = extra_points_allowed
+        self._backing = backing
+        self._buffer = buffer
+        self.from_snapshot = from_snapshot
+
+    def __len__(self) -> int:
+        """Cantidad de cursos."""
+        return len(self._course_ids)
+
+    def __iter__(self) -> Iterator[str]:
+        """Itera los course_id en orden."""
+        return iter(self._course_ids)
+
+    def __getitem__(self, course_id: str) -> CourseConfig:
+        """
+        Retorna la configuración de un curso.
+
+        Raises:
+            KeyError: Si el curso no existe
+        """
+        index = bisect_left(self._course_ids, course_id)
+        if index == len(self._course_ids) or self._course_ids[index] != course_id:
+            raise KeyError(course_id)
+        start = self._weight_offsets[index]
+        end = self._weight_offsets[index + 1]
+        return CourseConfig(
+            course_id,
+            tuple(self._weights[start:end]),
+            bool(self._extra_points_allowed[index]),
+        )
+
+    def close(self) -> None:
+        """Libera el snapshot mapeado, si lo hay."""
+        if self._backing is None or self._backing.closed:
+            return
+        for column in (self._weight_offsets, self._weights, self._extra_points_allowed):
+            if isinstance(column, memoryview):
+                column.release()
+        if isinstance(self._course_ids, StringTable):
+            self._course_ids.release()
+        if self._buffer is not None:
+            self._buffer.release()
+        self._backing.close()
+
+    def __enter__(self) -> "CourseCatalog":
+        """Permite usar el catálogo como context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Libera el snapshot al salir del bloque ``with``."""
+        self.close()
+
+
+def load_course_configs(
+    sources: Sequence[str], snapshot_path: Optional[str] = None
+) -> CourseCatalog:
+    """
+    Carga las configuraciones desde el snapshot o, si no está vigente, desde las fuentes.
+
+    Al compilar desde las fuentes se escribe un snapshot nuevo para los
+    inicios siguientes; si no se puede escribir (por ejemplo, un directorio
+    de solo lectura), el catálogo se usa igual.
+
+    Args:
+        sources: Archivos de configuración de cursos
+        snapshot_path: Ruta del snapshot (por defecto junto a la primera fuente)
+
+    Returns:
+        Catálogo de cursos; ``from_snapshot`` indica si se reutilizó el snapshot
+
+    Raises:
+        InvalidCourseConfigError: Si alguna fuente tiene un curso inválido
+            o repetido
+    """
+    if snapshot_path is None:
+        snapshot_path = default_snapshot_path(sources[0])
+    fingerprint = sources_fingerprint(sources)
+    catalog = open_snapshot(snapshot_path, fingerprint)
+    if catalog is not None:
+        return catalog
+
+    catalog = compile_course_configs(sources)
+    try:
+        write_snapshot(catalog, snapshot_path, fingerprint)
+    except OSError:
+        pass  # el snapshot es solo un caché
+    return catalog
+
+
+def compile_course_configs(sources: Sequence[str]) -> CourseCatalog:
+    """
+    Lee, valida y ordena las configuraciones de los archivos fuente.
+
+    Args:
+        sources: Archivos de configuración de cursos
+
+    Returns:
+        Catálogo en memoria
+
+    Raises:
+        InvalidCourseConfigError: Si algún curso es inválido o está repetido
+    """
+    courses: Dict[str, CourseConfig] = {}
+    for path in sources:
+        for config in read_course_configs(path):
+            if config.course_id in courses:
+                raise InvalidCourseConfigError(
+                    f"Curso repetido: {config.course_id} ({path})"
+                )
+            courses[config.course_id] = config
+
+    course_ids = sorted(courses)
+    weight_offsets = array("q", [0])
+    weights = array("d")
+    extra_points_allowed = array("b")
+    for course_id in course_ids:
+        config = courses[course_id]
+        weights.extend(config.weights)
+        weight_offsets.append(len(weights))
+        extra_points_allowed.append(config.extra_points_allowed)
+    return CourseCatalog(course_ids, weight_offsets, weights, extra_points_allowed)
+
+
+def read_course_configs(path: str) -> Iterator[CourseConfig]:
+    """
+    Lee y valida un archivo de configuración de cursos fila por fila.
+
+    Args:
+        path: Ruta del archivo CSV
+
+    Yields:
+        Configuraciones en el orden del archivo
+
+    Raises:
+        InvalidCourseConfigError: Si alguna fila tiene un formato inválido
+    """
+    with open(path, "r", encoding="utf-8") as config_file:
+        for line_number, line in enumerate(config_file, start=1):
+            stripped = line.strip()
+            if (
+                not stripped
+                or stripped.startswith("#")
+                or stripped.startswith("course_id,")
+            ):
+                continue
+            yield parse_course_config_line(stripped, line_number)
+
+
+def parse_course_config_line(line: str, line_number: int = 0) -> CourseConfig:
+    """
+    Convierte y valida una fila del archivo de configuración de cursos.
+
+    Args:
+        line: Fila del archivo
+        line_number: Número de línea (para mensajes de error)
+
+    Returns:
+        Configuración del curso
+
+    Raises:
+        InvalidCourseConfigError: Si la fila tiene un formato inválido, los
+            pesos no son válidos o algún voto no es ``s`` o ``n``
+    """
+    fields = line.rstrip("\r\n").split(",")
+    if len(fields) != _COURSE_CONFIG_FIELDS:
+        raise InvalidCourseConfigError(
+            f"Línea {line_number}: se esperaban {_COURSE_CONFIG_FIELDS} campos. "
+            f"Campos recibidos: {len(fields)}"
+        )
+    course_id, weights_field, votes_field = (field.strip() for field in fields)
+    if not course_id:
+        raise InvalidCourseConfigError(f"Línea {line_number}: falta el course_id")
+    try:
+        weights = tuple(float(weight) for weight in weights_field.split(";"))
+    except ValueError as e:
+        raise InvalidCourseConfigError(f"Línea {line_number}: {e}") from e
+    try:
+        WeightScheme(weights).raise_error()
+    except GradeCalculatorError as e:
+        raise InvalidCourseConfigError(f"Línea {line_number}: {e}") from e
+
+    votes: List[bool] = []
+    for vote in filter(None, (vote.strip().lower() for vote in votes_field.split(";"))):
+        if vote not in _VOTES:
+            raise InvalidCourseConfigError(
+                f"Línea {line_number}: voto inválido {vote!r} (use 's' o 'n')"
+            )
+        votes.append(_VOTES[vote])
+    return CourseConfig(
+        course_id, weights, ExtraPointsPolicy.can_assign_extra_points(votes)
+    )
+
+
+def sources_fingerprint(sources: Sequence[str]) -> bytes:
+    """
+    Calcula la huella que invalida el snapshot.
+
+    Combina la versión del formato con la ruta y el contenido de cada fuente
+    y de cada módulo que valida o resuelve la configuración.
+
+    Args:
+        sources: Archivos de configuración de cursos
+
+    Returns:
+        Huella de 16 bytes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(SNAPSHOT_MAGIC + struct.pack("<I", SNAPSHOT_VERSION))
+    for path in list(sources) + _rule_module_paths():
+        absolute = os.path.abspath(path)
+        digest.update(f"{absolute}\0".encode("utf-8"))
+        digest.update(_content_digest(absolute))
+    return digest.digest()
+
+
+def _rule_module_paths() -> List[str]:
+    """Archivos de los módulos cuyo código decide qué configuración es válida."""
+    modules = (constants, evaluation, weight_scheme, extra_points_policy, sys.modules[__name__])
+    return [module.__file__ or "" for module in modules]
+
+
+def _content_digest(path: str) -> bytes:
+    """Hash del contenido de un archivo, leído por bloques."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def default_snapshot_path(source_path: str) -> str:
+    """
+    Retorna la ruta de snapshot asociada a un archivo de configuración.
+
+    Args:
+        source_path: Ruta del archivo de configuración
+
+    Returns:
+        Ruta del snapshot
+    """
+    return source_path + SNAPSHOT_SUFFIX
+
+
+def write_snapshot(catalog: CourseCatalog, path: str, fingerprint: bytes) -> None:
+    """
+    Escribe el snapshot de forma atómica (archivo temporal único en el mismo
+    directorio y os.replace), por lo que dos procesos que lo regeneran a la
+    vez no se pisan el archivo temporal.
+
+    Args:
+        catalog: Catálogo a guardar
+        path: Ruta del snapshot
+        fingerprint: Huella de las fuentes (sources_fingerprint)
+    """
+    course_ids = list(catalog)
+    id_offsets, id_data = pack_strings(course_ids)
+    weight_offsets = array("q", [0])
+    weights = array("d")
+    extra_points_allowed = array("b")
+    for course_id in course_ids:
+        config = catalog[course_id]
+        weights.extend(config.weights)
+        weight_offsets.append(len(weights))
+        extra_points_allowed.append(config.extra_points_allowed)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as output:
+            output.write(
+                SNAPSHOT_HEADER.pack(
+                    SNAPSHOT_MAGIC,
+                    SNAPSHOT_VERSION,
+                    0,
+                    fingerprint,
+                    len(course_ids),
+                    len(weights),
+                    len(id_data),
+                )
+            )
+            for section in (id_offsets, weight_offsets, weights, extra_points_allowed):
+                output.write(column_bytes(section))
+            output.write(id_data)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def open_snapshot(path: str, fingerprint: bytes) -> Optional[CourseCatalog]:
+    """
+    Abre un snapshot mapeándolo en memoria si sigue vigente.
+
+    Args:
+        path: Ruta del snapshot
+        fingerprint: Huella actual de las fuentes
+
+    Returns:
+        Catálogo respaldado por el snapshot, o None si no existe, tiene otra
+        versión, está dañado o su huella no coincide
+    """
+    try:
+        with open(path, "rb") as snapshot_file:
+            size = os.fstat(snapshot_file.fileno()).st_size
+            if size < SNAPSHOT_HEADER.size:
+                return None
+            backing = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        return None
+
+    magic, version, _, stored, courses, weight_count, id_bytes = (
+        SNAPSHOT_HEADER.unpack_from(backing)
+    )
+    expected_size = SNAPSHOT_HEADER.size + 8 * (2 * (courses + 1) + weight_count)
+    expected_size += courses + id_bytes
+    if (
+        magic != SNAPSHOT_MAGIC
+        or version != SNAPSHOT_VERSION
+        or stored != fingerprint
+        or size != expected_size
+    ):
+        backing.close()
+        return None
+
+    buffer = memoryview(backing)
+    position = SNAPSHOT_HEADER.size
+    id_offsets = column_view(buffer, position, "q", courses + 1)
+    position += 8 * (courses + 1)
+    weight_offsets = column_view(buffer, position, "q", courses + 1)
+    position += 8 * (courses + 1)
+    weights = column_view(buffer, position, "d", weight_count)
+    position += 8 * weight_count
+    extra_points_allowed = column_view(buffer, position, "b", courses)
+    position += courses
+    course_ids = StringTable(id_offsets, buffer[position : position + id_bytes])
+    return CourseCatalog(
+        course_ids,
+        weight_offsets,
+        weights,
+        extra_points_allowed,
+        from_snapshot=True,
+        backing=backing,
+        buffer=buffer,
+    )
@@ -0,0 +1,516 @@
+"""Promedios acumulados ponderados por créditos, por estudiante y por ciclo.
+
+Combina las notas finales de cada curso (calculadas con GradeCalculator) en
+el promedio ponderado por créditos de cada ciclo y el promedio acumulado de
+cada estudiante. Las sumas se mantienen al día: cambiar, agregar o quitar la
+nota de un curso ajusta solo las sumas de ese estudiante, sin recalcular su
+historial.
+
+Los créditos y las notas se guardan como enteros en centésimas (las notas
+finales ya vienen redondeadas a 2 decimales), de modo que las sumas son
+exactas y no acumulan error de punto flotante tras millones de cambios.
+
+Formato del archivo de notas por curso (CSV, una fila por estudiante, ciclo y
+curso; la cabecera y las líneas vacías o con ``#`` se ignoran):
+
+    student_id,term,course_id,credits,final_grade
+"""
+
+import math
+from array import array
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+from src.constants import MAX_GRADE, MIN_GRADE
+from src.exceptions import InvalidCourseGradeError
+from src.models.grade_result import RESULT_DECIMALS
+
+COURSE_GRADES_HEADER = "student_id,term,course_id,credits,final_grade"
+AVERAGES_HEADER = "student_id,term,credits,average"
+CUMULATIVE_TERM = "total"
+_COURSE_GRADE_FIELDS = 5
+_SCALE = 100
+# Bits del índice de curso dentro de la clave (ciclo, curso)
+_COURSE_BITS = 32
+# Créditos máximos de un curso: con hasta 2**_COURSE_BITS cursos por ciclo,
+# la suma de créditos × nota en centésimas de un ciclo cabe en int64
+MAX_COURSE_CREDITS = 1000.0
+
+
+class CourseGrade(NamedTuple):
+    """Nota final de un estudiante en un curso de un ciclo."""
+
+    student_id: str
+    term: str
+    course_id: str
+    credits: float
+    final_grade: float
+
+
+class TermAverage(NamedTuple):
+    """Promedio ponderado de un estudiante en un ciclo."""
+
+    term: str
+    credits: float
+    average: float
+
+
+class StudentAverages(NamedTuple):
+    """Promedio acumulado y por ciclo de un estudiante."""
+
+    student_id: str
+    credits: float
+    average: float
+    terms: List[TermAverage]
+
+
+class _StudentLedger:
+    """Cursos y sumas ponderadas de un estudiante (en centésimas)."""
+
+    __slots__ = (
+        "keys",
+        "credits",
+        "grades",
+        "term_credits",
+        "term_points",
+        "total_credits",
+        "total_points",
+    )
+
+    def __init__(self) -> None:
+        """Inicializa el estudiante sin cursos."""
+        self.keys = array("q")
+        self.credits = array("q")
+        self.grades = array("q")
+        self.term_credits = array("q")
+        self.term_points = array("q")
+        self.total_credits = 0
+        self.total_points = 0
+
+    def apply(self, term_index: int, credits: int, points: int) -> None:
+        """Suma (o resta, con valores negativos) una contribución."""
+        if term_index >= len(self.term_credits):
+            missing = term_index + 1 - len(self.term_credits)
+            self.term_credits.extend([0] * missing)
+            self.term_points.extend([0] * missing)
+        self.term_credits[term_index] += credits
+        self.term_points[term_index] += points
+        self.total_credits += credits
+        self.total_points += points
+
+    def find(self, key: int) -> int:
+        """Posición del curso en el estudiante, o -1 si no lo tiene."""
+        try:
+            return self.keys.index(key)
+        except ValueError:
+            return -1
+
+
+class CumulativeAggregator:
+    """
+    Promedios ponderados por créditos de cada estudiante, por ciclo y total.
+
+    set_grade y remove_grade actualizan las sumas en tiempo constante respecto
+    a la cantidad de estudiantes (buscar el curso recorre solo los cursos del
+    estudiante, con array.index en C).
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el agregador vacío."""
+        self._students: Dict[str, _StudentLedger] = {}
+        self._term_index: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._course_index: Dict[str, int] = {}
+
+    @staticmethod
+    def build(grades: Iterable[CourseGrade]) -> "CumulativeAggregator":
+        """
+        Construye los promedios de todos los estudiantes en una sola pasada.
+
+        Las filas consecutivas de un mismo estudiante se agrupan y se
+        incorporan juntas, sin buscar cada curso en el estudiante. Si una
+        fila repite un curso, la última reemplaza a las anteriores, igual que
+        con set_grade.
+
+        Args:
+            grades: Notas por curso (por ejemplo, read_course_grades)
+
+        Returns:
+            Agregador con los promedios de todos los estudiantes
+
+        Raises:
+            InvalidCourseGradeError: Si alguna nota o créditos son inválidos
+        """
+        aggregator = CumulativeAggregator()
+        intern_term = aggregator._intern_term
+        intern_course = aggregator._intern_course
+        current_id: Optional[str] = None
+        pending: Dict[int, Tuple[int, int]] = {}
+        for student_id, term, course_id, credits, final_grade in grades:
+            if student_id != current_id:
+                if pending:
+                    aggregator._merge(current_id, pending)
+                    pending = {}
+                current_id = student_id
+            key = (intern_term(term) << _COURSE_BITS) | intern_course(course_id)
+            pending[key] = _scaled(credits, final_grade)
+        if pending:
+            aggregator._merge(current_id, pending)
+        return aggregator
+
+    def set_grade(
+        self,
+        student_id: str,
+        term: str,
+        course_id: str,
+        credits: float,
+        final_grade: float,
+    ) -> None:
+        """
+        Registra o reemplaza la nota final de un curso y ajusta los promedios.
+
+        Args:
+            student_id: Identificador del estudiante
+            term: Ciclo del curso
+            course_id: Identificador del curso
+            credits: Créditos del curso (positivos)
+            final_grade: Nota final del curso
+
+        Raises:
+            InvalidCourseGradeError: Si los créditos no son positivos o la nota
+                está fuera de rango
+        """
+        scaled_credits, scaled_grade = _scaled(credits, final_grade)
+        key = (self._intern_term(term) << _COURSE_BITS) | self._intern_course(
+            course_id
+        )
+        ledger = self._students.get(student_id)
+        if ledger is None:
+            ledger = self._students[student_id] = _StudentLedger()
+        self._set_scaled(ledger, key, scaled_credits, scaled_grade)
+
+    def add_result(
+        self,
+        student_id: str,
+        term: str,
+        course_id: str,
+        credits: float,
+        result: Mapping[str, float],
+    ) -> None:
+        """
+        Registra el resultado de GradeCalculator para un curso.
+
+        Args:
+            student_id: Identificador del estudiante
+            term: Ciclo del curso
+            course_id: Identificador del curso
+            credits: Créditos del curso
+            result: Resultado de calculate_final_grade (o un GradeResult)
+        """
+        self.set_grade(student_id, term, course_id, credits, result["final_grade"])
+
+    def remove_grade(self, student_id: str, term: str, course_id: str) -> bool:
+        """
+        Quita la nota de un curso y ajusta los promedios.
+
+        Args:
+            student_id: Identificador del estudiante
+            term: Ciclo del curso
+            course_id: Identificador del curso
+
+        Returns:
+            True si el curso estaba registrado (al quitar su último curso, el
+            estudiante deja de estar registrado)
+        """
+        ledger = self._students.get(student_id)
+        term_index = self._term_index.get(term)
+        course_index = self._course_index.get(course_id)
+        if ledger is None or term_index is None or course_index is None:
+            return False
+        position = ledger.find((term_index << _COURSE_BITS) | course_index)
+        if position < 0:
+            return False
+
+        credits = ledger.credits[position]
+        ledger.apply(term_index, -credits, -credits * ledger.grades[position])
+        # Reemplaza el curso por el último para quitarlo en tiempo constante
+        last = len(ledger.keys) - 1
+        for column in (ledger.keys, ledger.credits, ledger.grades):
+            column[position] = column[last]
+            column.pop()
+        if not ledger.keys:
+            del self._students[student_id]
+        return True
+
+    def average(self, student_id: str) -> Optional[float]:
+        """
+        Retorna el promedio acumulado de un estudiante.
+
+        Args:
+            student_id: Identificador del estudiante
+
+        Returns:
+            Promedio ponderado por créditos, o None si no tiene cursos
+        """
+        ledger = self._students.get(student_id)
+        if ledger is None:
+            return None
+        return _average(ledger.total_credits, ledger.total_points)
+
+    def term_average(self, student_id: str, term: str) -> Optional[float]:
+        """
+        Retorna el promedio de un estudiante en un ciclo.
+
+        Args:
+            student_id: Identificador del estudiante
+            term: Ciclo
+
+        Returns:
+            Promedio ponderado por créditos, o None si no tiene cursos en el ciclo
+        """
+        ledger = self._students.get(student_id)
+        term_index = self._term_index.get(term)
+        if ledger is None or term_index is None or term_index >= len(
+            ledger.term_credits
+        ):
+            return None
+        return _average(ledger.term_credits[term_index], ledger.term_points[term_index])
+
+    def averages(self, student_id: str) -> StudentAverages:
+        """
+        Retorna el promedio acumulado y los promedios por ciclo de un estudiante.
+
+        Args:
+            student_id: Identificador del estudiante
+
+        Returns:
+            Promedios del estudiante, con los ciclos en orden de aparición
+
+        Raises:
+            KeyError: Si el estudiante no tiene cursos registrados
+        """
+        ledger = self._students[student_id]
+        terms = [
+            TermAverage(
+                self._terms[index],
+                credits / _SCALE,
+                _average(credits, ledger.term_points[index]) or 0.0,
+            )
+            for index, credits in enumerate(ledger.term_credits)
+            if credits
+        ]
+        return StudentAverages(
+            student_id,
+            ledger.total_credits / _SCALE,
+            _average(ledger.total_credits, ledger.total_points) or 0.0,
+            terms,
+        )
+
+    def student_ids(self) -> Iterator[str]:
+        """Itera los estudiantes en orden de aparición."""
+        return iter(self._students)
+
+    def __len__(self) -> int:
+        """Cantidad de estudiantes."""
+        return len(self._students)
+
+    def __contains__(self, student_id: object) -> bool:
+        """Indica si el estudiante tiene cursos registrados."""
+        return student_id in self._students
+
+    def _set_scaled(
+        self, ledger: _StudentLedger, key: int, credits: int, grade: int
+    ) -> None:
+        """Registra o reemplaza un curso con créditos y nota en centésimas."""
+        term_index = key >> _COURSE_BITS
+        position = ledger.find(key)
+        if position < 0:
+            ledger.keys.append(key)
+            ledger.credits.append(credits)
+            ledger.grades.append(grade)
+        else:
+            old_credits = ledger.credits[position]
+            ledger.apply(
+                term_index, -old_credits, -old_credits * ledger.grades[position]
+            )
+            ledger.credits[position] = credits
+            ledger.grades[position] = grade
+        ledger.apply(term_index, credits, credits * grade)
+
+    def _merge(self, student_id: str, courses: Dict[int, Tuple[int, int]]) -> None:
+        """Incorpora los cursos de un estudiante agrupados por build."""
+        ledger = self._students.get(student_id)
+        if ledger is not None:
+            # El estudiante ya apareció antes en el archivo
+            for key, (credits, grade) in courses.items():
+                self._set_scaled(ledger, key, credits, grade)
+            return
+
+        ledger = self._students[student_id] = _StudentLedger()
+        values = list(courses.values())
+        ledger.keys = array("q", courses)
+        ledger.credits = array("q", [credits for credits, _ in values])
+        ledger.grades = array("q", [grade for _, grade in values])
+        term_sums: Dict[int, List[int]] = {}
+        for key, (credits, grade) in zip(courses, values):
+            sums = term_sums.get(key >> _COURSE_BITS)
+            if sums is None:
+                sums = term_sums[key >> _COURSE_BITS] = [0, 0]
+            sums[0] += credits
+            sums[1] += credits * grade
+        for term_index, (credits, points) in term_sums.items():
+            ledger.apply(term_index, credits, points)
+
+    def _intern_term(self, term: str) -> int:
+        """Índice del ciclo, asignando uno nuevo si no existe."""
+        index = self._term_index.get(term)
+        if index is None:
+            index = self._term_index[term] = len(self._terms)
+            self._terms.append(term)
+        return index
+
+    def _intern_course(self, course_id: str) -> int:
+        """Índice del curso, asignando uno nuevo si no existe."""
+        index = self._course_index.get(course_id)
+        if index is None:
+            index = self._course_index[course_id] = len(self._course_index)
+        return index
+
+
+def read_course_grades(path: str) -> Iterator[CourseGrade]:
+    """
+    Lee un archivo de notas por curso fila por fila.
+
+    Args:
+        path: Ruta del archivo CSV
+
+    Yields:
+        Notas por curso en el orden del archivo
+
+    Raises:
+        InvalidCourseGradeError: Si alguna fila tiene un formato inválido
+    """
+    with open(path, "r", encoding="utf-8") as grades_file:
+        for line_number, line in enumerate(grades_file, start=1):
+            stripped = line.strip()
+            if (
+                not stripped
+                or stripped.startswith("#")
+                or stripped.startswith("student_id,")
+            ):
+                continue
+            yield parse_course_grade_line(stripped, line_number)
+
+
+def parse_course_grade_line(line: str, line_number: int = 0) -> CourseGrade:
+    """
+    Convierte una fila del archivo de notas por curso.
+
+    Args:
+        line: Fila del archivo
+        line_number: Número de línea (para mensajes de error)
+
+    Returns:
+        Nota por curso
+
+    Raises:
+        InvalidCourseGradeError: Si la fila tiene un formato inválido
+    """
+    fields = line.rstrip("\r\n").split(",")
+    if len(fields) != _COURSE_GRADE_FIELDS:
+        raise InvalidCourseGradeError(
+            f"Línea {line_number}: se esperaban {_COURSE_GRADE_FIELDS} campos. "
+            f"Campos recibidos: {len(fields)}"
+        )
+    student_id, term, course_id, credits, final_grade = fields
+    try:
+        return CourseGrade(
+            student_id.strip(),
+            term.strip(),
+            course_id.strip(),
+            float(credits),
+            float(final_grade),
+        )
+    except ValueError as e:
+        raise InvalidCourseGradeError(f"Línea {line_number}: {e}") from e
+
+
+def write_averages_csv(aggregator: CumulativeAggregator, output: TextIO) -> int:
+    """
+    Escribe los promedios por ciclo y acumulados de cada estudiante.
+
+    Cada estudiante tiene una fila por ciclo y una fila con el ciclo
+    ``total`` para el promedio acumulado.
+
+    Args:
+        aggregator: Agregador con los promedios
+        output: Archivo de texto de salida
+
+    Returns:
+        Cantidad de estudiantes escritos
+    """
+    output.write(AVERAGES_HEADER + "\n")
+    for student_id in aggregator.student_ids():
+        averages = aggregator.averages(student_id)
+        for term in averages.terms:
+            output.write(
+                f"{student_id},{term.term},{term.credits},{term.average}\n"
+            )
+        output.write(
+            f"{student_id},{CUMULATIVE_TERM},{averages.credits},{averages.average}\n"
+        )
+    return len(aggregator)
+
+
+def aggregate_course_grades(input_path: str, output_path: str) -> int:
+    """
+    Calcula los promedios de un archivo de notas por curso en una sola pasada.
+
+    Args:
+        input_path: Archivo de notas por curso
+        output_path: CSV de promedios por ciclo y acumulados
+
+    Returns:
+        Cantidad de estudiantes
+
+    Raises:
+        InvalidCourseGradeError: Si alguna fila es inválida
+    """
+    aggregator = CumulativeAggregator.build(read_course_grades(input_path))
+    with open(output_path, "w", encoding="utf-8", newline="") as output:
+        return write_averages_csv(aggregator, output)
+
+
+def _scaled(credits: float, final_grade: float) -> Tuple[int, int]:
+    """Valida y convierte créditos y nota a centésimas."""
+    if not (
+        math.isfinite(credits)
+        and round(credits * _SCALE) >= 1
+        and credits <= MAX_COURSE_CREDITS
+    ):
+        raise InvalidCourseGradeError(
+            f"Los créditos deben estar entre {1 / _SCALE} y {MAX_COURSE_CREDITS}. "
+            f"Valor recibido: {credits}"
+        )
+    if not MIN_GRADE <= final_grade <= MAX_GRADE:
+        raise InvalidCourseGradeError(
+            f"La nota final debe estar entre {MIN_GRADE} y {MAX_GRADE}. "
+            f"Valor recibido: {final_grade}"
+        )
+    return round(credits * _SCALE), round(final_grade * _SCALE)
+
+
+def _average(credits: int, points: int) -> Optional[float]:
+    """Promedio redondeado a partir de sumas en centésimas."""
+    if credits == 0:
+        return None
+    return round(points / (credits * _SCALE), RESULT_DECIMALS)
@@ -0,0 +1,196 @@
+"""Deduplicación de perfiles de entrada idénticos dentro de un lote."""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Iterator, NamedTuple, Optional, Set, Tuple
+
+from src.batch.batch_grader import BatchGrader, GradedRow
+from src.constants import MIN_ATTENDANCE_PERCENTAGE, MAX_PERCENTAGE, MIN_PERCENTAGE
+from src.models.student_record import StudentRecord
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+class DedupReport(NamedTuple):
+    """Resumen de la deduplicación de un lote."""
+
+    total_rows: int
+    unique_profiles: int
+    evicted_profiles: int = 0
+    recomputed_profiles: int = 0
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Filas por perfil único (1.0 significa que no hubo duplicados)."""
+        if self.unique_profiles == 0:
+            return 1.0
+        return self.total_rows / self.unique_profiles
+
+    @property
+    def calls_saved(self) -> int:
+        """Cantidad de llamadas a GradeCalculator evitadas."""
+        return self.total_rows - self.unique_profiles - self.recomputed_profiles
+
+
+def profile_key(record: StudentRecord) -> Tuple[Hashable, ...]:
+    """
+    Construye la tupla canónica de entrada de un registro.
+
+    Dos registros con la misma tupla producen exactamente el mismo resultado
+    (o el mismo error) en GradeCalculator. Los datos que el cálculo ignora se
+    normalizan para agrupar más perfiles:
+
+    - La tardanza solo importa si no alcanzó la asistencia mínima, y dentro
+      del rango válido solo importa si supera el umbral de penalización.
+    - Los votos solo importan a través del acuerdo unánime de profesores.
+    - Los puntos extra solo importan si los profesores están de acuerdo.
+
+    Args:
+        record: Registro del estudiante
+
+    Returns:
+        Tupla canónica (hashable) del perfil
+    """
+    tardiness_key: Hashable = None
+    if not record.has_reached_minimum:
+        tardiness = record.tardiness_percentage
+        if MIN_PERCENTAGE <= tardiness <= MAX_PERCENTAGE:
+            tardiness_key = tardiness >= (MIN_ATTENDANCE_PERCENTAGE * 100)
+        else:
+            # Fuera de rango: se conserva el valor para reproducir el error exacto
+            tardiness_key = ("invalid", tardiness)
+
+    can_assign = ExtraPointsPolicy.can_assign_extra_points(
+        list(record.all_years_teachers)
+    )
+    extra_key: Optional[float] = record.extra_points if can_assign else None
+
+    return (
+        record.grades,
+        record.weights,
+        record.has_reached_minimum,
+        tardiness_key,
+        can_assign,
+        extra_key,
+    )
+
+
+class ProfileDeduplicator:
+    """
+    Calcula la nota final una sola vez por perfil de entrada único.
+
+    Agrupa los registros por su tupla canónica (ver profile_key), llama a
+    GradeCalculator una vez por perfil y reparte el resultado a cada
+    estudiante con el mismo perfil, manteniendo el orden de entrada.
+
+    Con max_profiles la caché se limita a esa cantidad de perfiles y se
+    descarta el usado hace más tiempo: la memoria queda acotada y un perfil
+    descartado solo se vuelve a calcular si reaparece. Para que el reporte
+    distinga esos recálculos de los perfiles nuevos, se recuerda el hash de
+    cada perfil descartado (un entero, frente al resultado completo).
+    """
+
+    def __init__(self, max_profiles: Optional[int] = None) -> None:
+        """
+        Inicializa el deduplicador con la caché de perfiles vacía.
+
+        Args:
+            max_profiles: Perfiles retenidos como máximo (None para no limitar)
+        """
+        if max_profiles is not None and max_profiles < 1:
+            raise ValueError("max_profiles debe ser al menos 1")
+        self._profiles: Dict[Tuple[Hashable, ...], GradedRow] = (
+            {} if max_profiles is None else OrderedDict()
+        )
+        self._max_profiles = max_profiles
+        self._total_rows = 0
+        self._computed_profiles = 0
+        self._evicted_profiles = 0
+        self._recomputed_profiles = 0
+        self._evicted_hashes: Set[int] = set()
+
+    def grade(self, records: Iterable[StudentRecord]) -> Iterator[GradedRow]:
+        """
+        Calcula la nota final de cada registro reutilizando perfiles repetidos.
+
+        Args:
+            records: Registros de estudiantes
+
+        Yields:
+            Un GradedRow por registro, en el mismo orden de entrada
+        """
+        for record in records:
+            yield self.grade_one(record)
+
+    def grade_one(self, record: StudentRecord) -> GradedRow:
+        """
+        Calcula la nota final de un registro reutilizando su perfil si existe.
+
+        Args:
+            record: Registro del estudiante
+
+        Returns:
+            GradedRow con el resultado o el mensaje de error
+        """
+        self._total_rows += 1
+        key = profile_key(record)
+        cached = self._profiles.get(key)
+        if cached is None:
+            cached = BatchGrader.grade_one(record)
+            self._computed_profiles += 1
+            if self._max_profiles is not None:
+                if self._evicted_hashes and hash(key) in self._evicted_hashes:
+                    self._recomputed_profiles += 1
+                if len(self._profiles) >= self._max_profiles:
+                    evicted, _ = self._profiles.popitem(last=False)  # type: ignore[call-arg]
+                    self._evicted_hashes.add(hash(evicted))
+                    self._evicted_profiles += 1
+            self._profiles[key] = cached
+        elif self._max_profiles is not None:
+            self._profiles.move_to_end(key)  # type: ignore[attr-defined]
+
+        # GradeResult no se modifica, por lo que se comparte entre filas
+        return GradedRow(record.student_id, cached.result, cached.error)
+
+    def counters(self) -> Dict[str, int]:
+        """
+        Serializa los contadores del deduplicador (no la caché de perfiles).
+
+        Returns:
+            Diccionario serializable en JSON
+        """
+        return {
+            "total_rows": self._total_rows,
+            "computed_profiles": self._computed_profiles,
+            "evicted_profiles": self._evicted_profiles,
+            "recomputed_profiles": self._recomputed_profiles,
+        }
+
+    def restore_counters(self, state: Dict[str, int]) -> None:
+        """
+        Restaura los contadores serializados con counters().
+
+        La caché y los hashes de perfiles descartados no se restauran: los
+        perfiles vistos antes se vuelven a calcular (y a contar como únicos)
+        si reaparecen.
+
+        Args:
+            state: Contadores serializados
+        """
+        self._total_rows = state["total_rows"]
+        self._computed_profiles = state["computed_profiles"]
+        self._evicted_profiles = state["evicted_profiles"]
+        self._recomputed_profiles = state.get("recomputed_profiles", 0)
+
+    def report(self) -> DedupReport:
+        """
+        Retorna el resumen de la deduplicación hasta el momento.
+
+        Returns:
+            DedupReport con filas totales, perfiles únicos, descartados y
+            recalculados tras descartarse
+        """
+        return DedupReport(
+            self._total_rows,
+            self._computed_profiles - self._recomputed_profiles,
+            self._evicted_profiles,
+            self._recomputed_profiles,
+        )
@@ -0,0 +1,296 @@
+"""Pruebas diferenciales de los motores de cálculo contra la referencia.
+
+Cada motor rápido (deduplicación, hilos, procesos, columnar, asíncrono,
+esquemas de pesos internados) debe producir exactamente lo mismo que
+GradeCalculator.calculate_final_grade con objetos Evaluation. Este módulo:
+
+- Genera corpus reproducibles: casos límite (pesos en el borde de
+  WEIGHT_TOLERANCE, tardanzas en el umbral del 40%, notas en MAX_GRADE,
+  puntos extra que superan el máximo, cantidad de evaluaciones en
+  MAX_EVALUATIONS, valores fuera de rango) y registros aleatorios con una
+  semilla, de modo que cualquier diferencia se reproduce con la misma semilla.
+- Ejecuta el corpus en cada motor, compara fila por fila (resultado
+  redondeado o mensaje de error) y mide el tiempo de cada uno.
+
+Ver benchmarks/differential.py para ejecutarlo desde la línea de comandos.
+"""
+
+import asyncio
+import itertools
+import random
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from src.batch.batch_grader import BatchGrader, GradedRow
+from src.batch.deduplication import ProfileDeduplicator
+from src.batch.parallel import grade_batch_processes, grade_batch_threaded
+from src.calculator.async_calculator import AsyncGradeCalculator
+from src.calculator.grade_calculator import GradeCalculator
+from src.constants import (
+    EXPECTED_WEIGHT_SUM,
+    MAX_EVALUATIONS,
+    MAX_GRADE,
+    MAX_PERCENTAGE,
+    MIN_ATTENDANCE_PERCENTAGE,
+    MIN_GRADE,
+    MIN_PERCENTAGE,
+    WEIGHT_TOLERANCE,
+)
+from src.exceptions import GradeCalculatorError
+from src.models.evaluation import Evaluation
+from src.models.student_record import StudentRecord
+
+Engine = Callable[[Sequence[StudentRecord]], List[GradedRow]]
+
+
+class Mismatch(NamedTuple):
+    """Fila en la que un motor difiere de la referencia."""
+
+    index: int
+    student_id: str
+    expected: str
+    actual: str
+
+
+class EngineRun(NamedTuple):
+    """Resultado de ejecutar el corpus en un motor."""
+
+    engine: str
+    rows: int
+    seconds: float
+    mismatches: List[Mismatch]
+
+    @property
+    def rows_per_second(self) -> float:
+        """Filas procesadas por segundo."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class DifferentialReport(NamedTuple):
+    """Comparación de todos los motores contra la referencia."""
+
+    rows: int
+    reference_seconds: float
+    runs: List[EngineRun]
+
+    @property
+    def total_mismatches(self) -> int:
+        """Cantidad total de filas distintas en todos los motores."""
+        return sum(len(run.mismatches) for run in self.runs)
+
+    def speedup(self, run: EngineRun) -> float:
+        """
+        Velocidad de un motor relativa a la referencia.
+
+        Args:
+            run: Ejecución de un motor
+
+        Returns:
+            Tiempo de la referencia dividido por el del motor
+        """
+        return self.reference_seconds / run.seconds if run.seconds else 0.0
+
+
+def reference_grade(record: StudentRecord) -> GradedRow:
+    """
+    Calcula un registro con la implementación de referencia.
+
+    Args:
+        record: Registro del estudiante
+
+    Returns:
+        GradedRow con el diccionario de calculate_final_grade o el error
+    """
+    try:
+        evaluations = [
+            Evaluation(grade, weight)
+            for grade, weight in zip(record.grades, record.weights)
+        ]
+        result = GradeCalculator.calculate_final_grade(
+            evaluations,
+            record.has_reached_minimum,
+            record.tardiness_percentage,
+            list(record.all_years_teachers),
+            record.extra_points,
+        )
+        return GradedRow(record.student_id, result, None)
+    except GradeCalculatorError as e:
+        return GradedRow(record.student_id, None, str(e))
+
+
+def default_engines() -> Dict[str, Engine]:
+    """
+    Motores a comparar contra la referencia.
+
+    Returns:
+        Nombre y función de cada motor
+    """
+    return {
+        "scalar": lambda records: list(BatchGrader.grade(records)),
+        "dedup": lambda records: list(ProfileDeduplicator().grade(records)),
+        "columns": lambda records: list(BatchGrader.grade_columns(records)),
+        "thread": lambda records: grade_batch_threaded(records, chunk_size=256),
+        "process": lambda records: grade_batch_processes(records, chunk_size=4096),
+        "async": lambda records: asyncio.run(
+            AsyncGradeCalculator(inline_threshold=0).acalculate_batch(records)
+        ),
+    }
+
+
+def edge_case_records() -> List[StudentRecord]:
+    """
+    Genera el corpus de casos límite (producto de valores en los bordes).
+
+    Returns:
+        Registros con combinaciones de pesos, tardanzas, notas, votos y
+        puntos extra en los límites de cada regla
+    """
+    threshold = MIN_ATTENDANCE_PERCENTAGE * 100
+    weight_sets = [
+        [EXPECTED_WEIGHT_SUM],
+        [30.0, 30.0, 40.0],
+        [33.33, 33.33, 33.34],
+        [33.33, 33.33, 33.33],
+        [50.0, 50.0 + WEIGHT_TOLERANCE],
+        [50.0, 50.0 - WEIGHT_TOLERANCE],
+        [50.0, 50.0 + 2 * WEIGHT_TOLERANCE],
+        [EXPECTED_WEIGHT_SUM / MAX_EVALUATIONS] * MAX_EVALUATIONS,
+        [EXPECTED_WEIGHT_SUM / (MAX_EVALUATIONS + 1)] * (MAX_EVALUATIONS + 1),
+        [60.0, 40.0, 0.0],
+        [120.0, -20.0],
+        [],
+    ]
+    grade_values = [MIN_GRADE, 10.5, 19.99, MAX_GRADE, MAX_GRADE + 0.01, -0.01]
+    tardiness_values = [
+        MIN_PERCENTAGE,
+        threshold - 0.01,
+        threshold,
+        threshold + 0.01,
+        MAX_PERCENTAGE,
+        MAX_PERCENTAGE + 0.01,
+        MIN_PERCENTAGE - 0.01,
+    ]
+    vote_sets = [[], [True], [True, True, True], [True, False]]
+    extra_values = [0.0, 0.5, 5.0, -1.0]
+
+    records: List[StudentRecord] = []
+    combinations = itertools.product(
+        weight_sets,
+        grade_values,
+        (True, False),
+        tardiness_values,
+        vote_sets,
+        extra_values,
+    )
+    for index, (weights, grade, reached, tardiness, votes, extra) in enumerate(
+        combinations
+    ):
+        # La nota límite va en la última evaluación; el resto varía
+        grades = [(index + position) % 21 * 1.0 for position in range(len(weights))]
+        if grades:
+            grades[-1] = grade
+        records.append(
+            StudentRecord(
+                f"E{index:06d}", grades, weights, reached, tardiness, votes, extra
+            )
+        )
+    return records
+
+
+def random_records(count: int, seed: int = 0) -> List[StudentRecord]:
+    """
+    Genera registros aleatorios reproducibles, incluidos algunos inválidos.
+
+    Args:
+        count: Cantidad de registros
+        seed: Semilla del generador
+
+    Returns:
+        Registros de estudiantes
+    """
+    generator = random.Random(seed)
+    records: List[StudentRecord] = []
+    for index in range(count):
+        size = generator.randint(0, MAX_EVALUATIONS + 1)
+        raw = [generator.randint(1, 20) for _ in range(size)]
+        weights = [round(value * EXPECTED_WEIGHT_SUM / sum(raw), 2) for value in raw]
+        if weights and generator.random() < 0.9:
+            # Corrige el redondeo para que la suma quede en el borde válido
+            weights[-1] = round(EXPECTED_WEIGHT_SUM - sum(weights[:-1]), 2)
+        grades = [
+            round(generator.uniform(MIN_GRADE - 0.5, MAX_GRADE + 0.5), 2)
+            if generator.random() < 0.02
+            else generator.randint(0, 40) / 2
+            for _ in weights
+        ]
+        records.append(
+            StudentRecord(
+                student_id=f"R{index:07d}",
+                grades=grades,
+                weights=weights,
+                has_reached_minimum=generator.random() < 0.5,
+                tardiness_percentage=round(generator.uniform(-1.0, 101.0), 2),
+                all_years_teachers=[
+                    generator.random() < 0.8 for _ in range(generator.randint(0, 4))
+                ],
+                extra_points=generator.choice((0.0, 0.5, 1.0, 2.5, 20.0, -0.5)),
+            )
+        )
+    return records
+
+
+def run_differential(
+    records: Sequence[StudentRecord],
+    engines: Optional[Dict[str, Engine]] = None,
+    max_mismatches: int = 100,
+) -> DifferentialReport:
+    """
+    Ejecuta el corpus en cada motor y lo compara con la referencia.
+
+    Args:
+        records: Corpus de registros
+        engines: Motores a comparar (por defecto, default_engines())
+        max_mismatches: Diferencias a conservar por motor
+
+    Returns:
+        Reporte con tiempos y diferencias de cada motor
+    """
+    engines = engines if engines is not None else default_engines()
+    start = time.perf_counter()
+    expected = [reference_grade(record) for record in records]
+    reference_seconds = time.perf_counter() - start
+
+    runs: List[EngineRun] = []
+    for name, engine in engines.items():
+        start = time.perf_counter()
+        actual = engine(records)
+        seconds = time.perf_counter() - start
+        mismatches = _diff(expected, actual, max_mismatches)
+        runs.append(EngineRun(name, len(records), seconds, mismatches))
+    return DifferentialReport(len(records), reference_seconds, runs)
+
+
+def _diff(
+    expected: Sequence[GradedRow], actual: Sequence[GradedRow], limit: int
+) -> List[Mismatch]:
+    """Compara dos listas de resultados fila por fila."""
+    mismatches: List[Mismatch] = []
+    if len(actual) != len(expected):
+        mismatches.append(
+            Mismatch(-1, "", f"{len(expected)} filas", f"{len(actual)} filas")
+        )
+    for index, (wanted, got) in enumerate(zip(expected, actual)):
+        if _describe(wanted) != _describe(got):
+            mismatches.append(
+                Mismatch(index, wanted.student_id, _describe(wanted), _describe(got))
+            )
+            if len(mismatches) >= limit:
+                break
+    return mismatches
+
+
+def _describe(row: GradedRow) -> str:
+    """Representación comparable de una fila (resultado redondeado o error)."""
+    if row.result is None:
+        return f"{row.student_id} error: {row.error}"
+    return f"{row.student_id} {dict(row.result)}"
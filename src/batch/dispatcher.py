@@ -0,0 +1,270 @@
+"""Selección adaptativa del motor de cálculo por lotes.
+
+Motores disponibles, en orden de complejidad:
+
+- ``scalar``: BatchGrader, un registro tras otro.
+- ``dedup``: ProfileDeduplicator, una llamada por perfil único.
+- ``thread``: grade_batch_threaded (escala solo en builds free-threaded).
+- ``process``: grade_batch_processes (escala siempre, con costo de arranque).
+
+La primera vez que se usa en una máquina, el despachador mide el costo por
+fila de cada motor con rosters sintéticos de varios tamaños y guarda la
+calibración en disco. Luego, para cada lote, estima el costo de cada motor
+según su tamaño y la proporción de perfiles duplicados (medida sobre una
+muestra) y usa el más barato; ante costos similares prefiere el motor más
+simple. La calibración se repite si cambia la máquina o el intérprete.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from src.batch.batch_grader import BatchGrader, GradedRow
+from src.batch.checkpoint import write_json_atomically
+from src.batch.deduplication import ProfileDeduplicator, profile_key
+from src.batch.parallel import grade_batch_processes, grade_batch_threaded
+from src.batch.synthetic import generate_records
+from src.models.student_record import StudentRecord
+
+CALIBRATION_VERSION = 1
+DEFAULT_CALIBRATION_SIZES = (128, 2048, 16384)
+DEFAULT_CALIBRATION_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "cs-gradecalculator", "dispatch.json"
+)
+SHAPE_SAMPLE_SIZE = 512
+# Un motor más complejo solo se elige si es al menos este tanto más rápido
+MIN_SPEEDUP = 1.1
+_MIN_TIMING_SECONDS = 0.02
+
+ENGINE_AUTO = "auto"
+ENGINE_SCALAR = "scalar"
+ENGINE_DEDUP = "dedup"
+ENGINE_THREAD = "thread"
+ENGINE_PROCESS = "process"
+
+_ENGINES: Dict[str, Callable[[Sequence[StudentRecord]], List[GradedRow]]] = {
+    ENGINE_SCALAR: lambda records: list(BatchGrader.grade(records)),
+    ENGINE_DEDUP: lambda records: list(ProfileDeduplicator().grade(records)),
+    ENGINE_THREAD: grade_batch_threaded,
+    ENGINE_PROCESS: grade_batch_processes,
+}
+ENGINES = tuple(_ENGINES)
+
+
+class DispatchDecision(NamedTuple):
+    """Motor elegido para un lote y los datos usados para elegirlo."""
+
+    engine: str
+    rows: int
+    dedup_ratio: float
+    estimated_seconds: Dict[str, float]
+
+
+def machine_fingerprint() -> str:
+    """
+    Identifica la máquina e intérprete para los que vale una calibración.
+
+    Returns:
+        Huella con plataforma, CPU, cantidad de núcleos y versión de Python
+    """
+    gil = getattr(sys, "_is_gil_enabled", None)
+    return "|".join(
+        [
+            platform.platform(),
+            platform.machine(),
+            str(os.cpu_count()),
+            sys.version.split()[0],
+            "gil" if gil is None or gil() else "nogil",
+        ]
+    )
+
+
+def estimate_dedup_ratio(records: Sequence[StudentRecord]) -> float:
+    """
+    Estima filas por perfil único a partir de una muestra del lote.
+
+    Args:
+        records: Registros del lote
+
+    Returns:
+        Filas por perfil único en la muestra (1.0 sin duplicados)
+    """
+    sample = records[:SHAPE_SAMPLE_SIZE]
+    if not sample:
+        return 1.0
+    return len(sample) / len({profile_key(record) for record in sample})
+
+
+class AdaptiveDispatcher:
+    """Enruta cada lote al motor más rápido según la calibración local."""
+
+    def __init__(
+        self,
+        calibration_path: Optional[str] = DEFAULT_CALIBRATION_PATH,
+        sizes: Sequence[int] = DEFAULT_CALIBRATION_SIZES,
+    ) -> None:
+        """
+        Inicializa el despachador (la calibración se carga al primer uso).
+
+        Args:
+            calibration_path: Archivo de caché de la calibración (None la
+                mantiene solo en memoria)
+            sizes: Tamaños de lote usados para calibrar
+        """
+        self._calibration_path = calibration_path
+        self._sizes = tuple(sorted(sizes))
+        self._calibration: Optional[Dict] = None
+        self.last_decision: Optional[DispatchDecision] = None
+
+    @property
+    def calibration(self) -> Dict:
+        """Calibración vigente (se carga de disco o se mide si hace falta)."""
+        if self._calibration is None:
+            self._calibration = self._load() or self.calibrate()
+        return self._calibration
+
+    def calibrate(self) -> Dict:
+        """
+        Mide el costo por fila de cada motor y guarda la calibración.
+
+        Para ``dedup`` se guarda por separado el costo por fila de construir
+        la clave de perfil (``profile_key``) y el costo por perfil único del
+        resto, de modo que su costo se pueda estimar para cualquier
+        proporción de duplicados.
+
+        Returns:
+            Calibración con segundos por fila de cada motor y tamaño
+        """
+        records = generate_records(self._sizes[-1], seed=0)
+        per_row: Dict[str, List[float]] = {engine: [] for engine in ENGINES}
+        per_row["profile_key"] = []
+        for size in self._sizes:
+            sample = records[:size]
+            for engine in ENGINES:
+                if engine != ENGINE_DEDUP:
+                    per_row[engine].append(_time_per_row(_ENGINES[engine], sample))
+            key_seconds = _time_per_row(
+                lambda rows: [profile_key(row) for row in rows], sample
+            )
+            unique = len({profile_key(record) for record in sample})
+            dedup_seconds = _time_per_row(_ENGINES[ENGINE_DEDUP], sample)
+            per_row["profile_key"].append(key_seconds)
+            per_row[ENGINE_DEDUP].append(
+                max(dedup_seconds - key_seconds, 0.0) * size / unique
+            )
+
+        self._calibration = {
+            "version": CALIBRATION_VERSION,
+            "machine": machine_fingerprint(),
+            "sizes": list(self._sizes),
+            "seconds_per_row": per_row,
+        }
+        if self._calibration_path is not None:
+            os.makedirs(os.path.dirname(self._calibration_path) or ".", exist_ok=True)
+            write_json_atomically(self._calibration_path, self._calibration)
+        return self._calibration
+
+    def choose(self, records: Sequence[StudentRecord]) -> DispatchDecision:
+        """
+        Elige el motor más rápido estimado para un lote.
+
+        Args:
+            records: Registros del lote
+
+        Returns:
+            Decisión con el motor y el costo estimado de cada uno
+        """
+        return self.select(len(records), records[:SHAPE_SAMPLE_SIZE])
+
+    def select(self, rows: int, sample: Sequence[StudentRecord]) -> DispatchDecision:
+        """
+        Elige el motor para un lote del que solo se conoce una muestra.
+
+        Permite decidir antes de materializar el lote (p. ej. un roster
+        mapeado en memoria que se calcula en streaming).
+
+        Args:
+            rows: Cantidad de filas del lote
+            sample: Primeros registros del lote (hasta SHAPE_SAMPLE_SIZE)
+
+        Returns:
+            Decisión con el motor y el costo estimado de cada uno
+        """
+        calibration = self.calibration
+        bucket = _size_bucket(calibration["sizes"], rows)
+        per_row = {
+            name: seconds[bucket]
+            for name, seconds in calibration["seconds_per_row"].items()
+        }
+        dedup_ratio = estimate_dedup_ratio(sample)
+
+        estimates = {engine: per_row[engine] * rows for engine in ENGINES}
+        estimates[ENGINE_DEDUP] = rows * (
+            per_row["profile_key"] + per_row[ENGINE_DEDUP] / dedup_ratio
+        )
+        fastest = min(estimates.values())
+        engine = next(
+            name for name in ENGINES if estimates[name] <= fastest * MIN_SPEEDUP
+        )
+        self.last_decision = DispatchDecision(engine, rows, dedup_ratio, estimates)
+        return self.last_decision
+
+    def grade(self, records: Sequence[StudentRecord]) -> List[GradedRow]:
+        """
+        Calcula un lote con el motor elegido (registrado en last_decision).
+
+        Args:
+            records: Registros del lote
+
+        Returns:
+            Un GradedRow por registro, en el orden de entrada
+        """
+        decision = self.choose(records)
+        return _ENGINES[decision.engine](records)
+
+    def _load(self) -> Optional[Dict]:
+        """Lee la calibración en caché si corresponde a esta máquina."""
+        if self._calibration_path is None:
+            return None
+        try:
+            with open(self._calibration_path, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+        except (FileNotFoundError, ValueError):
+            return None
+        if (
+            data.get("version") != CALIBRATION_VERSION
+            or data.get("machine") != machine_fingerprint()
+            or data.get("sizes") != list(self._sizes)
+        ):
+            return None
+        return data
+
+
+def _time_per_row(
+    engine: Callable[[Sequence[StudentRecord]], object],
+    records: Sequence[StudentRecord],
+) -> float:
+    """Mide los segundos por fila de un motor (mejor de varias ejecuciones)."""
+    best = float("inf")
+    total = 0.0
+    runs = 0
+    while runs < 2 or total < _MIN_TIMING_SECONDS:
+        start = time.perf_counter()
+        engine(records)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        runs += 1
+    return best / max(len(records), 1)
+
+
+def _size_bucket(sizes: Sequence[int], rows: int) -> int:
+    """Índice del tamaño calibrado más cercano (en escala logarítmica)."""
+    rows = max(rows, 1)
+    return min(
+        range(len(sizes)),
+        key=lambda index: max(sizes[index], rows) / min(sizes[index], rows),
+    )
@@ -0,0 +1,102 @@
+"""Ordenamiento externo con memoria acotada.
+
+Ordena secuencias que no caben en memoria: los elementos se acumulan hasta
+``max_in_memory``, cada bloque se ordena y se vuelca a un archivo temporal
+(una "corrida"), y al final las corridas se combinan con una mezcla de k vías
+(heapq.merge) que mantiene en memoria solo un lote por corrida. Si la
+secuencia completa cabe en un bloque no se escribe nada en disco.
+
+El orden es estable: elementos con la misma clave conservan su orden de
+entrada, igual que con sorted().
+"""
+
+import heapq
+import pickle
+import tempfile
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional
+
+DEFAULT_MAX_IN_MEMORY = 1_000_000
+# Elementos por lote serializado en cada corrida
+_RUN_BATCH_SIZE = 4096
+
+
+class SortStats:
+    """Contadores de una ejecución de external_sort."""
+
+    __slots__ = ("items", "runs", "spilled_bytes")
+
+    def __init__(self) -> None:
+        """Inicializa los contadores en cero."""
+        self.items = 0
+        self.runs = 0
+        self.spilled_bytes = 0
+
+
+def external_sort(
+    items: Iterable[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    max_in_memory: int = DEFAULT_MAX_IN_MEMORY,
+    directory: Optional[str] = None,
+    stats: Optional[SortStats] = None,
+) -> Iterator[Any]:
+    """
+    Ordena una secuencia arbitrariamente grande con memoria acotada.
+
+    Args:
+        items: Elementos a ordenar (deben poder serializarse con pickle)
+        key: Función de clave, como en sorted()
+        max_in_memory: Elementos ordenados en memoria antes de volcar una corrida
+        directory: Directorio de los archivos temporales (por defecto, el del
+            sistema)
+        stats: Contadores a actualizar (elementos, corridas, bytes volcados)
+
+    Yields:
+        Los elementos en orden
+    """
+    if max_in_memory < 1:
+        raise ValueError("max_in_memory debe ser al menos 1")
+    stats = stats if stats is not None else SortStats()
+    iterator = iter(items)
+    runs: List[IO[bytes]] = []
+    try:
+        while True:
+            chunk = list(islice(iterator, max_in_memory))
+            stats.items += len(chunk)
+            chunk.sort(key=key)
+            if not runs and len(chunk) < max_in_memory:
+                # Todo cupo en memoria
+                yield from chunk
+                return
+            if chunk:
+                runs.append(_spill(chunk, directory, stats))
+            if len(chunk) < max_in_memory:
+                break
+        del chunk
+        yield from heapq.merge(*(_read_run(run) for run in runs), key=key)
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _spill(chunk: List[Any], directory: Optional[str], stats: SortStats) -> IO[bytes]:
+    """Escribe un bloque ordenado en un archivo temporal por lotes."""
+    run = tempfile.TemporaryFile(dir=directory)
+    for start in range(0, len(chunk), _RUN_BATCH_SIZE):
+        pickle.dump(
+            chunk[start : start + _RUN_BATCH_SIZE], run, pickle.HIGHEST_PROTOCOL
+        )
+    stats.runs += 1
+    stats.spilled_bytes += run.tell()
+    run.seek(0)
+    return run
+
+
+def _read_run(run: IO[bytes]) -> Iterator[Any]:
+    """Lee una corrida lote por lote."""
+    while True:
+        try:
+            batch = pickle.load(run)
+        except EOFError:
+            return
+        yield from batch
@@ -0,0 +1,289 @@
+"""Modo watch: califica continuamente eventos agregados a un gradebook.
+
+El LMS exporta las notas publicadas como un log de solo-agregado, una línea
+por evento:
+
+    student_id,evaluation_id,grade,weight
+
+Un evento posterior para la misma evaluación reemplaza la nota anterior.
+El watcher lee solo los bytes nuevos desde el último offset, actualiza el
+estado de los estudiantes afectados y recalcula únicamente sus notas
+finales. El estado se guarda periódicamente en un snapshot, de modo que al
+reiniciar solo se reprocesan los eventos posteriores a ese snapshot.
+
+El log no incluye asistencia ni votos: las notas se calculan asumiendo
+asistencia mínima alcanzada y sin puntos extra.
+
+En Linux, run() espera los cambios del log con inotify: un evento agregado
+se procesa apenas se escribe, sin esperar al siguiente intervalo. En otras
+plataformas (o si inotify no está disponible) el log se lee cada
+``poll_interval`` segundos.
+"""
+
+import ctypes
+import json
+import os
+import select
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.batch.batch_grader import BatchGrader, GradedRow
+from src.batch.checkpoint import write_json_atomically
+from src.models.student_record import StudentRecord
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_INTERVAL = 10000
+DEFAULT_POLL_INTERVAL = 0.05
+_MAX_SELECT_WAIT = 0.1
+_EVENT_FIELD_COUNT = 4
+_HEADER_PREFIX = b"student_id,"
+
+
+class GradebookWatcher:
+    """Mantiene el estado por estudiante a partir de un log de eventos."""
+
+    def __init__(
+        self,
+        log_path: str,
+        snapshot_path: Optional[str] = None,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    ) -> None:
+        """
+        Inicializa el watcher y restaura el snapshot si existe.
+
+        Args:
+            log_path: Ruta del log de eventos
+            snapshot_path: Ruta del snapshot de estado (None lo desactiva)
+            snapshot_interval: Eventos procesados entre snapshots
+        """
+        self._log_path = log_path
+        self._snapshot_path = snapshot_path
+        self._snapshot_interval = snapshot_interval
+        self._students: Dict[str, Dict[str, Tuple[float, float]]] = {}
+        self._offset = 0
+        self._events_since_snapshot = 0
+        self.malformed_events = 0
+        if snapshot_path is not None:
+            self._restore_snapshot()
+
+    @property
+    def offset(self) -> int:
+        """Bytes del log ya procesados."""
+        return self._offset
+
+    @property
+    def student_count(self) -> int:
+        """Cantidad de estudiantes con al menos un evento."""
+        return len(self._students)
+
+    def poll(self) -> List[GradedRow]:
+        """
+        Procesa los eventos nuevos del log.
+
+        Solo se consumen líneas completas; una línea sin salto de línea final
+        se procesa en la siguiente llamada, cuando termine de escribirse.
+
+        Returns:
+            Nota final recalculada de cada estudiante afectado, en el orden
+            de su primer evento nuevo (vacío si el log aún no existe)
+        """
+        try:
+            log_file = open(self._log_path, "rb")
+        except FileNotFoundError:
+            return []
+        with log_file:
+            size = os.fstat(log_file.fileno()).st_size
+            if size < self._offset:
+                # El log fue truncado o reemplazado: se reconstruye desde cero
+                self._students = {}
+                self._offset = 0
+            log_file.seek(self._offset)
+            data = log_file.read(size - self._offset)
+
+        complete = data.rfind(b"\n") + 1
+        if complete == 0:
+            return []
+        self._offset += complete
+
+        affected: Dict[str, None] = {}
+        for line in data[:complete].splitlines():
+            student_id = self._apply_event(line)
+            if student_id is not None:
+                affected[student_id] = None
+                self._events_since_snapshot += 1
+
+        updates = [self.grade_student(student_id) for student_id in affected]
+        if (
+            self._snapshot_path is not None
+            and self._events_since_snapshot >= self._snapshot_interval
+        ):
+            self.save_snapshot()
+        return updates
+
+    def grade_student(self, student_id: str) -> GradedRow:
+        """
+        Calcula la nota final actual de un estudiante.
+
+        Args:
+            student_id: Identificador del estudiante
+
+        Returns:
+            Resultado del estudiante (con error si sus pesos aún no suman 100%)
+        """
+        evaluations = self._students.get(student_id, {})
+        record = StudentRecord(
+            student_id=student_id,
+            grades=[grade for grade, _ in evaluations.values()],
+            weights=[weight for _, weight in evaluations.values()],
+            has_reached_minimum=True,
+            tardiness_percentage=0.0,
+            all_years_teachers=[],
+            extra_points=0.0,
+        )
+        return BatchGrader.grade_one(record)
+
+    def save_snapshot(self) -> None:
+        """Persiste de forma atómica el estado y el offset actuales."""
+        if self._snapshot_path is None:
+            return
+        write_json_atomically(
+            self._snapshot_path,
+            {
+                "version": SNAPSHOT_VERSION,
+                "offset": self._offset,
+                "students": {
+                    student_id: [
+                        [evaluation_id, grade, weight]
+                        for evaluation_id, (grade, weight) in evaluations.items()
+                    ]
+                    for student_id, evaluations in self._students.items()
+                },
+            },
+        )
+        self._events_since_snapshot = 0
+
+    def run(
+        self,
+        emit: Callable[[GradedRow], None],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        stop_event: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Sigue el log indefinidamente emitiendo cada nota recalculada.
+
+        Args:
+            emit: Función que recibe cada resultado actualizado
+            poll_interval: Segundos entre lecturas del log (con inotify, la
+                espera máxima entre lecturas si no hay cambios)
+            stop_event: Evento que detiene el bucle al activarse
+        """
+        stop_event = stop_event or threading.Event()
+        notifier = _ChangeNotifier(self._log_path)
+        try:
+            while not stop_event.is_set():
+                for update in self.poll():
+                    emit(update)
+                if not stop_event.is_set():
+                    notifier.wait(poll_interval, stop_event)
+        finally:
+            notifier.close()
+            self.save_snapshot()
+
+    def _apply_event(self, line: bytes) -> Optional[str]:
+        """Aplica un evento al estado y retorna el estudiante afectado."""
+        stripped = line.strip()
+        if not stripped or stripped.startswith((b"#", _HEADER_PREFIX)):
+            return None
+
+        fields = stripped.split(b",")
+        if len(fields) != _EVENT_FIELD_COUNT:
+            self.malformed_events += 1
+            return None
+        try:
+            student_id = fields[0].decode("utf-8").strip()
+            evaluation_id = fields[1].decode("utf-8").strip()
+            grade = float(fields[2])
+            weight = float(fields[3])
+        except ValueError:
+            self.malformed_events += 1
+            return None
+
+        self._students.setdefault(student_id, {})[evaluation_id] = (grade, weight)
+        return student_id
+
+    def _restore_snapshot(self) -> None:
+        """Carga el snapshot si existe y corresponde al log actual."""
+        try:
+            with open(self._snapshot_path, "r", encoding="utf-8") as snapshot_file:
+                data = json.load(snapshot_file)
+        except FileNotFoundError:
+            return
+
+        try:
+            log_size = os.path.getsize(self._log_path)
+        except FileNotFoundError:
+            log_size = 0
+        if data.get("version") != SNAPSHOT_VERSION or data["offset"] > log_size:
+            return
+
+        self._offset = data["offset"]
+        self._students = {
+            student_id: {
+                evaluation_id: (grade, weight)
+                for evaluation_id, grade, weight in evaluations
+            }
+            for student_id, evaluations in data["students"].items()
+        }
+
+
+class _ChangeNotifier:
+    """Espera cambios en el directorio del log con inotify, o un intervalo fijo."""
+
+    # Máscara de inotify: archivo modificado, cerrado, creado o movido al directorio
+    _MASK = 0x002 | 0x008 | 0x080 | 0x100
+    _IN_NONBLOCK = os.O_NONBLOCK
+    _IN_CLOEXEC = 0o2000000
+
+    def __init__(self, log_path: str) -> None:
+        """
+        Registra el directorio del log en inotify si está disponible.
+
+        Args:
+            log_path: Ruta del log de eventos
+        """
+        self._fd = -1
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return
+        if fd < 0:
+            return
+        directory = os.path.dirname(os.path.abspath(log_path)).encode()
+        if libc.inotify_add_watch(fd, directory, self._MASK) < 0:
+            os.close(fd)
+            return
+        self._fd = fd
+
+    def wait(self, timeout: float, stop_event: threading.Event) -> None:
+        """Espera un cambio (o el intervalo, sin inotify) y descarta los eventos."""
+        if self._fd < 0:
+            stop_event.wait(timeout)
+            return
+        # La espera se acota para notar stop_event sin depender de un cambio
+        ready, _, _ = select.select([self._fd], [], [], min(timeout, _MAX_SELECT_WAIT))
+        if ready:
+            try:
+                while os.read(self._fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        """Libera el descriptor de inotify."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -0,0 +1,410 @@
+"""Lectura de rosters mapeando el archivo en memoria.
+
+El CSV se recorre con ``mmap`` y ``memoryview``: las columnas numéricas se
+convierten directamente desde el buffer, sin decodificar cada línea a
+``str`` ni dividirla en subcadenas. Solo el identificador del estudiante se
+decodifica. El resultado se carga en un RosterColumns, el mismo formato que
+produce el roster binario (ver roster_columns).
+
+Los rosters CSV comprimidos con gzip o zstd se leen sin descomprimirlos a
+disco: un hilo entrega bloques descomprimidos (ver compressed_input) y cada
+bloque se recorre con el mismo parser, desde bytes en lugar del mmap.
+
+Para acotar la memoria, RosterStream lee un roster CSV (comprimido o no) por
+bloques de filas: solo un bloque está cargado en columnas a la vez, y con un
+roster comprimido el cálculo de un bloque se superpone con la
+descompresión de los siguientes.
+"""
+
+import mmap
+import os
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Union
+
+from src.batch.compressed_input import (
+    DEFAULT_CHUNK_SIZE,
+    decompressed_chunks,
+    detect_compression,
+)
+from src.batch.roster_columns import (
+    RosterColumns,
+    RosterColumnsBuilder,
+    is_roster_binary,
+    read_roster_binary,
+)
+from src.exceptions import InvalidRosterError
+from src.models.student_record import StudentRecord
+
+_NEWLINE = b"\n"
+_COMMA = b","
+_SEMICOLON = b";"
+_COLON = b":"
+_CARRIAGE_RETURN = ord("\r")
+_COMMENT = ord("#")
+_WHITESPACE = frozenset(b" \t\r\n")
+_FLAG_VALUES = {ord("s"): True, ord("S"): True, ord("n"): False, ord("N"): False}
+_HEADER_PREFIX = b"student_id,"
+_SEPARATOR_COUNT = 5
+# El parser recorre tanto el mmap del archivo como bloques descomprimidos
+_Buffer = Union[mmap.mmap, bytes]
+
+
+def open_roster(path: str) -> RosterColumns:
+    """
+    Abre un roster en formato binario o CSV según su contenido.
+
+    Args:
+        path: Ruta del roster
+
+    Returns:
+        Roster columnar (cerrar con close() o usar ``with``)
+
+    Raises:
+        InvalidRosterError: Si el roster tiene un formato inválido
+    """
+    if is_roster_binary(path):
+        return read_roster_binary(path)
+    if detect_compression(path) is not None:
+        return read_roster_chunks(decompressed_chunks(path))
+    return read_roster_mmap(path)
+
+
+def read_roster_mmap(path: str) -> RosterColumns:
+    """
+    Lee un roster CSV mapeándolo en memoria y lo carga en columnas.
+
+    Acepta el mismo formato que roster_reader.read_roster_csv.
+
+    Args:
+        path: Ruta del roster CSV
+
+    Returns:
+        Roster columnar en memoria
+
+    Raises:
+        InvalidRosterError: Si alguna fila tiene un formato inválido
+    """
+    builder = RosterColumnsBuilder()
+    with open(path, "rb") as roster_file:
+        if os.fstat(roster_file.fileno()).st_size == 0:
+            return builder.build()
+        with mmap.mmap(roster_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            buffer = memoryview(mapped)
+            try:
+                _scan_lines(mapped, buffer, builder)
+            finally:
+                buffer.release()
+    return builder.build()
+
+
+def read_roster_chunks(chunks: Iterable[bytes]) -> RosterColumns:
+    """
+    Lee un roster CSV que llega por bloques (por ejemplo, descomprimido).
+
+    Cada bloque se parsea hasta su último salto de línea; el resto se une al
+    bloque siguiente, de modo que las líneas partidas entre bloques se leen
+    completas.
+
+    Args:
+        chunks: Bloques consecutivos de bytes del CSV
+
+    Returns:
+        Roster columnar en memoria
+
+    Raises:
+        InvalidRosterError: Si alguna fila tiene un formato inválido
+    """
+    return next(_parse_chunks(chunks, None))
+
+
+class RosterStream:
+    """
+    Roster CSV leído por bloques de filas, sin cargarlo completo en memoria.
+
+    El primer bloque se lee al abrir, para poder muestrear el roster (ver
+    head y estimated_rows) antes de calcular; el resto se lee a medida que
+    se recorre records(), que solo puede llamarse una vez. Cerrar con
+    close() o usar ``with``.
+    """
+
+    def __init__(
+        self, path: str, block_rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """
+        Abre el roster y lee el primer bloque.
+
+        Args:
+            path: Ruta del roster CSV (comprimido con gzip/zstd o no)
+            block_rows: Filas por bloque (cada bloque puede excederlas en las
+                filas de un bloque de bytes leído)
+            chunk_size: Bytes leídos (o descomprimidos) por vez
+
+        Raises:
+            InvalidRosterError: Si alguna fila del primer bloque es inválida
+        """
+        if block_rows < 1:
+            raise ValueError("block_rows debe ser al menos 1")
+        self._path = path
+        self._chunks: Iterator[bytes]
+        if detect_compression(path) is not None:
+            self._chunks = decompressed_chunks(path, chunk_size)
+        else:
+            self._chunks = _file_chunks(path, chunk_size)
+        self._bytes_read = 0
+        self._exhausted = False
+        self._blocks = _parse_chunks(self._counted(self._chunks), block_rows)
+        self._head: Optional[RosterColumns] = None
+        try:
+            self._head = next(self._blocks)
+        except BaseException:
+            self.close()
+            raise
+        self._head_bytes = self._bytes_read
+        self._head_complete = self._exhausted
+
+    def head(self) -> RosterColumns:
+        """
+        Retorna el primer bloque, mientras no se haya empezado a recorrer.
+
+        Raises:
+            ValueError: Si records() ya se llamó
+        """
+        if self._head is None:
+            raise ValueError("El roster ya se recorrió")
+        return self._head
+
+    def estimated_rows(self) -> int:
+        """
+        Estima la cantidad de filas del roster sin recorrerlo.
+
+        Es exacta si el roster entero cabe en el primer bloque. Si no,
+        proyecta los bytes por fila del primer bloque al tamaño del archivo;
+        en un roster comprimido se usa el tamaño comprimido, por lo que la
+        estimación es una cota inferior.
+
+        Raises:
+            ValueError: Si records() ya se llamó
+        """
+        head = self.head()
+        if self._head_complete or not len(head):
+            return len(head)
+        bytes_per_row = self._head_bytes / len(head)
+        return max(len(head), round(os.path.getsize(self._path) / bytes_per_row))
+
+    def records(self, start: int = 0) -> Iterator[StudentRecord]:
+        """
+        Itera los registros en orden, leyendo un bloque a la vez.
+
+        Args:
+            start: Posición de la primera fila a retornar
+
+        Yields:
+            Registros desde la fila ``start``
+
+        Raises:
+            InvalidRosterError: Si alguna fila tiene un formato inválido
+        """
+        first = self.head()
+        self._head = None
+        position = 0
+        for block in chain([first], self._blocks):
+            skip = min(max(start - position, 0), len(block))
+            position += len(block)
+            yield from block.records(skip)
+
+    def close(self) -> None:
+        """Deja de leer el archivo (y detiene la descompresión, si la hay)."""
+        self._head = None
+        self._blocks.close()
+        self._chunks.close()  # type: ignore[attr-defined]
+
+    def _counted(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Entrega los bloques de bytes contando los leídos y si se terminaron."""
+        for chunk in chunks:
+            self._bytes_read += len(chunk)
+            yield chunk
+        self._exhausted = True
+
+    def __enter__(self) -> "RosterStream":
+        """Permite usar el roster como context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Cierra el roster al salir del bloque ``with``."""
+        self.close()
+
+
+def _file_chunks(path: str, chunk_size: int) -> Iterator[bytes]:
+    """Lee un archivo sin comprimir en bloques de bytes."""
+    with open(path, "rb") as roster_file:
+        while True:
+            chunk = roster_file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _parse_chunks(
+    chunks: Iterable[bytes], block_rows: Optional[int]
+) -> Iterator[RosterColumns]:
+    """
+    Parsea bloques de bytes y entrega las filas en rosters columnares.
+
+    Con block_rows None entrega un único roster con todas las filas; si no,
+    entrega uno cada vez que se acumulan al menos block_rows filas (y uno
+    final, posiblemente vacío).
+    """
+    builder = RosterColumnsBuilder()
+    pending = b""
+    line_number = 0
+    for chunk in chunks:
+        data = pending + chunk if pending else chunk
+        cut = data.rfind(_NEWLINE) + 1
+        if cut:
+            with memoryview(data) as buffer:
+                line_number = _scan_lines(data, buffer, builder, cut, line_number)
+        pending = data[cut:]
+        if block_rows is not None and len(builder) >= block_rows:
+            yield builder.build()
+            builder = RosterColumnsBuilder()
+    if pending:
+        with memoryview(pending) as buffer:
+            _scan_lines(pending, buffer, builder, len(pending), line_number)
+    yield builder.build()
+
+
+def _scan_lines(
+    mapped: _Buffer,
+    buffer: memoryview,
+    builder: RosterColumnsBuilder,
+    size: Optional[int] = None,
+    line_number: int = 0,
+) -> int:
+    """
+    Recorre las líneas del buffer y agrega cada fila válida al constructor.
+
+    Retorna el número de la última línea leída, para continuar la numeración
+    en el bloque siguiente.
+    """
+    size = len(mapped) if size is None else size
+    start = 0
+    while start < size:
+        line_number += 1
+        end = mapped.find(_NEWLINE, start, size)
+        next_start = size if end == -1 else end + 1
+        if end == -1:
+            end = size
+        if end > start and buffer[end - 1] == _CARRIAGE_RETURN:
+            end -= 1
+
+        if not _is_skippable(mapped, buffer, start, end):
+            try:
+                _parse_line(mapped, buffer, start, end, builder)
+            except ValueError as e:
+                raise InvalidRosterError(f"Línea {line_number}: {e}") from e
+        start = next_start
+    return line_number
+
+
+def _is_skippable(mapped: _Buffer, buffer: memoryview, start: int, end: int) -> bool:
+    """Indica si la línea es vacía, un comentario o la cabecera."""
+    while start < end and buffer[start] in _WHITESPACE:
+        start += 1
+    if start == end or buffer[start] == _COMMENT:
+        return True
+    return mapped.find(_HEADER_PREFIX, start, start + len(_HEADER_PREFIX)) == start
+
+
+def _parse_line(
+    mapped: _Buffer,
+    buffer: memoryview,
+    start: int,
+    end: int,
+    builder: RosterColumnsBuilder,
+) -> None:
+    """Convierte una línea en columnas leyendo los campos desde el buffer."""
+    separators: List[int] = []
+    position = start
+    while True:
+        comma = mapped.find(_COMMA, position, end)
+        if comma == -1:
+            break
+        separators.append(comma)
+        position = comma + 1
+    if len(separators) != _SEPARATOR_COUNT:
+        raise ValueError(
+            f"se esperaban {_SEPARATOR_COUNT + 1} campos. "
+            f"Campos recibidos: {len(separators) + 1}"
+        )
+
+    bounds = [start] + [comma + 1 for comma in separators]
+    ends = separators + [end]
+    grades: List[float] = []
+    weights: List[float] = []
+    _parse_evaluations(mapped, buffer, bounds[5], ends[5], grades, weights)
+
+    builder.append(
+        str(buffer[bounds[0] : ends[0]], "utf-8").strip(),
+        grades,
+        weights,
+        _parse_flag(buffer, bounds[1], ends[1]),
+        float(buffer[bounds[2] : ends[2]]),
+        [
+            _flag_value(buffer[i])
+            for i in range(bounds[3], ends[3])
+            if buffer[i] not in _WHITESPACE
+        ],
+        float(buffer[bounds[4] : ends[4]]),
+    )
+
+
+def _parse_flag(buffer: memoryview, start: int, end: int) -> bool:
+    """Convierte un campo ``s``/``n`` (con espacios opcionales) en booleano."""
+    values = [buffer[i] for i in range(start, end) if buffer[i] not in _WHITESPACE]
+    if len(values) != 1:
+        raise ValueError(
+            f"Se esperaba 's' o 'n'. Valor recibido: {bytes(buffer[start:end])!r}"
+        )
+    return _flag_value(values[0])
+
+
+def _flag_value(byte: int) -> bool:
+    """Convierte el byte ``s``/``n`` en booleano."""
+    try:
+        return _FLAG_VALUES[byte]
+    except KeyError:
+        raise ValueError(
+            f"Se esperaba 's' o 'n'. Valor recibido: {chr(byte)!r}"
+        ) from None
+
+
+def _parse_evaluations(
+    mapped: _Buffer,
+    buffer: memoryview,
+    start: int,
+    end: int,
+    grades: List[float],
+    weights: List[float],
+) -> None:
+    """Convierte ``nota:peso;nota:peso`` leyendo directamente del buffer."""
+    while start < end and buffer[start] in _WHITESPACE:
+        start += 1
+    while end > start and buffer[end - 1] in _WHITESPACE:
+        end -= 1
+    if start == end:
+        return
+
+    position = start
+    while position <= end:
+        pair_end = mapped.find(_SEMICOLON, position, end)
+        if pair_end == -1:
+            pair_end = end
+        colon = mapped.find(_COLON, position, pair_end)
+        if colon == -1:
+            raise ValueError(
+                "Evaluación inválida (se esperaba nota:peso): "
+                f"{str(buffer[position:pair_end], 'utf-8')!r}"
+            )
+        grades.append(float(buffer[position:colon]))
+        weights.append(float(buffer[colon + 1 : pair_end]))
+        position = pair_end + 1
@@ -0,0 +1,112 @@
+"""Cálculo por lotes en paralelo con hilos o procesos.
+
+GradeCalculator no guarda estado, por lo que varios hilos pueden calcular
+notas al mismo tiempo sin sincronización. En CPython con GIL el cálculo
+(puro Python) no escala con más hilos, pero esta API permite integrarlo en
+servidores con hilos donde no se pueden usar procesos; en builds sin GIL
+(free-threaded) sí escala. Ver benchmarks/thread_scaling.py.
+
+grade_batch_processes reparte los bloques entre procesos: escala en
+cualquier build, a cambio del costo de iniciar el pool y serializar los
+registros, por lo que solo conviene con lotes grandes. Quien califica
+varios lotes seguidos puede pasar el mismo pool (``executor``) a cada uno
+para pagar el arranque una sola vez.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from src.batch.batch_grader import BatchGrader, GradedRow
+from src.models.student_record import StudentRecord
+
+DEFAULT_CHUNK_SIZE = 1024
+
+
+def grade_batch_threaded(
+    records: Sequence[StudentRecord],
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> List[GradedRow]:
+    """
+    Calcula un lote repartiendo bloques de registros entre hilos.
+
+    El resultado es idéntico al de BatchGrader.grade y está en el mismo
+    orden de entrada, sin importar la cantidad de hilos.
+
+    Args:
+        records: Registros de estudiantes
+        max_workers: Hilos del pool (por defecto, cantidad de CPUs); se
+            ignora si se pasa ``executor``
+        chunk_size: Registros por tarea
+        executor: Pool existente del servidor anfitrión, si lo hay
+
+    Returns:
+        Un GradedRow por registro, en el orden de entrada
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser al menos 1")
+    chunks = [
+        records[start : start + chunk_size]
+        for start in range(0, len(records), chunk_size)
+    ]
+    if len(chunks) <= 1 and executor is None:
+        return list(BatchGrader.grade(records))
+
+    if executor is not None:
+        return _grade_chunks(executor, chunks)
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return _grade_chunks(pool, chunks)
+
+
+def grade_batch_processes(
+    records: Sequence[StudentRecord],
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> List[GradedRow]:
+    """
+    Calcula un lote repartiendo bloques de registros entre procesos.
+
+    Un lote de un solo bloque se calcula en el proceso actual, sin usar el
+    pool.
+
+    Args:
+        records: Registros de estudiantes
+        max_workers: Procesos del pool (por defecto, cantidad de CPUs); se
+            ignora si se pasa ``executor``
+        chunk_size: Registros por tarea
+        executor: ProcessPoolExecutor existente, reutilizado entre lotes
+
+    Returns:
+        Un GradedRow por registro, en el orden de entrada
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser al menos 1")
+    chunks = [
+        records[start : start + chunk_size]
+        for start in range(0, len(records), chunk_size)
+    ]
+    if len(chunks) <= 1:
+        return list(BatchGrader.grade(records))
+    if executor is not None:
+        return _grade_chunks(executor, chunks)
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _grade_chunks(pool, chunks)
+
+
+def _grade_chunk(chunk: Sequence[StudentRecord]) -> List[GradedRow]:
+    """Calcula un bloque de registros en el hilo actual."""
+    return [BatchGrader.grade_one(record) for record in chunk]
+
+
+def _grade_chunks(
+    executor: Executor, chunks: Sequence[Sequence[StudentRecord]]
+) -> List[GradedRow]:
+    """Envía los bloques al pool y concatena sus resultados en orden."""
+    results: List[GradedRow] = []
+    for chunk_rows in executor.map(_grade_chunk, chunks):
+        results.extend(chunk_rows)
+    return results
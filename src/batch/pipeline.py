@@ -0,0 +1,714 @@
+"""Pipeline de cálculo por lotes: roster CSV de entrada, resultados CSV de salida."""
+
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from operator import itemgetter
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from src.batch.batch_grader import BatchGrader, GradedRow
+from src.batch.checkpoint import (
+    CheckpointState,
+    CheckpointWriter,
+    default_checkpoint_path,
+    input_fingerprint,
+    load_checkpoint,
+)
+from src.batch.compressed_input import DEFAULT_CHUNK_SIZE as DEFAULT_ROSTER_CHUNK_SIZE
+from src.batch.deduplication import DedupReport, ProfileDeduplicator
+from src.batch.dispatcher import (
+    ENGINE_AUTO,
+    ENGINE_DEDUP,
+    ENGINE_PROCESS,
+    ENGINE_SCALAR,
+    ENGINE_THREAD,
+    ENGINES,
+    SHAPE_SAMPLE_SIZE,
+    AdaptiveDispatcher,
+)
+from src.batch.external_sort import DEFAULT_MAX_IN_MEMORY, SortStats, external_sort
+from src.batch.mmap_roster_reader import RosterStream, open_roster
+from src.batch.parallel import grade_batch_processes, grade_batch_threaded
+from src.batch.result_format import (
+    ResultReader,
+    is_result_binary,
+    write_results_binary,
+)
+from src.batch.roster_columns import (
+    RosterColumns,
+    is_roster_binary,
+    write_roster_binary,
+)
+from src.batch.statistics import GradeStatistics
+from src.diagnostics.stage_metrics import (
+    STAGE_COMPUTE,
+    STAGE_PARSE,
+    STAGE_WRITE,
+    PipelineTracer,
+    StageQueue,
+)
+from src.exceptions import CheckpointMismatchError, InvalidResultFileError
+from src.models.grade_result import RESULT_FIELDS, GradeResult
+from src.models.student_record import StudentRecord
+
+RESULTS_HEADER = (
+    "student_id,final_grade,weighted_average,penalty_applied,"
+    "extra_points_applied,error"
+)
+OUTPUT_FORMATS = ("csv", "binary")
+DEFAULT_CHECKPOINT_INTERVAL = 10000
+DEFAULT_WRITE_CHUNK_SIZE = 1024
+ORDER_BY_CHOICES = ("student_id", "final_grade")
+# Memoria estimada por fila ordenada en memoria y por perfil en la caché de
+# deduplicación (objetos de Python incluidos), usada para repartir memory_limit
+SORT_ROW_BYTES = 400
+DEDUP_PROFILE_BYTES = 450
+# Memoria estimada por fila de un bloque de roster CSV leído en columnas
+ROSTER_ROW_BYTES = 200
+# Bytes leídos por vez de un roster por bloques: con los que el descompresor
+# deja en espera, suman una fracción pequeña del presupuesto
+_ROSTER_CHUNK_DIVISOR = 64
+_MIN_ROSTER_CHUNK = 4096
+ENGINE_CHOICES = (ENGINE_AUTO,) + ENGINES
+# Filas entregadas de una vez a los motores paralelos, sin materializar el
+# roster completo; todos los bloques de un lote comparten el mismo pool
+PARALLEL_BLOCK_SIZE = 65536
+_Roster = Union[RosterColumns, RosterStream]
+
+
+class _ParallelEngine(NamedTuple):
+    """Motor paralelo: cálculo de un bloque con un pool y fábrica del pool."""
+
+    grade: Callable[..., List[GradedRow]]
+    pool: Callable[[], Executor]
+
+
+_PARALLEL_ENGINES: Dict[str, _ParallelEngine] = {
+    ENGINE_THREAD: _ParallelEngine(
+        grade_batch_threaded, partial(ThreadPoolExecutor, max_workers=os.cpu_count())
+    ),
+    ENGINE_PROCESS: _ParallelEngine(grade_batch_processes, ProcessPoolExecutor),
+}
+
+
+class BatchSummary(NamedTuple):
+    """Resumen de la ejecución de un lote."""
+
+    total_rows: int
+    graded_rows: int
+    error_rows: int
+    dedup: Optional[DedupReport]
+    statistics: GradeStatistics
+    sort: Optional[SortStats] = None
+    engine: str = ENGINE_SCALAR
+
+
+def run_batch(
+    input_path: str,
+    output_path: str,
+    deduplicate: bool = False,
+    output_format: str = "csv",
+    checkpoint_interval: int = 0,
+    resume: bool = False,
+    checkpoint_path: Optional[str] = None,
+    tracer: Optional[PipelineTracer] = None,
+    write_queue_size: int = 0,
+    write_chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    order_by: Optional[str] = None,
+    memory_limit: Optional[int] = None,
+    passing_grade: Optional[float] = None,
+    engine: Optional[str] = None,
+    dispatcher: Optional[AdaptiveDispatcher] = None,
+) -> BatchSummary:
+    """
+    Calcula las notas finales de un roster y escribe los resultados.
+
+    El roster de entrada puede estar en formato CSV o binario (ver
+    pack_roster); ambos se leen mapeando el archivo en memoria.
+
+    Con checkpoint_interval > 0 se persiste el progreso cada esa cantidad de
+    filas (ver checkpoint). Con resume=True se continúa desde el último
+    checkpoint consistente, produciendo la misma salida que una ejecución
+    sin interrupciones. Al terminar con éxito el checkpoint se elimina.
+
+    Con write_queue_size > 0 la escritura corre en un hilo propio, que recibe
+    bloques de write_chunk_size filas por una cola de esa capacidad; el hilo
+    principal sigue leyendo y calculando mientras se escribe. Con un tracer,
+    se miden las filas y tiempos de cada etapa y la ocupación de la cola (ver
+    diagnostics.stage_metrics).
+
+    Con order_by los resultados se escriben ordenados por ``student_id`` o
+    como ranking (``final_grade`` de mayor a menor, filas con error al
+    final), usando ordenamiento externo: las corridas que exceden la memoria
+    se vuelcan a archivos temporales junto al archivo de salida y se combinan
+    al escribir. memory_limit (en bytes) acota el estado intermedio del lote:
+    la mitad para las filas a ordenar, un cuarto para la caché de perfiles
+    de la deduplicación y un cuarto para el roster. Con memory_limit, un
+    roster CSV (comprimido o no) se lee por bloques de filas en lugar de
+    cargarse completo (ver RosterStream); un roster binario ya se lee
+    mapeado en memoria, sin copiarlo.
+
+    engine elige el motor de cálculo (ver dispatcher): ``scalar``, ``dedup``,
+    ``thread``, ``process`` o ``auto``, que usa el que el despachador estima
+    más rápido según la calibración local, el tamaño del roster y una
+    muestra de sus perfiles. Los motores paralelos reciben el roster en
+    bloques de PARALLEL_BLOCK_SIZE filas y crean un solo pool de hilos o
+    procesos para todo el lote. deduplicate=True equivale a
+    ``dedup``; sin engine se usa ``scalar``.
+
+    Args:
+        input_path: Ruta del roster de entrada (CSV o binario)
+        output_path: Ruta del archivo de resultados
+        deduplicate: Si se calcula una sola vez por perfil de entrada único
+        output_format: ``csv`` o ``binary`` (ver result_format)
+        checkpoint_interval: Filas entre checkpoints (0 los desactiva)
+        resume: Si se reanuda desde el checkpoint existente
+        checkpoint_path: Ruta del checkpoint (por defecto ``<output>.ckpt``)
+        tracer: Trazador de etapas (None para no medir)
+        write_queue_size: Bloques en espera hacia el hilo de escritura (0
+            escribe en el hilo principal)
+        write_chunk_size: Filas por bloque enviado al hilo de escritura
+        order_by: ``student_id``, ``final_grade`` o None (orden del roster)
+        memory_limit: Bytes para el estado intermedio (None para no acotar)
+        passing_grade: Nota mínima aprobatoria para contar aprobados en las
+            estadísticas (None para no contarlos)
+        engine: Motor de cálculo, ``auto`` o None (``scalar``)
+        dispatcher: Despachador usado con ``auto`` (por defecto, uno con la
+            calibración en caché de esta máquina)
+
+    Returns:
+        Resumen de la ejecución (acumulado desde el inicio del lote; con
+        resume, los contadores de deduplicación también)
+
+    Raises:
+        InvalidRosterError: Si alguna fila del roster tiene formato inválido
+        CheckpointMismatchError: Si el checkpoint no corresponde al roster
+        ValueError: Si el formato de salida, el orden o el motor no existen,
+            si se combinan checkpoints con escritura en un hilo u
+            ordenamiento, o deduplicate con un motor distinto de ``dedup``
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Formato de salida desconocido: {output_format}")
+    if order_by is not None and order_by not in ORDER_BY_CHOICES:
+        raise ValueError(f"Orden desconocido: {order_by}")
+    if engine is not None and engine not in ENGINE_CHOICES:
+        raise ValueError(f"Motor desconocido: {engine}")
+    if deduplicate and engine not in (None, ENGINE_AUTO, ENGINE_DEDUP):
+        raise ValueError(f"La deduplicación no se combina con el motor {engine}")
+    if memory_limit is not None and memory_limit <= 0:
+        raise ValueError("memory_limit debe ser positivo")
+    checkpointing = checkpoint_interval > 0 or resume
+    if checkpointing and output_format != "csv":
+        raise ValueError("Los checkpoints solo están disponibles con salida csv")
+    if checkpointing and write_queue_size > 0:
+        raise ValueError("Los checkpoints no admiten escritura en un hilo")
+    if checkpointing and order_by is not None:
+        raise ValueError("Los checkpoints no admiten ordenar la salida")
+    if resume and checkpoint_interval <= 0:
+        checkpoint_interval = DEFAULT_CHECKPOINT_INTERVAL
+
+    sort_stats = SortStats() if order_by is not None else None
+    previous_stage = tracer.enter(STAGE_PARSE) if tracer is not None else None
+    try:
+        roster = _open_input(input_path, memory_limit)
+    finally:
+        if tracer is not None:
+            tracer.enter(previous_stage)
+
+    with roster:
+        if (
+            tracer is not None
+            and tracer.total_rows is None
+            and isinstance(roster, RosterColumns)
+        ):
+            tracer.total_rows = len(roster)
+        engine = _resolve_engine(roster, engine, deduplicate, dispatcher)
+        deduplicator = None
+        if engine == ENGINE_DEDUP:
+            max_profiles = None
+            if memory_limit is not None:
+                max_profiles = max(1, memory_limit // 4 // DEDUP_PROFILE_BYTES)
+            deduplicator = ProfileDeduplicator(max_profiles)
+        parallel = _PARALLEL_ENGINES.get(engine)
+        if checkpointing:
+            statistics = _run_csv_with_checkpoints(
+                roster,
+                input_path,
+                output_path,
+                deduplicator,
+                checkpoint_path or default_checkpoint_path(output_path),
+                checkpoint_interval,
+                resume,
+                tracer,
+                passing_grade,
+                parallel,
+            )
+        else:
+            statistics = GradeStatistics(passing_grade)
+            rows = _traced_rows(
+                roster, 0, deduplicator, statistics, tracer, parallel
+            )
+            if order_by is not None:
+                max_in_memory = DEFAULT_MAX_IN_MEMORY
+                if memory_limit is not None:
+                    max_in_memory = max(1, memory_limit // 2 // SORT_ROW_BYTES)
+                rows = _ordered_rows(
+                    rows,
+                    order_by,
+                    max_in_memory,
+                    os.path.dirname(os.path.abspath(output_path)),
+                    sort_stats,
+                )
+            writer: Callable[[Iterable[GradedRow]], object]
+            if output_format == "binary":
+                writer = partial(write_results_binary, path=output_path)
+            else:
+                writer = partial(_write_csv_file, output_path=output_path)
+            _write_rows(rows, writer, tracer, write_queue_size, write_chunk_size)
+
+    return BatchSummary(
+        total_rows=statistics.total_rows,
+        graded_rows=statistics.graded_rows,
+        error_rows=statistics.error_rows,
+        dedup=deduplicator.report() if deduplicator is not None else None,
+        statistics=statistics,
+        sort=sort_stats,
+        engine=engine,
+    )
+
+
+def _open_input(input_path: str, memory_limit: Optional[int]) -> _Roster:
+    """Abre el roster completo o, con presupuesto de memoria, por bloques."""
+    if memory_limit is None or is_roster_binary(input_path):
+        return open_roster(input_path)
+    budget = memory_limit // 4
+    chunk_size = min(
+        DEFAULT_ROSTER_CHUNK_SIZE,
+        max(_MIN_ROSTER_CHUNK, memory_limit // _ROSTER_CHUNK_DIVISOR),
+    )
+    return RosterStream(input_path, max(1, budget // ROSTER_ROW_BYTES), chunk_size)
+
+
+def _resolve_engine(
+    roster: _Roster,
+    engine: Optional[str],
+    deduplicate: bool,
+    dispatcher: Optional[AdaptiveDispatcher],
+) -> str:
+    """
+    Determina el motor del lote; con ``auto`` lo elige el despachador.
+
+    Con un roster por bloques, la muestra de perfiles sale del primer bloque
+    y la cantidad de filas se estima con el tamaño del archivo (ver
+    RosterStream.estimated_rows).
+    """
+    if deduplicate:
+        return ENGINE_DEDUP
+    if engine is None:
+        return ENGINE_SCALAR
+    if engine != ENGINE_AUTO:
+        return engine
+    if isinstance(roster, RosterStream):
+        known = roster.head()
+        rows = roster.estimated_rows()
+    else:
+        known = roster
+        rows = len(roster)
+    sample_size = min(len(known), SHAPE_SAMPLE_SIZE)
+    sample = [known.record(index) for index in range(sample_size)]
+    dispatcher = dispatcher or AdaptiveDispatcher()
+    return dispatcher.select(rows, sample).engine
+
+
+def _run_csv_with_checkpoints(
+    roster: _Roster,
+    input_path: str,
+    output_path: str,
+    deduplicator: Optional[ProfileDeduplicator],
+    checkpoint_path: str,
+    checkpoint_interval: int,
+    resume: bool,
+    tracer: Optional[PipelineTracer],
+    passing_grade: Optional[float],
+    parallel: Optional[_ParallelEngine],
+) -> GradeStatistics:
+    """Escribe los resultados CSV persistiendo checkpoints periódicos."""
+    fingerprint = input_fingerprint(input_path)
+    state = load_checkpoint(checkpoint_path) if resume else None
+
+    output: BinaryIO
+    if state is None:
+        statistics = GradeStatistics(passing_grade)
+        start_row = 0
+        output = open(output_path, "wb")
+        output.write((RESULTS_HEADER + "\n").encode("utf-8"))
+    else:
+        if state.input_fingerprint != fingerprint or (
+            isinstance(roster, RosterColumns) and state.next_row > len(roster)
+        ):
+            raise CheckpointMismatchError(
+                f"El checkpoint {checkpoint_path} no corresponde al roster {input_path}"
+            )
+        statistics = GradeStatistics.from_dict(state.statistics)
+        if statistics.passing_grade != passing_grade:
+            raise CheckpointMismatchError(
+                f"El checkpoint {checkpoint_path} usa otra nota aprobatoria"
+            )
+        if deduplicator is not None and state.dedup is not None:
+            deduplicator.restore_counters(state.dedup)
+        start_row = state.next_row
+        output = open(output_path, "r+b")
+        output.truncate(state.output_bytes)
+        output.seek(state.output_bytes)
+
+    with output:
+        checkpointer = CheckpointWriter(checkpoint_path, output.fileno())
+        previous_stage = tracer.enter(STAGE_WRITE) if tracer is not None else None
+        try:
+            rows = _traced_rows(
+                roster, start_row, deduplicator, statistics, tracer, parallel
+            )
+            if tracer is not None:
+                rows = tracer.count(STAGE_WRITE, rows)
+            for row_number, row in enumerate(rows, start=start_row + 1):
+                output.write((format_result_line(row) + "\n").encode("utf-8"))
+                if row_number % checkpoint_interval == 0:
+                    output.flush()
+                    checkpointer.submit(
+                        CheckpointState(
+                            input_fingerprint=fingerprint,
+                            next_row=row_number,
+                            output_bytes=output.tell(),
+                            statistics=statistics.to_dict(),
+                            dedup=(
+                                deduplicator.counters()
+                                if deduplicator is not None
+                                else None
+                            ),
+                        )
+                    )
+        finally:
+            if tracer is not None:
+                tracer.enter(previous_stage)
+            checkpointer.close()
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return statistics
+
+
+def _observe(
+    rows: Iterable[GradedRow], statistics: GradeStatistics
+) -> Iterator[GradedRow]:
+    """Actualiza las estadísticas con cada fila sin alterar el flujo."""
+    for row in rows:
+        statistics.add(row)
+        yield row
+
+
+def _traced_rows(
+    roster: _Roster,
+    start_row: int,
+    deduplicator: Optional[ProfileDeduplicator],
+    statistics: GradeStatistics,
+    tracer: Optional[PipelineTracer],
+    parallel: Optional[_ParallelEngine] = None,
+) -> Iterator[GradedRow]:
+    """Encadena lectura, cálculo y estadísticas, midiendo cada etapa."""
+    records: Iterable[StudentRecord] = roster.records(start_row)
+    if tracer is not None:
+        records = tracer.iterate(STAGE_PARSE, records)
+    if parallel is not None:
+        graded = _grade_in_blocks(records, parallel)
+    else:
+        graded = grade_records(records, deduplicator)
+    rows = _observe(graded, statistics)
+    if tracer is None:
+        return rows
+    return tracer.iterate(STAGE_COMPUTE, rows)
+
+
+def _grade_in_blocks(
+    records: Iterable[StudentRecord], engine: _ParallelEngine
+) -> Iterator[GradedRow]:
+    """Calcula los registros por bloques con un motor paralelo, en orden."""
+    iterator = iter(records)
+    block = list(islice(iterator, PARALLEL_BLOCK_SIZE))
+    if not block:
+        return
+    # Un solo pool para todo el lote: el arranque se paga una vez
+    with engine.pool() as pool:
+        while block:
+            yield from engine.grade(block, executor=pool)
+            block = list(islice(iterator, PARALLEL_BLOCK_SIZE))
+
+
+def _ordered_rows(
+    rows: Iterable[GradedRow],
+    order_by: str,
+    max_in_memory: int,
+    directory: str,
+    stats: Optional[SortStats],
+) -> Iterator[GradedRow]:
+    """Ordena las filas con memoria acotada (ver external_sort)."""
+    # Se ordenan tuplas planas: ocupan menos en memoria y al serializarse
+    items = (_sort_item(row, order_by) for row in rows)
+    for _, student_id, values, error in external_sort(
+        items, key=itemgetter(0), max_in_memory=max_in_memory, directory=directory, stats=stats
+    ):
+        result = GradeResult(*values) if values is not None else None
+        yield GradedRow(student_id, result, error)
+
+
+def _sort_item(row: GradedRow, order_by: str) -> tuple:
+    """Clave de orden y valores de una fila, como tupla plana."""
+    values = None
+    if row.result is not None:
+        values = tuple(row.result[name] for name in RESULT_FIELDS)
+    if order_by == "student_id":
+        key: tuple = (row.student_id,)
+    elif values is None:
+        key = (1, 0.0)
+    else:
+        key = (0, -values[0])
+    return key, row.student_id, values, row.error
+
+
+def _write_csv_file(rows: Iterable[GradedRow], output_path: str) -> None:
+    """Escribe los resultados en un archivo CSV."""
+    with open(output_path, "w", encoding="utf-8", newline="") as output:
+        write_results_csv(rows, output)
+
+
+def _write_rows(
+    rows: Iterable[GradedRow],
+    writer: Callable[[Iterable[GradedRow]], object],
+    tracer: Optional[PipelineTracer],
+    queue_size: int,
+    chunk_size: int,
+) -> None:
+    """Escribe las filas en el hilo actual o en un hilo de escritura."""
+    if queue_size <= 0:
+        if tracer is None:
+            writer(rows)
+            return
+        previous_stage = tracer.enter(STAGE_WRITE)
+        try:
+            writer(tracer.count(STAGE_WRITE, rows))
+        finally:
+            tracer.enter(previous_stage)
+        return
+
+    stage_queue = StageQueue(queue_size, tracer)
+    errors: List[BaseException] = []
+
+    def consume() -> None:
+        if tracer is not None:
+            tracer.enter(STAGE_WRITE)
+        try:
+            queued_rows = stage_queue.rows()
+            if tracer is not None:
+                queued_rows = tracer.count(STAGE_WRITE, queued_rows)
+            writer(queued_rows)
+        except BaseException as e:  # se relanza en el hilo principal
+            errors.append(e)
+        finally:
+            if tracer is not None:
+                tracer.enter(None)
+
+    consumer = threading.Thread(target=consume, name="batch-writer", daemon=True)
+    consumer.start()
+    try:
+        chunk: List[GradedRow] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                stage_queue.put(chunk, consumer)
+                chunk = []
+        if chunk:
+            stage_queue.put(chunk, consumer)
+    except RuntimeError:
+        # El hilo de escritura terminó con error; se relanza el original
+        if not errors:
+            raise
+    finally:
+        try:
+            stage_queue.close(consumer)
+        except RuntimeError:
+            pass
+        consumer.join()
+    if errors:
+        raise errors[0]
+
+
+def pack_roster(input_path: str, output_path: str) -> int:
+    """
+    Convierte un roster CSV al formato binario columnar.
+
+    El archivo binario se genera una vez y puede releerse muchas veces sin
+    parsear filas (ver roster_columns.read_roster_binary).
+
+    Args:
+        input_path: Ruta del roster CSV
+        output_path: Ruta del roster binario de salida
+
+    Returns:
+        Cantidad de estudiantes escritos
+
+    Raises:
+        InvalidRosterError: Si alguna fila del roster tiene formato inválido
+    """
+    with open_roster(input_path) as roster:
+        write_roster_binary(roster, output_path)
+        return len(roster)
+
+
+def export_results_csv(input_path: str, output_path: str) -> int:
+    """
+    Convierte un archivo de resultados binario a CSV.
+
+    Args:
+        input_path: Ruta del archivo de resultados binario
+        output_path: Ruta del CSV de salida
+
+    Returns:
+        Cantidad de filas exportadas
+
+    Raises:
+        InvalidResultFileError: Si el archivo binario es inválido
+    """
+    with ResultReader(input_path) as reader:
+        with open(output_path, "w", encoding="utf-8", newline="") as output:
+            total_rows, _ = write_results_csv(reader.rows(), output)
+    return total_rows
+
+
+def grade_records(
+    records: Iterable[StudentRecord], deduplicator: Optional[ProfileDeduplicator] = None
+) -> Iterator[GradedRow]:
+    """
+    Calcula los registros con o sin deduplicación de perfiles.
+
+    Args:
+        records: Registros de estudiantes
+        deduplicator: Deduplicador a usar, o None para calcular cada fila
+
+    Returns:
+        Iterador de GradedRow en el orden de entrada
+    """
+    if deduplicator is not None:
+        return deduplicator.grade(records)
+    return BatchGrader.grade(records)
+
+
+def write_results_csv(rows: Iterable[GradedRow], output: TextIO) -> Tuple[int, int]:
+    """
+    Escribe los resultados en formato CSV (con cabecera).
+
+    Args:
+        rows: Resultados por estudiante
+        output: Archivo de texto de salida
+
+    Returns:
+        Tupla (filas escritas, filas con error)
+    """
+    output.write(RESULTS_HEADER + "\n")
+    total_rows = 0
+    error_rows = 0
+    for row in rows:
+        total_rows += 1
+        if row.error is not None:
+            error_rows += 1
+        output.write(format_result_line(row) + "\n")
+    return total_rows, error_rows
+
+
+def format_result_line(row: GradedRow) -> str:
+    """
+    Convierte un resultado en una fila CSV (sin salto de línea).
+
+    Args:
+        row: Resultado del estudiante
+
+    Returns:
+        Fila CSV
+    """
+    if row.result is None:
+        error = (row.error or "").replace(",", ";").replace("\n", " ")
+        return f"{row.student_id},,,,,{error}"
+
+    result = row.result
+    return (
+        f"{row.student_id},{result['final_grade']},{result['weighted_average']},"
+        f"{result['penalty_applied']},{result['extra_points_applied']},"
+    )
+
+
+def parse_result_line(line: str) -> GradedRow:
+    """
+    Convierte una fila CSV de resultados en GradedRow (inversa de format_result_line).
+
+    Args:
+        line: Fila CSV, con o sin salto de línea
+
+    Returns:
+        Resultado del estudiante
+
+    Raises:
+        InvalidResultFileError: Si la fila no tiene el formato esperado
+    """
+    fields = line.rstrip("\r\n").split(",", 5)
+    if len(fields) != 6:
+        raise InvalidResultFileError(f"Fila de resultados inválida: {line!r}")
+    student_id, final_grade, weighted_average, penalty, extra_points, error = fields
+    if not final_grade:
+        return GradedRow(student_id, None, error)
+    try:
+        result = {
+            "final_grade": float(final_grade),
+            "weighted_average": float(weighted_average),
+            "penalty_applied": float(penalty),
+            "extra_points_applied": float(extra_points),
+        }
+    except ValueError as e:
+        raise InvalidResultFileError(f"Fila de resultados inválida: {line!r}") from e
+    return GradedRow(student_id, result, None)
+
+
+def read_results(path: str) -> Iterator[GradedRow]:
+    """
+    Lee un archivo de resultados CSV o binario.
+
+    Args:
+        path: Ruta del archivo de resultados
+
+    Yields:
+        Resultado de cada estudiante en el orden del archivo
+
+    Raises:
+        InvalidResultFileError: Si el archivo no tiene el formato esperado
+    """
+    if is_result_binary(path):
+        with ResultReader(path) as reader:
+            yield from reader.rows()
+        return
+
+    with open(path, "r", encoding="utf-8") as results:
+        for line in results:
+            if line.startswith("student_id,") or not line.strip():
+                continue
+            yield parse_result_line(line)
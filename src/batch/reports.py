@@ -0,0 +1,344 @@
+"""Reportes por estudiante del detalle de la nota final, en texto o HTML.
+
+Genera en bloque la misma hoja que muestra el modo interactivo (promedio
+ponderado, penalización, puntos extra y nota final) a partir de un archivo
+de resultados, sin una sesión por estudiante:
+
+- En un solo archivo, los reportes se escriben uno tras otro en streaming.
+- En un directorio, un archivo por estudiante: el hilo principal arma los
+  reportes y los entrega por grupos a un pool de hilos que crea y escribe
+  los archivos (la creación de archivos es E/S y libera el GIL). La
+  cantidad de grupos pendientes es acotada, por lo que la memoria de los
+  reportes no crece con la cantidad de estudiantes. Un student_id que no es
+  un nombre de archivo seguro lleva un sufijo con su hash, para que IDs
+  distintos (``A/1``, ``A_1``, ``A 1``) no terminen en el mismo archivo.
+
+Las plantillas (string.Template) se compilan una sola vez al importar el
+módulo; en HTML, el identificador y el mensaje de error se escapan.
+"""
+
+import hashlib
+import html
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from string import Template
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+from src.batch.batch_grader import GradedRow
+from src.exceptions import ReportFileCollisionError
+
+REPORT_FORMATS = ("text", "html")
+DEFAULT_REPORT_WORKERS = 4
+DEFAULT_REPORT_GROUP_SIZE = 256
+_OUTPUT_BUFFER_SIZE = 1 << 20
+_RULE = "=" * 60
+_UNSAFE_FILENAME = re.compile(r"[^\w.-]")
+_FILENAME_HASH_LENGTH = 8
+
+_TEXT_REPORT = Template(
+    f"{_RULE}\n"
+    "Estudiante: $student_id\n"
+    "\n"
+    "--- Detalle del Cálculo ---\n"
+    "Promedio Ponderado: $weighted_average\n"
+    "Penalización Aplicada: $penalty_applied\n"
+    "Puntos Extra Aplicados: $extra_points_applied\n"
+    "\n"
+    f"{_RULE}\n"
+    "NOTA FINAL: $final_grade\n"
+    f"{_RULE}\n"
+)
+_TEXT_ERROR = Template(
+    f"{_RULE}\n"
+    "Estudiante: $student_id\n"
+    "\n"
+    "✗ Error al calcular la nota final: $error\n"
+    f"{_RULE}\n"
+)
+_HTML_REPORT = Template(
+    '<section class="report">\n'
+    "<h2>Estudiante: $student_id</h2>\n"
+    "<table>\n"
+    "<tr><th>Promedio Ponderado</th><td>$weighted_average</td></tr>\n"
+    "<tr><th>Penalización Aplicada</th><td>$penalty_applied</td></tr>\n"
+    "<tr><th>Puntos Extra Aplicados</th><td>$extra_points_applied</td></tr>\n"
+    '<tr class="final"><th>NOTA FINAL</th><td>$final_grade</td></tr>\n'
+    "</table>\n"
+    "</section>\n"
+)
+_HTML_ERROR = Template(
+    '<section class="report error">\n'
+    "<h2>Estudiante: $student_id</h2>\n"
+    "<p>✗ Error al calcular la nota final: $error</p>\n"
+    "</section>\n"
+)
+_HTML_HEADER = Template(
+    "<!DOCTYPE html>\n"
+    '<html lang="es">\n'
+    '<head><meta charset="utf-8"><title>$title</title></head>\n'
+    "<body>\n"
+)
+_HTML_FOOTER = "</body>\n</html>\n"
+_EXTENSIONS = {"text": ".txt", "html": ".html"}
+
+
+class ReportSummary(NamedTuple):
+    """Resumen de una generación de reportes."""
+
+    reports: int
+    error_reports: int
+    files: int
+
+
+def render_report(row: GradedRow, report_format: str = "text") -> str:
+    """
+    Arma el reporte de un estudiante.
+
+    Args:
+        row: Resultado del estudiante
+        report_format: ``text`` o ``html``
+
+    Returns:
+        Reporte (en HTML, una sección sin el documento que la contiene)
+
+    Raises:
+        ValueError: Si el formato no existe
+    """
+    return _renderer(report_format)(row)
+
+
+def write_reports_file(
+    rows: Iterable[GradedRow], output_path: str, report_format: str = "text"
+) -> ReportSummary:
+    """
+    Escribe los reportes de todos los estudiantes en un solo archivo.
+
+    Args:
+        rows: Resultados por estudiante
+        output_path: Archivo de salida
+        report_format: ``text`` o ``html``
+
+    Returns:
+        Resumen con la cantidad de reportes
+
+    Raises:
+        ValueError: Si el formato no existe
+    """
+    render = _renderer(report_format)
+    reports = 0
+    errors = 0
+    with open(
+        output_path, "w", encoding="utf-8", newline="", buffering=_OUTPUT_BUFFER_SIZE
+    ) as output:
+        if report_format == "html":
+            output.write(_HTML_HEADER.substitute(title="Reportes de notas finales"))
+        separator = "" if report_format == "html" else "\n"
+        for row in rows:
+            if reports:
+                output.write(separator)
+            output.write(render(row))
+            reports += 1
+            errors += row.result is None
+        if report_format == "html":
+            output.write(_HTML_FOOTER)
+    return ReportSummary(reports, errors, 1)
+
+
+def write_report_files(
+    rows: Iterable[GradedRow],
+    directory: str,
+    report_format: str = "text",
+    workers: int = DEFAULT_REPORT_WORKERS,
+    group_size: int = DEFAULT_REPORT_GROUP_SIZE,
+) -> ReportSummary:
+    """
+    Escribe un archivo de reporte por estudiante en un directorio.
+
+    El nombre de cada archivo es el de safe_filename más la extensión del
+    formato. Se recuerda qué student_id ocupó cada nombre: un ID repetido (o
+    dos IDs con el mismo nombre) es un error, en vez de sobrescribir un
+    reporte en silencio.
+
+    Args:
+        rows: Resultados por estudiante
+        directory: Directorio de salida (se crea si no existe)
+        report_format: ``text`` o ``html``
+        workers: Hilos que escriben los archivos
+        group_size: Reportes entregados juntos a un hilo
+
+    Returns:
+        Resumen con la cantidad de reportes y de archivos creados
+
+    Raises:
+        ValueError: Si el formato no existe o workers/group_size no son positivos
+        ReportFileCollisionError: Si dos reportes irían al mismo archivo
+    """
+    if workers < 1 or group_size < 1:
+        raise ValueError("workers y group_size deben ser al menos 1")
+    render = _renderer(report_format)
+    extension = _EXTENSIONS[report_format]
+    os.makedirs(directory, exist_ok=True)
+
+    reports = 0
+    errors = 0
+    claimed: Dict[str, str] = {}
+    written: List[int] = []
+    # Grupos en espera acotados: el hilo principal espera si los hilos de
+    # escritura se atrasan
+    slots = threading.BoundedSemaphore(2 * workers)
+    pending: List["Future[int]"] = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-writer") as pool:
+        group: List[Tuple[str, str]] = []
+        for row in rows:
+            content = render(row)
+            if report_format == "html":
+                content = _html_document(row.student_id, content)
+            filename = safe_filename(row.student_id) + extension
+            _claim(claimed, filename, row.student_id)
+            group.append((os.path.join(directory, filename), content))
+            reports += 1
+            errors += row.result is None
+            if len(group) >= group_size:
+                pending = _submit(pool, slots, group, pending, written)
+                group = []
+        if group:
+            pending = _submit(pool, slots, group, pending, written)
+        for future in pending:
+            written.append(future.result())
+    return ReportSummary(reports, errors, sum(written))
+
+
+def generate_reports(
+    rows: Iterable[GradedRow],
+    output: str,
+    report_format: str = "text",
+    split: bool = False,
+    workers: int = DEFAULT_REPORT_WORKERS,
+) -> ReportSummary:
+    """
+    Genera los reportes en un archivo o en un directorio.
+
+    Args:
+        rows: Resultados por estudiante
+        output: Archivo de salida, o directorio si split es True
+        report_format: ``text`` o ``html``
+        split: Si se escribe un archivo por estudiante
+        workers: Hilos de escritura cuando split es True
+
+    Returns:
+        Resumen con la cantidad de reportes y de archivos
+    """
+    if split:
+        return write_report_files(rows, output, report_format, workers)
+    return write_reports_file(rows, output, report_format)
+
+
+def safe_filename(student_id: str) -> str:
+    """
+    Convierte un student_id en un nombre de archivo seguro.
+
+    Un ID que ya es seguro se usa tal cual; si hubo que cambiarlo, se agregan
+    los primeros caracteres del SHA-1 del ID original, de modo que IDs
+    distintos den nombres distintos.
+
+    Args:
+        student_id: Identificador del estudiante
+
+    Returns:
+        Nombre sin separadores de ruta ni caracteres especiales
+    """
+    name = _UNSAFE_FILENAME.sub("_", student_id.strip())
+    if not name or name.strip(".") == "":
+        name = "_" + name
+    if name == student_id:
+        return name
+    digest = hashlib.sha1(student_id.encode("utf-8")).hexdigest()
+    return f"{name}-{digest[:_FILENAME_HASH_LENGTH]}"
+
+
+def _claim(claimed: Dict[str, str], filename: str, student_id: str) -> None:
+    """Registra el archivo de un estudiante; falla si otro reporte ya lo usa."""
+    owner = claimed.get(filename)
+    if owner is None:
+        claimed[filename] = student_id
+        return
+    if owner == student_id:
+        raise ReportFileCollisionError(f"student_id repetido: {student_id}")
+    raise ReportFileCollisionError(
+        f"Los estudiantes {owner} y {student_id} irían al archivo {filename}"
+    )
+
+
+def _renderer(report_format: str) -> Callable[[GradedRow], str]:
+    """Función que arma el reporte en el formato indicado."""
+    if report_format not in REPORT_FORMATS:
+        raise ValueError(f"Formato de reporte desconocido: {report_format}")
+    if report_format == "html":
+        return _render_html
+    return _render_text
+
+
+def _render_text(row: GradedRow) -> str:
+    """Reporte de texto, con las mismas líneas que el modo interactivo."""
+    if row.result is None:
+        return _TEXT_ERROR.substitute(student_id=row.student_id, error=row.error or "")
+    return _TEXT_REPORT.substitute(_values(row), student_id=row.student_id)
+
+
+def _render_html(row: GradedRow) -> str:
+    """Sección HTML del reporte."""
+    student_id = html.escape(row.student_id)
+    if row.result is None:
+        return _HTML_ERROR.substitute(
+            student_id=student_id, error=html.escape(row.error or "")
+        )
+    return _HTML_REPORT.substitute(_values(row), student_id=student_id)
+
+
+def _values(row: GradedRow) -> Dict[str, float]:
+    """Campos numéricos del resultado para la plantilla."""
+    result = row.result
+    assert result is not None
+    return {
+        "weighted_average": result["weighted_average"],
+        "penalty_applied": result["penalty_applied"],
+        "extra_points_applied": result["extra_points_applied"],
+        "final_grade": result["final_grade"],
+    }
+
+
+def _html_document(student_id: str, section: str) -> str:
+    """Documento HTML completo con una sola sección."""
+    title = "Reporte de " + html.escape(student_id)
+    return _HTML_HEADER.substitute(title=title) + section + _HTML_FOOTER
+
+
+def _submit(
+    pool: ThreadPoolExecutor,
+    slots: threading.BoundedSemaphore,
+    group: List[Tuple[str, str]],
+    pending: List["Future[int]"],
+    written: List[int],
+) -> List["Future[int]"]:
+    """Entrega un grupo a los hilos de escritura y anota los terminados en written."""
+    slots.acquire()
+    future = pool.submit(_write_group, group)
+    future.add_done_callback(lambda _: slots.release())
+    still_pending = []
+    for previous in pending:
+        if previous.done():
+            written.append(previous.result())  # relanza el error de escritura, si hubo
+        else:
+            still_pending.append(previous)
+    still_pending.append(future)
+    return still_pending
+
+
+def _write_group(group: List[Tuple[str, str]]) -> int:
+    """Escribe los archivos de un grupo de reportes y devuelve cuántos creó."""
+    for path, content in group:
+        with open(path, "w", encoding="utf-8", newline="") as output:
+            output.write(content)
+    return len(group)
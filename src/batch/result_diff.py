@@ -0,0 +1,410 @@
+"""Diferencias de notas finales entre dos ejecuciones de un lote.
+
+Compara dos archivos de resultados (CSV o binarios, ver pipeline y
+result_format) y reporta solo los estudiantes cuya nota final cambió, fue
+agregada o fue quitada. Una fila con error no tiene nota final; pasar de
+error a nota (o al revés) cuenta como cambio.
+
+Hay dos estrategias, ambas con memoria acotada:
+
+- Alineada: si ambos archivos tienen el mismo formato y los mismos
+  estudiantes en el mismo orden (el caso habitual al recalcular el mismo
+  roster), se compara un hash por bloque de filas y solo se revisan fila por
+  fila los bloques cuyo hash difiere. En archivos binarios el hash se calcula
+  directamente sobre las columnas mapeadas en memoria.
+- Mezcla: en otro caso, ambos lados se ordenan por student_id con
+  ordenamiento externo (external_sort) y se recorren juntos en una sola
+  pasada (merge-join).
+"""
+
+import hashlib
+import sys
+from operator import itemgetter
+from typing import IO, Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.batch.external_sort import DEFAULT_MAX_IN_MEMORY, external_sort
+from src.batch.result_format import ResultReader, is_result_binary
+from src.exceptions import InvalidResultFileError
+from src.models.grade_result import RESULT_DECIMALS
+
+DIFF_HEADER = "student_id,change,old_final_grade,new_final_grade,delta"
+CHANGE_CHANGED = "changed"
+CHANGE_ADDED = "added"
+CHANGE_REMOVED = "removed"
+DEFAULT_DIFF_BLOCK_SIZE = 4096
+_DIGEST_SIZE = 16
+
+# (student_id, nota final o None si la fila tiene error)
+_Row = Tuple[str, Optional[float]]
+_BlockDigest = Tuple[bytes, bytes]
+
+
+class ResultChange(NamedTuple):
+    """Cambio de nota final de un estudiante."""
+
+    student_id: str
+    change: str
+    old_grade: Optional[float]
+    new_grade: Optional[float]
+
+    @property
+    def delta(self) -> Optional[float]:
+        """Diferencia de nota (nueva - anterior), o None si falta alguna."""
+        if self.old_grade is None or self.new_grade is None:
+            return None
+        return round(self.new_grade - self.old_grade, RESULT_DECIMALS)
+
+
+class DiffSummary(NamedTuple):
+    """Conteos de una comparación de resultados."""
+
+    old_rows: int
+    new_rows: int
+    unchanged: int
+    changed: int
+    added: int
+    removed: int
+    aligned: bool
+    skipped_blocks: int
+    total_blocks: int
+
+    @property
+    def differences(self) -> int:
+        """Cantidad total de estudiantes con diferencias."""
+        return self.changed + self.added + self.removed
+
+
+def diff_results(
+    old_path: str,
+    new_path: str,
+    emit: Callable[[ResultChange], None],
+    block_size: int = DEFAULT_DIFF_BLOCK_SIZE,
+    max_in_memory: int = DEFAULT_MAX_IN_MEMORY,
+) -> DiffSummary:
+    """
+    Compara las notas finales de dos archivos de resultados.
+
+    Args:
+        old_path: Resultados publicados anteriormente (CSV o binario)
+        new_path: Resultados nuevos (CSV o binario)
+        emit: Función que recibe cada cambio
+        block_size: Filas por bloque de hash en la estrategia alineada
+        max_in_memory: Filas ordenadas en memoria por corrida en la mezcla
+
+    Returns:
+        Conteos de filas sin cambios, cambiadas, agregadas y quitadas
+
+    Raises:
+        InvalidResultFileError: Si algún archivo no tiene el formato esperado
+    """
+    old_side = _open_side(old_path)
+    try:
+        new_side = _open_side(new_path)
+        try:
+            if type(old_side) is type(new_side):
+                old_digests = old_side.block_digests(block_size)
+                new_digests = new_side.block_digests(block_size)
+                if (
+                    old_side.row_count == new_side.row_count
+                    and [ids for ids, _ in old_digests] == [ids for ids, _ in new_digests]
+                ):
+                    return _diff_aligned(
+                        old_side, new_side, old_digests, new_digests, block_size, emit
+                    )
+            return _diff_merged(old_side, new_side, emit, max_in_memory)
+        finally:
+            new_side.close()
+    finally:
+        old_side.close()
+
+
+def write_result_diff(
+    old_path: str,
+    new_path: str,
+    output_path: Optional[str] = None,
+    block_size: int = DEFAULT_DIFF_BLOCK_SIZE,
+    max_in_memory: int = DEFAULT_MAX_IN_MEMORY,
+) -> DiffSummary:
+    """
+    Compara dos archivos de resultados y escribe los cambios en CSV.
+
+    Args:
+        old_path: Resultados publicados anteriormente
+        new_path: Resultados nuevos
+        output_path: CSV de cambios (None para la salida estándar)
+        block_size: Filas por bloque de hash en la estrategia alineada
+        max_in_memory: Filas ordenadas en memoria por corrida en la mezcla
+
+    Returns:
+        Conteos de la comparación
+
+    Raises:
+        InvalidResultFileError: Si algún archivo no tiene el formato esperado
+    """
+    if output_path is None:
+        return _write_diff(sys.stdout, old_path, new_path, block_size, max_in_memory)
+    with open(output_path, "w", encoding="utf-8", newline="") as output:
+        return _write_diff(output, old_path, new_path, block_size, max_in_memory)
+
+
+def format_change_line(change: ResultChange) -> str:
+    """
+    Convierte un cambio en una fila CSV (sin salto de línea).
+
+    Args:
+        change: Cambio de nota
+
+    Returns:
+        Fila CSV con student_id, tipo de cambio, notas y diferencia
+    """
+    return ",".join(
+        (
+            change.student_id,
+            change.change,
+            _format_grade(change.old_grade),
+            _format_grade(change.new_grade),
+            _format_grade(change.delta),
+        )
+    )
+
+
+def _write_diff(
+    output: IO[str],
+    old_path: str,
+    new_path: str,
+    block_size: int,
+    max_in_memory: int,
+) -> DiffSummary:
+    """Escribe el encabezado y una fila por cambio."""
+    output.write(DIFF_HEADER + "\n")
+
+    def emit(change: ResultChange) -> None:
+        output.write(format_change_line(change) + "\n")
+
+    return diff_results(old_path, new_path, emit, block_size, max_in_memory)
+
+
+class _BinarySide:
+    """Archivo de resultados binario (columnas mapeadas en memoria)."""
+
+    def __init__(self, path: str) -> None:
+        """Abre el archivo binario."""
+        self._reader = ResultReader(path)
+        self.row_count = len(self._reader)
+
+    def block_digests(self, block_size: int) -> List[_BlockDigest]:
+        """Hash de identificadores y de notas de cada bloque de filas."""
+        reader = self._reader
+        final_grade = reader.column("final_grade")
+        status = reader.column("status")
+        digests: List[_BlockDigest] = []
+        for start in range(0, self.row_count, block_size):
+            end = min(start + block_size, self.row_count)
+            ids = hashlib.blake2b(
+                reader.student_ids.byte_range(start, end), digest_size=_DIGEST_SIZE
+            )
+            # Los offsets distinguen "ab" + "c" de "a" + "bc"
+            ids.update(reader.student_ids.offset_range(start, end))
+            values = hashlib.blake2b(final_grade[start:end], digest_size=_DIGEST_SIZE)
+            values.update(status[start:end])
+            digests.append((ids.digest(), values.digest()))
+        return digests
+
+    def block_rows(self, block_index: int, block_size: int) -> List[_Row]:
+        """Filas del bloque indicado."""
+        start = block_index * block_size
+        end = min(start + block_size, self.row_count)
+        return [self._row(index) for index in range(start, end)]
+
+    def rows(self) -> Iterator[_Row]:
+        """Itera las filas en el orden del archivo."""
+        for index in range(self.row_count):
+            yield self._row(index)
+
+    def close(self) -> None:
+        """Cierra el archivo."""
+        self._reader.close()
+
+    def _row(self, index: int) -> _Row:
+        """Identificador y nota final de una fila."""
+        student_id = self._reader.student_ids[index]
+        if self._reader.column("status")[index]:
+            return student_id, None
+        return student_id, self._reader.column("final_grade")[index]
+
+
+class _CsvSide:
+    """Archivo de resultados CSV, leído en modo binario."""
+
+    def __init__(self, path: str) -> None:
+        """Abre el archivo CSV."""
+        self._file = open(path, "rb")
+        self.row_count = 0
+        self._block_offsets: List[int] = []
+
+    def block_digests(self, block_size: int) -> List[_BlockDigest]:
+        """Hash de identificadores y de valores de cada bloque de filas."""
+        digests: List[_BlockDigest] = []
+        self._block_offsets = []
+        ids: List[bytes] = []
+        values: List[bytes] = []
+        self._file.seek(0)
+        self.row_count = 0
+        offset = 0
+        for line in self._file:
+            line_start = offset
+            offset += len(line)
+            student_id, separator, rest = line.rstrip(b"\r\n").partition(b",")
+            if not separator or student_id == b"student_id":
+                continue
+            if not ids:
+                self._block_offsets.append(line_start)
+            self.row_count += 1
+            ids.append(student_id)
+            values.append(rest)
+            if len(ids) == block_size:
+                digests.append(_digest_lines(ids, values))
+                ids, values = [], []
+        if ids:
+            digests.append(_digest_lines(ids, values))
+        return digests
+
+    def block_rows(self, block_index: int, block_size: int) -> List[_Row]:
+        """Filas del bloque indicado (requiere block_digests antes)."""
+        self._file.seek(self._block_offsets[block_index])
+        rows: List[_Row] = []
+        for line in self._file:
+            row = _parse_csv_row(line)
+            if row is None:
+                continue
+            rows.append(row)
+            if len(rows) == block_size:
+                break
+        return rows
+
+    def rows(self) -> Iterator[_Row]:
+        """Itera las filas en el orden del archivo."""
+        self._file.seek(0)
+        count = 0
+        for line in self._file:
+            row = _parse_csv_row(line)
+            if row is not None:
+                count += 1
+                yield row
+        self.row_count = count
+
+    def close(self) -> None:
+        """Cierra el archivo."""
+        self._file.close()
+
+
+def _open_side(path: str) -> "_BinarySide | _CsvSide":
+    """Abre un archivo de resultados según su formato."""
+    if is_result_binary(path):
+        return _BinarySide(path)
+    return _CsvSide(path)
+
+
+def _diff_aligned(
+    old_side: "_BinarySide | _CsvSide",
+    new_side: "_BinarySide | _CsvSide",
+    old_digests: List[_BlockDigest],
+    new_digests: List[_BlockDigest],
+    block_size: int,
+    emit: Callable[[ResultChange], None],
+) -> DiffSummary:
+    """Compara solo los bloques cuyo hash de valores difiere."""
+    changed = 0
+    skipped = 0
+    for block_index, (old_digest, new_digest) in enumerate(zip(old_digests, new_digests)):
+        if old_digest == new_digest:
+            skipped += 1
+            continue
+        old_rows = old_side.block_rows(block_index, block_size)
+        new_rows = new_side.block_rows(block_index, block_size)
+        for (student_id, old_grade), (_, new_grade) in zip(old_rows, new_rows):
+            if old_grade != new_grade:
+                changed += 1
+                emit(ResultChange(student_id, CHANGE_CHANGED, old_grade, new_grade))
+    return DiffSummary(
+        old_rows=old_side.row_count,
+        new_rows=new_side.row_count,
+        unchanged=old_side.row_count - changed,
+        changed=changed,
+        added=0,
+        removed=0,
+        aligned=True,
+        skipped_blocks=skipped,
+        total_blocks=len(old_digests),
+    )
+
+
+def _diff_merged(
+    old_side: "_BinarySide | _CsvSide",
+    new_side: "_BinarySide | _CsvSide",
+    emit: Callable[[ResultChange], None],
+    max_in_memory: int,
+) -> DiffSummary:
+    """Recorre ambos lados ordenados por student_id en una sola pasada."""
+    key = itemgetter(0)
+    old_rows = external_sort(old_side.rows(), key=key, max_in_memory=max_in_memory)
+    new_rows = external_sort(new_side.rows(), key=key, max_in_memory=max_in_memory)
+    unchanged = changed = added = removed = 0
+
+    old_row = next(old_rows, None)
+    new_row = next(new_rows, None)
+    while old_row is not None or new_row is not None:
+        if new_row is None or (old_row is not None and old_row[0] < new_row[0]):
+            assert old_row is not None
+            removed += 1
+            emit(ResultChange(old_row[0], CHANGE_REMOVED, old_row[1], None))
+            old_row = next(old_rows, None)
+        elif old_row is None or new_row[0] < old_row[0]:
+            added += 1
+            emit(ResultChange(new_row[0], CHANGE_ADDED, None, new_row[1]))
+            new_row = next(new_rows, None)
+        else:
+            if old_row[1] == new_row[1]:
+                unchanged += 1
+            else:
+                changed += 1
+                emit(ResultChange(old_row[0], CHANGE_CHANGED, old_row[1], new_row[1]))
+            old_row = next(old_rows, None)
+            new_row = next(new_rows, None)
+
+    return DiffSummary(
+        old_rows=old_side.row_count,
+        new_rows=new_side.row_count,
+        unchanged=unchanged,
+        changed=changed,
+        added=added,
+        removed=removed,
+        aligned=False,
+        skipped_blocks=0,
+        total_blocks=0,
+    )
+
+
+def _parse_csv_row(line: bytes) -> Optional[_Row]:
+    """Identificador y nota final de una fila CSV (None si no es una fila)."""
+    fields = line.rstrip(b"\r\n").split(b",", 2)
+    if len(fields) < 2 or fields[0] == b"student_id":
+        return None
+    try:
+        grade = float(fields[1]) if fields[1] else None
+    except ValueError as e:
+        raise InvalidResultFileError(f"Nota final inválida: {fields[1]!r}") from e
+    return str(fields[0], "utf-8"), grade
+
+
+def _digest_lines(ids: List[bytes], values: List[bytes]) -> _BlockDigest:
+    """Hash de los identificadores y de los valores de un bloque CSV."""
+    return (
+        hashlib.blake2b(b"\n".join(ids), digest_size=_DIGEST_SIZE).digest(),
+        hashlib.blake2b(b"\n".join(values), digest_size=_DIGEST_SIZE).digest(),
+    )
+
+
+def _format_grade(value: Optional[float]) -> str:
+    """Formatea una nota (vacía si no hay)."""
+    return "" if value is None else str(value)
@@ -0,0 +1,376 @@
+"""Formato binario columnar de resultados.
+
+Alternativa al CSV para salidas de millones de filas. Cada columna se
+almacena contigua, de modo que una herramienta puede leer solo la columna
+que necesita (por ejemplo final_grade) sin tocar el resto del archivo.
+
+Formato (little-endian):
+
+    Cabecera (40 bytes): magic ``GRRSLT01``, versión (uint32), reservado
+    (uint32), filas n, bytes de identificadores, bytes de errores (uint64).
+
+    Secciones, en este orden y contiguas:
+        id_offsets            int64[n+1]
+        error_offsets         int64[n+1]
+        final_grade           float64[n]
+        weighted_average      float64[n]
+        penalty_applied       float64[n]
+        extra_points_applied  float64[n]
+        status                int8[n]     (0 = calculado, 1 = error)
+        ids                   UTF-8
+        errors                UTF-8       (cadena vacía en filas sin error)
+
+Las filas con error tienen NaN en las columnas numéricas.
+"""
+
+import math
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.batch.batch_grader import GradedRow
+from src.batch.binary_format import StringTable, column_bytes, column_view
+from src.exceptions import InvalidResultFileError
+
+RESULT_MAGIC = b"GRRSLT01"
+RESULT_VERSION = 1
+RESULT_HEADER = struct.Struct("<8sIIQQQ")
+RESULT_COLUMNS = (
+    "final_grade",
+    "weighted_average",
+    "penalty_applied",
+    "extra_points_applied",
+)
+STATUS_OK = 0
+STATUS_ERROR = 1
+DEFAULT_BLOCK_SIZE = 65536
+_SECTION_ORDER = (
+    ("id_offsets", "error_offsets") + RESULT_COLUMNS + ("status", "ids", "errors")
+)
+
+
+class ResultWriter:
+    """
+    Escribe resultados en formato binario columnar por bloques.
+
+    Cada columna se acumula en memoria hasta ``block_size`` filas y luego se
+    vuelca a un archivo temporal propio; al cerrar, los bloques se copian
+    contiguos detrás de la cabecera. La memoria usada es proporcional al
+    tamaño de bloque y no a la cantidad de filas. El archivo final se
+    publica de forma atómica (os.replace) solo si close() termina bien.
+    """
+
+    def __init__(self, path: str, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        """
+        Inicializa el escritor.
+
+        Args:
+            path: Ruta del archivo de resultados
+            block_size: Filas acumuladas por columna antes de volcarlas
+        """
+        self._path = path
+        self._block_size = block_size
+        directory = os.path.dirname(os.path.abspath(path))
+        self._spools: Dict[str, IO[bytes]] = {
+            name: tempfile.TemporaryFile(dir=directory) for name in _SECTION_ORDER
+        }
+        self._numeric: Dict[str, array] = {name: array("d") for name in RESULT_COLUMNS}
+        self._status = array("b")
+        self._id_offsets = array("q", [0])
+        self._error_offsets = array("q", [0])
+        self._ids: List[bytes] = []
+        self._errors: List[bytes] = []
+        self._row_count = 0
+        self._error_count = 0
+        self._id_bytes = 0
+        self._error_bytes = 0
+        self._closed = False
+
+    @property
+    def row_count(self) -> int:
+        """Cantidad de filas escritas."""
+        return self._row_count
+
+    @property
+    def error_count(self) -> int:
+        """Cantidad de filas con error escritas."""
+        return self._error_count
+
+    def write(self, row: GradedRow) -> None:
+        """
+        Agrega una fila de resultados.
+
+        Args:
+            row: Resultado del estudiante
+        """
+        encoded_id = row.student_id.encode("utf-8")
+        self._id_bytes += len(encoded_id)
+        self._ids.append(encoded_id)
+        self._id_offsets.append(self._id_bytes)
+
+        if row.result is None:
+            encoded_error = (row.error or "").encode("utf-8")
+            self._error_bytes += len(encoded_error)
+            self._errors.append(encoded_error)
+            self._status.append(STATUS_ERROR)
+            self._error_count += 1
+            for name in RESULT_COLUMNS:
+                self._numeric[name].append(math.nan)
+        else:
+            self._status.append(STATUS_OK)
+            for name in RESULT_COLUMNS:
+                self._numeric[name].append(row.result[name])
+        self._error_offsets.append(self._error_bytes)
+
+        self._row_count += 1
+        if len(self._status) >= self._block_size:
+            self._flush_block()
+
+    def write_rows(self, rows: Iterable[GradedRow]) -> None:
+        """
+        Agrega varias filas de resultados.
+
+        Args:
+            rows: Resultados por estudiante
+        """
+        for row in rows:
+            self.write(row)
+
+    def close(self) -> None:
+        """Completa el archivo: escribe la cabecera y copia las columnas."""
+        if self._closed:
+            return
+        self._flush_block(final=True)
+
+        temporary_path = self._path + ".tmp"
+        with open(temporary_path, "wb") as output:
+            output.write(
+                RESULT_HEADER.pack(
+                    RESULT_MAGIC,
+                    RESULT_VERSION,
+                    0,
+                    self._row_count,
+                    self._id_bytes,
+                    self._error_bytes,
+                )
+            )
+            for name in _SECTION_ORDER:
+                spool = self._spools[name]
+                spool.seek(0)
+                shutil.copyfileobj(spool, output)
+        os.replace(temporary_path, self._path)
+        self._release_spools()
+
+    def abort(self) -> None:
+        """Descarta lo escrito sin publicar el archivo de resultados."""
+        self._release_spools()
+
+    def __enter__(self) -> "ResultWriter":
+        """Permite usar el escritor como context manager."""
+        return self
+
+    def __exit__(self, exc_type: Optional[type], *exc_info: object) -> None:
+        """Completa el archivo, o lo descarta si hubo una excepción."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _flush_block(self, final: bool = False) -> None:
+        """Vuelca el bloque actual de cada columna a su archivo temporal."""
+        for name in RESULT_COLUMNS:
+            self._spools[name].write(column_bytes(self._numeric[name]))
+            self._numeric[name] = array("d")
+        self._spools["status"].write(column_bytes(self._status))
+        self._status = array("b")
+        self._spools["ids"].write(b"".join(self._ids))
+        self._ids = []
+        self._spools["errors"].write(b"".join(self._errors))
+        self._errors = []
+
+        # Los offsets tienen n+1 elementos: el último se conserva para el
+        # siguiente bloque y se escribe solo al cerrar.
+        for name, offsets in (
+            ("id_offsets", self._id_offsets),
+            ("error_offsets", self._error_offsets),
+        ):
+            pending = offsets if final else offsets[:-1]
+            self._spools[name].write(column_bytes(pending))
+            del offsets[: len(pending)]
+
+    def _release_spools(self) -> None:
+        """Cierra los archivos temporales de las columnas."""
+        for spool in self._spools.values():
+            spool.close()
+        self._closed = True
+
+
+class ResultReader:
+    """
+    Lee un archivo de resultados binario mapeándolo en memoria.
+
+    Las columnas son vistas sobre el mmap: acceder a una columna solo lee
+    las páginas de esa columna.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Abre el archivo de resultados.
+
+        Args:
+            path: Ruta del archivo
+
+        Raises:
+            InvalidResultFileError: Si el archivo no tiene el formato esperado
+        """
+        with open(path, "rb") as result_file:
+            size = os.fstat(result_file.fileno()).st_size
+            if size < RESULT_HEADER.size:
+                raise InvalidResultFileError(f"Archivo de resultados truncado: {path}")
+            self._backing = mmap.mmap(result_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, rows, id_bytes, error_bytes = RESULT_HEADER.unpack_from(
+            self._backing
+        )
+        expected_size = RESULT_HEADER.size + 8 * (2 * (rows + 1) + 4 * rows)
+        expected_size += rows + id_bytes + error_bytes
+        if magic != RESULT_MAGIC or version != RESULT_VERSION or size != expected_size:
+            self._backing.close()
+            raise InvalidResultFileError(f"Archivo de resultados inválido: {path}")
+
+        self._row_count = rows
+        self._offsets = _section_offsets(rows, id_bytes)
+        buffer = memoryview(self._backing)
+        self._columns: Dict[str, memoryview] = {}
+        self.student_ids = StringTable(
+            column_view(buffer, self._offsets["id_offsets"], "q", rows + 1),
+            buffer[self._offsets["ids"] : self._offsets["ids"] + id_bytes],
+        )
+        self.errors = StringTable(
+            column_view(buffer, self._offsets["error_offsets"], "q", rows + 1),
+            buffer[self._offsets["errors"] : self._offsets["errors"] + error_bytes],
+        )
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        """Cantidad de filas."""
+        return self._row_count
+
+    def column(self, name: str) -> memoryview:
+        """
+        Retorna una columna numérica sin leer las demás.
+
+        Args:
+            name: final_grade, weighted_average, penalty_applied,
+                extra_points_applied o status
+
+        Returns:
+            Vista indexable de la columna (float64, o int8 para status)
+
+        Raises:
+            KeyError: Si la columna no existe
+        """
+        if name not in self._columns:
+            if name not in RESULT_COLUMNS and name != "status":
+                raise KeyError(name)
+            typecode = "b" if name == "status" else "d"
+            self._columns[name] = column_view(
+                self._buffer, self._offsets[name], typecode, self._row_count
+            )
+        return self._columns[name]
+
+    def row(self, index: int) -> GradedRow:
+        """
+        Reconstruye la fila indicada como GradedRow.
+
+        Args:
+            index: Posición de la fila
+
+        Returns:
+            Resultado del estudiante
+        """
+        student_id = self.student_ids[index]
+        if self.column("status")[index] == STATUS_ERROR:
+            return GradedRow(student_id, None, self.errors[index])
+        result = {name: self.column(name)[index] for name in RESULT_COLUMNS}
+        return GradedRow(student_id, result, None)
+
+    def rows(self) -> Iterator[GradedRow]:
+        """Itera las filas en orden."""
+        for index in range(self._row_count):
+            yield self.row(index)
+
+    def close(self) -> None:
+        """Libera las vistas y el archivo mapeado."""
+        if self._backing.closed:
+            return
+        for view in self._columns.values():
+            if isinstance(view, memoryview):
+                view.release()
+        self._columns = {}
+        self.student_ids.release()
+        self.errors.release()
+        self._buffer.release()
+        self._backing.close()
+
+    def __enter__(self) -> "ResultReader":
+        """Permite usar el lector como context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Cierra el lector al salir del bloque ``with``."""
+        self.close()
+
+
+def is_result_binary(path: str) -> bool:
+    """
+    Indica si el archivo es un archivo de resultados binario.
+
+    Args:
+        path: Ruta del archivo
+
+    Returns:
+        True si el archivo comienza con el magic del formato
+    """
+    with open(path, "rb") as result_file:
+        return result_file.read(len(RESULT_MAGIC)) == RESULT_MAGIC
+
+
+def write_results_binary(rows: Iterable[GradedRow], path: str) -> Tuple[int, int]:
+    """
+    Escribe resultados en formato binario columnar.
+
+    Args:
+        rows: Resultados por estudiante
+        path: Ruta del archivo de salida
+
+    Returns:
+        Tupla (filas escritas, filas con error)
+    """
+    with ResultWriter(path) as writer:
+        writer.write_rows(rows)
+    return writer.row_count, writer.error_count
+
+
+def _section_offsets(rows: int, id_bytes: int) -> Dict[str, int]:
+    """Calcula la posición de inicio de cada sección del archivo."""
+    offsets: Dict[str, int] = {}
+    position = RESULT_HEADER.size
+    for name, size in (
+        ("id_offsets", 8 * (rows + 1)),
+        ("error_offsets", 8 * (rows + 1)),
+        ("final_grade", 8 * rows),
+        ("weighted_average", 8 * rows),
+        ("penalty_applied", 8 * rows),
+        ("extra_points_applied", 8 * rows),
+        ("status", rows),
+        ("ids", id_bytes),
+        ("errors", 0),
+    ):
+        offsets[name] = position
+        position += size
+    return offsets
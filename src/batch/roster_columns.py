@@ -0,0 +1,415 @@
+"""Representación columnar de un roster y su formato binario.
+
+Formato binario (little-endian), pensado para generarse una vez a partir
+del CSV y releerse muchas veces sin parsear filas:
+
+    Cabecera (48 bytes): magic ``GRROST01``, versión (uint32), reservado
+    (uint32), filas n, evaluaciones e, votos v, bytes de identificadores
+    (uint64 cada uno).
+
+    Secciones, en este orden y contiguas:
+        id_offsets        int64[n+1]
+        eval_offsets      int64[n+1]
+        vote_offsets      int64[n+1]
+        grades            float64[e]
+        weights           float64[e]
+        tardiness         float64[n]
+        extra_points      float64[n]
+        reached_minimum   int8[n]
+        votes             int8[v]
+        ids               UTF-8 (bytes de identificadores)
+
+Las secciones de 8 bytes van primero, por lo que todas quedan alineadas
+y pueden leerse con ``memoryview.cast`` directamente sobre el mmap. Al
+abrir el archivo se verifica que cada tabla de offsets empiece en 0, no
+decrezca y termine en el largo de su sección: un archivo dañado o editado
+a mano produciría, si no, filas equivocadas en silencio.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from src.batch.binary_format import (
+    StringTable,
+    column_bytes,
+    column_view,
+    pack_strings,
+)
+from src.exceptions import InvalidRosterError
+from src.models.student_record import StudentRecord
+from src.models.weight_scheme import WeightScheme
+
+ROSTER_MAGIC = b"GRROST01"
+ROSTER_VERSION = 1
+ROSTER_HEADER = struct.Struct("<8sIIQQQQ")
+# Offsets comparados por vez al validar un roster binario
+_OFFSET_CHECK_BLOCK = 65536
+
+
+class RosterColumns:
+    """
+    Roster almacenado por columnas en arreglos numéricos.
+
+    Las columnas pueden ser ``array`` (construidas en memoria) o vistas
+    ``memoryview`` sobre un archivo binario mapeado (ver read_roster_binary).
+    En el segundo caso se debe llamar a close() (o usar ``with``) al terminar.
+    """
+
+    def __init__(
+        self,
+        student_ids: Sequence[str],
+        eval_offsets: Sequence[int],
+        grades: Sequence[float],
+        weights: Sequence[float],
+        has_reached_minimum: Sequence[int],
+        tardiness_percentages: Sequence[float],
+        vote_offsets: Sequence[int],
+        votes: Sequence[int],
+        extra_points: Sequence[float],
+        backing: Optional[mmap.mmap] = None,
+    ) -> None:
+        """
+        Inicializa el roster columnar.
+
+        Args:
+            student_ids: Identificadores de estudiantes (n)
+            eval_offsets: Inicio de las evaluaciones de cada fila (n+1)
+            grades: Notas de todas las evaluaciones concatenadas
+            weights: Pesos de todas las evaluaciones concatenadas
+            has_reached_minimum: 1 si alcanzó la asistencia mínima (n)
+            tardiness_percentages: Porcentaje de tardanzas (n)
+            vote_offsets: Inicio de los votos de cada fila (n+1)
+            votes: Votos de profesores concatenados (1/0)
+            extra_points: Puntos extra (n)
+            backing: Archivo mapeado que respalda las vistas, si existe
+        """
+        self.student_ids = student_ids
+        self.eval_offsets = eval_offsets
+        self.grades = grades
+        self.weights = weights
+        self.has_reached_minimum = has_reached_minimum
+        self.tardiness_percentages = tardiness_percentages
+        self.vote_offsets = vote_offsets
+        self.votes = votes
+        self.extra_points = extra_points
+        self._backing = backing
+
+    def __len__(self) -> int:
+        """Cantidad de estudiantes."""
+        return len(self.eval_offsets) - 1
+
+    def record(self, index: int) -> StudentRecord:
+        """
+        Materializa la fila indicada como StudentRecord.
+
+        Args:
+            index: Posición de la fila
+
+        Returns:
+            Registro del estudiante
+        """
+        eval_start = self.eval_offsets[index]
+        eval_end = self.eval_offsets[index + 1]
+        vote_start = self.vote_offsets[index]
+        vote_end = self.vote_offsets[index + 1]
+        return StudentRecord(
+            student_id=self.student_ids[index],
+            grades=self.grades[eval_start:eval_end],
+            weights=WeightScheme.intern(self.weights[eval_start:eval_end]).weights,
+            has_reached_minimum=bool(self.has_reached_minimum[index]),
+            tardiness_percentage=self.tardiness_percentages[index],
+            all_years_teachers=[bool(vote) for vote in self.votes[vote_start:vote_end]],
+            extra_points=self.extra_points[index],
+        )
+
+    def records(self, start: int = 0) -> Iterator[StudentRecord]:
+        """
+        Itera los registros en orden.
+
+        Args:
+            start: Posición de la primera fila a retornar
+
+        Yields:
+            Registros desde la fila ``start``
+        """
+        for index in range(start, len(self)):
+            yield self.record(index)
+
+    def close(self) -> None:
+        """Libera las vistas y el archivo mapeado que respalda las columnas."""
+        if self._backing is None:
+            return
+        for column in (
+            self.eval_offsets,
+            self.grades,
+            self.weights,
+            self.has_reached_minimum,
+            self.tardiness_percentages,
+            self.vote_offsets,
+            self.votes,
+            self.extra_points,
+        ):
+            if isinstance(column, memoryview):
+                column.release()
+        if isinstance(self.student_ids, StringTable):
+            self.student_ids.release()
+        self._backing.close()
+        self._backing = None
+
+    def __enter__(self) -> "RosterColumns":
+        """Permite usar el roster como context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Cierra el roster al salir del bloque ``with``."""
+        self.close()
+
+    @staticmethod
+    def from_records(records: Iterable[StudentRecord]) -> "RosterColumns":
+        """
+        Construye un roster columnar a partir de registros.
+
+        Args:
+            records: Registros de estudiantes
+
+        Returns:
+            Roster columnar en memoria
+        """
+        builder = RosterColumnsBuilder()
+        for record in records:
+            builder.append(
+                record.student_id,
+                record.grades,
+                record.weights,
+                record.has_reached_minimum,
+                record.tardiness_percentage,
+                record.all_years_teachers,
+                record.extra_points,
+            )
+        return builder.build()
+
+
+class RosterColumnsBuilder:
+    """Acumula filas en arreglos columnares."""
+
+    def __init__(self) -> None:
+        """Inicializa el constructor con columnas vacías."""
+        self._student_ids: List[str] = []
+        self._eval_offsets = array("q", [0])
+        self._grades = array("d")
+        self._weights = array("d")
+        self._has_reached_minimum = array("b")
+        self._tardiness_percentages = array("d")
+        self._vote_offsets = array("q", [0])
+        self._votes = array("b")
+        self._extra_points = array("d")
+
+    def __len__(self) -> int:
+        """Cantidad de filas acumuladas."""
+        return len(self._student_ids)
+
+    def append(
+        self,
+        student_id: str,
+        grades: Iterable[float],
+        weights: Iterable[float],
+        has_reached_minimum: bool,
+        tardiness_percentage: float,
+        votes: Iterable[bool],
+        extra_points: float,
+    ) -> None:
+        """
+        Agrega una fila al roster.
+
+        Args:
+            student_id: Identificador del estudiante
+            grades: Notas de las evaluaciones
+            weights: Pesos de las evaluaciones
+            has_reached_minimum: Si alcanzó la asistencia mínima
+            tardiness_percentage: Porcentaje de tardanzas
+            votes: Votos de profesores
+            extra_points: Puntos extra
+        """
+        self._student_ids.append(student_id)
+        self._grades.extend(grades)
+        self._weights.extend(weights)
+        if len(self._grades) != len(self._weights):
+            raise InvalidRosterError(
+                f"Cantidad distinta de notas y pesos para el estudiante {student_id}"
+            )
+        self._eval_offsets.append(len(self._grades))
+        self._has_reached_minimum.append(1 if has_reached_minimum else 0)
+        self._tardiness_percentages.append(tardiness_percentage)
+        self._votes.extend(1 if vote else 0 for vote in votes)
+        self._vote_offsets.append(len(self._votes))
+        self._extra_points.append(extra_points)
+
+    def build(self) -> RosterColumns:
+        """
+        Retorna el roster columnar acumulado.
+
+        Returns:
+            Roster columnar en memoria
+        """
+        return RosterColumns(
+            student_ids=self._student_ids,
+            eval_offsets=self._eval_offsets,
+            grades=self._grades,
+            weights=self._weights,
+            has_reached_minimum=self._has_reached_minimum,
+            tardiness_percentages=self._tardiness_percentages,
+            vote_offsets=self._vote_offsets,
+            votes=self._votes,
+            extra_points=self._extra_points,
+        )
+
+
+def write_roster_binary(columns: RosterColumns, path: str) -> None:
+    """
+    Escribe un roster columnar en formato binario.
+
+    Args:
+        columns: Roster columnar
+        path: Ruta del archivo binario de salida
+    """
+    id_offsets, id_data = pack_strings(columns.student_ids)
+    row_count = len(columns)
+    with open(path, "wb") as output:
+        output.write(
+            ROSTER_HEADER.pack(
+                ROSTER_MAGIC,
+                ROSTER_VERSION,
+                0,
+                row_count,
+                len(columns.grades),
+                len(columns.votes),
+                len(id_data),
+            )
+        )
+        output.write(column_bytes(id_offsets))
+        for typecode, column in (
+            ("q", columns.eval_offsets),
+            ("q", columns.vote_offsets),
+            ("d", columns.grades),
+            ("d", columns.weights),
+            ("d", columns.tardiness_percentages),
+            ("d", columns.extra_points),
+            ("b", columns.has_reached_minimum),
+            ("b", columns.votes),
+        ):
+            output.write(column_bytes(array(typecode, column)))
+        output.write(id_data)
+
+
+def is_roster_binary(path: str) -> bool:
+    """
+    Indica si el archivo es un roster en formato binario.
+
+    Args:
+        path: Ruta del archivo
+
+    Returns:
+        True si el archivo comienza con el magic del formato binario
+    """
+    with open(path, "rb") as roster_file:
+        return roster_file.read(len(ROSTER_MAGIC)) == ROSTER_MAGIC
+
+
+def read_roster_binary(path: str) -> RosterColumns:
+    """
+    Carga un roster binario mapeándolo en memoria, sin parsear filas.
+
+    Las columnas numéricas son vistas sobre el mmap (cero copias); el
+    roster retornado debe cerrarse con close() o usarse con ``with``.
+
+    Args:
+        path: Ruta del archivo binario
+
+    Returns:
+        Roster columnar respaldado por el archivo
+
+    Raises:
+        InvalidRosterError: Si el archivo no tiene el formato esperado o sus
+            offsets no son consistentes con las secciones
+    """
+    with open(path, "rb") as roster_file:
+        size = os.fstat(roster_file.fileno()).st_size
+        if size < ROSTER_HEADER.size:
+            raise InvalidRosterError(f"Roster binario truncado: {path}")
+        backing = mmap.mmap(roster_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, _, rows, evaluations, votes, id_bytes = ROSTER_HEADER.unpack_from(
+        backing
+    )
+    expected_size = ROSTER_HEADER.size + 8 * (3 * (rows + 1) + 2 * evaluations + 2 * rows)
+    expected_size += rows + votes + id_bytes
+    if magic != ROSTER_MAGIC or version != ROSTER_VERSION or size != expected_size:
+        backing.close()
+        raise InvalidRosterError(f"Archivo de roster binario inválido: {path}")
+
+    buffer = memoryview(backing)
+    position = ROSTER_HEADER.size
+    sections = []
+    for typecode, count in (
+        ("q", rows + 1),
+        ("q", rows + 1),
+        ("q", rows + 1),
+        ("d", evaluations),
+        ("d", evaluations),
+        ("d", rows),
+        ("d", rows),
+        ("b", rows),
+        ("b", votes),
+    ):
+        sections.append(column_view(buffer, position, typecode, count))
+        position += array(typecode).itemsize * count
+    for offsets, end in zip(sections, (id_bytes, evaluations, votes)):
+        if not _valid_offsets(offsets, end):
+            for section in sections:
+                section.release()
+            buffer.release()
+            backing.close()
+            raise InvalidRosterError(f"Offsets inválidos en el roster binario: {path}")
+    id_table = StringTable(sections[0], buffer[position : position + id_bytes])
+    buffer.release()
+
+    (
+        _,
+        eval_offsets,
+        vote_offsets,
+        grades,
+        weights,
+        tardiness,
+        extra_points,
+        reached_minimum,
+        vote_values,
+    ) = sections
+    return RosterColumns(
+        student_ids=id_table,
+        eval_offsets=eval_offsets,
+        grades=grades,
+        weights=weights,
+        has_reached_minimum=reached_minimum,
+        tardiness_percentages=tardiness,
+        vote_offsets=vote_offsets,
+        votes=vote_values,
+        extra_points=extra_points,
+        backing=backing,
+    )
+
+
+def _valid_offsets(offsets: memoryview, end: int) -> bool:
+    """Indica si los offsets empiezan en 0, no decrecen y terminan en end."""
+    if offsets[0] != 0 or offsets[-1] != end:
+        return False
+    previous = 0
+    # Por bloques: sorted() en C sobre una lista ya ordenada es lineal
+    for start in range(0, len(offsets), _OFFSET_CHECK_BLOCK):
+        block = offsets[start : start + _OFFSET_CHECK_BLOCK].tolist()
+        if block[0] < previous or block != sorted(block):
+            return False
+        previous = block[-1]
+    return True
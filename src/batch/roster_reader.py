@@ -0,0 +1,150 @@
+"""Lectura de archivos de estudiantes (roster) en formato CSV.
+
+Formato de cada fila (separada por comas):
+
+    student_id,has_reached_minimum,tardiness_percentage,teachers_votes,extra_points,evaluations
+
+- has_reached_minimum: ``s`` o ``n``
+- teachers_votes: un carácter ``s``/``n`` por profesor (vacío si no hay votos)
+- evaluations: pares ``nota:peso`` separados por ``;`` (vacío si no hay)
+
+La primera fila puede ser una cabecera (primer campo ``student_id``) y las
+líneas vacías o que comienzan con ``#`` se ignoran.
+"""
+
+from typing import Iterator, List, Tuple
+
+from src.exceptions import InvalidRosterError
+from src.models.student_record import StudentRecord
+from src.models.weight_scheme import WeightScheme
+
+ROSTER_HEADER = (
+    "student_id,has_reached_minimum,tardiness_percentage,"
+    "teachers_votes,extra_points,evaluations"
+)
+ROSTER_FIELD_COUNT = 6
+
+
+def read_roster_csv(path: str) -> Iterator[StudentRecord]:
+    """
+    Lee un archivo roster y genera un registro por estudiante.
+
+    Args:
+        path: Ruta del archivo CSV
+
+    Yields:
+        Registros de estudiantes en el orden del archivo
+
+    Raises:
+        InvalidRosterError: Si alguna fila tiene un formato inválido
+    """
+    with open(path, "r", encoding="utf-8") as roster_file:
+        yield from parse_roster_lines(roster_file)
+
+
+def parse_roster_lines(lines: Iterator[str]) -> Iterator[StudentRecord]:
+    """
+    Convierte líneas de texto en registros de estudiantes.
+
+    Args:
+        lines: Líneas del roster (con o sin salto de línea final)
+
+    Yields:
+        Registros de estudiantes
+
+    Raises:
+        InvalidRosterError: Si alguna fila tiene un formato inválido
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if _is_skippable(line):
+            continue
+        yield parse_roster_line(line, line_number)
+
+
+def parse_roster_line(line: str, line_number: int = 0) -> StudentRecord:
+    """
+    Convierte una fila del roster en un registro de estudiante.
+
+    Args:
+        line: Fila del roster
+        line_number: Número de línea (para mensajes de error)
+
+    Returns:
+        Registro del estudiante
+
+    Raises:
+        InvalidRosterError: Si la fila tiene un formato inválido
+    """
+    fields = line.rstrip("\r\n").split(",")
+    if len(fields) != ROSTER_FIELD_COUNT:
+        raise InvalidRosterError(
+            f"Línea {line_number}: se esperaban {ROSTER_FIELD_COUNT} campos. "
+            f"Campos recibidos: {len(fields)}"
+        )
+
+    student_id, attendance, tardiness, votes, extra, evaluations = fields
+    try:
+        grades, weights = _parse_evaluations(evaluations.strip())
+        return StudentRecord(
+            student_id=student_id.strip(),
+            grades=grades,
+            weights=WeightScheme.intern(weights).weights,
+            has_reached_minimum=_parse_flag(attendance),
+            tardiness_percentage=float(tardiness),
+            all_years_teachers=[_parse_flag(vote) for vote in votes.strip()],
+            extra_points=float(extra),
+        )
+    except ValueError as e:
+        raise InvalidRosterError(f"Línea {line_number}: {e}") from e
+
+
+def format_roster_line(record: StudentRecord) -> str:
+    """
+    Convierte un registro de estudiante en una fila del roster.
+
+    Args:
+        record: Registro del estudiante
+
+    Returns:
+        Fila del roster (sin salto de línea)
+    """
+    votes = "".join("s" if vote else "n" for vote in record.all_years_teachers)
+    evaluations = ";".join(
+        f"{grade!r}:{weight!r}" for grade, weight in zip(record.grades, record.weights)
+    )
+    return (
+        f"{record.student_id},{'s' if record.has_reached_minimum else 'n'},"
+        f"{record.tardiness_percentage!r},{votes},{record.extra_points!r},{evaluations}"
+    )
+
+
+def _is_skippable(line: str) -> bool:
+    """Indica si la línea es vacía, un comentario o la cabecera."""
+    stripped = line.strip()
+    return not stripped or stripped.startswith("#") or stripped.startswith("student_id,")
+
+
+def _parse_flag(value: str) -> bool:
+    """Convierte ``s``/``n`` en un booleano."""
+    flag = value.strip().lower()
+    if flag == "s":
+        return True
+    if flag == "n":
+        return False
+    raise ValueError(f"Se esperaba 's' o 'n'. Valor recibido: {value!r}")
+
+
+def _parse_evaluations(value: str) -> Tuple[List[float], List[float]]:
+    """Convierte ``nota:peso;nota:peso`` en listas de notas y pesos."""
+    grades: List[float] = []
+    weights: List[float] = []
+    if not value:
+        return grades, weights
+
+    for pair in value.split(";"):
+        grade, separator, weight = pair.partition(":")
+        if not separator:
+            raise ValueError(f"Evaluación inválida (se esperaba nota:peso): {pair!r}")
+        grades.append(float(grade))
+        weights.append(float(weight))
+    return grades, weights
@@ -0,0 +1,364 @@
+"""Cálculo por lotes particionado en fragmentos (shards) independientes.
+
+Los estudiantes se reparten en N fragmentos según un hash estable de su
+identificador. Cada fragmento se procesa en un proceso independiente
+(``python -m src.cli shard-worker``), que hace las veces de un nodo, y luego
+las salidas se combinan en un único resultado determinista:
+
+- Las filas se escriben en el mismo orden del roster original: se recorre
+  el roster y cada fila se toma, en orden, de la salida de su fragmento.
+- Las estadísticas de cada fragmento se combinan en orden de índice.
+
+Un manifiesto JSON en el directorio de trabajo registra los fragmentos y
+su estado, de modo que un fragmento fallido puede reprocesarse por sí solo.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+import zlib
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, TextIO
+
+from src.batch.checkpoint import input_fingerprint, write_json_atomically
+from src.batch.mmap_roster_reader import open_roster
+from src.batch.pipeline import RESULTS_HEADER, run_batch
+from src.batch.roster_reader import format_roster_line
+from src.batch.statistics import GradeStatistics
+from src.exceptions import ShardingError
+
+MANIFEST_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+_POLL_INTERVAL = 0.01
+
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+
+class ShardRunSummary(NamedTuple):
+    """Resumen de una ejecución particionada."""
+
+    shard_count: int
+    failed_shards: List[int]
+    statistics: Optional[GradeStatistics]
+
+
+def shard_for(student_id: str, shard_count: int) -> int:
+    """
+    Calcula el fragmento de un estudiante con un hash estable (CRC32).
+
+    A diferencia de hash(), el resultado no depende del proceso ni de
+    PYTHONHASHSEED, por lo que todos los nodos asignan igual.
+
+    Args:
+        student_id: Identificador del estudiante
+        shard_count: Cantidad de fragmentos
+
+    Returns:
+        Índice del fragmento (0..shard_count-1)
+    """
+    return zlib.crc32(student_id.encode("utf-8")) % shard_count
+
+
+class ShardManifest:
+    """Manifiesto persistente de una ejecución particionada."""
+
+    def __init__(self, path: str, data: Dict) -> None:
+        """
+        Inicializa el manifiesto.
+
+        Args:
+            path: Ruta del archivo de manifiesto
+            data: Contenido del manifiesto
+        """
+        self.path = path
+        self.data = data
+
+    @property
+    def shard_count(self) -> int:
+        """Cantidad de fragmentos."""
+        return self.data["shard_count"]
+
+    @property
+    def shards(self) -> List[Dict]:
+        """Entradas de cada fragmento (input, output, statistics, status)."""
+        return self.data["shards"]
+
+    def pending_shards(self) -> List[int]:
+        """Índices de los fragmentos que aún no terminaron con éxito."""
+        return [
+            shard["index"] for shard in self.shards if shard["status"] != STATUS_DONE
+        ]
+
+    def save(self) -> None:
+        """Persiste el manifiesto de forma atómica."""
+        write_json_atomically(self.path, self.data)
+
+    @staticmethod
+    def load(path: str) -> Optional["ShardManifest"]:
+        """
+        Lee un manifiesto existente.
+
+        Args:
+            path: Ruta del manifiesto
+
+        Returns:
+            Manifiesto, o None si no existe
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as manifest_file:
+                data = json.load(manifest_file)
+        except FileNotFoundError:
+            return None
+        if data.get("version") != MANIFEST_VERSION:
+            raise ShardingError(f"Versión de manifiesto no soportada: {path}")
+        return ShardManifest(path, data)
+
+
+def partition_roster(
+    input_path: str, work_dir: str, shard_count: int, deduplicate: bool = False
+) -> ShardManifest:
+    """
+    Reparte el roster en fragmentos y crea el manifiesto.
+
+    Args:
+        input_path: Ruta del roster (CSV o binario)
+        work_dir: Directorio de trabajo de los fragmentos
+        shard_count: Cantidad de fragmentos
+        deduplicate: Si cada fragmento usa deduplicación de perfiles
+
+    Returns:
+        Manifiesto con todos los fragmentos pendientes
+    """
+    if shard_count < 1:
+        raise ShardingError("La cantidad de fragmentos debe ser al menos 1")
+    os.makedirs(work_dir, exist_ok=True)
+
+    shards = [
+        {
+            "index": index,
+            "input": os.path.join(work_dir, f"shard-{index:04d}.csv"),
+            "output": os.path.join(work_dir, f"shard-{index:04d}.results.csv"),
+            "statistics": os.path.join(work_dir, f"shard-{index:04d}.stats.json"),
+            "rows": 0,
+            "status": STATUS_PENDING,
+        }
+        for index in range(shard_count)
+    ]
+    shard_files = [open(shard["input"], "w", encoding="utf-8") for shard in shards]
+    try:
+        with open_roster(input_path) as roster:
+            for record in roster.records():
+                index = shard_for(record.student_id, shard_count)
+                shard_files[index].write(format_roster_line(record) + "\n")
+                shards[index]["rows"] += 1
+    finally:
+        for shard_file in shard_files:
+            shard_file.close()
+
+    manifest = ShardManifest(
+        os.path.join(work_dir, MANIFEST_NAME),
+        {
+            "version": MANIFEST_VERSION,
+            "input_path": os.path.abspath(input_path),
+            "input_fingerprint": input_fingerprint(input_path),
+            "shard_count": shard_count,
+            "deduplicate": deduplicate,
+            "shards": shards,
+        },
+    )
+    manifest.save()
+    return manifest
+
+
+def run_shard_worker(manifest_path: str, index: int) -> GradeStatistics:
+    """
+    Procesa un fragmento (punto de entrada de cada proceso/nodo).
+
+    Args:
+        manifest_path: Ruta del manifiesto
+        index: Índice del fragmento
+
+    Returns:
+        Estadísticas del fragmento (también se guardan en disco)
+    """
+    manifest = ShardManifest.load(manifest_path)
+    if manifest is None:
+        raise ShardingError(f"No existe el manifiesto: {manifest_path}")
+    shard = manifest.shards[index]
+    summary = run_batch(
+        shard["input"], shard["output"], deduplicate=manifest.data["deduplicate"]
+    )
+    write_json_atomically(shard["statistics"], summary.statistics.to_dict())
+    return summary.statistics
+
+
+def run_shards(
+    manifest: ShardManifest,
+    indices: Sequence[int],
+    max_parallel: Optional[int] = None,
+) -> List[int]:
+    """
+    Ejecuta fragmentos como procesos independientes y actualiza el manifiesto.
+
+    Args:
+        manifest: Manifiesto de la ejecución
+        indices: Fragmentos a ejecutar
+        max_parallel: Procesos simultáneos (por defecto, cantidad de CPUs)
+
+    Returns:
+        Índices de los fragmentos que fallaron
+    """
+    max_parallel = max_parallel or os.cpu_count() or 1
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [_PROJECT_ROOT, environment.get("PYTHONPATH")])
+    )
+
+    queue = list(indices)
+    running: Dict[int, subprocess.Popen] = {}
+    failed: List[int] = []
+    while queue or running:
+        while queue and len(running) < max_parallel:
+            index = queue.pop(0)
+            command = [sys.executable, "-m", "src.cli", "shard-worker"]
+            running[index] = subprocess.Popen(
+                command + [manifest.path, str(index)],
+                env=environment,
+                stdout=subprocess.DEVNULL,
+            )
+        # Se consultan todos los procesos para liberar el cupo del primero
+        # que termine, no del más antiguo
+        finished = [
+            (index, return_code)
+            for index, return_code in (
+                (index, process.poll()) for index, process in running.items()
+            )
+            if return_code is not None
+        ]
+        if not finished:
+            time.sleep(_POLL_INTERVAL)
+            continue
+        for index, return_code in finished:
+            del running[index]
+            status = STATUS_DONE if return_code == 0 else STATUS_FAILED
+            manifest.shards[index]["status"] = status
+            if status == STATUS_FAILED:
+                failed.append(index)
+        manifest.save()
+    return sorted(failed)
+
+
+def merge_shards(manifest: ShardManifest, output_path: str) -> GradeStatistics:
+    """
+    Combina las salidas de los fragmentos en un resultado determinista.
+
+    Args:
+        manifest: Manifiesto con todos los fragmentos terminados
+        output_path: Ruta del CSV de resultados combinado
+
+    Returns:
+        Estadísticas combinadas en orden de índice de fragmento
+
+    Raises:
+        ShardingError: Si hay fragmentos pendientes o sus salidas no
+            corresponden al roster
+    """
+    pending = manifest.pending_shards()
+    if pending:
+        raise ShardingError(f"Fragmentos sin terminar: {pending}")
+    input_path = manifest.data["input_path"]
+    if input_fingerprint(input_path) != manifest.data["input_fingerprint"]:
+        raise ShardingError("El roster cambió después de particionarlo")
+
+    statistics = GradeStatistics()
+    for shard in manifest.shards:
+        with open(shard["statistics"], "r", encoding="utf-8") as statistics_file:
+            statistics.merge(GradeStatistics.from_dict(json.load(statistics_file)))
+
+    shard_files = [
+        open(shard["output"], "r", encoding="utf-8") for shard in manifest.shards
+    ]
+    try:
+        shard_lines = [_result_lines(shard_file) for shard_file in shard_files]
+        with open_roster(input_path) as roster:
+            with open(output_path, "w", encoding="utf-8", newline="") as output:
+                output.write(RESULTS_HEADER + "\n")
+                for student_id in roster.student_ids:
+                    index = shard_for(student_id, manifest.shard_count)
+                    line = next(shard_lines[index], None)
+                    if line is None or not line.startswith(student_id + ","):
+                        raise ShardingError(
+                            f"La salida del fragmento {index} no corresponde al roster"
+                        )
+                    output.write(line)
+    finally:
+        for shard_file in shard_files:
+            shard_file.close()
+    return statistics
+
+
+def run_sharded_batch(
+    input_path: str,
+    output_path: str,
+    shard_count: int,
+    work_dir: Optional[str] = None,
+    only: Optional[int] = None,
+    deduplicate: bool = False,
+    max_parallel: Optional[int] = None,
+) -> ShardRunSummary:
+    """
+    Ejecuta un lote particionado completo o reprocesa un fragmento.
+
+    Si el directorio de trabajo ya tiene un manifiesto para el mismo roster,
+    cantidad de fragmentos y opción de deduplicación, se reutiliza y solo se ejecutan los fragmentos
+    pendientes o fallidos (o únicamente ``only``). La salida combinada se
+    escribe cuando todos los fragmentos terminaron con éxito.
+
+    Args:
+        input_path: Ruta del roster (CSV o binario)
+        output_path: Ruta del CSV de resultados combinado
+        shard_count: Cantidad de fragmentos
+        work_dir: Directorio de trabajo (por defecto ``<output>.shards``)
+        only: Índice del único fragmento a ejecutar
+        deduplicate: Si cada fragmento usa deduplicación de perfiles
+        max_parallel: Procesos simultáneos
+
+    Returns:
+        Resumen con los fragmentos fallidos y, si se combinó, las estadísticas
+    """
+    work_dir = work_dir or output_path + ".shards"
+    manifest = ShardManifest.load(os.path.join(work_dir, MANIFEST_NAME))
+    if (
+        manifest is None
+        or manifest.shard_count != shard_count
+        or manifest.data["input_path"] != os.path.abspath(input_path)
+        or manifest.data["input_fingerprint"] != input_fingerprint(input_path)
+        or manifest.data["deduplicate"] != deduplicate
+    ):
+        manifest = partition_roster(input_path, work_dir, shard_count, deduplicate)
+
+    if only is not None:
+        if not 0 <= only < shard_count:
+            raise ShardingError(f"Fragmento inexistente: {only}")
+        indices = [only]
+    else:
+        indices = manifest.pending_shards()
+    run_shards(manifest, indices, max_parallel)
+
+    failed = manifest.pending_shards()
+    if failed:
+        return ShardRunSummary(shard_count, failed, None)
+    return ShardRunSummary(shard_count, [], merge_shards(manifest, output_path))
+
+
+def _result_lines(shard_file: TextIO) -> Iterator[str]:
+    """Itera las filas de resultados de un fragmento, sin la cabecera."""
+    next(shard_file, None)
+    for line in shard_file:
+        yield line
@@ -0,0 +1,151 @@
+"""Estadísticas incrementales (streaming) de un lote de resultados."""
+
+import math
+from typing import Any, Dict, Optional
+
+from src.batch.batch_grader import GradedRow
+
+
+class GradeStatistics:
+    """
+    Acumula estadísticas de un lote en una sola pasada y memoria constante.
+
+    La media y la varianza se calculan con el algoritmo de Welford, y dos
+    acumuladores parciales se pueden combinar con merge() (por ejemplo,
+    resultados de distintos fragmentos o de una ejecución reanudada).
+
+    La cantidad de aprobados solo se cuenta si se indica la nota mínima
+    aprobatoria: el sistema no define una propia.
+    """
+
+    def __init__(self, passing_grade: Optional[float] = None) -> None:
+        """
+        Inicializa las estadísticas vacías.
+
+        Args:
+            passing_grade: Nota mínima aprobatoria (None para no contar aprobados)
+        """
+        self.passing_grade = passing_grade
+        self.total_rows = 0
+        self.error_rows = 0
+        self.graded_rows = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.passed = 0
+        self.penalized = 0
+        self.with_extra_points = 0
+
+    @property
+    def variance(self) -> float:
+        """Varianza poblacional de la nota final."""
+        if self.graded_rows == 0:
+            return 0.0
+        return self._m2 / self.graded_rows
+
+    def add(self, row: GradedRow) -> None:
+        """
+        Incorpora el resultado de un estudiante.
+
+        Args:
+            row: Resultado del estudiante
+        """
+        self.total_rows += 1
+        if row.result is None:
+            self.error_rows += 1
+            return
+
+        final_grade = row.result["final_grade"]
+        self.graded_rows += 1
+        delta = final_grade - self.mean
+        self.mean += delta / self.graded_rows
+        self._m2 += delta * (final_grade - self.mean)
+        self.minimum = min(self.minimum, final_grade)
+        self.maximum = max(self.maximum, final_grade)
+        if self.passing_grade is not None and final_grade >= self.passing_grade:
+            self.passed += 1
+        if row.result["penalty_applied"] > 0:
+            self.penalized += 1
+        if row.result["extra_points_applied"] > 0:
+            self.with_extra_points += 1
+
+    def merge(self, other: "GradeStatistics") -> None:
+        """
+        Combina las estadísticas de otro acumulador en este.
+
+        Args:
+            other: Estadísticas a incorporar
+
+        Raises:
+            ValueError: Si los acumuladores usan distinta nota aprobatoria
+        """
+        if other.passing_grade != self.passing_grade:
+            raise ValueError("Las estadísticas usan distinta nota aprobatoria")
+        combined = self.graded_rows + other.graded_rows
+        if other.graded_rows:
+            delta = other.mean - self.mean
+            self.mean += delta * other.graded_rows / combined
+            self._m2 += (
+                other._m2 + delta * delta * self.graded_rows * other.graded_rows / combined
+            )
+        self.total_rows += other.total_rows
+        self.error_rows += other.error_rows
+        self.graded_rows = combined
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.passed += other.passed
+        self.penalized += other.penalized
+        self.with_extra_points += other.with_extra_points
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializa el estado completo del acumulador.
+
+        Returns:
+            Diccionario serializable en JSON
+        """
+        return {
+            "passing_grade": self.passing_grade,
+            "total_rows": self.total_rows,
+            "error_rows": self.error_rows,
+            "graded_rows": self.graded_rows,
+            "mean": self.mean,
+            "m2": self._m2,
+            "minimum": None if self.graded_rows == 0 else self.minimum,
+            "maximum": None if self.graded_rows == 0 else self.maximum,
+            "passed": self.passed,
+            "penalized": self.penalized,
+            "with_extra_points": self.with_extra_points,
+        }
+
+    @staticmethod
+    def from_dict(state: Dict[str, Any]) -> "GradeStatistics":
+        """
+        Restaura un acumulador serializado con to_dict().
+
+        Args:
+            state: Estado serializado
+
+        Returns:
+            Acumulador con el mismo estado
+        """
+        statistics = GradeStatistics(state.get("passing_grade"))
+        statistics.total_rows = state["total_rows"]
+        statistics.error_rows = state["error_rows"]
+        statistics.graded_rows = state["graded_rows"]
+        statistics.mean = state["mean"]
+        statistics._m2 = state["m2"]
+        if state["minimum"] is not None:
+            statistics.minimum = state["minimum"]
+            statistics.maximum = state["maximum"]
+        statistics.passed = state["passed"]
+        statistics.penalized = state["penalized"]
+        statistics.with_extra_points = state["with_extra_points"]
+        return statistics
+
+    def __eq__(self, other: object) -> bool:
+        """Dos acumuladores son iguales si su estado serializado es igual."""
+        if not isinstance(other, GradeStatistics):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
@@ -0,0 +1,182 @@
+"""Fachada asíncrona de GradeCalculator para servidores con asyncio.
+
+- ``acalculate`` agrupa las llamadas concurrentes (micro-batching): la primera
+  llamada de un grupo programa el procesamiento para la siguiente vuelta del
+  event loop (o tras ``max_wait`` segundos) y todas las que lleguen antes se
+  calculan juntas. Así, N llamadas simultáneas (por ejemplo con
+  ``asyncio.gather``) se resuelven en un solo lote sin agregar latencia a una
+  llamada aislada cuando ``max_wait`` es 0.
+- ``acalculate_batch`` calcula un lote completo.
+
+En ambos casos los lotes pequeños se calculan directamente en el event loop
+(cuesta menos que el cambio de hilo) y los grandes se envían a un executor
+para no bloquearlo.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.batch.batch_grader import BatchGrader, GradedRow
+from src.calculator.grade_calculator import GradeCalculator
+from src.models.evaluation import Evaluation
+from src.models.student_record import StudentRecord
+
+DEFAULT_INLINE_THRESHOLD = 64
+DEFAULT_MAX_BATCH_SIZE = 4096
+
+_Request = Tuple[List[Evaluation], bool, float, List[bool], float]
+_Outcome = Tuple[Optional[Dict[str, float]], Optional[BaseException]]
+
+
+class AsyncGradeCalculator:
+    """Calcula notas finales sin bloquear el event loop."""
+
+    def __init__(
+        self,
+        max_wait: float = 0.0,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Inicializa la fachada.
+
+        Args:
+            max_wait: Segundos máximos que una llamada espera a otras para
+                formar un lote (0 agrupa solo las de la misma vuelta del loop)
+            max_batch_size: Tamaño de lote que se procesa sin esperar más
+            inline_threshold: Tamaño máximo de lote calculado en el event loop
+            executor: Executor para lotes grandes (por defecto, el del loop)
+        """
+        if max_wait < 0:
+            raise ValueError("max_wait no puede ser negativo")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size debe ser al menos 1")
+        self._max_wait = max_wait
+        self._max_batch_size = max_batch_size
+        self._inline_threshold = inline_threshold
+        self._executor = executor
+        self._pending: List[Tuple[_Request, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self.flushed_batches = 0
+
+    async def acalculate(
+        self,
+        evaluations: List[Evaluation],
+        has_reached_minimum: bool,
+        tardiness_percentage: float,
+        all_years_teachers: List[bool],
+        extra_points: float,
+    ) -> Dict[str, float]:
+        """
+        Calcula la nota final de un estudiante (ver GradeCalculator).
+
+        Args:
+            evaluations: Lista de evaluaciones del estudiante
+            has_reached_minimum: True si alcanzó la asistencia mínima
+            tardiness_percentage: Porcentaje de tardanzas (0-100)
+            all_years_teachers: Lista de votos de profesores (True/False)
+            extra_points: Puntos extra a aplicar (si aplica)
+
+        Returns:
+            Diccionario con el detalle del cálculo
+
+        Raises:
+            GradeCalculatorError: Si los datos del estudiante son inválidos
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        request = (
+            evaluations,
+            has_reached_minimum,
+            tardiness_percentage,
+            all_years_teachers,
+            extra_points,
+        )
+        self._pending.append((request, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self._max_wait > 0:
+                self._flush_handle = loop.call_later(self._max_wait, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    async def acalculate_batch(
+        self, records: Sequence[StudentRecord]
+    ) -> List[GradedRow]:
+        """
+        Calcula un lote de registros.
+
+        Args:
+            records: Registros de estudiantes
+
+        Returns:
+            Un GradedRow por registro, en el orden de entrada
+        """
+        if len(records) <= self._inline_threshold:
+            return list(BatchGrader.grade(records))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _grade_all, records)
+
+    def _flush(self) -> None:
+        """Procesa las llamadas pendientes como un solo lote."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.flushed_batches += 1
+
+        requests = [request for request, _ in batch]
+        futures = [future for _, future in batch]
+        if len(batch) <= self._inline_threshold:
+            _resolve(futures, _calculate_all(requests))
+            return
+        loop = asyncio.get_running_loop()
+        outcomes = loop.run_in_executor(self._executor, _calculate_all, requests)
+        outcomes.add_done_callback(lambda done: _resolve_from(futures, done))
+
+
+def _grade_all(records: Sequence[StudentRecord]) -> List[GradedRow]:
+    """Calcula un lote completo (se ejecuta en el executor)."""
+    return list(BatchGrader.grade(records))
+
+
+def _calculate_all(requests: Sequence[_Request]) -> List[_Outcome]:
+    """Calcula cada llamada capturando su excepción por separado."""
+    outcomes: List[_Outcome] = []
+    for request in requests:
+        try:
+            outcomes.append((GradeCalculator.calculate_final_grade(*request), None))
+        except Exception as e:  # se entrega a quien llamó
+            outcomes.append((None, e))
+    return outcomes
+
+
+def _resolve(futures: Sequence[asyncio.Future], outcomes: List[_Outcome]) -> None:
+    """Entrega a cada llamada su resultado o su excepción."""
+    for future, (result, error) in zip(futures, outcomes):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+def _resolve_from(futures: Sequence[asyncio.Future], done: asyncio.Future) -> None:
+    """Entrega los resultados de un lote calculado en el executor."""
+    if done.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+    if done.exception() is not None:
+        for future in futures:
+            if not future.done():
+                future.set_exception(done.exception())
+        return
+    _resolve(futures, done.result())
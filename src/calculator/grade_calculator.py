@@ -1,6 +1,6 @@
 """Calculadora de Notas Finales."""
 
-from typing import Dict, List
+from typing import Dict, List, Sequence, Sized
 
 from src.constants import (
     EXPECTED_WEIGHT_SUM,
@@ -9,6 +9,8 @@ from src.constants import (
 )
 from src.exceptions import InvalidWeightError, MaxEvaluationsExceededError
 from src.models.evaluation import Evaluation
+from src.models.grade_result import GradeResult
+from src.models.weight_scheme import WeightScheme
 from src.policies.attendance_policy import AttendancePolicy
 from src.policies.extra_points_policy import ExtraPointsPolicy
 
@@ -54,6 +56,43 @@ class GradeCalculator:
                 - penalty_applied: Penalización aplicada
                 - extra_points_applied: Puntos extra aplicados
 
+        Raises:
+            MaxEvaluationsExceededError: Si se excede el máximo de evaluaciones
+            InvalidWeightError: Si los pesos no suman 100%
+        """
+        return GradeCalculator.calculate_result(
+            evaluations,
+            has_reached_minimum,
+            tardiness_percentage,
+            all_years_teachers,
+            extra_points,
+        ).to_dict()
+
+    @staticmethod
+    def calculate_result(
+        evaluations: List[Evaluation],
+        has_reached_minimum: bool,
+        tardiness_percentage: float,
+        all_years_teachers: List[bool],
+        extra_points: float,
+    ) -> GradeResult:
+        """
+        Calcula la nota final retornando un GradeResult.
+
+        Mismo cálculo que calculate_final_grade, pero sin construir el
+        diccionario ni redondear: los campos se redondean al leerlos. Conviene
+        para lotes grandes o cuando solo se necesita la nota final.
+
+        Args:
+            evaluations: Lista de evaluaciones del estudiante
+            has_reached_minimum: True si alcanzó la asistencia mínima
+            tardiness_percentage: Porcentaje de tardanzas (0-100)
+            all_years_teachers: Lista de votos de profesores (True/False)
+            extra_points: Puntos extra a aplicar (si aplica)
+
+        Returns:
+            Resultado con los valores sin redondear
+
         Raises:
             MaxEvaluationsExceededError: Si se excede el máximo de evaluaciones
             InvalidWeightError: Si los pesos no suman 100%
@@ -62,7 +101,93 @@ class GradeCalculator:
         GradeCalculator._validate_weights_sum(evaluations)
 
         weighted_average = GradeCalculator._calculate_weighted_average(evaluations)
+        return GradeCalculator._apply_policies(
+            weighted_average,
+            has_reached_minimum,
+            tardiness_percentage,
+            all_years_teachers,
+            extra_points,
+        )
+
+    @staticmethod
+    def calculate_with_scheme(
+        grades: Sequence[float],
+        scheme: WeightScheme,
+        has_reached_minimum: bool,
+        tardiness_percentage: float,
+        all_years_teachers: List[bool],
+        extra_points: float,
+    ) -> GradeResult:
+        """
+        Calcula la nota final con un esquema de pesos ya validado.
 
+        Equivale a calculate_result con Evaluation(nota, peso) por cada par,
+        incluidos los errores y su orden, pero sin crear las evaluaciones ni
+        volver a validar la suma de los pesos: eso se hizo una sola vez al
+        crear el esquema (ver WeightScheme.intern).
+
+        Args:
+            grades: Notas de las evaluaciones (0-20), en el orden del esquema
+            scheme: Esquema de pesos compartido
+            has_reached_minimum: True si alcanzó la asistencia mínima
+            tardiness_percentage: Porcentaje de tardanzas (0-100)
+            all_years_teachers: Lista de votos de profesores (True/False)
+            extra_points: Puntos extra a aplicar (si aplica)
+
+        Returns:
+            Resultado con los valores sin redondear
+
+        Raises:
+            ValueError: Si la cantidad de notas no coincide con el esquema
+            InvalidEvaluationError: Si una nota o un peso son inválidos
+            MaxEvaluationsExceededError: Si se excede el máximo de evaluaciones
+            InvalidWeightError: Si los pesos no suman 100%
+        """
+        if len(grades) != len(scheme):
+            raise ValueError("La cantidad de notas no coincide con el esquema")
+        # Mismo orden de validación que al construir cada Evaluation
+        for grade in grades[: scheme.invalid_weight_index + 1]:
+            Evaluation._validate_grade(grade)
+        if scheme.invalid_weight_index < len(scheme):
+            scheme.raise_error()
+        GradeCalculator._validate_evaluations_count(grades)
+        scheme.raise_error()
+
+        weighted_average = 0.0
+        if grades and scheme.total != 0:
+            weighted_sum = sum(
+                grade * weight for grade, weight in zip(grades, scheme.weights)
+            )
+            weighted_average = weighted_sum / scheme.total
+        return GradeCalculator._apply_policies(
+            weighted_average,
+            has_reached_minimum,
+            tardiness_percentage,
+            all_years_teachers,
+            extra_points,
+        )
+
+    @staticmethod
+    def _apply_policies(
+        weighted_average: float,
+        has_reached_minimum: bool,
+        tardiness_percentage: float,
+        all_years_teachers: List[bool],
+        extra_points: float,
+    ) -> GradeResult:
+        """
+        Aplica la penalización por asistencia y los puntos extra.
+
+        Args:
+            weighted_average: Promedio ponderado de las evaluaciones
+            has_reached_minimum: True si alcanzó la asistencia mínima
+            tardiness_percentage: Porcentaje de tardanzas (0-100)
+            all_years_teachers: Lista de votos de profesores (True/False)
+            extra_points: Puntos extra a aplicar (si aplica)
+
+        Returns:
+            Resultado con los valores sin redondear
+        """
         penalty_fraction = AttendancePolicy.calculate_penalty(
             has_reached_minimum, tardiness_percentage
         )
@@ -78,20 +203,17 @@ class GradeCalculator:
         else:
             final_grade = grade_after_penalty
 
-        return {
-            "final_grade": round(final_grade, 2),
-            "weighted_average": round(weighted_average, 2),
-            "penalty_applied": round(penalty_applied, 2),
-            "extra_points_applied": round(extra_points_applied, 2),
-        }
+        return GradeResult(
+            final_grade, weighted_average, penalty_applied, extra_points_applied
+        )
 
     @staticmethod
-    def _validate_evaluations_count(evaluations: List[Evaluation]) -> None:
+    def _validate_evaluations_count(evaluations: Sized) -> None:
         """
         Valida que no se exceda el máximo de evaluaciones.
 
         Args:
-            evaluations: Lista de evaluaciones
+            evaluations: Evaluaciones (o notas) del estudiante
 
         Raises:
             MaxEvaluationsExceededError: Si se excede el máximo permitido
@@ -1,15 +1,840 @@
 """Interfaz de línea de comandos para CS-GradeCalculator."""
 
-from typing import List
+import argparse
+import sys
+from typing import Dict, List, Optional
 
+from src.batch.batch_grader import GradedRow
+from src.batch.cohort_index import COHORT_QUERIES, CohortIndex
+from src.batch.course_config import load_course_configs
+from src.batch.cumulative import aggregate_course_grades
+from src.batch.dispatcher import (
+    DEFAULT_CALIBRATION_PATH,
+    ENGINE_DEDUP,
+    ENGINES,
+    AdaptiveDispatcher,
+)
+from src.batch.gradebook_watcher import DEFAULT_POLL_INTERVAL, GradebookWatcher
+from src.batch.reports import DEFAULT_REPORT_WORKERS, REPORT_FORMATS, generate_reports
+from src.batch.result_diff import write_result_diff
+from src.batch.sharding import run_shard_worker, run_sharded_batch
+from src.batch.pipeline import (
+    DEFAULT_WRITE_CHUNK_SIZE,
+    ENGINE_CHOICES,
+    ORDER_BY_CHOICES,
+    OUTPUT_FORMATS,
+    export_results_csv,
+    format_result_line,
+    pack_roster,
+    read_results,
+    run_batch,
+)
 from src.calculator.grade_calculator import GradeCalculator
 from src.constants import MAX_EVALUATIONS
+from src.diagnostics.profiling import RunProfiler, format_report
+from src.diagnostics.stage_metrics import PipelineTracer, format_summary
 from src.exceptions import GradeCalculatorError
 from src.models.evaluation import Evaluation
+from src.service.audit_log import verify_audit_log
+from src.service.rpc import serve
 
 
-def main() -> None:
-    """Función principal del CLI."""
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Función principal del CLI.
+
+    Sin argumentos inicia el flujo interactivo; con un subcomando
+    (por ejemplo ``batch``) ejecuta el modo no interactivo correspondiente.
+
+    Args:
+        argv: Argumentos de línea de comandos (por defecto sys.argv[1:])
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if args:
+        _run_command(args)
+        return
+
+    _run_interactive()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Construye el parser de los subcomandos no interactivos.
+
+    Returns:
+        Parser de argumentos
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="CS-GradeCalculator - Sistema de Cálculo de Notas Finales",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    profiling = _build_profiling_parser()
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        parents=[profiling],
+        help="Calcula las notas finales de un roster CSV",
+    )
+    batch_parser.add_argument("input", help="Roster CSV de entrada")
+    batch_parser.add_argument("output", help="Archivo de resultados")
+    batch_parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Calcula una sola vez por perfil de entrada idéntico",
+    )
+    batch_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="csv",
+        help="Formato del archivo de resultados (por defecto csv)",
+    )
+    batch_parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=0,
+        metavar="FILAS",
+        help="Guarda un checkpoint cada FILAS filas (solo salida csv)",
+    )
+    batch_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reanuda desde el último checkpoint (<salida>.ckpt)",
+    )
+    batch_parser.add_argument(
+        "--trace-stages",
+        action="store_true",
+        help="Muestra filas/s y tiempo de reloj, CPU y bloqueo por etapa",
+    )
+    batch_parser.add_argument(
+        "--progress",
+        type=float,
+        metavar="SEGUNDOS",
+        help="Imprime el progreso por etapa en stderr cada SEGUNDOS",
+    )
+    batch_parser.add_argument(
+        "--write-queue",
+        type=int,
+        default=0,
+        metavar="BLOQUES",
+        help="Escribe en un hilo propio con una cola de BLOQUES bloques",
+    )
+    batch_parser.add_argument(
+        "--write-chunk",
+        type=int,
+        default=DEFAULT_WRITE_CHUNK_SIZE,
+        metavar="FILAS",
+        help=f"Filas por bloque de la cola (por defecto {DEFAULT_WRITE_CHUNK_SIZE})",
+    )
+    batch_parser.add_argument(
+        "--order-by",
+        choices=ORDER_BY_CHOICES,
+        help="Ordena la salida por student_id o como ranking por final_grade",
+    )
+    batch_parser.add_argument(
+        "--memory-limit",
+        type=_parse_size,
+        metavar="TAMAÑO",
+        help=(
+            "Memoria para el estado intermedio y la lectura del roster (p. ej. "
+            "512M); el exceso va a disco"
+        ),
+    )
+    batch_parser.add_argument(
+        "--passing-grade",
+        type=float,
+        metavar="NOTA",
+        help="Nota mínima aprobatoria, para contar los aprobados",
+    )
+    batch_parser.add_argument(
+        "--engine",
+        choices=ENGINE_CHOICES,
+        help=(
+            "Motor de cálculo (por defecto scalar, o dedup con --dedup); auto "
+            "usa el más rápido según la calibración, que se mide y guarda la "
+            "primera vez (ver calibrate)"
+        ),
+    )
+    batch_parser.add_argument(
+        "--calibration-cache",
+        default=DEFAULT_CALIBRATION_PATH,
+        help="Archivo de caché de la calibración usada por --engine auto",
+    )
+
+    pack_parser = subparsers.add_parser(
+        "pack-roster",
+        parents=[profiling],
+        help="Convierte un roster CSV al formato binario columnar",
+    )
+    pack_parser.add_argument("input", help="Roster CSV de entrada")
+    pack_parser.add_argument("output", help="Roster binario de salida")
+
+    export_parser = subparsers.add_parser(
+        "export-csv",
+        parents=[profiling],
+        help="Convierte resultados binarios a CSV",
+    )
+    export_parser.add_argument("input", help="Resultados en formato binario")
+    export_parser.add_argument("output", help="CSV de salida")
+
+    shard_parser = subparsers.add_parser(
+        "shard",
+        parents=[profiling],
+        help="Calcula un roster particionado en procesos independientes",
+    )
+    shard_parser.add_argument("input", help="Roster de entrada (CSV o binario)")
+    shard_parser.add_argument("output", help="CSV de resultados combinado")
+    shard_parser.add_argument(
+        "--shards", type=int, required=True, help="Cantidad de fragmentos"
+    )
+    shard_parser.add_argument(
+        "--work-dir", help="Directorio de trabajo (por defecto <salida>.shards)"
+    )
+    shard_parser.add_argument(
+        "--only", type=int, metavar="INDICE", help="Reprocesa solo ese fragmento"
+    )
+    shard_parser.add_argument(
+        "--parallel", type=int, help="Procesos simultáneos (por defecto, CPUs)"
+    )
+    shard_parser.add_argument(
+        "--dedup", action="store_true", help="Deduplica perfiles en cada fragmento"
+    )
+
+    worker_parser = subparsers.add_parser(
+        "shard-worker",
+        parents=[profiling],
+        help="Procesa un fragmento (uso interno de 'shard')",
+    )
+    worker_parser.add_argument("manifest", help="Manifiesto de la ejecución")
+    worker_parser.add_argument("index", type=int, help="Índice del fragmento")
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        parents=[profiling],
+        help="Sigue un log de eventos de notas y emite notas recalculadas",
+    )
+    watch_parser.add_argument(
+        "log", help="Log de eventos (student_id,evaluation_id,grade,weight)"
+    )
+    watch_parser.add_argument(
+        "--snapshot", help="Ruta del snapshot de estado (por defecto <log>.snapshot)"
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=(
+            f"Segundos entre lecturas del log (por defecto {DEFAULT_POLL_INTERVAL}; "
+            "en Linux los cambios se detectan al instante con inotify)"
+        ),
+    )
+    watch_parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Procesa los eventos pendientes y termina",
+    )
+
+    gpa_parser = subparsers.add_parser(
+        "gpa",
+        parents=[profiling],
+        help="Calcula promedios ponderados por créditos por ciclo y acumulados",
+    )
+    gpa_parser.add_argument(
+        "input", help="Notas por curso (student_id,term,course_id,credits,final_grade)"
+    )
+    gpa_parser.add_argument("output", help="CSV de promedios")
+
+    diff_parser = subparsers.add_parser(
+        "diff",
+        parents=[profiling],
+        help="Muestra los estudiantes cuya nota final cambió entre dos resultados",
+    )
+    diff_parser.add_argument("old", help="Resultados anteriores (CSV o binario)")
+    diff_parser.add_argument("new", help="Resultados nuevos (CSV o binario)")
+    diff_parser.add_argument(
+        "--output",
+        metavar="ARCHIVO",
+        help="CSV de cambios (por defecto, la salida estándar)",
+    )
+
+    cohort_parser = subparsers.add_parser(
+        "cohort",
+        parents=[profiling],
+        help="Consulta desaprobados, penalizados, con puntos extra o cerca del aprobado",
+    )
+    cohort_parser.add_argument("results", help="Resultados (CSV o binario)")
+    cohort_parser.add_argument(
+        "--query",
+        choices=tuple(COHORT_QUERIES),
+        help="Lista los estudiantes de la categoría (por defecto, solo los conteos)",
+    )
+    cohort_parser.add_argument(
+        "--passing-grade",
+        type=float,
+        metavar="NOTA",
+        help="Nota mínima aprobatoria (requerida para failing y near-threshold)",
+    )
+
+    courses_parser = subparsers.add_parser(
+        "courses",
+        parents=[profiling],
+        help="Carga la configuración de cursos usando su snapshot precompilado",
+    )
+    courses_parser.add_argument(
+        "sources", nargs="+", help="Archivos de configuración de cursos (CSV)"
+    )
+    courses_parser.add_argument(
+        "--snapshot",
+        metavar="ARCHIVO",
+        help="Snapshot precompilado (por defecto, junto a la primera fuente)",
+    )
+    courses_parser.add_argument(
+        "--course", metavar="CURSO", help="Muestra la configuración de un curso"
+    )
+
+    report_parser = subparsers.add_parser(
+        "report",
+        parents=[profiling],
+        help="Genera el reporte del detalle de la nota final de cada estudiante",
+    )
+    report_parser.add_argument("results", help="Resultados (CSV o binario)")
+    report_parser.add_argument(
+        "output", help="Archivo de reportes, o directorio con --split"
+    )
+    report_parser.add_argument(
+        "--format",
+        choices=REPORT_FORMATS,
+        default="text",
+        help="Formato de los reportes (por defecto text)",
+    )
+    report_parser.add_argument(
+        "--split",
+        action="store_true",
+        help="Escribe un archivo por estudiante en el directorio de salida",
+    )
+    report_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_REPORT_WORKERS,
+        metavar="HILOS",
+        help=f"Hilos de escritura con --split (por defecto {DEFAULT_REPORT_WORKERS})",
+    )
+
+    subparsers.add_parser(
+        "rpc",
+        parents=[profiling],
+        help="Atiende solicitudes JSON por línea en stdin y responde en stdout",
+    )
+
+    audit_parser = subparsers.add_parser(
+        "audit-verify",
+        parents=[profiling],
+        help="Recalcula y verifica un log de auditoría",
+    )
+    audit_parser.add_argument("log", help="Log de auditoría (JSONL)")
+
+    calibrate_parser = subparsers.add_parser(
+        "calibrate",
+        parents=[profiling],
+        help="Mide los motores de cálculo por lotes en esta máquina",
+    )
+    calibrate_parser.add_argument(
+        "--cache",
+        default=DEFAULT_CALIBRATION_PATH,
+        help="Archivo de caché de la calibración",
+    )
+
+    return parser
+
+
+def _parse_size(text: str) -> int:
+    """
+    Convierte un tamaño como ``512M`` o ``2G`` en bytes (argparse type).
+
+    Args:
+        text: Número con sufijo opcional K, M o G (potencias de 1024)
+
+    Returns:
+        Cantidad de bytes
+
+    Raises:
+        argparse.ArgumentTypeError: Si el tamaño no es válido
+    """
+    units = {"K": 2**10, "M": 2**20, "G": 2**30}
+    normalized = text.strip().upper().removesuffix("B")
+    multiplier = units.get(normalized[-1:], 1)
+    if normalized[-1:] in units:
+        normalized = normalized[:-1]
+    try:
+        size = int(float(normalized) * multiplier)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tamaño inválido: {text}") from None
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"El tamaño debe ser positivo: {text}")
+    return size
+
+
+def _build_profiling_parser() -> argparse.ArgumentParser:
+    """
+    Construye las opciones de perfilado comunes a todos los subcomandos.
+
+    Returns:
+        Parser padre (sin ayuda propia) con las opciones de perfilado
+    """
+    profiling = argparse.ArgumentParser(add_help=False)
+    group = profiling.add_argument_group("perfilado")
+    group.add_argument(
+        "--profile",
+        metavar="ARCHIVO",
+        help="Perfila con cProfile; guarda ARCHIVO (.pstats) y un resumen .txt",
+    )
+    group.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Reporta la memoria pico y las asignaciones principales por etapa",
+    )
+    group.add_argument(
+        "--profile-sample",
+        action="store_true",
+        help="Muestrea la pila por etapa (bajo costo, apto para producción)",
+    )
+    return profiling
+
+
+def _run_command(args: List[str]) -> None:
+    """
+    Ejecuta un subcomando no interactivo, perfilándolo si se pidió.
+
+    Args:
+        args: Argumentos de línea de comandos
+    """
+    options = _build_parser().parse_args(args)
+    profiler = RunProfiler(
+        profile_path=options.profile,
+        trace_memory=options.trace_memory,
+        sample=options.profile_sample,
+    )
+    if not profiler.enabled:
+        _dispatch_command(options)
+        return
+
+    try:
+        with profiler:
+            _dispatch_command(options)
+    finally:
+        if profiler.report is not None:
+            # En modo rpc la salida estándar es el canal de respuestas
+            stream = sys.stderr if options.command == "rpc" else sys.stdout
+            print(file=stream)
+            print("Perfil de la ejecución:", file=stream)
+            for line in format_report(profiler.report):
+                print(line, file=stream)
+
+
+def _dispatch_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando indicado en las opciones.
+
+    Args:
+        options: Argumentos parseados
+    """
+    if options.command == "batch":
+        _run_batch_command(options)
+    elif options.command == "pack-roster":
+        _run_pack_roster_command(options)
+    elif options.command == "export-csv":
+        _run_export_csv_command(options)
+    elif options.command == "shard":
+        _run_shard_command(options)
+    elif options.command == "shard-worker":
+        _run_shard_worker_command(options)
+    elif options.command == "watch":
+        _run_watch_command(options)
+    elif options.command == "calibrate":
+        _run_calibrate_command(options)
+    elif options.command == "gpa":
+        _run_gpa_command(options)
+    elif options.command == "cohort":
+        _run_cohort_command(options)
+    elif options.command == "diff":
+        _run_diff_command(options)
+    elif options.command == "courses":
+        _run_courses_command(options)
+    elif options.command == "report":
+        _run_report_command(options)
+    elif options.command == "rpc":
+        _run_rpc_command()
+    elif options.command == "audit-verify":
+        _run_audit_verify_command(options)
+
+
+def _run_batch_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``batch`` y muestra el resumen.
+
+    Args:
+        options: Argumentos parseados
+    """
+    tracer = None
+    if options.trace_stages or options.progress is not None:
+        tracer = PipelineTracer(progress_interval=options.progress)
+    try:
+        summary = run_batch(
+            options.input,
+            options.output,
+            deduplicate=options.dedup,
+            output_format=options.format,
+            checkpoint_interval=options.checkpoint_interval,
+            resume=options.resume,
+            tracer=tracer,
+            write_queue_size=options.write_queue,
+            write_chunk_size=options.write_chunk,
+            order_by=options.order_by,
+            memory_limit=options.memory_limit,
+            passing_grade=options.passing_grade,
+            engine=options.engine,
+            dispatcher=AdaptiveDispatcher(options.calibration_cache),
+        )
+    except ValueError as e:
+        print(f"✗ Error en los argumentos: {e}")
+        sys.exit(2)
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error al procesar el lote: {e}")
+        sys.exit(1)
+
+    print(f"Filas procesadas: {summary.total_rows}")
+    print(f"Filas calculadas: {summary.graded_rows}")
+    print(f"Filas con error: {summary.error_rows}")
+    print(f"Motor de cálculo: {summary.engine}")
+    statistics = summary.statistics
+    if statistics.graded_rows:
+        print(f"Promedio de notas finales: {statistics.mean:.2f}")
+        print(f"Nota mínima / máxima: {statistics.minimum} / {statistics.maximum}")
+        if statistics.passing_grade is not None:
+            print(f"Aprobados: {statistics.passed}")
+    if summary.dedup is not None:
+        print(f"Perfiles únicos: {summary.dedup.unique_profiles}")
+        if options.resume:
+            print(
+                "  (los perfiles vistos antes de reanudar se cuentan de nuevo "
+                "si reaparecen)"
+            )
+        print(f"Ratio de deduplicación: {summary.dedup.dedup_ratio:.2f}x")
+        if summary.dedup.evicted_profiles:
+            print(f"Perfiles descartados por memoria: {summary.dedup.evicted_profiles}")
+            print(
+                f"Perfiles recalculados tras descartarse: "
+                f"{summary.dedup.recomputed_profiles}"
+            )
+    if summary.sort is not None and summary.sort.runs:
+        print(
+            f"Corridas volcadas a disco: {summary.sort.runs} "
+            f"({summary.sort.spilled_bytes / 2**20:.1f} MiB)"
+        )
+    if tracer is not None:
+        print("Tiempo por etapa:")
+        for line in format_summary(tracer.report()):
+            print(line)
+
+
+def _run_pack_roster_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``pack-roster``.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        row_count = pack_roster(options.input, options.output)
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error al convertir el roster: {e}")
+        sys.exit(1)
+
+    print(f"Estudiantes escritos: {row_count}")
+
+
+def _run_export_csv_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``export-csv``.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        row_count = export_results_csv(options.input, options.output)
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error al exportar los resultados: {e}")
+        sys.exit(1)
+
+    print(f"Filas exportadas: {row_count}")
+
+
+def _run_shard_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``shard`` y muestra el resumen.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        summary = run_sharded_batch(
+            options.input,
+            options.output,
+            options.shards,
+            work_dir=options.work_dir,
+            only=options.only,
+            deduplicate=options.dedup,
+            max_parallel=options.parallel,
+        )
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error al procesar el lote particionado: {e}")
+        sys.exit(1)
+
+    if summary.failed_shards:
+        print(f"✗ Fragmentos pendientes o fallidos: {summary.failed_shards}")
+        print("  Reprocese cada uno con --only INDICE.")
+        sys.exit(1)
+
+    statistics = summary.statistics
+    print(f"Fragmentos: {summary.shard_count}")
+    print(f"Filas procesadas: {statistics.total_rows}")
+    print(f"Filas con error: {statistics.error_rows}")
+
+
+def _run_shard_worker_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando interno ``shard-worker``.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        run_shard_worker(options.manifest, options.index)
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error en el fragmento {options.index}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _run_watch_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``watch``: una línea CSV por nota recalculada.
+
+    Args:
+        options: Argumentos parseados
+    """
+    watcher = GradebookWatcher(
+        options.log, snapshot_path=options.snapshot or options.log + ".snapshot"
+    )
+
+    def emit(row: GradedRow) -> None:
+        print(format_result_line(row), flush=True)
+
+    if options.once:
+        for row in watcher.poll():
+            emit(row)
+        watcher.save_snapshot()
+        return
+
+    try:
+        watcher.run(emit, poll_interval=options.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def _run_calibrate_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``calibrate``: recalibra y muestra el costo por fila.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        calibration = AdaptiveDispatcher(options.cache).calibrate()
+    except OSError as e:
+        print(f"✗ Error al guardar la calibración: {e}")
+        sys.exit(1)
+
+    print("Microsegundos por fila (sin perfiles duplicados):")
+    print("filas".rjust(8) + "".join(engine.rjust(10) for engine in ENGINES))
+    seconds_per_row = calibration["seconds_per_row"]
+    for index, size in enumerate(calibration["sizes"]):
+        costs = "".join(
+            f"{_engine_seconds_per_row(seconds_per_row, engine, index) * 1e6:>10.2f}"
+            for engine in ENGINES
+        )
+        print(f"{size:>8}{costs}")
+    print(f"Calibración guardada en {options.cache}")
+
+
+def _run_gpa_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``gpa``.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        student_count = aggregate_course_grades(options.input, options.output)
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error al calcular los promedios: {e}")
+        sys.exit(1)
+
+    print(f"Estudiantes: {student_count}")
+
+
+def _run_diff_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``diff``.
+
+    Si los cambios van a la salida estándar, los conteos se muestran en la
+    salida de errores para no mezclarlos con el CSV.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        summary = write_result_diff(options.old, options.new, options.output)
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error al comparar los resultados: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    stream = sys.stdout if options.output else sys.stderr
+    print(f"Filas anteriores: {summary.old_rows}", file=stream)
+    print(f"Filas nuevas: {summary.new_rows}", file=stream)
+    print(f"Sin cambios: {summary.unchanged}", file=stream)
+    print(f"Cambiadas: {summary.changed}", file=stream)
+    print(f"Agregadas: {summary.added}", file=stream)
+    print(f"Quitadas: {summary.removed}", file=stream)
+    if summary.aligned:
+        print(
+            f"Bloques omitidos por hash: {summary.skipped_blocks}/{summary.total_blocks}",
+            file=stream,
+        )
+
+
+def _run_cohort_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``cohort``: un student_id por línea, o los conteos.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        index = CohortIndex.build(read_results(options.results), options.passing_grade)
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error al leer los resultados: {e}")
+        sys.exit(1)
+
+    if options.query:
+        try:
+            students = COHORT_QUERIES[options.query](index)
+        except ValueError as e:
+            print(f"✗ Error en los argumentos: {e} (--passing-grade)")
+            sys.exit(2)
+        for student_id in students:
+            print(student_id)
+        return
+
+    for name, count in index.counts().items():
+        print(f"{name}: {count}")
+
+
+def _run_courses_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``courses``.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        catalog = load_course_configs(options.sources, options.snapshot)
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error en la configuración de cursos: {e}")
+        sys.exit(1)
+
+    with catalog:
+        print(f"Cursos: {len(catalog)}")
+        print(f"Snapshot: {'reutilizado' if catalog.from_snapshot else 'regenerado'}")
+        if options.course is None:
+            return
+        config = catalog.get(options.course)
+        if config is None:
+            print(f"✗ Curso no encontrado: {options.course}")
+            sys.exit(1)
+        weights = "/".join(f"{weight:g}" for weight in config.weights)
+        print(f"Pesos (%): {weights}")
+        print(f"Puntos extra permitidos: {'sí' if config.extra_points_allowed else 'no'}")
+
+
+def _run_report_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``report``.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        summary = generate_reports(
+            read_results(options.results),
+            options.output,
+            report_format=options.format,
+            split=options.split,
+            workers=options.workers,
+        )
+    except ValueError as e:
+        print(f"✗ Error en los argumentos: {e}")
+        sys.exit(2)
+    except (OSError, GradeCalculatorError) as e:
+        print(f"✗ Error al generar los reportes: {e}")
+        sys.exit(1)
+
+    print(f"Reportes generados: {summary.reports}")
+    print(f"Reportes con error: {summary.error_reports}")
+    print(f"Archivos escritos: {summary.files}")
+
+
+def _run_rpc_command() -> None:
+    """Ejecuta el subcomando ``rpc`` hasta el fin de la entrada estándar."""
+    try:
+        serve(sys.stdin.buffer, sys.stdout.buffer)
+    except KeyboardInterrupt:
+        pass
+
+
+def _run_audit_verify_command(options: argparse.Namespace) -> None:
+    """
+    Ejecuta el subcomando ``audit-verify``; termina con código 1 si hay diferencias.
+
+    Args:
+        options: Argumentos parseados
+    """
+    try:
+        verification = verify_audit_log(options.log)
+    except OSError as e:
+        print(f"✗ Error al leer el log de auditoría: {e}")
+        sys.exit(1)
+
+    print(f"Entradas verificadas: {verification.total_entries}")
+    print(f"Entradas coincidentes: {verification.matched}")
+    print(f"Líneas corruptas: {verification.corrupt_lines}")
+    for seq, detail in verification.mismatches:
+        print(f"✗ Entrada {seq}: {detail}")
+    if verification.mismatches or verification.corrupt_lines:
+        sys.exit(1)
+
+
+def _engine_seconds_per_row(
+    seconds_per_row: Dict[str, List[float]], engine: str, index: int
+) -> float:
+    """Costo por fila de un motor; dedup incluye la clave de perfil."""
+    seconds = seconds_per_row[engine][index]
+    if engine == ENGINE_DEDUP:
+        seconds += seconds_per_row["profile_key"][index]
+    return seconds
+
+
+def _run_interactive() -> None:
+    """Ejecuta el flujo interactivo de cálculo para un estudiante."""
     print("=" * 60)
     print("CS-GradeCalculator - Sistema de Cálculo de Notas Finales")
     print("=" * 60)
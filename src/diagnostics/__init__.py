@@ -0,0 +1 @@
+"""Herramientas de diagnóstico de rendimiento."""
@@ -0,0 +1,430 @@
+"""Perfilado de ejecuciones del CLI y de los lotes.
+
+En el pipeline las etapas se intercalan fila por fila (cada registro se lee,
+valida, calcula y escribe antes del siguiente), por lo que no pueden medirse
+por separado con un cronómetro. Cada muestra de pila o asignación de memoria
+se atribuye a una etapa según el módulo del frame más interno del proyecto:
+
+- ``parse``: lectura de rosters (CSV, mmap, binario columnar).
+- ``validate``: validación de notas y pesos (Evaluation, WeightScheme).
+- ``compute``: cálculo y políticas (GradeCalculator, BatchGrader, ...).
+- ``write``: escritura de resultados y checkpoints.
+
+Hay tres modos, combinables:
+
+- ``profile_path``: cProfile sobre toda la ejecución; guarda el ``.pstats`` y
+  un resumen de texto con las N funciones de mayor tiempo acumulado.
+- ``trace_memory``: tracemalloc; reporta la memoria pico total, la memoria
+  pico observada en cada etapa y los sitios de asignación principales de
+  cada etapa en el momento de mayor uso.
+- ``sample``: un hilo toma la pila del hilo principal cada
+  ``sample_interval`` segundos. Su costo es casi nulo, por lo que puede
+  dejarse activo en producción.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from types import FrameType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+STAGE_PARSE = "parse"
+STAGE_VALIDATE = "validate"
+STAGE_COMPUTE = "compute"
+STAGE_WRITE = "write"
+STAGE_OTHER = "other"
+STAGES = (STAGE_PARSE, STAGE_VALIDATE, STAGE_COMPUTE, STAGE_WRITE, STAGE_OTHER)
+
+DEFAULT_SAMPLE_INTERVAL = 0.01
+DEFAULT_TOP = 20
+# Más frames encarecen mucho tracemalloc; 4 alcanzan el frame del proyecto
+TRACEMALLOC_FRAMES = 4
+# Crecimiento de memoria que dispara una nueva instantánea de tracemalloc
+_SNAPSHOT_GROWTH = 1.5
+_MEMORY_SAMPLE_INTERVAL = 0.005
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_STAGE_MODULES = {
+    "batch/roster_reader.py": STAGE_PARSE,
+    "batch/mmap_roster_reader.py": STAGE_PARSE,
+    "batch/roster_columns.py": STAGE_PARSE,
+    "batch/binary_format.py": STAGE_PARSE,
+    "models/student_record.py": STAGE_PARSE,
+    "models/evaluation.py": STAGE_VALIDATE,
+    "models/weight_scheme.py": STAGE_VALIDATE,
+    "calculator/grade_calculator.py": STAGE_COMPUTE,
+    "policies/attendance_policy.py": STAGE_COMPUTE,
+    "policies/extra_points_policy.py": STAGE_COMPUTE,
+    "batch/batch_grader.py": STAGE_COMPUTE,
+    "batch/deduplication.py": STAGE_COMPUTE,
+    "batch/statistics.py": STAGE_COMPUTE,
+    "models/grade_result.py": STAGE_COMPUTE,
+    "batch/pipeline.py": STAGE_WRITE,
+    "batch/result_format.py": STAGE_WRITE,
+    "batch/checkpoint.py": STAGE_WRITE,
+}
+
+# Excluye de las instantáneas la memoria del propio perfilador
+_PROFILER_FILTERS = [
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+]
+
+
+class StageReport(NamedTuple):
+    """Mediciones de una etapa del pipeline."""
+
+    stage: str
+    samples: int
+    peak_bytes: int
+    top_sites: List[Tuple[str, int]]
+
+
+class ProfileReport(NamedTuple):
+    """Resultado del perfilado de una ejecución."""
+
+    wall_seconds: float
+    stats_path: Optional[str]
+    summary_path: Optional[str]
+    peak_bytes: Optional[int]
+    total_samples: int
+    stages: List[StageReport]
+    top_functions: List[Tuple[str, int]]
+
+
+def stage_of_file(filename: str) -> Optional[str]:
+    """
+    Retorna la etapa a la que pertenece un archivo fuente del proyecto.
+
+    Args:
+        filename: Ruta del archivo fuente
+
+    Returns:
+        Etapa del archivo, o None si no es un módulo de etapa del proyecto
+    """
+    relative = os.path.relpath(os.path.abspath(filename), _SRC_DIR)
+    return _STAGE_MODULES.get(relative.replace(os.sep, "/"))
+
+
+class StageSampler:
+    """
+    Muestreador de pila del hilo principal atribuido por etapas.
+
+    En el hilo principal de sistemas POSIX usa SIGPROF con un temporizador de
+    tiempo de CPU: el manejador recibe el frame interrumpido sin esperar al
+    GIL. Un hilo de muestreo solo obtiene el GIL cuando el hilo observado lo
+    libera (típicamente al escribir), lo que sesga las muestras hacia la
+    escritura; se usa solo cuando no hay señales disponibles.
+
+    Si tracemalloc está activo, registra además la memoria pico de cada etapa
+    y guarda una instantánea cada vez que la memoria crece un 50%, de modo
+    que la última corresponde aproximadamente al momento de mayor uso.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        thread_id: Optional[int] = None,
+    ) -> None:
+        """
+        Inicializa el muestreador (sin iniciarlo).
+
+        Args:
+            interval: Segundos entre muestras
+            thread_id: Hilo a muestrear (por defecto, el que llama a start)
+        """
+        self.interval = interval
+        self.thread_id = thread_id
+        self.samples: Counter = Counter()
+        self.functions: Counter = Counter()
+        self.stage_peak_bytes: Dict[str, int] = {}
+        self.peak_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._snapshot_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous_handler: Any = None
+        self._in_sample = False
+
+    def start(self) -> None:
+        """Inicia el muestreo."""
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        if _can_use_timer_signal(self.thread_id):
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Detiene el muestreo (y espera al hilo de muestreo, si lo hay)."""
+        if self._previous_handler is not None:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+            self._previous_handler = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample(self, frame: Optional[FrameType] = None) -> None:
+        """
+        Toma una muestra de la pila del hilo observado.
+
+        Args:
+            frame: Frame actual del hilo (por defecto se obtiene del intérprete)
+        """
+        if frame is None:
+            frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        stage, function = _classify_stack(frame)
+        del frame
+        self.samples[stage] += 1
+        if function is not None:
+            self.functions[function] += 1
+
+        if tracemalloc.is_tracing():
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.stage_peak_bytes.get(stage, 0):
+                self.stage_peak_bytes[stage] = current
+            if current > self._snapshot_bytes * _SNAPSHOT_GROWTH:
+                self.peak_snapshot = tracemalloc.take_snapshot().filter_traces(
+                    _PROFILER_FILTERS
+                )
+                self._snapshot_bytes = current
+
+    def _on_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        """Manejador de SIGPROF: muestrea el frame interrumpido."""
+        # Una instantánea lenta puede recibir otra señal antes de terminar
+        if self._in_sample:
+            return
+        self._in_sample = True
+        try:
+            self.sample(frame)
+        finally:
+            self._in_sample = False
+
+    def _run(self) -> None:
+        """Bucle del hilo de muestreo (sin señales disponibles)."""
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+class RunProfiler:
+    """
+    Perfila una ejecución con cProfile, tracemalloc y/o muestreo de pila.
+
+    Usar como context manager alrededor de la ejecución y luego leer
+    ``report`` o imprimir ``format_report(profiler.report)``.
+    """
+
+    def __init__(
+        self,
+        profile_path: Optional[str] = None,
+        trace_memory: bool = False,
+        sample: bool = False,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        top: int = DEFAULT_TOP,
+    ) -> None:
+        """
+        Configura los modos de perfilado.
+
+        Args:
+            profile_path: Ruta del ``.pstats`` de cProfile (None lo desactiva);
+                el resumen de texto se guarda junto a él con extensión ``.txt``
+            trace_memory: Si se mide la memoria con tracemalloc
+            sample: Si se muestrea la pila del hilo principal
+            sample_interval: Segundos entre muestras de pila
+            top: Cantidad de funciones y sitios de asignación a reportar
+        """
+        self.profile_path = profile_path
+        self.trace_memory = trace_memory
+        self.sample = sample
+        self.top = top
+        self.report: Optional[ProfileReport] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StageSampler] = None
+        if sample or trace_memory:
+            interval = sample_interval
+            if trace_memory:
+                interval = min(interval, _MEMORY_SAMPLE_INTERVAL)
+            self._sampler = StageSampler(interval)
+        self._started_tracing = False
+        self._start = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si algún modo de perfilado está activo."""
+        return self.profile_path is not None or self._sampler is not None
+
+    def __enter__(self) -> "RunProfiler":
+        """Inicia los modos de perfilado configurados."""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracing = True
+        if self._sampler is not None:
+            self._sampler.start()
+        if self.profile_path is not None:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Detiene el perfilado, escribe los archivos y arma el reporte."""
+        wall_seconds = time.perf_counter() - self._start
+        summary_path = None
+        if self._profile is not None:
+            self._profile.disable()
+            summary_path = self._write_profile(self._profile)
+
+        peak_bytes = None
+        if self.trace_memory:
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        if self._sampler is not None:
+            self._sampler.stop()
+        if self._started_tracing:
+            tracemalloc.stop()
+
+        self.report = self._build_report(wall_seconds, summary_path, peak_bytes)
+
+    def _write_profile(self, profile: cProfile.Profile) -> str:
+        """Guarda el ``.pstats`` y el resumen de texto; retorna la ruta del resumen."""
+        assert self.profile_path is not None
+        profile.dump_stats(self.profile_path)
+        summary = io.StringIO()
+        stats = pstats.Stats(profile, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        summary_path = os.path.splitext(self.profile_path)[0] + ".txt"
+        with open(summary_path, "w", encoding="utf-8") as summary_file:
+            summary_file.write(summary.getvalue())
+        return summary_path
+
+    def _build_report(
+        self,
+        wall_seconds: float,
+        summary_path: Optional[str],
+        peak_bytes: Optional[int],
+    ) -> ProfileReport:
+        """Combina las mediciones de cada modo en un ProfileReport."""
+        sampler = self._sampler
+        stages: List[StageReport] = []
+        top_functions: List[Tuple[str, int]] = []
+        total_samples = 0
+        if sampler is not None:
+            total_samples = sum(sampler.samples.values())
+            top_functions = sampler.functions.most_common(self.top)
+            sites = _top_sites_by_stage(sampler.peak_snapshot, self.top)
+            for stage in STAGES:
+                samples = sampler.samples.get(stage, 0)
+                stage_peak = sampler.stage_peak_bytes.get(stage, 0)
+                if samples or stage_peak or sites.get(stage):
+                    stages.append(
+                        StageReport(stage, samples, stage_peak, sites.get(stage, []))
+                    )
+        return ProfileReport(
+            wall_seconds=wall_seconds,
+            stats_path=self.profile_path,
+            summary_path=summary_path,
+            peak_bytes=peak_bytes,
+            total_samples=total_samples,
+            stages=stages,
+            top_functions=top_functions,
+        )
+
+
+def format_report(report: ProfileReport) -> List[str]:
+    """
+    Convierte un reporte de perfilado en líneas de texto.
+
+    Args:
+        report: Reporte de RunProfiler
+
+    Returns:
+        Líneas del reporte, sin saltos de línea
+    """
+    lines = [f"Tiempo total: {report.wall_seconds:.3f} s"]
+    if report.stats_path is not None:
+        lines.append(f"Perfil cProfile: {report.stats_path}")
+        lines.append(f"Resumen del perfil: {report.summary_path}")
+    if report.peak_bytes is not None:
+        lines.append(f"Memoria pico: {_format_bytes(report.peak_bytes)}")
+    if report.stages:
+        lines.append("Etapa       muestras       %   memoria pico")
+        for stage in report.stages:
+            share = 100 * stage.samples / max(report.total_samples, 1)
+            peak = _format_bytes(stage.peak_bytes) if stage.peak_bytes else "-"
+            lines.append(
+                f"{stage.stage:<10}{stage.samples:>10}{share:>8.1f}{peak:>15}"
+            )
+        for stage in report.stages:
+            if stage.top_sites:
+                lines.append(f"Asignaciones principales ({stage.stage}):")
+                for site, size in stage.top_sites:
+                    lines.append(f"  {_format_bytes(size):>10}  {site}")
+    if report.top_functions:
+        lines.append("Funciones más muestreadas:")
+        for function, samples in report.top_functions:
+            lines.append(f"  {samples:>8}  {function}")
+    return lines
+
+
+def _can_use_timer_signal(thread_id: int) -> bool:
+    """Indica si el hilo puede muestrearse con SIGPROF."""
+    return (
+        hasattr(signal, "setitimer")
+        and thread_id == threading.main_thread().ident
+        and threading.get_ident() == thread_id
+    )
+
+
+def _classify_stack(frame: Optional[FrameType]) -> Tuple[str, Optional[str]]:
+    """Retorna la etapa y la función más interna del proyecto de una pila."""
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        stage = stage_of_file(filename)
+        if stage is not None:
+            return stage, f"{os.path.basename(filename)}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return STAGE_OTHER, None
+
+
+def _top_sites_by_stage(
+    snapshot: Optional[tracemalloc.Snapshot], top: int
+) -> Dict[str, List[Tuple[str, int]]]:
+    """Agrupa la memoria de una instantánea por etapa y línea de asignación."""
+    if snapshot is None:
+        return {}
+    sizes: Dict[str, Counter] = {}
+    for trace in snapshot.traces:
+        # tracemalloc ordena los frames del más antiguo al más reciente
+        site = None
+        stage = STAGE_OTHER
+        for frame in reversed(trace.traceback):
+            frame_stage = stage_of_file(frame.filename)
+            if frame_stage is not None:
+                stage = frame_stage
+                site = f"{os.path.relpath(frame.filename, _SRC_DIR)}:{frame.lineno}"
+                break
+        if site is None:
+            frame = trace.traceback[-1]
+            site = f"{frame.filename}:{frame.lineno}"
+        sizes.setdefault(stage, Counter())[site] += trace.size
+    return {stage: counter.most_common(top) for stage, counter in sizes.items()}
+
+
+def _format_bytes(size: int) -> str:
+    """Formatea una cantidad de bytes en KiB o MiB."""
+    if size >= 1 << 20:
+        return f"{size / (1 << 20):.1f} MiB"
+    return f"{size / 1024:.1f} KiB"
@@ -0,0 +1,400 @@
+"""Contadores y tiempos por etapa del pipeline de lotes.
+
+Las etapas del pipeline son iteradores encadenados: escribir una fila pide
+la siguiente al cálculo, que pide el siguiente registro a la lectura. Para
+medir cada etapa por separado, PipelineTracer lleva la etapa en curso de cada
+hilo y, en cada cambio de etapa, atribuye el tiempo transcurrido a la etapa
+anterior. Así el tiempo de cada etapa es exclusivo (no incluye el de las
+etapas de las que consume) y la suma de todas es el tiempo total.
+
+Por cada etapa se mide el tiempo de reloj y el tiempo de CPU del hilo; la
+diferencia es el tiempo bloqueado (E/S, esperas). Si las etapas corren en
+hilos distintos unidos por una cola acotada (ver StageQueue), se registra
+además la ocupación de la cola y cuánto espera cada lado: un productor que
+espera con la cola llena indica que el consumidor es el cuello de botella, y
+un consumidor que espera con la cola vacía indica lo contrario.
+"""
+
+import queue
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO
+
+from src.diagnostics.profiling import STAGE_COMPUTE, STAGE_PARSE, STAGE_WRITE
+
+PIPELINE_STAGES = (STAGE_PARSE, STAGE_COMPUTE, STAGE_WRITE)
+
+DEFAULT_PROGRESS_INTERVAL = 5.0
+# Filas entre consultas del reloj para decidir si se imprime el progreso
+_PROGRESS_CHECK_ROWS = 1024
+_QUEUE_POLL_SECONDS = 0.1
+
+
+class StageTimer:
+    """Filas y tiempos acumulados de una etapa."""
+
+    __slots__ = ("name", "rows", "wall_seconds", "cpu_seconds")
+
+    def __init__(self, name: str) -> None:
+        """
+        Inicializa los contadores de la etapa en cero.
+
+        Args:
+            name: Nombre de la etapa
+        """
+        self.name = name
+        self.rows = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+
+    @property
+    def blocked_seconds(self) -> float:
+        """Tiempo de reloj sin uso de CPU (E/S o esperas)."""
+        return max(self.wall_seconds - self.cpu_seconds, 0.0)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Filas por segundo de tiempo propio de la etapa."""
+        return self.rows / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class QueueStats:
+    """Ocupación y esperas de una cola entre dos etapas."""
+
+    __slots__ = (
+        "name",
+        "capacity",
+        "puts",
+        "occupancy_total",
+        "max_occupancy",
+        "put_wait_seconds",
+        "get_wait_seconds",
+    )
+
+    def __init__(self, name: str, capacity: int) -> None:
+        """
+        Inicializa las estadísticas de la cola.
+
+        Args:
+            name: Nombre de la cola (por ejemplo ``compute->write``)
+            capacity: Cantidad máxima de elementos en la cola
+        """
+        self.name = name
+        self.capacity = capacity
+        self.puts = 0
+        self.occupancy_total = 0
+        self.max_occupancy = 0
+        self.put_wait_seconds = 0.0
+        self.get_wait_seconds = 0.0
+
+    @property
+    def mean_occupancy(self) -> float:
+        """Ocupación promedio observada al encolar."""
+        return self.occupancy_total / self.puts if self.puts else 0.0
+
+
+class PipelineReport(NamedTuple):
+    """Instantánea de los contadores de un pipeline."""
+
+    elapsed_seconds: float
+    stages: List[StageTimer]
+    queues: List[QueueStats]
+
+
+class PipelineTracer:
+    """Mide filas, tiempo de reloj y de CPU de cada etapa del pipeline."""
+
+    def __init__(
+        self,
+        stages: Iterable[str] = PIPELINE_STAGES,
+        progress_interval: Optional[float] = None,
+        stream: Optional[TextIO] = None,
+        total_rows: Optional[int] = None,
+    ) -> None:
+        """
+        Inicializa el trazador.
+
+        Args:
+            stages: Nombres de las etapas, en orden del pipeline
+            progress_interval: Segundos entre líneas de progreso (None las
+                desactiva)
+            stream: Destino de las líneas de progreso (por defecto stderr)
+            total_rows: Filas esperadas, para mostrar el porcentaje de avance
+        """
+        self.timers: Dict[str, StageTimer] = {name: StageTimer(name) for name in stages}
+        self.queues: List[QueueStats] = []
+        self.progress_interval = progress_interval
+        self.stream = stream
+        self.total_rows = total_rows
+        self._local = threading.local()
+        self._start = time.perf_counter()
+        self._next_progress = self._start + (progress_interval or 0.0)
+
+    def iterate(self, stage: str, iterable: Iterable[Any]) -> Iterator[Any]:
+        """
+        Envuelve un iterador para que producir cada elemento cuente en la etapa.
+
+        Args:
+            stage: Etapa que produce los elementos
+            iterable: Iterador de la etapa
+
+        Yields:
+            Los mismos elementos del iterador
+        """
+        timer = self.timers[stage]
+        iterator = iter(iterable)
+        switch = self._switch
+        while True:
+            previous = switch(stage)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                switch(previous)
+                return
+            switch(previous)
+            timer.rows += 1
+            if self.progress_interval is not None and not (
+                timer.rows % _PROGRESS_CHECK_ROWS
+            ):
+                self._maybe_print_progress()
+            yield item
+
+    def count(self, stage: str, iterable: Iterable[Any]) -> Iterator[Any]:
+        """
+        Cuenta las filas que consume una etapa sin cambiar la etapa en curso.
+
+        Args:
+            stage: Etapa que consume los elementos
+            iterable: Elementos consumidos
+
+        Yields:
+            Los mismos elementos
+        """
+        timer = self.timers[stage]
+        for item in iterable:
+            timer.rows += 1
+            yield item
+
+    def enter(self, stage: Optional[str]) -> Optional[str]:
+        """
+        Marca el inicio de una etapa en el hilo actual.
+
+        Args:
+            stage: Etapa que comienza (None para ninguna)
+
+        Returns:
+            Etapa anterior, para restaurarla con enter(previous)
+        """
+        return self._switch(stage)
+
+    def add_queue(self, name: str, capacity: int) -> QueueStats:
+        """
+        Registra una cola entre etapas.
+
+        Args:
+            name: Nombre de la cola
+            capacity: Capacidad de la cola
+
+        Returns:
+            Estadísticas a actualizar por la cola
+        """
+        stats = QueueStats(name, capacity)
+        self.queues.append(stats)
+        return stats
+
+    def report(self) -> PipelineReport:
+        """
+        Retorna los contadores acumulados hasta ahora.
+
+        Returns:
+            Tiempo transcurrido, contadores por etapa y por cola
+        """
+        return PipelineReport(
+            time.perf_counter() - self._start,
+            list(self.timers.values()),
+            list(self.queues),
+        )
+
+    def _switch(self, stage: Optional[str]) -> Optional[str]:
+        """Atribuye el tiempo desde el último cambio y cambia de etapa."""
+        local = self._local
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        previous = getattr(local, "stage", None)
+        if previous is not None:
+            timer = self.timers[previous]
+            timer.wall_seconds += wall - local.wall
+            timer.cpu_seconds += cpu - local.cpu
+        local.stage = stage
+        local.wall = wall
+        local.cpu = cpu
+        return previous
+
+    def _maybe_print_progress(self) -> None:
+        """Imprime una línea de progreso si ya pasó el intervalo."""
+        now = time.perf_counter()
+        if now < self._next_progress:
+            return
+        self._next_progress = now + (self.progress_interval or 0.0)
+        stream = self.stream if self.stream is not None else sys.stderr
+        print(format_progress(self.report(), self.total_rows), file=stream, flush=True)
+
+
+class StageQueue:
+    """
+    Cola acotada de bloques de filas entre dos etapas en hilos distintos.
+
+    Con un trazador, registra la ocupación al encolar y el tiempo que cada
+    lado espera; ese tiempo no se atribuye a ninguna etapa.
+    """
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        capacity: int,
+        tracer: Optional[PipelineTracer] = None,
+        name: str = f"{STAGE_COMPUTE}->{STAGE_WRITE}",
+    ) -> None:
+        """
+        Inicializa la cola.
+
+        Args:
+            capacity: Cantidad máxima de bloques en espera
+            tracer: Trazador del pipeline (None para no medir)
+            name: Nombre de la cola en los reportes
+        """
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=capacity)
+        self._tracer = tracer
+        self._stats = tracer.add_queue(name, capacity) if tracer is not None else None
+
+    def put(self, chunk: List[Any], consumer: threading.Thread) -> None:
+        """
+        Encola un bloque, esperando si la cola está llena.
+
+        Args:
+            chunk: Bloque de filas
+            consumer: Hilo consumidor; si termina se deja de esperar
+
+        Raises:
+            RuntimeError: Si el consumidor terminó antes de cerrar la cola
+        """
+        stats = self._stats
+        if stats is None or self._tracer is None:
+            self._put(chunk, consumer)
+            return
+        occupancy = self._queue.qsize()
+        stats.puts += 1
+        stats.occupancy_total += occupancy
+        stats.max_occupancy = max(stats.max_occupancy, occupancy)
+        previous = self._tracer.enter(None)
+        start = time.perf_counter()
+        try:
+            self._put(chunk, consumer)
+        finally:
+            stats.put_wait_seconds += time.perf_counter() - start
+            self._tracer.enter(previous)
+
+    def close(self, consumer: threading.Thread) -> None:
+        """
+        Indica al consumidor que no habrá más bloques.
+
+        Args:
+            consumer: Hilo consumidor
+        """
+        self._put(self._DONE, consumer)
+
+    def rows(self) -> Iterator[Any]:
+        """
+        Itera las filas de los bloques hasta que la cola se cierra.
+
+        Yields:
+            Filas en el orden en que se encolaron
+        """
+        while True:
+            chunk = self._get()
+            if chunk is self._DONE:
+                return
+            yield from chunk
+
+    def _put(self, item: Any, consumer: threading.Thread) -> None:
+        """Encola un elemento mientras el consumidor siga vivo."""
+        while True:
+            try:
+                self._queue.put(item, timeout=_QUEUE_POLL_SECONDS)
+                return
+            except queue.Full:
+                if not consumer.is_alive():
+                    raise RuntimeError("La etapa consumidora terminó antes de tiempo")
+
+    def _get(self) -> Any:
+        """Desencola un bloque midiendo la espera."""
+        if self._stats is None or self._tracer is None:
+            return self._queue.get()
+        previous = self._tracer.enter(None)
+        start = time.perf_counter()
+        try:
+            return self._queue.get()
+        finally:
+            self._stats.get_wait_seconds += time.perf_counter() - start
+            self._tracer.enter(previous)
+
+
+def format_progress(report: PipelineReport, total_rows: Optional[int] = None) -> str:
+    """
+    Arma una línea de progreso con el avance y el reparto del tiempo.
+
+    Args:
+        report: Contadores del pipeline
+        total_rows: Filas esperadas (None si no se conocen)
+
+    Returns:
+        Línea de progreso sin salto de línea
+    """
+    rows = report.stages[-1].rows if report.stages else 0
+    elapsed = report.elapsed_seconds
+    line = f"[{elapsed:7.1f} s] {rows} filas"
+    if total_rows:
+        line += f" ({100 * rows / total_rows:.1f}%)"
+    if elapsed:
+        line += f", {rows / elapsed:.0f} filas/s"
+    busy = sum(stage.wall_seconds for stage in report.stages) or 1.0
+    shares = " ".join(
+        f"{stage.name} {100 * stage.wall_seconds / busy:.0f}%"
+        for stage in report.stages
+    )
+    line += f" | {shares}"
+    for stats in report.queues:
+        line += f" | cola {stats.name} {stats.mean_occupancy:.1f}/{stats.capacity}"
+    return line
+
+
+def format_summary(report: PipelineReport) -> List[str]:
+    """
+    Arma el resumen final del pipeline por etapa y por cola.
+
+    Args:
+        report: Contadores del pipeline
+
+    Returns:
+        Líneas del resumen, sin saltos de línea
+    """
+    lines = [
+        f"Tiempo total: {report.elapsed_seconds:.3f} s",
+        "Etapa         filas     filas/s    reloj s      CPU s  bloqueado s",
+    ]
+    for stage in report.stages:
+        lines.append(
+            f"{stage.name:<9}{stage.rows:>10}{stage.rows_per_second:>12.0f}"
+            f"{stage.wall_seconds:>11.3f}{stage.cpu_seconds:>11.3f}"
+            f"{stage.blocked_seconds:>13.3f}"
+        )
+    for stats in report.queues:
+        lines.append(
+            f"Cola {stats.name}: ocupación media {stats.mean_occupancy:.1f}"
+            f" / máxima {stats.max_occupancy} de {stats.capacity}; "
+            f"espera al encolar {stats.put_wait_seconds:.3f} s, "
+            f"al desencolar {stats.get_wait_seconds:.3f} s"
+        )
+    return lines
@@ -36,3 +36,68 @@ class InvalidExtraPointsError(GradeCalculatorError):
 
     pass
 
+
+class InvalidRosterError(GradeCalculatorError):
+    """Error cuando una fila del archivo de estudiantes (roster) es inválida."""
+
+    pass
+
+
+class InvalidResultFileError(GradeCalculatorError):
+    """Error cuando un archivo de resultados binario es inválido."""
+
+    pass
+
+
+class CheckpointMismatchError(GradeCalculatorError):
+    """Error cuando un checkpoint no corresponde al lote que se intenta reanudar."""
+
+    pass
+
+
+class ShardingError(GradeCalculatorError):
+    """Error en la partición o combinación de un lote particionado."""
+
+    pass
+
+
+class AdmissionRejectedError(GradeCalculatorError):
+    """Error cuando una solicitud no se admite (cola llena o plazo inalcanzable)."""
+
+    pass
+
+
+class DeadlineExceededError(AdmissionRejectedError):
+    """Error cuando una solicitud encolada ya no puede cumplir su plazo."""
+
+    pass
+
+
+class AuditLogFullError(GradeCalculatorError):
+    """Error cuando la cola del log de auditoría está llena."""
+
+    pass
+
+
+class InvalidCourseGradeError(GradeCalculatorError):
+    """Error cuando la nota o los créditos de un curso son inválidos."""
+
+    pass
+
+
+class InvalidRpcRequestError(GradeCalculatorError):
+    """Error cuando una solicitud del modo RPC no tiene el formato esperado."""
+
+    pass
+
+
+class InvalidCourseConfigError(GradeCalculatorError):
+    """Error cuando la configuración de un curso es inválida."""
+
+    pass
+
+
+class ReportFileCollisionError(GradeCalculatorError):
+    """Error cuando dos reportes por estudiante irían al mismo archivo."""
+
+    pass
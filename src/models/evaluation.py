@@ -36,7 +36,8 @@ class Evaluation:
         """Retorna el peso de la evaluación como porcentaje."""
         return self._weight
 
-    def _validate_grade(self, grade: float) -> None:
+    @staticmethod
+    def _validate_grade(grade: float) -> None:
         """
         Valida que la nota esté en el rango válido.
 
@@ -52,7 +53,8 @@ class Evaluation:
                 f"Valor recibido: {grade}"
             )
 
-    def _validate_weight(self, weight: float) -> None:
+    @staticmethod
+    def _validate_weight(weight: float) -> None:
         """
         Valida que el peso sea positivo.
 
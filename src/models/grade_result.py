@@ -0,0 +1,126 @@
+"""Modelo de Resultado de cálculo de nota final."""
+
+from typing import Dict, Iterator, Mapping
+
+RESULT_FIELDS = (
+    "final_grade",
+    "weighted_average",
+    "penalty_applied",
+    "extra_points_applied",
+)
+RESULT_DECIMALS = 2
+
+
+class GradeResult(Mapping[str, float]):
+    """
+    Resultado del cálculo de la nota final de un estudiante.
+
+    Guarda los valores sin redondear y redondea cada campo solo cuando se
+    lee. Implementa Mapping, por lo que puede usarse como el diccionario que
+    retorna GradeCalculator.calculate_final_grade (``result["final_grade"]``,
+    ``dict(result)``, comparación con un dict).
+    """
+
+    __slots__ = (
+        "raw_final_grade",
+        "raw_weighted_average",
+        "raw_penalty_applied",
+        "raw_extra_points_applied",
+    )
+
+    def __init__(
+        self,
+        final_grade: float,
+        weighted_average: float,
+        penalty_applied: float,
+        extra_points_applied: float,
+    ) -> None:
+        """
+        Inicializa el resultado con los valores sin redondear.
+
+        Args:
+            final_grade: Nota final
+            weighted_average: Promedio ponderado
+            penalty_applied: Penalización aplicada
+            extra_points_applied: Puntos extra aplicados
+        """
+        _set_final_grade(self, final_grade)
+        _set_weighted_average(self, weighted_average)
+        _set_penalty_applied(self, penalty_applied)
+        _set_extra_points_applied(self, extra_points_applied)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Impide modificar el resultado después de construirlo."""
+        raise AttributeError(f"GradeResult es inmutable: no se puede asignar {name}")
+
+    def __delattr__(self, name: str) -> None:
+        """Impide borrar campos del resultado."""
+        raise AttributeError(f"GradeResult es inmutable: no se puede borrar {name}")
+
+    def __reduce__(self) -> tuple:
+        """Serializa con pickle reconstruyendo desde los valores sin redondear."""
+        return (
+            GradeResult,
+            (
+                self.raw_final_grade,
+                self.raw_weighted_average,
+                self.raw_penalty_applied,
+                self.raw_extra_points_applied,
+            ),
+        )
+
+    @property
+    def final_grade(self) -> float:
+        """Retorna la nota final redondeada."""
+        return round(self.raw_final_grade, RESULT_DECIMALS)
+
+    @property
+    def weighted_average(self) -> float:
+        """Retorna el promedio ponderado redondeado."""
+        return round(self.raw_weighted_average, RESULT_DECIMALS)
+
+    @property
+    def penalty_applied(self) -> float:
+        """Retorna la penalización aplicada redondeada."""
+        return round(self.raw_penalty_applied, RESULT_DECIMALS)
+
+    @property
+    def extra_points_applied(self) -> float:
+        """Retorna los puntos extra aplicados redondeados."""
+        return round(self.raw_extra_points_applied, RESULT_DECIMALS)
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Retorna el detalle del cálculo con los campos redondeados.
+
+        Returns:
+            Diccionario con final_grade, weighted_average, penalty_applied
+            y extra_points_applied
+        """
+        return {name: self[name] for name in RESULT_FIELDS}
+
+    def __getitem__(self, name: str) -> float:
+        """Retorna un campo redondeado por nombre, como un diccionario."""
+        if name not in RESULT_FIELDS:
+            raise KeyError(name)
+        return round(getattr(self, "raw_" + name), RESULT_DECIMALS)
+
+    def __iter__(self) -> Iterator[str]:
+        """Itera los nombres de los campos."""
+        return iter(RESULT_FIELDS)
+
+    def __len__(self) -> int:
+        """Cantidad de campos."""
+        return len(RESULT_FIELDS)
+
+    def __repr__(self) -> str:
+        """Representación string del resultado."""
+        return f"GradeResult({self.to_dict()})"
+
+
+# Escriben directamente en los slots, sin pasar por __setattr__ (que rechaza
+# toda asignación); solo los usa GradeResult.__init__
+_set_final_grade = GradeResult.raw_final_grade.__set__
+_set_weighted_average = GradeResult.raw_weighted_average.__set__
+_set_penalty_applied = GradeResult.raw_penalty_applied.__set__
+_set_extra_points_applied = GradeResult.raw_extra_points_applied.__set__
@@ -0,0 +1,60 @@
+"""Modelo de Registro de Estudiante para procesamiento por lotes."""
+
+from typing import Sequence, Tuple
+
+
+class StudentRecord:
+    """
+    Representa los datos de entrada de un estudiante dentro de un lote.
+
+    A diferencia de Evaluation, no valida los valores al construirse: las
+    notas y pesos se validan al calcular la nota final, de modo que un
+    registro inválido produce un error por fila y no detiene el lote.
+    """
+
+    __slots__ = (
+        "student_id",
+        "grades",
+        "weights",
+        "has_reached_minimum",
+        "tardiness_percentage",
+        "all_years_teachers",
+        "extra_points",
+    )
+
+    def __init__(
+        self,
+        student_id: str,
+        grades: Sequence[float],
+        weights: Sequence[float],
+        has_reached_minimum: bool,
+        tardiness_percentage: float,
+        all_years_teachers: Sequence[bool],
+        extra_points: float,
+    ) -> None:
+        """
+        Inicializa un registro de estudiante.
+
+        Args:
+            student_id: Código o identificador del estudiante
+            grades: Notas de las evaluaciones (0-20)
+            weights: Pesos de las evaluaciones como porcentaje
+            has_reached_minimum: True si alcanzó la asistencia mínima
+            tardiness_percentage: Porcentaje de tardanzas (0-100)
+            all_years_teachers: Votos de los profesores (True/False)
+            extra_points: Puntos extra a aplicar (si aplica)
+        """
+        self.student_id = student_id
+        self.grades: Tuple[float, ...] = tuple(grades)
+        self.weights: Tuple[float, ...] = tuple(weights)
+        self.has_reached_minimum = has_reached_minimum
+        self.tardiness_percentage = tardiness_percentage
+        self.all_years_teachers: Tuple[bool, ...] = tuple(all_years_teachers)
+        self.extra_points = extra_points
+
+    def __repr__(self) -> str:
+        """Representación string del registro."""
+        return (
+            f"StudentRecord(student_id={self.student_id!r}, "
+            f"evaluations={len(self.grades)})"
+        )
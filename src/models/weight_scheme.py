@@ -0,0 +1,133 @@
+"""Modelo de Esquema de Pesos compartido entre estudiantes."""
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from src.constants import EXPECTED_WEIGHT_SUM, WEIGHT_TOLERANCE
+from src.exceptions import GradeCalculatorError, InvalidWeightError
+from src.models.evaluation import Evaluation
+
+# Límite de esquemas internados; los siguientes se crean sin registrar
+MAX_INTERNED_SCHEMES = 65536
+
+
+class WeightScheme:
+    """
+    Tupla de pesos de evaluaciones, validada una sola vez.
+
+    En un roster los mismos pesos (por ejemplo 30/30/40) se repiten en miles
+    de estudiantes. WeightScheme.intern retorna siempre la misma instancia
+    para los mismos pesos, de modo que la tupla existe una sola vez en memoria
+    y su validación (cada peso positivo, suma 100%) se hace al crearla. Los
+    estudiantes que comparten un esquema no vuelven a sumar sus pesos.
+
+    Las instancias no deben modificarse.
+    """
+
+    __slots__ = ("scheme_id", "weights", "total", "_error", "_error_index")
+
+    _registry: Dict[Tuple[float, ...], "WeightScheme"] = {}
+    _schemes: List["WeightScheme"] = []
+    _lock = threading.Lock()
+
+    def __init__(self, weights: Sequence[float], scheme_id: int = -1) -> None:
+        """
+        Crea y valida un esquema de pesos (usar intern para compartirlo).
+
+        Args:
+            weights: Pesos de las evaluaciones como porcentaje
+            scheme_id: Identificador del esquema internado (-1 si no lo está)
+        """
+        self.scheme_id = scheme_id
+        self.weights: Tuple[float, ...] = tuple(weights)
+        self.total = sum(self.weights)
+        self._error: Optional[Tuple[Type[GradeCalculatorError], str]] = None
+        self._error_index = len(self.weights)
+
+        for index, weight in enumerate(self.weights):
+            try:
+                Evaluation._validate_weight(weight)
+            except GradeCalculatorError as e:
+                self._error = (type(e), str(e))
+                self._error_index = index
+                return
+        if self.weights and abs(self.total - EXPECTED_WEIGHT_SUM) > WEIGHT_TOLERANCE:
+            self._error = (
+                InvalidWeightError,
+                f"La suma de los pesos debe ser {EXPECTED_WEIGHT_SUM}%. "
+                f"Suma actual: {self.total}%",
+            )
+
+    @property
+    def is_valid(self) -> bool:
+        """Indica si los pesos son positivos y suman 100%."""
+        return self._error is None
+
+    @property
+    def invalid_weight_index(self) -> int:
+        """Posición del primer peso no positivo (la cantidad de pesos si no hay)."""
+        return self._error_index
+
+    def raise_error(self) -> None:
+        """
+        Lanza el error de validación del esquema, si lo tiene.
+
+        Raises:
+            InvalidEvaluationError: Si algún peso no es positivo
+            InvalidWeightError: Si los pesos no suman 100%
+        """
+        if self._error is not None:
+            error_type, message = self._error
+            raise error_type(message)
+
+    def __len__(self) -> int:
+        """Cantidad de evaluaciones del esquema."""
+        return len(self.weights)
+
+    def __repr__(self) -> str:
+        """Representación string del esquema."""
+        return f"WeightScheme(id={self.scheme_id}, weights={self.weights})"
+
+    @staticmethod
+    def intern(weights: Sequence[float]) -> "WeightScheme":
+        """
+        Retorna el esquema compartido para los pesos indicados.
+
+        Args:
+            weights: Pesos de las evaluaciones como porcentaje
+
+        Returns:
+            La misma instancia para los mismos pesos
+        """
+        key = tuple(weights)
+        scheme = WeightScheme._registry.get(key)
+        if scheme is not None:
+            return scheme
+        with WeightScheme._lock:
+            scheme = WeightScheme._registry.get(key)
+            if scheme is not None:
+                return scheme
+            if len(WeightScheme._schemes) >= MAX_INTERNED_SCHEMES:
+                return WeightScheme(key)
+            scheme = WeightScheme(key, len(WeightScheme._schemes))
+            WeightScheme._schemes.append(scheme)
+            WeightScheme._registry[key] = scheme
+            return scheme
+
+    @staticmethod
+    def get(scheme_id: int) -> "WeightScheme":
+        """
+        Retorna un esquema internado por su identificador.
+
+        Args:
+            scheme_id: Identificador asignado por intern
+
+        Returns:
+            Esquema de pesos
+        """
+        return WeightScheme._schemes[scheme_id]
+
+    @staticmethod
+    def interned_count() -> int:
+        """Cantidad de esquemas internados."""
+        return len(WeightScheme._schemes)
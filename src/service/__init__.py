@@ -0,0 +1 @@
+"""Servicio de cálculo de notas para uso embebido o en servidores."""
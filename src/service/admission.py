@@ -0,0 +1,277 @@
+"""Control de admisión para respetar el plazo de cálculo por solicitud.
+
+El RNF04 exige responder en MAX_CALCULATION_TIME_MS; con más de
+MAX_CONCURRENT_USERS solicitudes simultáneas, la espera en cola puede
+consumir ese plazo. El controlador:
+
+- Limita la concurrencia a una cantidad fija de hilos de trabajo.
+- Mantiene una cola acotada por carril de prioridad (``interactive`` para
+  docentes, ``bulk`` para lotes). Los hilos siempre atienden primero el
+  carril interactivo y, dentro de un carril, la solicitud de plazo más
+  próximo.
+- Rechaza al admitir una solicitud si su carril está lleno o si, con la
+  espera estimada, ya no podría cumplir su plazo.
+- Descarta al desencolar las solicitudes que ya no llegan a tiempo, en lugar
+  de calcular una respuesta que nadie va a usar.
+
+El tiempo de servicio se estima con un promedio móvil exponencial de las
+solicitudes atendidas.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from src.calculator.grade_calculator import GradeCalculator
+from src.constants import MAX_CALCULATION_TIME_MS, MAX_CONCURRENT_USERS
+from src.exceptions import AdmissionRejectedError, DeadlineExceededError
+
+LANE_INTERACTIVE = "interactive"
+LANE_BULK = "bulk"
+LANES = (LANE_INTERACTIVE, LANE_BULK)
+DEFAULT_MAX_QUEUE_DEPTH = 2 * MAX_CONCURRENT_USERS
+_SERVICE_TIME_SMOOTHING = 0.2
+
+
+class AdmissionMetrics(NamedTuple):
+    """Instantánea de las métricas del controlador."""
+
+    queue_depth: Dict[str, int]
+    in_flight: int
+    admitted: int
+    completed: int
+    rejected_queue_full: int
+    rejected_deadline: int
+    expired: int
+    service_time_ms: float
+
+
+class _Request(NamedTuple):
+    """Solicitud encolada."""
+
+    function: Callable[..., Any]
+    args: Tuple[Any, ...]
+    future: Future
+
+
+class AdmissionController:
+    """Cola acotada con carriles de prioridad y planificación por plazo."""
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENT_USERS,
+        max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH,
+        default_deadline_ms: Optional[Dict[str, Optional[float]]] = None,
+    ) -> None:
+        """
+        Inicializa el controlador e inicia los hilos de trabajo.
+
+        Args:
+            max_concurrency: Solicitudes calculadas al mismo tiempo
+            max_queue_depth: Solicitudes en espera por carril
+            default_deadline_ms: Plazo por defecto de cada carril (None sin
+                plazo); por defecto MAX_CALCULATION_TIME_MS para el carril
+                interactivo y sin plazo para lotes
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency debe ser al menos 1")
+        self._max_concurrency = max_concurrency
+        self._max_queue_depth = max_queue_depth
+        self._default_deadline_ms = {
+            LANE_INTERACTIVE: float(MAX_CALCULATION_TIME_MS),
+            LANE_BULK: None,
+        }
+        self._default_deadline_ms.update(default_deadline_ms or {})
+
+        self._condition = threading.Condition()
+        self._lanes: Dict[str, List[Tuple[float, int, _Request]]] = {
+            lane: [] for lane in LANES
+        }
+        self._sequence = itertools.count()
+        self._closed = False
+        self._in_flight = 0
+        self._admitted = 0
+        self._completed = 0
+        self._rejected_queue_full = 0
+        self._rejected_deadline = 0
+        self._expired = 0
+        self._service_time = 0.0
+
+        self._workers = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(max_concurrency)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(
+        self,
+        function: Callable[..., Any],
+        *args: Any,
+        lane: str = LANE_INTERACTIVE,
+        deadline_ms: Optional[float] = None,
+    ) -> Future:
+        """
+        Encola una solicitud si puede atenderse a tiempo.
+
+        Args:
+            function: Función a ejecutar
+            *args: Argumentos de la función
+            lane: Carril de prioridad (``interactive`` o ``bulk``)
+            deadline_ms: Plazo en milisegundos desde ahora (por defecto, el
+                del carril)
+
+        Returns:
+            Future con el resultado; falla con DeadlineExceededError si la
+            solicitud se descarta por plazo mientras espera
+
+        Raises:
+            AdmissionRejectedError: Si el carril está lleno o el plazo no se
+                puede cumplir con la espera estimada
+        """
+        if lane not in self._lanes:
+            raise ValueError(f"Carril desconocido: {lane}")
+        if deadline_ms is None:
+            deadline_ms = self._default_deadline_ms[lane]
+        now = time.monotonic()
+        deadline = float("inf") if deadline_ms is None else now + deadline_ms / 1000
+
+        with self._condition:
+            if self._closed:
+                raise AdmissionRejectedError("El controlador está cerrado")
+            queue = self._lanes[lane]
+            if len(queue) >= self._max_queue_depth:
+                self._rejected_queue_full += 1
+                raise AdmissionRejectedError(f"Cola {lane} llena")
+            if now + self._estimated_wait(lane) + self._service_time > deadline:
+                self._rejected_deadline += 1
+                raise AdmissionRejectedError(
+                    f"La solicitud no puede cumplir su plazo de {deadline_ms:.0f} ms"
+                )
+            request = _Request(function, args, Future())
+            heapq.heappush(queue, (deadline, next(self._sequence), request))
+            self._admitted += 1
+            self._condition.notify()
+        return request.future
+
+    def calculate(self, *args: Any, **kwargs: Any) -> Dict[str, float]:
+        """
+        Calcula una nota final a través del control de admisión y la espera.
+
+        Args:
+            *args: Argumentos de GradeCalculator.calculate_final_grade
+            **kwargs: ``lane`` y ``deadline_ms`` (ver submit)
+
+        Returns:
+            Diccionario con el detalle del cálculo
+
+        Raises:
+            AdmissionRejectedError: Si la solicitud no se admite o se descarta
+            GradeCalculatorError: Si los datos del estudiante son inválidos
+        """
+        future = self.submit(GradeCalculator.calculate_final_grade, *args, **kwargs)
+        return future.result()
+
+    def metrics(self) -> AdmissionMetrics:
+        """
+        Retorna las métricas actuales.
+
+        Returns:
+            Profundidad de cola por carril, solicitudes en curso y contadores
+        """
+        with self._condition:
+            return AdmissionMetrics(
+                queue_depth={lane: len(queue) for lane, queue in self._lanes.items()},
+                in_flight=self._in_flight,
+                admitted=self._admitted,
+                completed=self._completed,
+                rejected_queue_full=self._rejected_queue_full,
+                rejected_deadline=self._rejected_deadline,
+                expired=self._expired,
+                service_time_ms=self._service_time * 1000,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Deja de admitir solicitudes y detiene los hilos al vaciar las colas.
+
+        Args:
+            wait: Si espera a que terminen las solicitudes pendientes
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def __enter__(self) -> "AdmissionController":
+        """Permite usar el controlador como context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Detiene el controlador al salir del bloque ``with``."""
+        self.shutdown()
+
+    def _estimated_wait(self, lane: str) -> float:
+        """Segundos estimados de espera para una solicitud nueva del carril."""
+        ahead = self._in_flight
+        for other in LANES:
+            ahead += len(self._lanes[other])
+            if other == lane:
+                break
+        # Con todos los hilos libres no hay espera
+        return max(ahead - self._max_concurrency + 1, 0) * (
+            self._service_time / self._max_concurrency
+        )
+
+    def _next_request(self) -> Optional[_Request]:
+        """Toma la siguiente solicitud que aún puede cumplir su plazo."""
+        with self._condition:
+            while True:
+                for lane in LANES:
+                    queue = self._lanes[lane]
+                    while queue:
+                        deadline, _, request = heapq.heappop(queue)
+                        # Primero se reclama el future: si quien envió la
+                        # solicitud ya la canceló, no se puede fijar su error
+                        if not request.future.set_running_or_notify_cancel():
+                            continue
+                        if time.monotonic() + self._service_time > deadline:
+                            self._expired += 1
+                            request.future.set_exception(
+                                DeadlineExceededError("Plazo vencido en la cola")
+                            )
+                            continue
+                        self._in_flight += 1
+                        return request
+                if self._closed:
+                    return None
+                self._condition.wait()
+
+    def _work(self) -> None:
+        """Bucle de cada hilo de trabajo."""
+        while True:
+            request = self._next_request()
+            if request is None:
+                return
+            start = time.monotonic()
+            try:
+                result = request.function(*request.args)
+            except Exception as e:  # se entrega a quien envió la solicitud
+                request.future.set_exception(e)
+            else:
+                request.future.set_result(result)
+            elapsed = time.monotonic() - start
+            with self._condition:
+                self._in_flight -= 1
+                self._completed += 1
+                if self._service_time == 0.0:
+                    self._service_time = elapsed
+                else:
+                    self._service_time += _SERVICE_TIME_SMOOTHING * (
+                        elapsed - self._service_time
+                    )
@@ -0,0 +1,423 @@
+"""Log de auditoría de cálculos de notas finales.
+
+Para resolver reclamos de notas se registra cada cálculo con sus datos de
+entrada completos y el detalle del resultado (o el error). El registro no
+debe agregar latencia al cálculo, por lo que:
+
+- log_calculation solo agrega la entrada a una cola en memoria; la
+  serialización y la escritura ocurren en un hilo en segundo plano. La cola
+  es un ``deque`` acotado con un semáforo: el hilo escritor la vacía con
+  popleft (atómico en CPython) sin tomar el lock de los productores, que
+  solo protege la asignación del número de secuencia.
+- El hilo escribe por grupos (group commit): toma todas las entradas
+  acumuladas mientras se sincronizaba el grupo anterior, las escribe con
+  una sola llamada y hace un solo fsync por grupo.
+- Si la cola se llena, se aplica la política de contrapresión elegida:
+  ``block`` (por defecto) espera hasta ``block_timeout`` segundos y luego
+  lanza AuditLogFullError; ``raise`` lo lanza de inmediato; ``drop``
+  descarta la entrada y la cuenta en ``dropped``. Como el log sirve para
+  reclamos, solo ``drop`` admite perder entradas.
+
+Formato: JSON Lines de solo-agregado, una entrada por línea:
+
+    {"seq":0,"timestamp":1700000000.0,"student_id":"A001","grades":[15.0],
+     "weights":[100.0],"has_reached_minimum":true,"tardiness_percentage":0.0,
+     "all_years_teachers":[],"extra_points":0.0,"result":{...},"error":null}
+
+Una última línea incompleta (por ejemplo tras una caída) se ignora al leer.
+verify_audit_log recalcula cada entrada con GradeCalculator.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from src.calculator.grade_calculator import GradeCalculator
+from src.exceptions import AuditLogFullError, GradeCalculatorError
+from src.models.evaluation import Evaluation
+
+BACKPRESSURE_BLOCK = "block"
+BACKPRESSURE_RAISE = "raise"
+BACKPRESSURE_DROP = "drop"
+BACKPRESSURE_POLICIES = (BACKPRESSURE_BLOCK, BACKPRESSURE_RAISE, BACKPRESSURE_DROP)
+DEFAULT_MAX_QUEUE = 65536
+DEFAULT_COMMIT_INTERVAL = 0.05
+
+_Entry = Tuple[Any, ...]
+
+
+class AuditEntry(NamedTuple):
+    """Cálculo registrado en el log de auditoría."""
+
+    seq: int
+    timestamp: float
+    student_id: str
+    grades: List[float]
+    weights: List[float]
+    has_reached_minimum: bool
+    tardiness_percentage: float
+    all_years_teachers: List[bool]
+    extra_points: float
+    result: Optional[Dict[str, float]]
+    error: Optional[str]
+
+
+class AuditVerification(NamedTuple):
+    """Resultado de recalcular un log de auditoría."""
+
+    total_entries: int
+    matched: int
+    mismatches: List[Tuple[int, str]]
+    corrupt_lines: int
+
+
+class AuditLogWriter:
+    """Escribe el log de auditoría desde un hilo en segundo plano."""
+
+    def __init__(
+        self,
+        path: str,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        backpressure: str = BACKPRESSURE_BLOCK,
+        block_timeout: float = 1.0,
+        commit_interval: float = DEFAULT_COMMIT_INTERVAL,
+    ) -> None:
+        """
+        Abre el log (en modo agregado) e inicia el hilo escritor.
+
+        Args:
+            path: Ruta del log JSONL
+            max_queue: Entradas máximas en espera de escritura
+            backpressure: Política con la cola llena (block, raise o drop)
+            block_timeout: Segundos máximos de espera con la política block
+            commit_interval: Segundos máximos entre grupos de escritura
+        """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Política de contrapresión desconocida: {backpressure}")
+        self._file = open(path, "ab")
+        self._backpressure = backpressure
+        self._block_timeout = block_timeout
+        self._commit_interval = commit_interval
+        self._queue: Deque[_Entry] = deque()
+        self._capacity = threading.Semaphore(max_queue)
+        self._append_lock = threading.Lock()
+        self._accepted = 0
+        self._wakeup = threading.Event()
+        self._durable = threading.Condition()
+        self._written = 0
+        self._closing = False
+        self._error: Optional[BaseException] = None
+        self.dropped = 0
+        self.commits = 0
+        self._thread = threading.Thread(
+            target=self._run, name="audit-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def written(self) -> int:
+        """Entradas ya escritas y sincronizadas en disco."""
+        return self._written
+
+    def log_calculation(
+        self,
+        student_id: str,
+        evaluations: Sequence[Evaluation],
+        has_reached_minimum: bool,
+        tardiness_percentage: float,
+        all_years_teachers: Sequence[bool],
+        extra_points: float,
+        result: Optional[Dict[str, float]] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """
+        Encola un cálculo para registrarlo.
+
+        Args:
+            student_id: Código o identificador del estudiante
+            evaluations: Evaluaciones usadas en el cálculo
+            has_reached_minimum: True si alcanzó la asistencia mínima
+            tardiness_percentage: Porcentaje de tardanzas
+            all_years_teachers: Votos de los profesores
+            extra_points: Puntos extra solicitados
+            result: Detalle del cálculo, si terminó bien
+            error: Mensaje de error, si el cálculo falló
+
+        Returns:
+            True si se encoló; False si se descartó (política drop)
+
+        Raises:
+            AuditLogFullError: Si la cola está llena (políticas block y raise)
+            ValueError: Si el log ya se cerró
+            OSError: Si el hilo escritor falló (o la excepción que lo detuvo)
+        """
+        if self._error is not None:
+            raise self._error
+        if self._closing:
+            raise ValueError("El log de auditoría está cerrado")
+        if not self._acquire_capacity():
+            with self._append_lock:
+                self.dropped += 1
+            return False
+
+        entry = [
+            0,
+            time.time(),
+            student_id,
+            [evaluation.grade for evaluation in evaluations],
+            [evaluation.weight for evaluation in evaluations],
+            has_reached_minimum,
+            tardiness_percentage,
+            list(all_years_teachers),
+            extra_points,
+            None if result is None else dict(result),
+            error,
+        ]
+        with self._append_lock:
+            # Se revisa junto con el encolado: close() marca el cierre con el
+            # mismo lock, así que ninguna entrada aceptada queda sin escribir
+            if self._closing:
+                self._capacity.release()
+                raise ValueError("El log de auditoría está cerrado")
+            entry[0] = self._accepted
+            self._accepted += 1
+            self._queue.append(tuple(entry))
+        self._wakeup.set()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Espera a que todas las entradas encoladas estén en disco.
+
+        Args:
+            timeout: Segundos máximos de espera (None sin límite)
+
+        Raises:
+            OSError: Si el hilo escritor falló (o la excepción que lo detuvo)
+        """
+        target = self._accepted
+        self._wakeup.set()
+        with self._durable:
+            self._durable.wait_for(
+                lambda: self._written >= target or self._error is not None, timeout
+            )
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        """
+        Escribe las entradas pendientes y cierra el log.
+
+        Raises:
+            OSError: Si el hilo escritor falló (o la excepción que lo detuvo)
+        """
+        with self._append_lock:
+            self._closing = True
+        self._wakeup.set()
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "AuditLogWriter":
+        """Permite usar el writer como context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Cierra el log al salir del bloque ``with``."""
+        self.close()
+
+    def _acquire_capacity(self) -> bool:
+        """Reserva un lugar en la cola según la política de contrapresión."""
+        if self._capacity.acquire(blocking=False):
+            return True
+        if self._backpressure == BACKPRESSURE_DROP:
+            return False
+        if self._backpressure == BACKPRESSURE_BLOCK and self._capacity.acquire(
+            timeout=self._block_timeout
+        ):
+            return True
+        raise AuditLogFullError("La cola del log de auditoría está llena")
+
+    def _run(self) -> None:
+        """Bucle del hilo: escribe por grupos con un fsync por grupo."""
+        while True:
+            self._wakeup.wait(self._commit_interval)
+            self._wakeup.clear()
+            closing = self._closing
+            group: List[bytes] = []
+            try:
+                while self._queue:
+                    group.append(_encode_entry(self._queue.popleft()))
+                if group:
+                    self._file.write(b"".join(group))
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            except Exception as e:
+                # Cualquier falla detiene el hilo, pero queda registrada para
+                # que flush(), close() y los productores la reciban
+                with self._durable:
+                    self._error = e
+                    self._durable.notify_all()
+                return
+            if group:
+                for _ in group:
+                    self._capacity.release()
+                self.commits += 1
+                with self._durable:
+                    self._written += len(group)
+                    self._durable.notify_all()
+            if closing and not self._queue:
+                return
+
+
+def calculate_audited(
+    writer: AuditLogWriter,
+    student_id: str,
+    evaluations: List[Evaluation],
+    has_reached_minimum: bool,
+    tardiness_percentage: float,
+    all_years_teachers: List[bool],
+    extra_points: float,
+) -> Dict[str, float]:
+    """
+    Calcula la nota final y registra el cálculo (o su error) en el log.
+
+    Args:
+        writer: Log de auditoría
+        student_id: Código o identificador del estudiante
+        evaluations: Lista de evaluaciones del estudiante
+        has_reached_minimum: True si alcanzó la asistencia mínima
+        tardiness_percentage: Porcentaje de tardanzas (0-100)
+        all_years_teachers: Lista de votos de profesores (True/False)
+        extra_points: Puntos extra a aplicar (si aplica)
+
+    Returns:
+        Diccionario con el detalle del cálculo
+
+    Raises:
+        GradeCalculatorError: Si los datos son inválidos (también se registra)
+    """
+    arguments = (
+        evaluations,
+        has_reached_minimum,
+        tardiness_percentage,
+        all_years_teachers,
+        extra_points,
+    )
+    try:
+        result = GradeCalculator.calculate_final_grade(*arguments)
+    except GradeCalculatorError as e:
+        writer.log_calculation(student_id, *arguments, error=str(e))
+        raise
+    writer.log_calculation(student_id, *arguments, result=result)
+    return result
+
+
+def read_audit_log(path: str) -> Iterator[AuditEntry]:
+    """
+    Lee las entradas completas de un log de auditoría.
+
+    Args:
+        path: Ruta del log JSONL
+
+    Yields:
+        Entradas en orden de escritura
+
+    Raises:
+        ValueError: Si una línea completa no es una entrada válida
+    """
+    for entry in _read_entries(path):
+        if entry is None:
+            raise ValueError(f"Línea corrupta en el log de auditoría: {path}")
+        yield entry
+
+
+def verify_audit_log(path: str) -> AuditVerification:
+    """
+    Recalcula cada entrada del log y la compara con lo registrado.
+
+    Args:
+        path: Ruta del log JSONL
+
+    Returns:
+        Totales, entradas coincidentes, diferencias (seq, detalle) y líneas
+        corruptas
+    """
+    total = 0
+    matched = 0
+    corrupt = 0
+    mismatches: List[Tuple[int, str]] = []
+    for entry in _read_entries(path):
+        if entry is None:
+            corrupt += 1
+            continue
+        total += 1
+        result, error = _recalculate(entry)
+        if result == entry.result and error == entry.error:
+            matched += 1
+        else:
+            mismatches.append(
+                (
+                    entry.seq,
+                    f"{entry.student_id}: registrado {entry.result or entry.error}, "
+                    f"recalculado {result or error}",
+                )
+            )
+    return AuditVerification(total, matched, mismatches, corrupt)
+
+
+def _encode_entry(entry: _Entry) -> bytes:
+    """Serializa una entrada como una línea JSON compacta."""
+    return (
+        json.dumps(dict(zip(AuditEntry._fields, entry)), separators=(",", ":"))
+        + "\n"
+    ).encode("utf-8")
+
+
+def _read_entries(path: str) -> Iterator[Optional[AuditEntry]]:
+    """Itera las líneas completas del log (None si una línea es inválida)."""
+    with open(path, "rb") as log_file:
+        for line in log_file:
+            if not line.endswith(b"\n"):
+                # Escritura interrumpida: la entrada nunca se confirmó
+                return
+            try:
+                data = json.loads(line)
+                yield AuditEntry(*(data[field] for field in AuditEntry._fields))
+            except (ValueError, KeyError, TypeError):
+                yield None
+
+
+def _recalculate(
+    entry: AuditEntry,
+) -> Tuple[Optional[Dict[str, float]], Optional[str]]:
+    """Recalcula una entrada con GradeCalculator."""
+    try:
+        evaluations = [
+            Evaluation(grade, weight)
+            for grade, weight in zip(entry.grades, entry.weights)
+        ]
+        result = GradeCalculator.calculate_final_grade(
+            evaluations,
+            entry.has_reached_minimum,
+            entry.tardiness_percentage,
+            entry.all_years_teachers,
+            entry.extra_points,
+        )
+        return result, None
+    except GradeCalculatorError as e:
+        return None, str(e)
@@ -0,0 +1,219 @@
+"""Modo RPC por JSON Lines sobre stdin/stdout.
+
+Permite que otras herramientas usen el calculador como un subproceso de larga
+vida: cada línea de entrada es una solicitud JSON y cada línea de salida, su
+respuesta, en el mismo orden. Una línea puede ser:
+
+- Una solicitud: ``{"id": 1, "method": "calculate", "params": {...}}``.
+- Un lote: un arreglo JSON de solicitudes; la respuesta es un arreglo con
+  una respuesta por solicitud, en el mismo orden.
+
+Métodos:
+
+- ``calculate`` (por defecto si falta ``method``): ``params`` usa los mismos
+  campos que el log de auditoría: ``grades`` y ``weights`` (listas de igual
+  longitud), ``has_reached_minimum`` y, opcionales, ``tardiness_percentage``
+  (0), ``all_years_teachers`` ([]), ``extra_points`` (0) y ``student_id``,
+  que se repite en la respuesta.
+- ``ping``: responde ``"pong"``; sirve para comprobar que el proceso está vivo.
+
+Respuestas: ``{"id": 1, "result": {"final_grade": ..., ...}}`` o
+``{"id": 1, "error": {"type": "InvalidWeightError", "message": "..."}}``.
+``type`` es el nombre de la excepción de la jerarquía GradeCalculatorError
+(InvalidRpcRequestError si la solicitud está mal formada), por lo que el
+cliente puede distinguir errores de datos de errores de protocolo sin
+analizar el mensaje. Los números deben ser finitos: ``NaN``, ``Infinity`` y
+valores fuera del rango de float (``1e400`` o enteros enormes) se rechazan,
+igual que un JSON anidado más allá del límite de recursión. ``id`` y
+``student_id`` deben ser un string, un número o null.
+
+Las solicitudes pueden enviarse sin esperar respuesta (pipelining): el
+servidor procesa todas las líneas completas que ya llegaron y vacía la
+salida una sola vez antes de volver a esperar entrada.
+"""
+
+import json
+import math
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from src.calculator.grade_calculator import GradeCalculator
+from src.exceptions import GradeCalculatorError, InvalidRpcRequestError
+from src.models.evaluation import Evaluation
+
+METHOD_CALCULATE = "calculate"
+METHOD_PING = "ping"
+_READ_SIZE = 65536
+
+
+def serve(input_stream: BinaryIO, output_stream: BinaryIO) -> int:
+    """
+    Atiende solicitudes hasta el fin de la entrada.
+
+    Args:
+        input_stream: Entrada binaria (por ejemplo ``sys.stdin.buffer``)
+        output_stream: Salida binaria (por ejemplo ``sys.stdout.buffer``)
+
+    Returns:
+        Cantidad de líneas atendidas
+    """
+    handled = 0
+    pending = b""
+    read = getattr(input_stream, "read1", input_stream.read)
+    while True:
+        chunk = read(_READ_SIZE)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        responses = [handle_line(line) for line in lines if line.strip()]
+        if responses:
+            output_stream.write(b"".join(responses))
+            output_stream.flush()
+            handled += len(responses)
+    if pending.strip():
+        output_stream.write(handle_line(pending))
+        output_stream.flush()
+        handled += 1
+    return handled
+
+
+def handle_line(line: bytes) -> bytes:
+    """
+    Atiende una línea de entrada (solicitud o lote).
+
+    Args:
+        line: Línea JSON, sin importar el salto de línea final
+
+    Returns:
+        Línea JSON de respuesta, terminada en salto de línea
+    """
+    try:
+        message = json.loads(line, parse_constant=_reject_constant)
+    except RecursionError:
+        response: Any = _error_response(
+            None, InvalidRpcRequestError("JSON inválido: anidamiento demasiado profundo")
+        )
+    except ValueError as e:
+        response = _error_response(None, InvalidRpcRequestError(f"JSON inválido: {e}"))
+    else:
+        if isinstance(message, list):
+            if not message:
+                response = _error_response(None, InvalidRpcRequestError("Lote vacío"))
+            else:
+                response = [handle_request(request) for request in message]
+        else:
+            response = handle_request(message)
+    try:
+        return _encode(response)
+    except ValueError as e:
+        # No debería ocurrir: las entradas repetidas en la respuesta se validan
+        return _encode(
+            _error_response(None, InvalidRpcRequestError(f"Respuesta inválida: {e}"))
+        )
+
+
+def handle_request(request: Any) -> Dict[str, Any]:
+    """
+    Atiende una solicitud ya decodificada.
+
+    Args:
+        request: Objeto JSON de la solicitud
+
+    Returns:
+        Respuesta con ``result`` o con ``error``
+    """
+    request_id = request.get("id") if isinstance(request, dict) else None
+    if not _is_echoable(request_id):
+        return _error_response(
+            None, InvalidRpcRequestError("id debe ser un string, un número o null")
+        )
+    try:
+        if not isinstance(request, dict):
+            raise InvalidRpcRequestError("La solicitud debe ser un objeto JSON")
+        method = request.get("method", METHOD_CALCULATE)
+        if method == METHOD_PING:
+            return {"id": request_id, "result": "pong"}
+        if method != METHOD_CALCULATE:
+            raise InvalidRpcRequestError(f"Método desconocido: {method}")
+        params = request.get("params")
+        if not isinstance(params, dict):
+            raise InvalidRpcRequestError("params debe ser un objeto JSON")
+        if not _is_echoable(params.get("student_id")):
+            raise InvalidRpcRequestError("student_id debe ser un string, un número o null")
+        response: Dict[str, Any] = {"id": request_id, "result": _calculate(params)}
+        if "student_id" in params:
+            response["student_id"] = params["student_id"]
+        return response
+    except GradeCalculatorError as e:
+        return _error_response(request_id, e)
+
+
+def _calculate(params: Dict[str, Any]) -> Dict[str, float]:
+    """Valida los parámetros y calcula la nota final."""
+    grades = _number_list(params, "grades")
+    weights = _number_list(params, "weights")
+    if len(grades) != len(weights):
+        raise InvalidRpcRequestError("grades y weights deben tener la misma longitud")
+    has_reached_minimum = params.get("has_reached_minimum")
+    if not isinstance(has_reached_minimum, bool):
+        raise InvalidRpcRequestError("has_reached_minimum debe ser true o false")
+    teachers = params.get("all_years_teachers", [])
+    if not isinstance(teachers, list) or not all(isinstance(v, bool) for v in teachers):
+        raise InvalidRpcRequestError("all_years_teachers debe ser una lista de booleanos")
+
+    result = GradeCalculator.calculate_final_grade(
+        [Evaluation(grade, weight) for grade, weight in zip(grades, weights)],
+        has_reached_minimum,
+        _number(params, "tardiness_percentage", 0.0),
+        teachers,
+        _number(params, "extra_points", 0.0),
+    )
+    return dict(result)
+
+
+def _number(params: Dict[str, Any], name: str, default: Optional[float] = None) -> float:
+    """Lee un parámetro numérico finito (los booleanos no cuentan como números)."""
+    value = params.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise InvalidRpcRequestError(f"{name} debe ser un número")
+    try:
+        number = float(value)
+    except OverflowError:
+        number = math.inf
+    if not math.isfinite(number):
+        raise InvalidRpcRequestError(f"{name} debe ser un número finito")
+    return number
+
+
+def _number_list(params: Dict[str, Any], name: str) -> List[float]:
+    """Lee un parámetro que debe ser una lista de números."""
+    values = params.get(name)
+    if not isinstance(values, list):
+        raise InvalidRpcRequestError(f"{name} debe ser una lista de números")
+    return [_number({name: value}, name) for value in values]
+
+
+def _is_echoable(value: Any) -> bool:
+    """Indica si un valor puede repetirse en la respuesta (id, student_id)."""
+    if value is None or isinstance(value, (str, int)):
+        return True
+    return isinstance(value, float) and math.isfinite(value)
+
+
+def _reject_constant(name: str) -> Any:
+    """Rechaza NaN, Infinity y -Infinity al decodificar (json.loads)."""
+    raise ValueError(f"constante no permitida: {name}")
+
+
+def _encode(response: Any) -> bytes:
+    """Serializa una respuesta como línea JSON estricta (sin NaN ni Infinity)."""
+    encoded = json.dumps(response, separators=(",", ":"), allow_nan=False)
+    return encoded.encode("utf-8") + b"\n"
+
+
+def _error_response(request_id: Any, error: GradeCalculatorError) -> Dict[str, Any]:
+    """Respuesta de error con el tipo de excepción y su mensaje."""
+    return {
+        "id": request_id,
+        "error": {"type": type(error).__name__, "message": str(error)},
+    }
@@ -0,0 +1,39 @@
+"""Configuración compartida de los tests."""
+
+import json
+
+import pytest
+
+from src import cli
+from src.batch.dispatcher import (
+    CALIBRATION_VERSION,
+    DEFAULT_CALIBRATION_SIZES,
+    ENGINES,
+    machine_fingerprint,
+)
+
+
+@pytest.fixture(scope="session")
+def calibration_cache(tmp_path_factory) -> str:
+    """Calibración fija en la que el motor scalar es el más rápido."""
+    seconds_per_row = {engine: [1e-5] * len(DEFAULT_CALIBRATION_SIZES) for engine in ENGINES}
+    seconds_per_row["profile_key"] = [1e-5] * len(DEFAULT_CALIBRATION_SIZES)
+    path = tmp_path_factory.mktemp("calibration") / "dispatch.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": CALIBRATION_VERSION,
+                "machine": machine_fingerprint(),
+                "sizes": list(DEFAULT_CALIBRATION_SIZES),
+                "seconds_per_row": seconds_per_row,
+            }
+        ),
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_calibration(monkeypatch, calibration_cache: str) -> None:
+    """Evita que ``batch --engine auto`` calibre o escriba en ~/.cache."""
+    monkeypatch.setattr(cli, "DEFAULT_CALIBRATION_PATH", calibration_cache)
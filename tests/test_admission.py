@@ -0,0 +1,129 @@
+"""Tests unitarios para el control de admisión."""
+
+import threading
+import time
+
+import pytest
+
+from src.calculator.grade_calculator import GradeCalculator
+from src.exceptions import (
+    AdmissionRejectedError,
+    DeadlineExceededError,
+    InvalidWeightError,
+)
+from src.models.evaluation import Evaluation
+from src.service.admission import LANE_BULK, LANE_INTERACTIVE, AdmissionController
+
+
+def _blocker(controller: AdmissionController) -> threading.Event:
+    """Ocupa el único hilo de trabajo hasta que se active el evento."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def block() -> None:
+        started.set()
+        release.wait(5)
+
+    controller.submit(block, lane=LANE_BULK)
+    started.wait(5)
+    return release
+
+
+class TestAdmissionController:
+    """Tests para la clase AdmissionController."""
+
+    def test_shouldCalculateFinalGrade(self) -> None:
+        """Debe producir el mismo resultado que GradeCalculator."""
+        arguments = ([Evaluation(14.0, 40.0), Evaluation(16.0, 60.0)], True, 0.0, [], 0)
+        with AdmissionController(max_concurrency=2) as controller:
+            result = controller.calculate(*arguments)
+            metrics = controller.metrics()
+        assert result == GradeCalculator.calculate_final_grade(*arguments)
+        assert metrics.admitted == 1 and metrics.completed == 1
+
+    def test_shouldPropagateValidationErrors(self) -> None:
+        """Debe entregar los errores de validación a quien llamó."""
+        with AdmissionController(max_concurrency=1) as controller:
+            with pytest.raises(InvalidWeightError):
+                controller.calculate([Evaluation(14.0, 40.0)], True, 0.0, [], 0)
+
+    def test_shouldRejectWhenLaneQueueIsFull(self) -> None:
+        """Debe rechazar solicitudes cuando la cola del carril está llena."""
+        with AdmissionController(max_concurrency=1, max_queue_depth=1) as controller:
+            release = _blocker(controller)
+            queued = controller.submit(len, "abc", lane=LANE_BULK)
+            with pytest.raises(AdmissionRejectedError):
+                controller.submit(len, "abc", lane=LANE_BULK)
+            metrics = controller.metrics()
+            release.set()
+            assert queued.result(5) == 3
+        assert metrics.queue_depth == {LANE_INTERACTIVE: 0, LANE_BULK: 1}
+        assert metrics.in_flight == 1
+        assert metrics.rejected_queue_full == 1
+
+    def test_shouldServeInteractiveLaneBeforeBulk(self) -> None:
+        """Debe atender primero las solicitudes interactivas."""
+        order = []
+        with AdmissionController(max_concurrency=1) as controller:
+            release = _blocker(controller)
+            bulk = controller.submit(order.append, "bulk", lane=LANE_BULK)
+            interactive = controller.submit(
+                order.append, "interactive", deadline_ms=5000
+            )
+            release.set()
+            bulk.result(5)
+            interactive.result(5)
+        assert order == ["interactive", "bulk"]
+
+    def test_shouldScheduleEarliestDeadlineFirstWithinLane(self) -> None:
+        """Debe atender primero la solicitud de plazo más próximo."""
+        order = []
+        with AdmissionController(max_concurrency=1) as controller:
+            release = _blocker(controller)
+            late = controller.submit(order.append, "late", deadline_ms=5000)
+            early = controller.submit(order.append, "early", deadline_ms=4000)
+            release.set()
+            late.result(5)
+            early.result(5)
+        assert order == ["early", "late"]
+
+    def test_shouldDropRequestsThatMissedTheirDeadlineInQueue(self) -> None:
+        """Debe descartar solicitudes cuyo plazo venció mientras esperaban."""
+        with AdmissionController(max_concurrency=1) as controller:
+            release = _blocker(controller)
+            expired = controller.submit(len, "abc", deadline_ms=20)
+            time.sleep(0.05)
+            release.set()
+            with pytest.raises(DeadlineExceededError):
+                expired.result(5)
+            assert controller.metrics().expired == 1
+
+    def test_shouldSkipCancelledRequestsWhoseDeadlinePassed(self) -> None:
+        """Una solicitud cancelada y vencida no debe detener al hilo de trabajo."""
+        with AdmissionController(max_concurrency=1) as controller:
+            release = _blocker(controller)
+            cancelled = controller.submit(len, "abc", deadline_ms=20)
+            assert cancelled.cancel()
+            time.sleep(0.05)
+            release.set()
+            assert controller.submit(len, "abcd").result(1) == 4
+            assert controller.metrics().expired == 0
+
+    def test_shouldRejectRequestsThatCannotMeetDeadline(self) -> None:
+        """Debe rechazar al admitir si el tiempo de servicio excede el plazo."""
+        with AdmissionController(max_concurrency=1) as controller:
+            controller.submit(time.sleep, 0.05).result(5)
+            with pytest.raises(AdmissionRejectedError):
+                controller.submit(len, "abc", deadline_ms=10)
+            metrics = controller.metrics()
+        assert metrics.rejected_deadline == 1
+        assert metrics.service_time_ms >= 40
+
+    def test_shouldRejectUnknownLaneAndSubmissionsAfterShutdown(self) -> None:
+        """Debe rechazar carriles desconocidos y solicitudes tras cerrar."""
+        controller = AdmissionController(max_concurrency=1)
+        with pytest.raises(ValueError):
+            controller.submit(len, "abc", lane="batch")
+        controller.shutdown()
+        with pytest.raises(AdmissionRejectedError):
+            controller.submit(len, "abc")
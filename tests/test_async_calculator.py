@@ -0,0 +1,124 @@
+"""Tests unitarios para la fachada asíncrona de GradeCalculator."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.batch.batch_grader import BatchGrader
+from src.batch.synthetic import generate_records
+from src.calculator.async_calculator import AsyncGradeCalculator
+from src.calculator.grade_calculator import GradeCalculator
+from src.exceptions import InvalidWeightError
+from src.models.evaluation import Evaluation
+
+
+def _arguments(grade: float) -> tuple:
+    """Argumentos de una llamada con una sola evaluación."""
+    return ([Evaluation(grade, 100.0)], True, 0.0, [], 0.0)
+
+
+class TestAsyncGradeCalculator:
+    """Tests para la clase AsyncGradeCalculator."""
+
+    def test_shouldMatchSynchronousResult(self) -> None:
+        """Debe producir el mismo resultado que GradeCalculator."""
+        arguments = (
+            [Evaluation(14.0, 40.0), Evaluation(16.0, 60.0)],
+            False,
+            45.0,
+            [True, True],
+            1.5,
+        )
+        result = asyncio.run(AsyncGradeCalculator().acalculate(*arguments))
+        assert result == GradeCalculator.calculate_final_grade(*arguments)
+
+    def test_shouldCoalesceConcurrentCallersIntoOneBatch(self) -> None:
+        """Debe resolver llamadas simultáneas en un solo lote y en orden."""
+        calculator = AsyncGradeCalculator()
+
+        async def scenario() -> list:
+            return await asyncio.gather(
+                *(calculator.acalculate(*_arguments(float(g))) for g in range(20))
+            )
+
+        results = asyncio.run(scenario())
+        assert [result["final_grade"] for result in results] == list(range(20))
+        assert calculator.flushed_batches == 1
+
+    def test_shouldWaitUpToMaxWaitForMoreCallers(self) -> None:
+        """Debe agrupar llamadas que llegan dentro de max_wait."""
+        calculator = AsyncGradeCalculator(max_wait=0.05)
+
+        async def late_caller() -> dict:
+            await asyncio.sleep(0.01)
+            return await calculator.acalculate(*_arguments(12.0))
+
+        async def scenario() -> list:
+            return await asyncio.gather(
+                calculator.acalculate(*_arguments(10.0)), late_caller()
+            )
+
+        results = asyncio.run(scenario())
+        assert [result["final_grade"] for result in results] == [10.0, 12.0]
+        assert calculator.flushed_batches == 1
+
+    def test_shouldFlushWhenMaxBatchSizeIsReached(self) -> None:
+        """Debe procesar el lote apenas alcanza max_batch_size."""
+        calculator = AsyncGradeCalculator(max_wait=10.0, max_batch_size=4)
+
+        async def scenario() -> list:
+            return await asyncio.wait_for(
+                asyncio.gather(
+                    *(calculator.acalculate(*_arguments(15.0)) for _ in range(8))
+                ),
+                timeout=5,
+            )
+
+        assert len(asyncio.run(scenario())) == 8
+        assert calculator.flushed_batches == 2
+
+    def test_shouldRaiseErrorOnlyForInvalidCaller(self) -> None:
+        """Debe entregar la excepción solo a la llamada con datos inválidos."""
+        calculator = AsyncGradeCalculator()
+
+        async def scenario() -> list:
+            return await asyncio.gather(
+                calculator.acalculate(*_arguments(15.0)),
+                calculator.acalculate([Evaluation(15.0, 70.0)], True, 0.0, [], 0.0),
+                return_exceptions=True,
+            )
+
+        valid, invalid = asyncio.run(scenario())
+        assert valid["final_grade"] == 15.0
+        assert isinstance(invalid, InvalidWeightError)
+
+    def test_shouldOffloadLargeBatchesToExecutor(self) -> None:
+        """Debe calcular lotes grandes en el executor con el mismo resultado."""
+        records = generate_records(300, seed=2)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            calculator = AsyncGradeCalculator(inline_threshold=10, executor=executor)
+
+            async def scenario() -> tuple:
+                coalesced = await asyncio.gather(
+                    *(calculator.acalculate(*_arguments(11.0)) for _ in range(50))
+                )
+                return coalesced, await calculator.acalculate_batch(records)
+
+            coalesced, rows = asyncio.run(scenario())
+        assert all(result["final_grade"] == 11.0 for result in coalesced)
+        assert rows == list(BatchGrader.grade(records))
+
+    def test_shouldGradeSmallBatchInline(self) -> None:
+        """Debe calcular lotes pequeños sin usar el executor."""
+        records = generate_records(5)
+        calculator = AsyncGradeCalculator(executor=None)
+        rows = asyncio.run(calculator.acalculate_batch(records))
+        assert rows == list(BatchGrader.grade(records))
+
+    def test_shouldRejectInvalidConfiguration(self) -> None:
+        """Debe rechazar max_wait negativo y max_batch_size menor a 1."""
+        with pytest.raises(ValueError):
+            AsyncGradeCalculator(max_wait=-1.0)
+        with pytest.raises(ValueError):
+            AsyncGradeCalculator(max_batch_size=0)
@@ -0,0 +1,169 @@
+"""Tests unitarios para el log de auditoría."""
+
+import json
+import threading
+
+import pytest
+
+from src.exceptions import AuditLogFullError, InvalidWeightError
+from src.models.evaluation import Evaluation
+from src.service.audit_log import (
+    BACKPRESSURE_BLOCK,
+    BACKPRESSURE_DROP,
+    BACKPRESSURE_RAISE,
+    AuditLogWriter,
+    calculate_audited,
+    read_audit_log,
+    verify_audit_log,
+)
+
+
+def _arguments(grade: float = 15.0) -> tuple:
+    """Argumentos de un cálculo con una sola evaluación."""
+    return ([Evaluation(grade, 100.0)], False, 50.0, [True, True], 1.0)
+
+
+class TestAuditLogWriter:
+    """Tests para la clase AuditLogWriter."""
+
+    def test_shouldLogInputsAndResultOfEachCalculation(self, tmp_path) -> None:
+        """Debe registrar datos de entrada y resultado de cada cálculo."""
+        path = str(tmp_path / "audit.jsonl")
+        with AuditLogWriter(path) as writer:
+            result = calculate_audited(writer, "A001", *_arguments())
+            with pytest.raises(InvalidWeightError):
+                calculate_audited(
+                    writer, "A002", [Evaluation(15.0, 60.0)], True, 0.0, [], 0.0
+                )
+
+        first, second = read_audit_log(path)
+        assert (first.seq, first.student_id, first.grades) == (0, "A001", [15.0])
+        assert first.tardiness_percentage == 50.0
+        assert first.result == result and first.error is None
+        assert second.result is None and "suma de los pesos" in second.error
+
+    def test_shouldMakeEntriesDurableOnFlush(self, tmp_path) -> None:
+        """Debe tener en disco todas las entradas encoladas tras flush()."""
+        path = tmp_path / "audit.jsonl"
+        writer = AuditLogWriter(str(path), commit_interval=10.0)
+        for index in range(100):
+            writer.log_calculation(f"A{index}", *_arguments(), result={})
+        writer.flush(timeout=5)
+        assert writer.written == 100
+        assert len(path.read_bytes().splitlines()) == 100
+        assert writer.commits <= 100
+        writer.close()
+
+    def test_shouldKeepSequenceOrderWithConcurrentProducers(self, tmp_path) -> None:
+        """Debe escribir entradas de varios hilos en orden de secuencia."""
+        path = str(tmp_path / "audit.jsonl")
+        with AuditLogWriter(path) as writer:
+            threads = [
+                threading.Thread(
+                    target=lambda: [
+                        calculate_audited(writer, "A001", *_arguments())
+                        for _ in range(50)
+                    ]
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert [entry.seq for entry in read_audit_log(path)] == list(range(200))
+
+    def test_shouldApplyBackpressurePolicyWhenQueueIsFull(self, tmp_path) -> None:
+        """Debe esperar, rechazar o descartar según la política elegida."""
+        for policy in (BACKPRESSURE_BLOCK, BACKPRESSURE_RAISE, BACKPRESSURE_DROP):
+            writer = AuditLogWriter(
+                str(tmp_path / f"{policy}.jsonl"),
+                max_queue=1,
+                backpressure=policy,
+                block_timeout=0.01,
+            )
+            # Ocupa el único lugar de la cola sin que el hilo lo libere
+            writer._capacity.acquire()
+            if policy == BACKPRESSURE_DROP:
+                assert not writer.log_calculation("A001", *_arguments(), result={})
+                assert writer.dropped == 1
+            else:
+                with pytest.raises(AuditLogFullError):
+                    writer.log_calculation("A001", *_arguments(), result={})
+            writer.close()
+
+    def test_shouldWriteEveryAcceptedEntryWhenClosingConcurrently(self, tmp_path) -> None:
+        """Toda entrada aceptada mientras se cierra el log debe quedar escrita."""
+        path = str(tmp_path / "audit.jsonl")
+        writer = AuditLogWriter(path, commit_interval=0.001)
+        accepted = []
+
+        def produce(prefix: str) -> None:
+            for index in range(10000):
+                try:
+                    writer.log_calculation(f"{prefix}{index}", *_arguments(), result={})
+                except ValueError:
+                    return
+                accepted.append(f"{prefix}{index}")
+
+        producers = [
+            threading.Thread(target=produce, args=(prefix,)) for prefix in "AB"
+        ]
+        for producer in producers:
+            producer.start()
+        writer.close()
+        for producer in producers:
+            producer.join()
+
+        written = {entry.student_id for entry in read_audit_log(path)}
+        assert written == set(accepted)
+        with pytest.raises(ValueError):
+            writer.log_calculation("C001", *_arguments(), result={})
+
+    def test_shouldReportWriterFailuresOtherThanOSError(self, tmp_path) -> None:
+        """Una entrada que no se puede serializar no debe colgar flush()."""
+        writer = AuditLogWriter(str(tmp_path / "audit.jsonl"))
+        writer.log_calculation("A001", *_arguments(), result={"final_grade": object()})
+        with pytest.raises(TypeError):
+            writer.flush(timeout=5)
+        with pytest.raises(TypeError):
+            writer.close()
+
+    def test_shouldRejectUnknownBackpressurePolicy(self, tmp_path) -> None:
+        """Debe rechazar políticas de contrapresión desconocidas."""
+        with pytest.raises(ValueError):
+            AuditLogWriter(str(tmp_path / "audit.jsonl"), backpressure="wait")
+
+
+class TestVerifyAuditLog:
+    """Tests para verify_audit_log."""
+
+    def test_shouldMatchRecalculatedEntries(self, tmp_path) -> None:
+        """Debe confirmar que cada entrada coincide con GradeCalculator."""
+        path = str(tmp_path / "audit.jsonl")
+        with AuditLogWriter(path) as writer:
+            for grade in (5.0, 12.5, 20.0):
+                calculate_audited(writer, "A001", *_arguments(grade))
+        verification = verify_audit_log(path)
+        assert verification.total_entries == verification.matched == 3
+        assert verification.mismatches == [] and verification.corrupt_lines == 0
+
+    def test_shouldReportTamperedAndCorruptEntries(self, tmp_path) -> None:
+        """Debe reportar entradas alteradas y líneas corruptas."""
+        path = tmp_path / "audit.jsonl"
+        with AuditLogWriter(str(path)) as writer:
+            calculate_audited(writer, "A001", *_arguments())
+            calculate_audited(writer, "A002", *_arguments())
+        lines = path.read_text(encoding="utf-8").splitlines()
+        tampered = json.loads(lines[1])
+        tampered["result"]["final_grade"] = 20.0
+        path.write_text(
+            f"{lines[0]}\n{json.dumps(tampered)}\nno es json\n{{\"seq\": 3",
+            encoding="utf-8",
+        )
+
+        verification = verify_audit_log(str(path))
+        assert verification.total_entries == 2
+        assert verification.matched == 1
+        assert [seq for seq, _ in verification.mismatches] == [1]
+        assert verification.corrupt_lines == 1
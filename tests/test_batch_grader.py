@@ -0,0 +1,57 @@
+"""Tests unitarios para el cálculo por lotes."""
+
+from src.batch.batch_grader import BatchGrader, grade_record
+from src.calculator.grade_calculator import GradeCalculator
+from src.models.evaluation import Evaluation
+from src.models.student_record import StudentRecord
+
+
+class TestBatchGrader:
+    """Tests para la clase BatchGrader."""
+
+    def test_shouldMatchGradeCalculatorResult(self) -> None:
+        """Debe producir el mismo resultado que GradeCalculator."""
+        record = StudentRecord(
+            "A001", [14.0, 16.0, 18.0], [25.0, 35.0, 40.0], False, 45.0, [True, True], 1.5
+        )
+        expected = GradeCalculator.calculate_final_grade(
+            [Evaluation(14.0, 25.0), Evaluation(16.0, 35.0), Evaluation(18.0, 40.0)],
+            False,
+            45.0,
+            [True, True],
+            1.5,
+        )
+        assert grade_record(record) == expected
+
+    def test_shouldReportErrorPerRowWithoutStoppingBatch(self) -> None:
+        """Debe reportar el error en la fila inválida y continuar con el resto."""
+        records = [
+            StudentRecord("A001", [15.0], [70.0], True, 0.0, [], 0.0),
+            StudentRecord("A002", [15.0], [100.0], True, 0.0, [], 0.0),
+            StudentRecord("A003", [25.0], [100.0], True, 0.0, [], 0.0),
+        ]
+        rows = list(BatchGrader.grade(records))
+        assert [row.student_id for row in rows] == ["A001", "A002", "A003"]
+        assert rows[0].result is None and rows[0].error
+        assert rows[1].result is not None and rows[1].result["final_grade"] == 15.0
+        assert rows[2].result is None and rows[2].error
+
+
+class TestGradeResults:
+    """Tests para la clase GradeResults."""
+
+    def test_shouldStoreResultsByColumn(self) -> None:
+        """Debe guardar columnas sin redondear y materializar filas al leerlas."""
+        records = [
+            StudentRecord("A001", [13.0, 17.0], [33.0, 67.0], True, 0.0, [], 0.0),
+            StudentRecord("A002", [15.0], [70.0], True, 0.0, [], 0.0),
+        ]
+        results = BatchGrader.grade_columns(records)
+
+        assert len(results) == 2
+        assert list(results) == list(BatchGrader.grade(records))
+        assert results.column("final_grade") == [15.68, None]
+        raw_grade = grade_record(records[0]).raw_final_grade
+        assert results.raw_column("final_grade")[0] == raw_grade
+        assert results[-1].error and results[-1].result is None
+        assert results.student_ids == ["A001", "A002"]
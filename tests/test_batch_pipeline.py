@@ -0,0 +1,316 @@
+"""Tests unitarios para el pipeline de cálculo por lotes."""
+
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.batch.dispatcher import (
+    CALIBRATION_VERSION,
+    ENGINES,
+    AdaptiveDispatcher,
+    machine_fingerprint,
+)
+from src.batch.parallel import grade_batch_processes, grade_batch_threaded
+from src.batch.pipeline import (
+    RESULTS_HEADER,
+    _ParallelEngine,
+    export_results_csv,
+    format_result_line,
+    pack_roster,
+    parse_result_line,
+    read_results,
+    run_batch,
+)
+from src.batch.roster_reader import ROSTER_HEADER
+from src.diagnostics.stage_metrics import STAGE_PARSE, STAGE_WRITE, PipelineTracer
+from src.exceptions import InvalidResultFileError
+
+ROSTER_ROWS = [
+    "A001,s,0,ss,1,15:50;18:50",
+    "A002,s,0,ss,1,15:50;18:50",
+    "A003,n,45,n,0,15:50;18:50",
+    "A004,s,0,,0,15:30;18:40",
+]
+
+
+def _write_roster(tmp_path) -> str:
+    """Escribe un roster de prueba y retorna su ruta."""
+    roster = tmp_path / "roster.csv"
+    roster.write_text(ROSTER_HEADER + "\n" + "\n".join(ROSTER_ROWS) + "\n", encoding="utf-8")
+    return str(roster)
+
+
+class TestBatchPipeline:
+    """Tests para la función run_batch."""
+
+    def test_shouldWriteOneResultLinePerStudent(self, tmp_path) -> None:
+        """Debe escribir la cabecera y una línea por estudiante."""
+        output = tmp_path / "results.csv"
+        summary = run_batch(_write_roster(tmp_path), str(output))
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == RESULTS_HEADER
+        assert lines[1] == "A001,17.5,16.5,0.0,1.0,"
+        assert lines[3] == "A003,14.85,16.5,1.65,0.0,"
+        assert lines[4].startswith("A004,,,,,")
+        assert summary.total_rows == 4
+        assert summary.error_rows == 1
+        assert summary.dedup is None
+
+    def test_shouldProduceSameOutputWithDeduplication(self, tmp_path) -> None:
+        """Debe producir la misma salida con y sin deduplicación."""
+        roster = _write_roster(tmp_path)
+        plain = tmp_path / "plain.csv"
+        dedup = tmp_path / "dedup.csv"
+        run_batch(roster, str(plain))
+        summary = run_batch(roster, str(dedup), deduplicate=True)
+
+        assert plain.read_text(encoding="utf-8") == dedup.read_text(encoding="utf-8")
+        assert summary.dedup.unique_profiles == 3
+
+    def test_shouldGradeBinaryRosterLikeCsv(self, tmp_path) -> None:
+        """Debe producir la misma salida desde el roster binario empaquetado."""
+        roster = _write_roster(tmp_path)
+        packed = tmp_path / "roster.grr"
+        from_csv = tmp_path / "from_csv.csv"
+        from_binary = tmp_path / "from_binary.csv"
+
+        assert pack_roster(roster, str(packed)) == 4
+        run_batch(roster, str(from_csv))
+        run_batch(str(packed), str(from_binary))
+
+        assert from_csv.read_text(encoding="utf-8") == from_binary.read_text(
+            encoding="utf-8"
+        )
+
+    def test_shouldExportBinaryResultsAsIdenticalCsv(self, tmp_path) -> None:
+        """El CSV exportado desde el binario debe ser idéntico al CSV directo."""
+        roster = _write_roster(tmp_path)
+        direct = tmp_path / "direct.csv"
+        binary = tmp_path / "results.grs"
+        exported = tmp_path / "exported.csv"
+
+        run_batch(roster, str(direct))
+        summary = run_batch(roster, str(binary), output_format="binary")
+        assert export_results_csv(str(binary), str(exported)) == 4
+
+        assert summary.error_rows == 1
+        assert direct.read_text(encoding="utf-8") == exported.read_text(encoding="utf-8")
+
+    def test_shouldRankResultsWithinMemoryLimit(self, tmp_path) -> None:
+        """Debe ordenar la salida volcando corridas a disco si no cabe en memoria."""
+        output = tmp_path / "ranking.csv"
+        summary = run_batch(
+            _write_roster(tmp_path),
+            str(output),
+            deduplicate=True,
+            order_by="final_grade",
+            memory_limit=1000,
+        )
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert [line.split(",")[0] for line in lines[1:]] == ["A001", "A002", "A003", "A004"]
+        assert summary.sort.runs == 4
+        assert summary.dedup.evicted_profiles == 2
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["ranking.csv", "roster.csv"]
+
+    def test_shouldStreamCsvRosterWithinMemoryLimit(self, tmp_path) -> None:
+        """Con memory_limit, el roster CSV no debe cargarse completo."""
+        roster = tmp_path / "roster.csv"
+        roster.write_text(
+            "".join(f"S{index:04d},s,0,s,0,{index % 21}:100\n" for index in range(3000)),
+            encoding="utf-8",
+        )
+        expected = tmp_path / "expected.csv"
+        run_batch(str(roster), str(expected))
+
+        output = tmp_path / "streamed.csv"
+        with patch("src.batch.pipeline.open_roster", side_effect=AssertionError):
+            summary = run_batch(str(roster), str(output), memory_limit=100_000)
+
+        assert summary.total_rows == 3000
+        assert output.read_bytes() == expected.read_bytes()
+
+    def test_shouldOrderByStudentIdLikeUnorderedRun(self, tmp_path) -> None:
+        """Ordenar por student_id debe producir las mismas filas ordenadas."""
+        roster = tmp_path / "roster.csv"
+        roster.write_text(
+            ROSTER_HEADER + "\n" + "\n".join(reversed(ROSTER_ROWS)) + "\n", encoding="utf-8"
+        )
+        plain = tmp_path / "plain.csv"
+        ordered = tmp_path / "ordered.grs"
+        run_batch(str(roster), str(plain))
+        run_batch(str(roster), str(ordered), output_format="binary", order_by="student_id")
+
+        expected = sorted(plain.read_text(encoding="utf-8").splitlines()[1:])
+        assert [
+            format_result_line(row) for row in read_results(str(ordered))
+        ] == expected
+
+    def test_shouldRejectOrderingWithCheckpoints(self, tmp_path) -> None:
+        """No debe combinar checkpoints con salida ordenada."""
+        with pytest.raises(ValueError):
+            run_batch(
+                _write_roster(tmp_path),
+                str(tmp_path / "out.csv"),
+                checkpoint_interval=2,
+                order_by="student_id",
+            )
+
+    def test_shouldReadCsvAndBinaryResultsAlike(self, tmp_path) -> None:
+        """read_results debe reconstruir las mismas filas desde CSV y binario."""
+        roster = _write_roster(tmp_path)
+        csv_path = tmp_path / "results.csv"
+        binary = tmp_path / "results.grs"
+        run_batch(roster, str(csv_path))
+        run_batch(roster, str(binary), output_format="binary")
+
+        from_csv = list(read_results(str(csv_path)))
+        from_binary = list(read_results(str(binary)))
+
+        assert [row.student_id for row in from_csv] == ["A001", "A002", "A003", "A004"]
+        assert from_csv[2].result["penalty_applied"] == 1.65
+        assert from_csv[3].result is None
+        assert [row.result for row in from_csv] == [row.result for row in from_binary]
+
+    def test_shouldRejectMalformedResultLine(self) -> None:
+        """Debe lanzar InvalidResultFileError si la fila está incompleta."""
+        with pytest.raises(InvalidResultFileError):
+            parse_result_line("A001,15.0")
+
+    def test_shouldWriteIdenticalOutputFromWriterThread(self, tmp_path) -> None:
+        """La escritura en un hilo debe producir la misma salida y estadísticas."""
+        roster = _write_roster(tmp_path)
+        direct = tmp_path / "direct.csv"
+        threaded = tmp_path / "threaded.csv"
+        tracer = PipelineTracer()
+
+        expected = run_batch(roster, str(direct))
+        summary = run_batch(
+            roster, str(threaded), tracer=tracer, write_queue_size=2, write_chunk_size=1
+        )
+
+        assert direct.read_text(encoding="utf-8") == threaded.read_text(encoding="utf-8")
+        assert summary.statistics.to_dict() == expected.statistics.to_dict()
+        assert [stage.rows for stage in tracer.report().stages] == [4, 4, 4]
+        assert tracer.report().queues[0].puts == 4
+
+    def test_shouldTraceStagesWithCheckpoints(self, tmp_path) -> None:
+        """Debe medir las etapas también al escribir con checkpoints."""
+        tracer = PipelineTracer()
+        run_batch(
+            _write_roster(tmp_path),
+            str(tmp_path / "results.csv"),
+            checkpoint_interval=2,
+            tracer=tracer,
+        )
+
+        assert tracer.timers[STAGE_WRITE].rows == 4
+        assert tracer.timers[STAGE_PARSE].wall_seconds > 0
+
+    def test_shouldPropagateWriterThreadErrors(self, tmp_path) -> None:
+        """Un error del hilo de escritura debe llegar al llamador."""
+        roster = _write_roster(tmp_path)
+        with patch(
+            "src.batch.pipeline.write_results_csv", side_effect=OSError("disco lleno")
+        ):
+            with pytest.raises(OSError, match="disco lleno"):
+                run_batch(roster, str(tmp_path / "out.csv"), write_queue_size=1)
+
+    def test_shouldRejectWriterThreadWithCheckpoints(self, tmp_path) -> None:
+        """No debe combinar checkpoints con escritura en un hilo."""
+        with pytest.raises(ValueError):
+            run_batch(
+                _write_roster(tmp_path),
+                str(tmp_path / "out.csv"),
+                checkpoint_interval=2,
+                write_queue_size=2,
+            )
+
+    def test_shouldRouteBatchThroughCalibratedEngine(self, tmp_path) -> None:
+        """Con engine auto debe usar el motor que la calibración estima más rápido."""
+        costs = {engine: [1.0, 1.0] for engine in ENGINES}
+        costs["process"] = [0.5, 0.5]
+        costs["profile_key"] = [0.1, 0.1]
+        cache = tmp_path / "dispatch.json"
+        cache.write_text(
+            json.dumps(
+                {
+                    "version": CALIBRATION_VERSION,
+                    "machine": machine_fingerprint(),
+                    "sizes": [16, 64],
+                    "seconds_per_row": costs,
+                }
+            ),
+            encoding="utf-8",
+        )
+        dispatcher = AdaptiveDispatcher(str(cache), (16, 64))
+        roster = _write_roster(tmp_path)
+        expected = tmp_path / "expected.csv"
+        output = tmp_path / "auto.csv"
+        run_batch(roster, str(expected))
+
+        spy = Mock(wraps=grade_batch_processes)
+        engine = _ParallelEngine(spy, ProcessPoolExecutor)
+        with patch.dict("src.batch.pipeline._PARALLEL_ENGINES", {"process": engine}):
+            summary = run_batch(roster, str(output), engine="auto", dispatcher=dispatcher)
+
+        assert summary.engine == "process"
+        spy.assert_called_once()
+        assert dispatcher.last_decision.rows == 4
+        assert output.read_bytes() == expected.read_bytes()
+
+    def test_shouldShareOnePoolAcrossParallelBlocks(self, tmp_path) -> None:
+        """Un motor paralelo debe crear un solo pool para todos los bloques."""
+        roster = _write_roster(tmp_path)
+        expected = tmp_path / "expected.csv"
+        output = tmp_path / "thread.csv"
+        run_batch(roster, str(expected))
+
+        grade = Mock(wraps=grade_batch_threaded)
+        pool = Mock(wraps=ThreadPoolExecutor)
+        engine = _ParallelEngine(grade, pool)
+        with patch.dict("src.batch.pipeline._PARALLEL_ENGINES", {"thread": engine}), patch(
+            "src.batch.pipeline.PARALLEL_BLOCK_SIZE", 1
+        ):
+            run_batch(roster, str(output), engine="thread")
+
+        pool.assert_called_once()
+        executors = {id(call.kwargs["executor"]) for call in grade.call_args_list}
+        assert grade.call_count == len(ROSTER_ROWS)
+        assert len(executors) == 1
+        assert output.read_bytes() == expected.read_bytes()
+
+    def test_shouldCostStreamedRosterByEstimatedSize(self, tmp_path) -> None:
+        """Con un roster por bloques, el despachador debe recibir el tamaño estimado."""
+        roster = tmp_path / "roster.csv"
+        roster.write_text(
+            "".join(f"S{index:04d},s,0,s,0,{index % 21}:100\n" for index in range(3000)),
+            encoding="utf-8",
+        )
+        dispatcher = Mock()
+        dispatcher.select.return_value.engine = "scalar"
+
+        run_batch(
+            str(roster),
+            str(tmp_path / "out.csv"),
+            memory_limit=100_000,
+            engine="auto",
+            dispatcher=dispatcher,
+        )
+
+        rows, sample = dispatcher.select.call_args.args
+        assert len(sample) < 3000
+        assert 2900 <= rows <= 3100
+
+    def test_shouldRejectDedupWithAnotherEngine(self, tmp_path) -> None:
+        """No debe combinar --dedup con un motor distinto de dedup."""
+        with pytest.raises(ValueError):
+            run_batch(
+                _write_roster(tmp_path),
+                str(tmp_path / "out.csv"),
+                deduplicate=True,
+                engine="thread",
+            )
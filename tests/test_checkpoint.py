@@ -0,0 +1,168 @@
+"""Tests unitarios para checkpoints y reanudación de lotes."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.batch import pipeline
+from src.batch.checkpoint import (
+    CheckpointState,
+    CheckpointWriter,
+    load_checkpoint,
+    write_checkpoint,
+)
+from src.batch.pipeline import run_batch
+from src.exceptions import CheckpointMismatchError
+
+
+def _write_roster(tmp_path, rows: int = 50) -> str:
+    """Escribe un roster con filas variadas y retorna su ruta."""
+    lines = []
+    for index in range(rows):
+        attendance = "s" if index % 3 else "n"
+        evaluations = f"{index % 21}:40;{(index * 7) % 21}:60"
+        if index % 11 == 0:
+            evaluations = "15:30;18:30"
+        lines.append(
+            f"S{index:04d},{attendance},{index % 100},ss,{index % 4},{evaluations}"
+        )
+    roster = tmp_path / "roster.csv"
+    roster.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(roster)
+
+
+class _Crash(Exception):
+    """Falla simulada en medio del lote."""
+
+
+def _crashing_grade_records(after_rows: int):
+    """Retorna un grade_records que falla después de cierta cantidad de filas."""
+    original = pipeline.grade_records
+
+    def grade_records(records, deduplicator=None):
+        for count, row in enumerate(original(records, deduplicator)):
+            if count == after_rows:
+                raise _Crash()
+            yield row
+
+    return grade_records
+
+
+class TestCheckpoint:
+    """Tests para la escritura de checkpoints y la reanudación."""
+
+    def test_shouldWriteAndLoadCheckpointAtomically(self, tmp_path) -> None:
+        """Debe leer el estado escrito sin dejar archivos temporales."""
+        path = tmp_path / "job.ckpt"
+        state = CheckpointState("10:20", 5, 123, {"total_rows": 5})
+        write_checkpoint(str(path), state)
+
+        assert load_checkpoint(str(path)) == state
+        assert not (tmp_path / "job.ckpt.tmp").exists()
+        assert load_checkpoint(str(tmp_path / "missing.ckpt")) is None
+
+    def test_shouldPersistLatestSubmittedState(self, tmp_path) -> None:
+        """El escritor en segundo plano debe persistir el último estado enviado."""
+        output = tmp_path / "out.csv"
+        path = tmp_path / "job.ckpt"
+        with open(output, "wb") as output_file:
+            writer = CheckpointWriter(str(path), output_file.fileno())
+            for row in range(1, 6):
+                writer.submit(CheckpointState("fp", row, row * 10, {}))
+            writer.close()
+        assert load_checkpoint(str(path)).next_row == 5
+
+    def test_shouldRejectUnknownCheckpointVersion(self, tmp_path) -> None:
+        """Debe rechazar checkpoints de otra versión."""
+        path = tmp_path / "job.ckpt"
+        path.write_text(json.dumps({"version": 99}), encoding="utf-8")
+        with pytest.raises(CheckpointMismatchError):
+            load_checkpoint(str(path))
+
+    def test_shouldResumeToIdenticalOutput(self, tmp_path) -> None:
+        """Reanudar después de una falla debe producir la misma salida y estadísticas."""
+        roster = _write_roster(tmp_path)
+        expected_output = tmp_path / "expected.csv"
+        expected = run_batch(roster, str(expected_output))
+
+        output = tmp_path / "results.csv"
+        with patch.object(pipeline, "grade_records", _crashing_grade_records(33)):
+            with pytest.raises(_Crash):
+                run_batch(roster, str(output), checkpoint_interval=10)
+
+        checkpoint = load_checkpoint(str(output) + ".ckpt")
+        assert checkpoint.next_row == 30
+
+        resumed = run_batch(roster, str(output), checkpoint_interval=10, resume=True)
+        assert output.read_bytes() == expected_output.read_bytes()
+        assert resumed.statistics == expected.statistics
+        assert resumed.total_rows == 50
+        assert not (tmp_path / "results.csv.ckpt").exists()
+
+    def test_shouldResumeStreamedRosterWithMemoryLimit(self, tmp_path) -> None:
+        """Reanudar leyendo el roster por bloques debe saltar las filas ya escritas."""
+        roster = _write_roster(tmp_path)
+        expected_output = tmp_path / "expected.csv"
+        run_batch(roster, str(expected_output))
+
+        output = tmp_path / "results.csv"
+        with patch.object(pipeline, "grade_records", _crashing_grade_records(33)):
+            with pytest.raises(_Crash):
+                run_batch(roster, str(output), checkpoint_interval=10, memory_limit=4000)
+        run_batch(
+            roster, str(output), checkpoint_interval=10, resume=True, memory_limit=4000
+        )
+        assert output.read_bytes() == expected_output.read_bytes()
+
+    def test_shouldPersistDedupCountersAcrossResume(self, tmp_path) -> None:
+        """El reporte de deduplicación debe cubrir todo el lote tras reanudar."""
+        roster = _write_roster(tmp_path)
+        output = tmp_path / "results.csv"
+        with patch.object(pipeline, "grade_records", _crashing_grade_records(33)):
+            with pytest.raises(_Crash):
+                run_batch(roster, str(output), deduplicate=True, checkpoint_interval=10)
+
+        assert load_checkpoint(str(output) + ".ckpt").dedup["total_rows"] == 30
+        resumed = run_batch(
+            roster, str(output), deduplicate=True, checkpoint_interval=10, resume=True
+        )
+        assert resumed.dedup.total_rows == 50
+
+    def test_shouldRejectResumeWithOtherPassingGrade(self, tmp_path) -> None:
+        """Reanudar con otra nota aprobatoria no debe mezclar conteos."""
+        roster = _write_roster(tmp_path)
+        output = tmp_path / "results.csv"
+        with patch.object(pipeline, "grade_records", _crashing_grade_records(33)):
+            with pytest.raises(_Crash):
+                run_batch(roster, str(output), checkpoint_interval=10, passing_grade=10.5)
+
+        with pytest.raises(CheckpointMismatchError):
+            run_batch(roster, str(output), resume=True, passing_grade=11.0)
+
+    def test_shouldStartFromScratchWhenResumingWithoutCheckpoint(self, tmp_path) -> None:
+        """--resume sin checkpoint debe procesar el lote completo."""
+        roster = _write_roster(tmp_path, rows=5)
+        output = tmp_path / "results.csv"
+        summary = run_batch(roster, str(output), resume=True)
+        assert summary.total_rows == 5
+
+    def test_shouldRejectCheckpointForModifiedRoster(self, tmp_path) -> None:
+        """Debe rechazar un checkpoint creado para otra versión del roster."""
+        roster = _write_roster(tmp_path, rows=5)
+        output = tmp_path / "results.csv"
+        output.write_text("", encoding="utf-8")
+        write_checkpoint(str(output) + ".ckpt", CheckpointState("0:0", 1, 0, {}))
+        with pytest.raises(CheckpointMismatchError):
+            run_batch(roster, str(output), resume=True)
+
+    def test_shouldRejectCheckpointsWithBinaryOutput(self, tmp_path) -> None:
+        """Los checkpoints solo están disponibles con salida csv."""
+        roster = _write_roster(tmp_path, rows=5)
+        with pytest.raises(ValueError):
+            run_batch(
+                roster,
+                str(tmp_path / "out.grs"),
+                output_format="binary",
+                checkpoint_interval=2,
+            )
@@ -171,3 +171,376 @@ class TestCLIHelpers:
             points = _register_extra_points([True, False])
             assert points == 0.0
 
+
+    def test_shouldRunBatchCommand(self, tmp_path) -> None:
+        """Debe ejecutar el subcomando batch sin interacción."""
+        from src.cli import main
+
+        roster = tmp_path / "roster.csv"
+        roster.write_text("A001,s,0,s,0,20:100\nA002,s,0,s,0,20:100\n", encoding="utf-8")
+        output = tmp_path / "results.csv"
+
+        with patch("builtins.print") as mock_print:
+            main(["batch", str(roster), str(output), "--dedup"])
+
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "Ratio de deduplicación: 2.00x" in printed
+        assert output.read_text(encoding="utf-8").count("A00") == 2
+
+    def test_shouldRunBatchWithCalibratedEngine(self, tmp_path) -> None:
+        """batch --engine auto debe usar el motor elegido por la calibración."""
+        import json
+
+        from src.batch.dispatcher import (
+            CALIBRATION_VERSION,
+            DEFAULT_CALIBRATION_SIZES,
+            machine_fingerprint,
+        )
+        from src.cli import main
+
+        sizes = len(DEFAULT_CALIBRATION_SIZES)
+        costs = {"scalar": 1.0, "dedup": 1.0, "thread": 0.5, "process": 1.0}
+        seconds_per_row = {name: [cost] * sizes for name, cost in costs.items()}
+        seconds_per_row["profile_key"] = [0.1] * sizes
+        cache = tmp_path / "dispatch.json"
+        cache.write_text(
+            json.dumps(
+                {
+                    "version": CALIBRATION_VERSION,
+                    "machine": machine_fingerprint(),
+                    "sizes": list(DEFAULT_CALIBRATION_SIZES),
+                    "seconds_per_row": seconds_per_row,
+                }
+            ),
+            encoding="utf-8",
+        )
+        roster = tmp_path / "roster.csv"
+        roster.write_text("A001,s,0,s,0,20:100\n", encoding="utf-8")
+
+        with patch("builtins.print") as mock_print:
+            main(
+                [
+                    "batch", str(roster), str(tmp_path / "out.csv"),
+                    "--engine", "auto", "--calibration-cache", str(cache),
+                ]
+            )
+
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "Motor de cálculo: thread" in printed
+
+    def test_shouldNotCalibrateBatchByDefault(self, tmp_path) -> None:
+        """Sin --engine, batch debe usar scalar sin calibrar ni escribir la caché."""
+        from src.cli import main
+
+        roster = tmp_path / "roster.csv"
+        roster.write_text("A001,s,0,s,0,20:100\n", encoding="utf-8")
+        cache = tmp_path / "dispatch.json"
+
+        with patch("src.cli.AdaptiveDispatcher.calibrate") as calibrate_mock, patch(
+            "builtins.print"
+        ) as mock_print:
+            main(
+                [
+                    "batch", str(roster), str(tmp_path / "out.csv"),
+                    "--calibration-cache", str(cache),
+                ]
+            )
+
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "Motor de cálculo: scalar" in printed
+        calibrate_mock.assert_not_called()
+        assert not cache.exists()
+
+    def test_shouldProfileBatchCommand(self, tmp_path) -> None:
+        """Debe perfilar el subcomando batch con --profile."""
+        from src.cli import main
+
+        roster = tmp_path / "roster.csv"
+        roster.write_text("A001,s,0,s,0,20:100\n", encoding="utf-8")
+        stats_path = tmp_path / "batch.pstats"
+
+        with patch("builtins.print") as mock_print:
+            main(["batch", str(roster), str(tmp_path / "out.csv"), "--profile", str(stats_path)])
+
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+        assert "Perfil de la ejecución:" in printed
+        assert stats_path.exists()
+        assert (tmp_path / "batch.txt").exists()
+
+    def test_shouldTraceBatchStagesWithWriterThread(self, tmp_path) -> None:
+        """Debe mostrar el tiempo por etapa y la cola hacia el hilo de escritura."""
+        from src.cli import main
+
+        roster = tmp_path / "roster.csv"
+        roster.write_text("A001,s,0,s,0,20:100\n", encoding="utf-8")
+
+        with patch("builtins.print") as mock_print:
+            main(
+                [
+                    "batch",
+                    str(roster),
+                    str(tmp_path / "out.csv"),
+                    "--trace-stages",
+                    "--write-queue",
+                    "2",
+                ]
+            )
+
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+        assert "Tiempo por etapa:" in printed
+        assert "Cola compute->write" in printed
+
+    def test_shouldExitWithErrorWhenBatchInputIsMissing(self, tmp_path) -> None:
+        """Debe terminar con error cuando el roster no existe."""
+        from src.cli import main
+
+        with patch("builtins.print"):
+            with pytest.raises(SystemExit):
+                main(["batch", str(tmp_path / "missing.csv"), str(tmp_path / "out.csv")])
+
+    def test_shouldRunPackRosterCommand(self, tmp_path) -> None:
+        """Debe convertir un roster CSV al formato binario."""
+        from src.batch.roster_columns import is_roster_binary
+        from src.cli import main
+
+        roster = tmp_path / "roster.csv"
+        roster.write_text("A001,s,0,s,0,20:100\n", encoding="utf-8")
+        packed = tmp_path / "roster.grr"
+
+        with patch("builtins.print"):
+            main(["pack-roster", str(roster), str(packed)])
+
+        assert is_roster_binary(str(packed))
+
+    def test_shouldRunBatchWithBinaryFormatAndExportCsv(self, tmp_path) -> None:
+        """Debe escribir resultados binarios y exportarlos a CSV."""
+        from src.cli import main
+
+        roster = tmp_path / "roster.csv"
+        roster.write_text("A001,s,0,s,0,20:100\n", encoding="utf-8")
+        binary = tmp_path / "results.grs"
+        exported = tmp_path / "results.csv"
+
+        with patch("builtins.print"):
+            main(["batch", str(roster), str(binary), "--format", "binary"])
+            main(["export-csv", str(binary), str(exported)])
+
+        assert "A001,20.0,20.0,0.0,0.0," in exported.read_text(encoding="utf-8")
+
+    def test_shouldRunBatchWithCheckpointsAndResume(self, tmp_path) -> None:
+        """Debe aceptar --checkpoint-interval y --resume."""
+        from src.cli import main
+
+        roster = tmp_path / "roster.csv"
+        roster.write_text("A001,s,0,s,0,20:100\nA002,s,0,s,0,9:100\n", encoding="utf-8")
+        output = tmp_path / "results.csv"
+
+        with patch("builtins.print") as mock_print:
+            main(
+                [
+                    "batch", str(roster), str(output),
+                    "--checkpoint-interval", "1", "--passing-grade", "10.5",
+                ]
+            )
+            main(["batch", str(roster), str(output), "--resume", "--passing-grade", "10.5"])
+
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "Aprobados: 1" in printed
+        assert not (tmp_path / "results.csv.ckpt").exists()
+
+    def test_shouldRunWatchCommandOnce(self, tmp_path) -> None:
+        """Debe emitir las notas del log y terminar con --once."""
+        from src.cli import main
+
+        log = tmp_path / "events.log"
+        log.write_text("A001,pc1,14,100\n", encoding="utf-8")
+
+        with patch("builtins.print") as mock_print:
+            main(["watch", str(log), "--once"])
+
+        mock_print.assert_called_with("A001,14.0,14.0,0.0,0.0,", flush=True)
+        assert (tmp_path / "events.log.snapshot").exists()
+
+    def test_shouldRunShardCommand(self, tmp_path) -> None:
+        """Debe ejecutar el lote particionado y combinar la salida."""
+        from src.cli import main
+
+        roster = tmp_path / "roster.csv"
+        roster.write_text("A001,s,0,s,0,20:100\nA002,s,0,s,0,9:100\n", encoding="utf-8")
+        output = tmp_path / "results.csv"
+
+        with patch("builtins.print") as mock_print:
+            main(["shard", str(roster), str(output), "--shards", "2"])
+
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "Filas procesadas: 2" in printed
+        assert output.read_text(encoding="utf-8").count("A00") == 2
+
+    def test_shouldRunCalibrateCommand(self, tmp_path) -> None:
+        """Debe recalibrar y mostrar el costo por fila de cada motor."""
+        from src.cli import main
+
+        calibration = {
+            "sizes": [128],
+            "seconds_per_row": {
+                "scalar": [1e-5],
+                "dedup": [1e-5],
+                "thread": [2e-5],
+                "process": [3e-5],
+                "profile_key": [1e-6],
+            },
+        }
+        cache = tmp_path / "dispatch.json"
+        with patch(
+            "src.cli.AdaptiveDispatcher.calibrate", return_value=calibration
+        ), patch("builtins.print") as mock_print:
+            main(["calibrate", "--cache", str(cache)])
+
+        printed = [str(call.args[0]) for call in mock_print.call_args_list]
+        assert printed[2] == "     128     10.00     11.00     20.00     30.00"
+
+    def test_shouldRunGpaCommand(self, tmp_path) -> None:
+        """Debe calcular los promedios ponderados por créditos."""
+        from src.cli import main
+
+        source = tmp_path / "courses.csv"
+        source.write_text("A001,2024-1,CS101,4,15\nA001,2024-1,MA101,2,12\n", encoding="utf-8")
+        output = tmp_path / "averages.csv"
+
+        with patch("builtins.print") as mock_print:
+            main(["gpa", str(source), str(output)])
+
+        mock_print.assert_called_with("Estudiantes: 1")
+        assert "A001,total,6.0,14.0" in output.read_text(encoding="utf-8")
+
+    def test_shouldRunAuditVerifyCommand(self, tmp_path) -> None:
+        """Debe verificar el log y terminar con error si hay diferencias."""
+        from src.cli import main
+        from src.service.audit_log import AuditLogWriter, calculate_audited
+
+        log = tmp_path / "audit.jsonl"
+        with AuditLogWriter(str(log)) as writer:
+            calculate_audited(writer, "A001", [Evaluation(15.0, 100.0)], True, 0, [], 0)
+
+        with patch("builtins.print") as mock_print:
+            main(["audit-verify", str(log)])
+        mock_print.assert_any_call("Entradas coincidentes: 1")
+
+        log.write_text(log.read_text().replace('"final_grade":15.0', '"final_grade":1'))
+        with patch("builtins.print"), pytest.raises(SystemExit) as exit_info:
+            main(["audit-verify", str(log)])
+        assert exit_info.value.code == 1
+
+    def test_shouldRunDiffCommand(self, tmp_path) -> None:
+        """Debe escribir los cambios y mostrar los conteos."""
+        import sys
+
+        from src.batch.pipeline import RESULTS_HEADER
+        from src.cli import main
+
+        old = tmp_path / "old.csv"
+        old.write_text(f"{RESULTS_HEADER}\nA1,10.0,10.0,0.0,0.0,\n", encoding="utf-8")
+        new = tmp_path / "new.csv"
+        new.write_text(f"{RESULTS_HEADER}\nA1,12.0,12.0,0.0,0.0,\n", encoding="utf-8")
+        output = tmp_path / "cambios.csv"
+
+        with patch("builtins.print") as mock_print:
+            main(["diff", str(old), str(new), "--output", str(output)])
+
+        mock_print.assert_any_call("Cambiadas: 1", file=sys.stdout)
+        assert "A1,changed,10.0,12.0,2.0" in output.read_text(encoding="utf-8")
+
+    def test_shouldRunCohortCommand(self, tmp_path) -> None:
+        """Debe listar la categoría pedida o mostrar los conteos."""
+        from src.batch.pipeline import RESULTS_HEADER
+        from src.cli import main
+
+        results = tmp_path / "results.csv"
+        results.write_text(
+            f"{RESULTS_HEADER}\nA1,10.2,10.2,0.0,0.0,\nA2,15.0,15.0,0.0,0.0,\n",
+            encoding="utf-8",
+        )
+
+        with patch("builtins.print") as mock_print:
+            main(
+                [
+                    "cohort", str(results),
+                    "--query", "near-threshold", "--passing-grade", "10.5",
+                ]
+            )
+        mock_print.assert_called_once_with("A1")
+
+        with patch("builtins.print") as mock_print:
+            main(["cohort", str(results), "--passing-grade", "10.5"])
+        mock_print.assert_any_call("failing: 1")
+
+        with patch("builtins.print"), pytest.raises(SystemExit) as exit_info:
+            main(["cohort", str(results), "--query", "failing"])
+        assert exit_info.value.code == 2
+
+    def test_shouldParseMemoryLimitSizes(self) -> None:
+        """Debe aceptar sufijos K, M y G y rechazar tamaños inválidos."""
+        import argparse
+
+        from src.cli import _parse_size
+
+        assert _parse_size("512M") == 512 * 2**20
+        assert _parse_size("1.5g") == 3 * 2**29
+        assert _parse_size("64KB") == 64 * 2**10
+        assert _parse_size("1000") == 1000
+        with pytest.raises(argparse.ArgumentTypeError):
+            _parse_size("mucho")
+        with pytest.raises(argparse.ArgumentTypeError):
+            _parse_size("0")
+
+    def test_shouldRunRpcCommandOverStdio(self) -> None:
+        """Debe atender solicitudes JSON por stdin y responder por stdout."""
+        import io
+        import json
+
+        from src.cli import main
+
+        stdin = io.TextIOWrapper(io.BytesIO(b'{"id":1,"method":"ping"}\n'))
+        stdout = io.TextIOWrapper(io.BytesIO())
+        with patch("sys.stdin", stdin), patch("sys.stdout", stdout):
+            main(["rpc"])
+            stdout.flush()
+            output = stdout.buffer.getvalue()
+
+        assert json.loads(output) == {"id": 1, "result": "pong"}
+
+    def test_shouldRunReportCommand(self, tmp_path) -> None:
+        """Debe generar un reporte por estudiante desde un archivo de resultados."""
+        from src.batch.pipeline import RESULTS_HEADER
+        from src.cli import main
+
+        results = tmp_path / "results.csv"
+        results.write_text(
+            f"{RESULTS_HEADER}\nA1,17.5,16.5,0.0,1.0,\nA2,,,,,Pesos inválidos\n",
+            encoding="utf-8",
+        )
+        directory = tmp_path / "reportes"
+
+        with patch("builtins.print") as mock_print:
+            main(["report", str(results), str(directory), "--split", "--format", "html"])
+
+        mock_print.assert_any_call("Reportes con error: 1")
+        assert sorted(path.name for path in directory.iterdir()) == ["A1.html", "A2.html"]
+
+    def test_shouldRunCoursesCommand(self, tmp_path) -> None:
+        """Debe cargar la configuración de cursos y reutilizar el snapshot."""
+        from src.cli import main
+
+        source = tmp_path / "courses.csv"
+        source.write_text(
+            "course_id,weights,teacher_votes\nCS101,30;30;40,s;s\n", encoding="utf-8"
+        )
+
+        with patch("builtins.print"):
+            main(["courses", str(source)])
+        with patch("builtins.print") as mock_print:
+            main(["courses", str(source), "--course", "CS101"])
+
+        mock_print.assert_any_call("Snapshot: reutilizado")
+        mock_print.assert_any_call("Pesos (%): 30/30/40")
+        mock_print.assert_any_call("Puntos extra permitidos: sí")
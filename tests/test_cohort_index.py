@@ -0,0 +1,125 @@
+"""Tests unitarios para el índice de consultas de la cohorte."""
+
+import pytest
+
+from src.batch.batch_grader import GradedRow
+from src.batch.cohort_index import CohortIndex
+
+
+def _row(
+    student_id: str, final_grade: float, penalty: float = 0.0, extra_points: float = 0.0
+) -> GradedRow:
+    """Crea una fila calificada."""
+    result = {
+        "final_grade": final_grade,
+        "weighted_average": final_grade,
+        "penalty_applied": penalty,
+        "extra_points_applied": extra_points,
+    }
+    return GradedRow(student_id, result, None)
+
+
+ROWS = [
+    _row("A001", 17.5, extra_points=1.0),
+    _row("A002", 10.0),
+    _row("A003", 9.95, penalty=1.1),
+    _row("A004", 4.0, penalty=0.4),
+    _row("A005", 10.5),
+    GradedRow("A006", None, "Pesos inválidos"),
+]
+
+
+class TestCohortIndex:
+    """Tests para la clase CohortIndex."""
+
+    def test_shouldAnswerThresholdQueriesInGradeOrder(self) -> None:
+        """Debe listar desaprobados y casi aprobados ordenados por nota."""
+        index = CohortIndex.build(ROWS, passing_grade=10.5)
+
+        assert index.failing() == ["A004", "A003", "A002"]
+        assert index.near_threshold() == ["A002"]
+        assert index.near_threshold(margin=0.55) == ["A003", "A002"]
+        assert index.grade_range(10.5) == ["A005", "A001"]
+
+    def test_shouldAnswerFlagQueries(self) -> None:
+        """Debe listar penalizados, con puntos extra y con error."""
+        index = CohortIndex.build(ROWS, passing_grade=10.5)
+
+        assert index.penalized() == ["A003", "A004"]
+        assert index.with_extra_points() == ["A001"]
+        assert index.with_errors() == ["A006"]
+        assert index.select(maximum=10.5, penalized=False) == ["A002"]
+
+    def test_shouldCountWithoutListing(self) -> None:
+        """Debe contar cada categoría."""
+        counts = CohortIndex.build(ROWS, passing_grade=10.5).counts()
+
+        assert counts == {
+            "total": 6,
+            "failing": 3,
+            "near_threshold": 1,
+            "penalized": 2,
+            "extra_points": 1,
+            "errors": 1,
+        }
+
+    def test_shouldRequirePassingGradeForThresholdQueries(self) -> None:
+        """Sin nota aprobatoria no debe inventar desaprobados."""
+        index = CohortIndex.build(ROWS)
+
+        with pytest.raises(ValueError):
+            index.failing()
+        assert "failing" not in index.counts()
+        assert index.penalized() == ["A003", "A004"]
+
+    def test_shouldMaintainIndexesIncrementally(self) -> None:
+        """Actualizar o quitar un estudiante debe reflejarse en todos los índices."""
+        index = CohortIndex.build(ROWS, passing_grade=10.5)
+
+        index.update(_row("A004", 12.0))
+        index.update(_row("A006", 10.2, penalty=1.0))
+        assert index.remove("A002")
+        assert not index.remove("A999")
+        index.update(_row("A007", 3.0))
+
+        assert index.failing() == ["A007", "A003", "A006"]
+        assert index.near_threshold() == ["A006"]
+        assert index.penalized() == ["A003", "A006"]
+        assert index.with_errors() == []
+        assert index.grade_of("A004") == 12.0
+        assert index.grade_of("A002") is None
+        assert len(index) == 6
+
+    def test_shouldMatchFullScanOnRandomUpdates(self) -> None:
+        """Las consultas deben coincidir con un recorrido completo tras muchas actualizaciones."""
+        import random
+
+        generator = random.Random(3)
+        index = CohortIndex(passing_grade=10.5)
+        current = {}
+        for _ in range(2000):
+            student_id = f"S{generator.randrange(300):03d}"
+            if generator.random() < 0.1:
+                index.remove(student_id)
+                current.pop(student_id, None)
+                continue
+            row = _row(
+                student_id,
+                round(generator.uniform(0, 20), 2),
+                penalty=generator.choice([0.0, 1.0]),
+            )
+            index.update(row)
+            current[student_id] = row
+
+        failing = sorted(
+            (row.result["final_grade"], row.student_id)
+            for row in current.values()
+            if row.result["final_grade"] < 10.5
+        )
+        assert sorted(index.failing()) == sorted(student_id for _, student_id in failing)
+        assert [index.grade_of(s) for s in index.failing()] == [g for g, _ in failing]
+        assert sorted(index.penalized()) == sorted(
+            row.student_id for row in current.values() if row.result["penalty_applied"] > 0
+        )
+        assert index.counts()["penalized"] == len(index.penalized())
+        assert index.counts()["total"] == len(current)
@@ -0,0 +1,72 @@
+"""Tests unitarios para la lectura de archivos comprimidos."""
+
+import gzip
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.batch.compressed_input import (
+    COMPRESSION_GZIP,
+    COMPRESSION_ZSTD,
+    decompressed_chunks,
+    detect_compression,
+)
+from src.exceptions import InvalidRosterError
+
+DATA = b"".join(b"A%05d,s,0,,0,15:100\n" % index for index in range(5000))
+
+
+class TestDecompressedChunks:
+    """Tests para decompressed_chunks y detect_compression."""
+
+    def test_shouldDetectCompressionByMagic(self, tmp_path) -> None:
+        """Debe reconocer gzip y zstd por sus primeros bytes."""
+        plain = tmp_path / "roster.csv"
+        plain.write_bytes(DATA)
+        compressed = tmp_path / "roster.csv.gz"
+        compressed.write_bytes(gzip.compress(DATA))
+        zstd = tmp_path / "roster.csv.zst"
+        zstd.write_bytes(b"\x28\xb5\x2f\xfd" + bytes(16))
+
+        assert detect_compression(str(plain)) is None
+        assert detect_compression(str(compressed)) == COMPRESSION_GZIP
+        assert detect_compression(str(zstd)) == COMPRESSION_ZSTD
+
+    def test_shouldDecompressConcatenatedMembersInBoundedChunks(self, tmp_path) -> None:
+        """Debe unir miembros gzip concatenados con bloques de tamaño acotado."""
+        path = tmp_path / "roster.csv.gz"
+        path.write_bytes(gzip.compress(DATA[:40000]) + gzip.compress(DATA[40000:]))
+
+        chunks = list(decompressed_chunks(str(path), chunk_size=4096))
+
+        assert b"".join(chunks) == DATA
+        assert max(len(chunk) for chunk in chunks) <= 4096
+
+    def test_shouldRejectTruncatedGzip(self, tmp_path) -> None:
+        """Un gzip truncado debe lanzar InvalidRosterError."""
+        path = tmp_path / "roster.csv.gz"
+        path.write_bytes(gzip.compress(DATA)[:-20])
+
+        with pytest.raises(InvalidRosterError):
+            list(decompressed_chunks(str(path)))
+
+    def test_shouldStopDecompressingWhenConsumerStops(self, tmp_path) -> None:
+        """El hilo de descompresión debe terminar si el consumidor abandona."""
+        path = tmp_path / "roster.csv.gz"
+        path.write_bytes(gzip.compress(DATA * 20))
+
+        chunks = decompressed_chunks(str(path), chunk_size=1024, max_buffered_chunks=1)
+        next(chunks)
+        chunks.close()
+
+        assert not any(t.name == "roster-decompress" for t in threading.enumerate())
+
+    def test_shouldExplainMissingZstandard(self, tmp_path) -> None:
+        """Sin el paquete zstandard, un archivo zstd debe rechazarse con un mensaje claro."""
+        path = tmp_path / "roster.csv.zst"
+        path.write_bytes(b"\x28\xb5\x2f\xfd" + bytes(16))
+
+        with patch("src.batch.compressed_input.zstandard", None):
+            with pytest.raises(InvalidRosterError, match="zstandard"):
+                list(decompressed_chunks(str(path)))
@@ -0,0 +1,157 @@
+"""Tests unitarios para la configuración de cursos y su snapshot."""
+
+import os
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from src.batch.course_config import (
+    COURSE_CONFIG_HEADER,
+    compile_course_configs,
+    default_snapshot_path,
+    load_course_configs,
+    parse_course_config_line,
+    sources_fingerprint,
+)
+from src.exceptions import InvalidCourseConfigError
+
+
+def _write_sources(tmp_path, lines: List[str], name: str = "courses.csv") -> str:
+    """Escribe un archivo de configuración de cursos con cabecera."""
+    path = tmp_path / name
+    path.write_text(COURSE_CONFIG_HEADER + "\n" + "\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+class TestParseCourseConfigLine:
+    """Tests para la función parse_course_config_line."""
+
+    def test_shouldResolveVotesIntoExtraPointsFlag(self) -> None:
+        """Debe validar los pesos y resolver los votos de los profesores."""
+        config = parse_course_config_line("CS101,30;30;40,s;S;s")
+
+        assert config.weights == (30.0, 30.0, 40.0)
+        assert config.extra_points_allowed is True
+        assert parse_course_config_line("CS102,100,s;n").extra_points_allowed is False
+        assert parse_course_config_line("CS103,100,").extra_points_allowed is False
+
+    def test_shouldRejectInvalidWeights(self) -> None:
+        """Debe rechazar pesos que no suman 100 con el número de línea."""
+        with pytest.raises(InvalidCourseConfigError, match="Línea 4"):
+            parse_course_config_line("CS101,30;30,s", 4)
+
+    def test_shouldRejectInvalidVotes(self) -> None:
+        """Debe rechazar votos distintos de s o n."""
+        with pytest.raises(InvalidCourseConfigError, match="voto inválido"):
+            parse_course_config_line("CS101,100,s;quizás")
+
+
+class TestLoadCourseConfigs:
+    """Tests para compile_course_configs y load_course_configs."""
+
+    def test_shouldCompileSortedCatalog(self, tmp_path) -> None:
+        """Debe combinar las fuentes y ordenar los cursos."""
+        first = _write_sources(tmp_path, ["MA200,50;50,s", "# comentario", "", "CS101,100,n"])
+        second = _write_sources(tmp_path, ["BI150,20;80,s;s"], "more.csv")
+
+        catalog = compile_course_configs([first, second])
+
+        assert list(catalog) == ["BI150", "CS101", "MA200"]
+        assert catalog["MA200"].weights == (50.0, 50.0)
+        assert "XX000" not in catalog
+
+    def test_shouldRejectDuplicatedCourses(self, tmp_path) -> None:
+        """Debe rechazar un curso definido en dos fuentes."""
+        first = _write_sources(tmp_path, ["CS101,100,s"])
+        second = _write_sources(tmp_path, ["CS101,100,n"], "more.csv")
+
+        with pytest.raises(InvalidCourseConfigError, match="repetido"):
+            compile_course_configs([first, second])
+
+    def test_shouldReuseSnapshotWithoutRevalidating(self, tmp_path) -> None:
+        """El segundo inicio debe leer el snapshot sin releer las fuentes."""
+        source = _write_sources(tmp_path, ["CS101,30;30;40,s;s", "MA200,50;50,s;n"])
+
+        with load_course_configs([source]) as first:
+            assert first.from_snapshot is False
+            expected = dict(first.items())
+        assert os.path.exists(default_snapshot_path(source))
+
+        with patch("src.batch.course_config.compile_course_configs") as compile_mock:
+            with load_course_configs([source]) as second:
+                assert second.from_snapshot is True
+                assert dict(second.items()) == expected
+                assert second["MA200"].extra_points_allowed is False
+        compile_mock.assert_not_called()
+
+    def test_shouldInvalidateSnapshotWhenSourceChanges(self, tmp_path) -> None:
+        """Debe regenerar el snapshot si cambia una fuente."""
+        source = _write_sources(tmp_path, ["CS101,100,s"])
+        load_course_configs([source]).close()
+
+        _write_sources(tmp_path, ["CS101,40;60,s", "MA200,100,n"])
+        with load_course_configs([source]) as catalog:
+            assert catalog.from_snapshot is False
+            assert catalog["CS101"].weights == (40.0, 60.0)
+            assert len(catalog) == 2
+
+    def test_shouldInvalidateSnapshotWhenConstantsChange(self, tmp_path) -> None:
+        """La huella debe depender de src/constants.py."""
+        source = _write_sources(tmp_path, ["CS101,100,s"])
+        constants_copy = tmp_path / "constants.py"
+        constants_copy.write_text("MAX_GRADE = 20.0\n", encoding="utf-8")
+
+        with patch("src.batch.course_config.constants.__file__", str(constants_copy)):
+            before = sources_fingerprint([source])
+            constants_copy.write_text("MAX_GRADE = 21.0\n", encoding="utf-8")
+            after = sources_fingerprint([source])
+
+        assert before != after
+
+    def test_shouldInvalidateSnapshotWhenValidatorsChange(self, tmp_path) -> None:
+        """La huella debe depender del código de los pesos y de la política de puntos extra."""
+        source = _write_sources(tmp_path, ["CS101,100,s"])
+        module_copy = tmp_path / "module.py"
+
+        for module in ("weight_scheme", "extra_points_policy", "evaluation"):
+            module_copy.write_text("LIMIT = 1\n", encoding="utf-8")
+            with patch(f"src.batch.course_config.{module}.__file__", str(module_copy)):
+                before = sources_fingerprint([source])
+                module_copy.write_text("LIMIT = 2\n", encoding="utf-8")
+                after = sources_fingerprint([source])
+            assert before != after, module
+
+    def test_shouldInvalidateSnapshotWhenEditKeepsSizeAndDate(self, tmp_path) -> None:
+        """Una edición del mismo largo con la misma fecha debe cambiar la huella."""
+        source = _write_sources(tmp_path, ["CS101,100,s"])
+        status = os.stat(source)
+        before = sources_fingerprint([source])
+
+        _write_sources(tmp_path, ["CS101,100,n"])
+        os.utime(source, ns=(status.st_atime_ns, status.st_mtime_ns))
+
+        assert os.path.getsize(source) == status.st_size
+        assert sources_fingerprint([source]) != before
+
+    def test_shouldNotLeaveTemporaryFiles(self, tmp_path) -> None:
+        """El snapshot debe publicarse sin dejar archivos temporales."""
+        source = _write_sources(tmp_path, ["CS101,100,s"])
+        load_course_configs([source]).close()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "courses.csv",
+            "courses.csv.gcfg",
+        ]
+
+    def test_shouldRebuildCorruptSnapshot(self, tmp_path) -> None:
+        """Un snapshot dañado debe descartarse y regenerarse."""
+        source = _write_sources(tmp_path, ["CS101,100,s"])
+        snapshot = tmp_path / "courses.gcfg"
+        snapshot.write_bytes(b"GRCFG001" + b"\x00" * 10)
+
+        with load_course_configs([source], str(snapshot)) as catalog:
+            assert catalog.from_snapshot is False
+        with load_course_configs([source], str(snapshot)) as catalog:
+            assert catalog.from_snapshot is True
+            assert catalog["CS101"].scheme.is_valid
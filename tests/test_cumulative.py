@@ -0,0 +1,180 @@
+"""Tests unitarios para los promedios acumulados ponderados por créditos."""
+
+import io
+
+import pytest
+
+from src.batch.cumulative import (
+    AVERAGES_HEADER,
+    COURSE_GRADES_HEADER,
+    MAX_COURSE_CREDITS,
+    CourseGrade,
+    CumulativeAggregator,
+    TermAverage,
+    aggregate_course_grades,
+    parse_course_grade_line,
+    write_averages_csv,
+)
+from src.calculator.grade_calculator import GradeCalculator
+from src.exceptions import InvalidCourseGradeError
+from src.models.evaluation import Evaluation
+
+GRADES = [
+    CourseGrade("A001", "2024-1", "CS101", 4, 15.0),
+    CourseGrade("A001", "2024-1", "MA101", 2, 12.0),
+    CourseGrade("A001", "2024-2", "CS102", 3, 18.0),
+    CourseGrade("A002", "2024-1", "CS101", 4, 10.5),
+]
+
+
+class TestCumulativeAggregator:
+    """Tests para la clase CumulativeAggregator."""
+
+    def test_shouldComputeCreditWeightedAverages(self) -> None:
+        """Debe ponderar cada nota por los créditos del curso."""
+        aggregator = CumulativeAggregator.build(GRADES)
+
+        assert aggregator.term_average("A001", "2024-1") == 14.0
+        assert aggregator.term_average("A001", "2024-2") == 18.0
+        assert aggregator.average("A001") == round((60 + 24 + 54) / 9, 2)
+        assert aggregator.average("A002") == 10.5
+        assert len(aggregator) == 2
+
+    def test_shouldReplaceGradeIncrementally(self) -> None:
+        """Cambiar la nota de un curso debe ajustar solo su contribución."""
+        aggregator = CumulativeAggregator.build(GRADES)
+        aggregator.set_grade("A001", "2024-1", "MA101", 2, 18.0)
+
+        assert aggregator.term_average("A001", "2024-1") == 16.0
+        averages = aggregator.averages("A001")
+        assert averages.credits == 9
+        assert averages.terms[0] == TermAverage("2024-1", 6, 16.0)
+
+    def test_shouldRemoveGrade(self) -> None:
+        """Debe quitar la contribución del curso eliminado."""
+        aggregator = CumulativeAggregator.build(GRADES)
+
+        assert aggregator.remove_grade("A001", "2024-2", "CS102")
+        assert not aggregator.remove_grade("A001", "2024-2", "CS102")
+        assert aggregator.term_average("A001", "2024-2") is None
+        assert aggregator.average("A001") == 14.0
+        assert [term.term for term in aggregator.averages("A001").terms] == ["2024-1"]
+
+    def test_shouldNotDriftAfterManyUpdates(self) -> None:
+        """Las sumas deben ser exactas tras muchos cambios de nota."""
+        aggregator = CumulativeAggregator.build(GRADES)
+        for step in range(10000):
+            aggregator.set_grade("A001", "2024-1", "MA101", 2.5, (step % 2001) / 100)
+        aggregator.set_grade("A001", "2024-1", "MA101", 2, 12.0)
+
+        fresh = CumulativeAggregator.build(GRADES)
+        assert aggregator.averages("A001") == fresh.averages("A001")
+
+    def test_shouldMatchIncrementalUpdatesWhenBuildingInBulk(self) -> None:
+        """La construcción masiva debe coincidir con set_grade fila por fila."""
+        rows = GRADES + [
+            CourseGrade("A001", "2024-1", "CS101", 4, 9.0),
+            CourseGrade("A003", "2024-1", "CS101", 1.5, 20.0),
+        ]
+        incremental = CumulativeAggregator()
+        for row in rows:
+            incremental.set_grade(*row)
+        bulk = CumulativeAggregator.build(rows)
+
+        for student_id in incremental.student_ids():
+            assert bulk.averages(student_id) == incremental.averages(student_id)
+        assert bulk.term_average("A001", "2024-1") == 10.0
+
+    def test_shouldAddCalculatorResult(self) -> None:
+        """Debe usar la nota final del resultado de GradeCalculator."""
+        result = GradeCalculator.calculate_final_grade(
+            [Evaluation(16.0, 100.0)], True, 0.0, [], 0.0
+        )
+        aggregator = CumulativeAggregator()
+        aggregator.add_result("A001", "2024-1", "CS101", 3, result)
+
+        assert aggregator.average("A001") == result["final_grade"]
+
+    def test_shouldForgetStudentAfterRemovingLastCourse(self) -> None:
+        """Sin cursos, el estudiante no debe seguir registrado ni escribirse."""
+        aggregator = CumulativeAggregator.build(GRADES)
+
+        assert aggregator.remove_grade("A002", "2024-1", "CS101")
+        assert "A002" not in aggregator
+        assert len(aggregator) == 1
+        with pytest.raises(KeyError):
+            aggregator.averages("A002")
+        output = io.StringIO()
+        assert write_averages_csv(aggregator, output) == 1
+        assert "A002" not in output.getvalue()
+
+    @pytest.mark.parametrize(
+        "credits, grade",
+        [
+            (0, 15.0),
+            (0.001, 15.0),
+            (float("inf"), 15.0),
+            (float("nan"), 15.0),
+            (1e300, 15.0),
+            (1000.01, 15.0),
+            (3, 20.5),
+            (3, -1.0),
+        ],
+    )
+    def test_shouldRejectInvalidCreditsOrGrade(self, credits, grade) -> None:
+        """Debe rechazar créditos no finitos, menores a una centésima o excesivos."""
+        with pytest.raises(InvalidCourseGradeError):
+            CumulativeAggregator().set_grade("A001", "2024-1", "CS101", credits, grade)
+
+    def test_shouldAcceptMaximumCredits(self) -> None:
+        """Los créditos máximos deben caber en las sumas del ciclo."""
+        aggregator = CumulativeAggregator()
+        for course in range(3):
+            aggregator.set_grade("A001", "2024-1", f"C{course}", MAX_COURSE_CREDITS, 20.0)
+        assert aggregator.average("A001") == 20.0
+
+    def test_shouldReturnNoneForUnknownStudent(self) -> None:
+        """Debe retornar None para un estudiante sin cursos."""
+        aggregator = CumulativeAggregator()
+        assert aggregator.average("X") is None
+        assert "X" not in aggregator
+
+
+class TestCourseGradeFiles:
+    """Tests para la lectura y escritura de archivos de promedios."""
+
+    def test_shouldParseCourseGradeLine(self) -> None:
+        """Debe convertir una fila en CourseGrade."""
+        assert parse_course_grade_line("A001,2024-1,CS101,4,15.5") == CourseGrade(
+            "A001", "2024-1", "CS101", 4.0, 15.5
+        )
+        with pytest.raises(InvalidCourseGradeError):
+            parse_course_grade_line("A001,2024-1,CS101,4", 7)
+
+    def test_shouldWriteTermAndCumulativeRows(self) -> None:
+        """Debe escribir una fila por ciclo y una fila total por estudiante."""
+        output = io.StringIO()
+        assert write_averages_csv(CumulativeAggregator.build(GRADES), output) == 2
+
+        lines = output.getvalue().splitlines()
+        assert lines[0] == AVERAGES_HEADER
+        assert lines[1:4] == [
+            "A001,2024-1,6.0,14.0",
+            "A001,2024-2,3.0,18.0",
+            "A001,total,9.0,15.33",
+        ]
+
+    def test_shouldAggregateFileInOnePass(self, tmp_path) -> None:
+        """Debe leer el archivo de notas y escribir los promedios."""
+        source = tmp_path / "courses.csv"
+        source.write_text(
+            COURSE_GRADES_HEADER
+            + "\n"
+            + "\n".join(",".join(str(field) for field in row) for row in GRADES)
+            + "\n",
+            encoding="utf-8",
+        )
+        output = tmp_path / "averages.csv"
+
+        assert aggregate_course_grades(str(source), str(output)) == 2
+        assert "A002,total,4.0,10.5" in output.read_text(encoding="utf-8")
@@ -0,0 +1,109 @@
+"""Tests unitarios para la deduplicación de perfiles."""
+
+import pytest
+
+from src.batch.batch_grader import BatchGrader
+from src.batch.deduplication import DedupReport, ProfileDeduplicator, profile_key
+from src.models.student_record import StudentRecord
+
+
+def _record(student_id: str, **overrides) -> StudentRecord:
+    """Crea un registro con valores por defecto."""
+    values = {
+        "grades": [15.0, 18.0],
+        "weights": [50.0, 50.0],
+        "has_reached_minimum": True,
+        "tardiness_percentage": 0.0,
+        "all_years_teachers": [True, True],
+        "extra_points": 1.0,
+    }
+    values.update(overrides)
+    return StudentRecord(student_id, **values)
+
+
+class TestProfileDeduplicator:
+    """Tests para la clase ProfileDeduplicator."""
+
+    def test_shouldShareKeyWhenIgnoredInputsDiffer(self) -> None:
+        """Debe normalizar tardanzas, votos y puntos extra que no afectan el cálculo."""
+        assert profile_key(_record("A", tardiness_percentage=80.0)) == profile_key(
+            _record("B", tardiness_percentage=10.0)
+        )
+        assert profile_key(
+            _record("A", has_reached_minimum=False, tardiness_percentage=45.0)
+        ) == profile_key(
+            _record("B", has_reached_minimum=False, tardiness_percentage=90.0)
+        )
+        assert profile_key(
+            _record("A", all_years_teachers=[False], extra_points=3.0)
+        ) == profile_key(_record("B", all_years_teachers=[True, False], extra_points=0.0))
+
+    def test_shouldSeparateKeysWhenResultCanDiffer(self) -> None:
+        """Debe distinguir perfiles cuyo resultado o error puede cambiar."""
+        assert profile_key(
+            _record("A", has_reached_minimum=False, tardiness_percentage=39.0)
+        ) != profile_key(
+            _record("B", has_reached_minimum=False, tardiness_percentage=40.0)
+        )
+        assert profile_key(
+            _record("A", has_reached_minimum=False, tardiness_percentage=101.0)
+        ) != profile_key(
+            _record("B", has_reached_minimum=False, tardiness_percentage=120.0)
+        )
+        assert profile_key(_record("A", extra_points=1.0)) != profile_key(
+            _record("B", extra_points=2.0)
+        )
+
+    def test_shouldMatchNonDeduplicatedResultsInOrder(self) -> None:
+        """Debe producir los mismos resultados y orden que el cálculo sin deduplicar."""
+        records = [
+            _record("A001"),
+            _record("A002", grades=[20.0, 20.0], extra_points=5.0),
+            _record("A003"),
+            _record("A004", weights=[30.0, 30.0]),
+            _record("A005", weights=[30.0, 30.0]),
+            _record("A006", has_reached_minimum=False, tardiness_percentage=50.0),
+        ]
+        deduplicator = ProfileDeduplicator()
+        assert list(deduplicator.grade(records)) == list(BatchGrader.grade(records))
+
+    def test_shouldReportDedupRatio(self) -> None:
+        """Debe reportar filas totales, perfiles únicos y ratio."""
+        deduplicator = ProfileDeduplicator()
+        list(deduplicator.grade([_record(f"A{i}") for i in range(4)]))
+        report = deduplicator.report()
+        assert report == DedupReport(total_rows=4, unique_profiles=1)
+        assert report.dedup_ratio == 4.0
+        assert report.calls_saved == 3
+
+    def test_shouldEvictLeastRecentlyUsedProfiles(self) -> None:
+        """Con max_profiles debe acotar la caché sin cambiar los resultados."""
+        records = [
+            _record("A001"),
+            _record("A002", grades=[20.0, 20.0]),
+            _record("A003"),
+            _record("A004", grades=[10.0, 10.0]),
+            _record("A005"),
+            _record("A006", grades=[20.0, 20.0]),
+        ]
+        deduplicator = ProfileDeduplicator(max_profiles=2)
+
+        assert list(deduplicator.grade(records)) == list(BatchGrader.grade(records))
+        report = deduplicator.report()
+        assert report.unique_profiles == 3
+        assert report.evicted_profiles == 2
+        assert report.recomputed_profiles == 1
+        assert report.calls_saved == 2
+        assert report.dedup_ratio == 2.0
+
+    def test_shouldShareReadOnlyResultBetweenStudents(self) -> None:
+        """Debe compartir un resultado de solo lectura entre perfiles iguales."""
+        deduplicator = ProfileDeduplicator()
+        first, second = deduplicator.grade([_record("A001"), _record("A002")])
+        assert first.result is second.result
+        with pytest.raises(TypeError):
+            first.result["final_grade"] = 0.0
+
+    def test_shouldReturnRatioOneWhenEmpty(self) -> None:
+        """Debe retornar ratio 1.0 cuando no hay filas."""
+        assert ProfileDeduplicator().report().dedup_ratio == 1.0
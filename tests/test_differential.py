@@ -0,0 +1,56 @@
+"""Tests diferenciales de los motores de cálculo contra la referencia."""
+
+from src.batch.batch_grader import BatchGrader, GradedRow
+from src.batch.differential import (
+    edge_case_records,
+    random_records,
+    reference_grade,
+    run_differential,
+)
+from src.constants import MAX_GRADE, MIN_ATTENDANCE_PERCENTAGE
+
+
+class TestDifferential:
+    """Tests para el arnés diferencial."""
+
+    def test_shouldFindNoMismatchesOnEdgeCaseAndRandomCorpus(self) -> None:
+        """Todos los motores deben coincidir con la referencia."""
+        records = edge_case_records() + random_records(2000, seed=11)
+        report = run_differential(records)
+        assert report.rows == len(records)
+        assert {run.engine for run in report.runs} >= {"scalar", "dedup", "thread"}
+        assert report.total_mismatches == 0, [
+            (run.engine, run.mismatches[:3]) for run in report.runs if run.mismatches
+        ]
+
+    def test_shouldReportMismatchesOfFaultyEngine(self) -> None:
+        """Debe reportar las filas en que un motor difiere."""
+
+        def faulty(records):
+            rows = list(BatchGrader.grade(records))
+            rows[1] = GradedRow(rows[1].student_id, None, "error inventado")
+            return rows
+
+        records = random_records(10, seed=1)
+        report = run_differential(records, {"faulty": faulty})
+        (run,) = report.runs
+        assert [mismatch.index for mismatch in run.mismatches] == [1]
+        assert run.mismatches[0].actual.endswith("error inventado")
+        assert run.rows == 10 and run.rows_per_second > 0
+
+    def test_shouldCoverBoundaryValues(self) -> None:
+        """El corpus de casos límite debe incluir los bordes de cada regla."""
+        records = edge_case_records()
+        assert any(
+            record.tardiness_percentage == MIN_ATTENDANCE_PERCENTAGE * 100
+            for record in records
+        )
+        assert any(record.grades and record.grades[-1] == MAX_GRADE for record in records)
+        errors = {reference_grade(record).error is None for record in records}
+        assert errors == {True, False}
+
+    def test_shouldGenerateReproducibleRandomCorpus(self) -> None:
+        """La misma semilla debe generar el mismo corpus."""
+        first = [reference_grade(record) for record in random_records(200, seed=3)]
+        second = [reference_grade(record) for record in random_records(200, seed=3)]
+        assert first == second
@@ -0,0 +1,103 @@
+"""Tests unitarios para la selección adaptativa del motor de cálculo."""
+
+import json
+from unittest.mock import patch
+
+from src.batch.batch_grader import BatchGrader
+from src.batch.dispatcher import (
+    CALIBRATION_VERSION,
+    ENGINES,
+    AdaptiveDispatcher,
+    estimate_dedup_ratio,
+    machine_fingerprint,
+)
+from src.batch.synthetic import generate_records
+
+SIZES = (16, 64)
+
+
+def _write_calibration(path, seconds_per_row, machine=None) -> None:
+    """Escribe una calibración conocida en el archivo de caché."""
+    path.write_text(
+        json.dumps(
+            {
+                "version": CALIBRATION_VERSION,
+                "machine": machine or machine_fingerprint(),
+                "sizes": list(SIZES),
+                "seconds_per_row": seconds_per_row,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def _costs(scalar, dedup, thread, process, key=0.1) -> dict:
+    """Costos por fila iguales para ambos tamaños calibrados."""
+    return {
+        "scalar": [scalar] * 2,
+        "dedup": [dedup] * 2,
+        "thread": [thread] * 2,
+        "process": [process] * 2,
+        "profile_key": [key] * 2,
+    }
+
+
+class TestAdaptiveDispatcher:
+    """Tests para la clase AdaptiveDispatcher."""
+
+    def test_shouldCalibrateOnceAndReuseCache(self, tmp_path) -> None:
+        """Debe guardar la calibración en disco y reutilizarla."""
+        cache = tmp_path / "cache" / "dispatch.json"
+        calibration = AdaptiveDispatcher(str(cache), SIZES).calibration
+        assert cache.exists()
+        assert set(calibration["seconds_per_row"]) == set(ENGINES) | {"profile_key"}
+
+        with patch.object(AdaptiveDispatcher, "calibrate") as mock_calibrate:
+            reloaded = AdaptiveDispatcher(str(cache), SIZES).calibration
+        mock_calibrate.assert_not_called()
+        assert reloaded == calibration
+
+    def test_shouldRecalibrateForAnotherMachine(self, tmp_path) -> None:
+        """Debe descartar una calibración hecha en otra máquina."""
+        cache = tmp_path / "dispatch.json"
+        _write_calibration(cache, _costs(1, 1, 1, 1), machine="otra")
+        calibration = AdaptiveDispatcher(str(cache), SIZES).calibration
+        assert calibration["machine"] == machine_fingerprint()
+
+    def test_shouldRouteToFastestEngineAndExposeChoice(self, tmp_path) -> None:
+        """Debe usar el motor más rápido y registrar la decisión."""
+        cache = tmp_path / "dispatch.json"
+        _write_calibration(cache, _costs(1.0, 1.0, 1.0, 0.5))
+        dispatcher = AdaptiveDispatcher(str(cache), SIZES)
+        records = generate_records(40)
+
+        rows = dispatcher.grade(records)
+
+        assert dispatcher.last_decision.engine == "process"
+        assert dispatcher.last_decision.rows == 40
+        assert rows == list(BatchGrader.grade(records))
+
+    def test_shouldPreferDedupForDuplicatedProfiles(self, tmp_path) -> None:
+        """Debe elegir dedup cuando el lote tiene muchos perfiles repetidos."""
+        cache = tmp_path / "dispatch.json"
+        _write_calibration(cache, _costs(1.0, 1.0, 1.0, 1.0))
+        dispatcher = AdaptiveDispatcher(str(cache), SIZES)
+
+        unique = generate_records(40)
+        duplicated = generate_records(4) * 10
+        assert dispatcher.choose(unique).engine == "scalar"
+        decision = dispatcher.choose(duplicated)
+        assert decision.engine == "dedup"
+        assert decision.dedup_ratio == 10.0
+
+    def test_shouldPreferSimplerEngineWhenCostsAreSimilar(self, tmp_path) -> None:
+        """Debe elegir scalar si otro motor es apenas más rápido."""
+        cache = tmp_path / "dispatch.json"
+        _write_calibration(cache, _costs(1.0, 5.0, 0.95, 0.97))
+        decision = AdaptiveDispatcher(str(cache), SIZES).choose(generate_records(40))
+        assert decision.engine == "scalar"
+
+    def test_shouldEstimateDedupRatioFromSample(self) -> None:
+        """Debe estimar filas por perfil único y tolerar lotes vacíos."""
+        assert estimate_dedup_ratio([]) == 1.0
+        assert estimate_dedup_ratio(generate_records(5) * 4) == 4.0
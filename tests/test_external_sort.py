@@ -0,0 +1,48 @@
+"""Tests unitarios para el ordenamiento externo."""
+
+import random
+
+import pytest
+
+from src.batch.external_sort import SortStats, external_sort
+
+
+class TestExternalSort:
+    """Tests para la función external_sort."""
+
+    def test_shouldSortInMemoryWithoutSpilling(self) -> None:
+        """Debe ordenar sin escribir corridas si todo cabe en memoria."""
+        stats = SortStats()
+
+        result = list(external_sort([3, 1, 2], max_in_memory=10, stats=stats))
+
+        assert result == [1, 2, 3]
+        assert stats.items == 3
+        assert stats.runs == 0
+
+    def test_shouldMergeSpilledRunsInOrder(self, tmp_path) -> None:
+        """Debe volcar corridas a disco y combinarlas en orden."""
+        values = list(range(10_000))
+        random.Random(7).shuffle(values)
+        stats = SortStats()
+
+        result = list(
+            external_sort(values, max_in_memory=999, directory=str(tmp_path), stats=stats)
+        )
+
+        assert result == sorted(values)
+        assert stats.runs == 11
+        assert stats.spilled_bytes > 0
+
+    def test_shouldKeepOrderOfEqualKeys(self) -> None:
+        """Debe ser estable igual que sorted()."""
+        items = [("b", 1), ("a", 2), ("b", 3), ("a", 4), ("b", 5)]
+
+        result = list(external_sort(items, key=lambda item: item[0], max_in_memory=2))
+
+        assert result == sorted(items, key=lambda item: item[0])
+
+    def test_shouldRejectNonPositiveMemoryLimit(self) -> None:
+        """Debe rechazar un límite de memoria menor a 1."""
+        with pytest.raises(ValueError):
+            list(external_sort([1], max_in_memory=0))
@@ -0,0 +1,78 @@
+"""Tests unitarios para la clase GradeResult."""
+
+import pickle
+
+import pytest
+
+from src.calculator.grade_calculator import GradeCalculator
+from src.models.evaluation import Evaluation
+from src.models.grade_result import GradeResult
+
+
+class TestGradeResult:
+    """Tests para la clase GradeResult."""
+
+    def test_shouldKeepRawValuesAndRoundOnRead(self) -> None:
+        """Debe guardar los valores sin redondear y redondear al leerlos."""
+        result = GradeResult(14.666666, 16.296296, 1.629629, 0.0)
+        assert result.raw_final_grade == 14.666666
+        assert result.final_grade == 14.67
+        assert result["weighted_average"] == 16.3
+        assert result.penalty_applied == 1.63
+
+    def test_shouldBehaveLikeResultDict(self) -> None:
+        """Debe poder usarse como el diccionario de calculate_final_grade."""
+        result = GradeResult(15.0, 15.0, 0.0, 0.0)
+        expected = {
+            "final_grade": 15.0,
+            "weighted_average": 15.0,
+            "penalty_applied": 0.0,
+            "extra_points_applied": 0.0,
+        }
+        assert result == expected
+        assert dict(result) == expected
+        assert result.to_dict() == expected
+        assert list(result) == list(expected)
+        assert len(result) == 4
+
+    def test_shouldRaiseKeyErrorForUnknownField(self) -> None:
+        """Debe lanzar KeyError para campos inexistentes."""
+        with pytest.raises(KeyError):
+            GradeResult(15.0, 15.0, 0.0, 0.0)["raw_final_grade"]
+
+    def test_shouldNotHaveInstanceDict(self) -> None:
+        """Debe usar __slots__ en lugar de un diccionario por instancia."""
+        assert not hasattr(GradeResult(15.0, 15.0, 0.0, 0.0), "__dict__")
+
+    def test_shouldRejectAssignmentAfterInit(self) -> None:
+        """No debe permitir reasignar ni borrar los valores sin redondear."""
+        result = GradeResult(15.0, 15.0, 0.0, 0.0)
+        with pytest.raises(AttributeError):
+            result.raw_final_grade = 20.0
+        with pytest.raises(AttributeError):
+            del result.raw_penalty_applied
+        assert result.final_grade == 15.0
+
+    def test_shouldSurvivePickle(self) -> None:
+        """Debe poder enviarse a otros procesos con pickle."""
+        result = GradeResult(14.666666, 16.296296, 1.629629, 0.0)
+        restored = pickle.loads(pickle.dumps(result))
+        assert restored.raw_final_grade == 14.666666
+        assert restored == result
+
+
+class TestCalculateResult:
+    """Tests para GradeCalculator.calculate_result."""
+
+    def test_shouldMatchCalculateFinalGrade(self) -> None:
+        """Debe producir los mismos campos que calculate_final_grade."""
+        arguments = (
+            [Evaluation(13.0, 33.0), Evaluation(17.0, 67.0)],
+            False,
+            55.0,
+            [True, True],
+            1.25,
+        )
+        result = GradeCalculator.calculate_result(*arguments)
+        assert isinstance(result, GradeResult)
+        assert result.to_dict() == GradeCalculator.calculate_final_grade(*arguments)
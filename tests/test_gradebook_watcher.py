@@ -0,0 +1,133 @@
+"""Tests unitarios para el modo watch sobre logs de eventos."""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from src.batch.gradebook_watcher import GradebookWatcher
+
+
+def _append(path, text: str) -> None:
+    """Agrega texto al final del log."""
+    with open(path, "a", encoding="utf-8") as log_file:
+        log_file.write(text)
+
+
+class TestGradebookWatcher:
+    """Tests para la clase GradebookWatcher."""
+
+    def test_shouldGradeOnlyAffectedStudents(self, tmp_path) -> None:
+        """Debe recalcular solo los estudiantes con eventos nuevos."""
+        log = tmp_path / "events.log"
+        _append(log, "A001,pc1,15,50\nA001,ex1,18,50\nB002,pc1,10,100\n")
+        watcher = GradebookWatcher(str(log))
+
+        first = watcher.poll()
+        assert [row.student_id for row in first] == ["A001", "B002"]
+        assert first[0].result["final_grade"] == 16.5
+
+        _append(log, "B002,pc1,12,100\n")
+        second = watcher.poll()
+        assert [row.student_id for row in second] == ["B002"]
+        assert second[0].result["final_grade"] == 12.0
+        assert watcher.poll() == []
+
+    def test_shouldReportErrorWhileWeightsAreIncomplete(self, tmp_path) -> None:
+        """Debe emitir error mientras los pesos no sumen 100%."""
+        log = tmp_path / "events.log"
+        _append(log, "A001,pc1,15,50\n")
+        row = GradebookWatcher(str(log)).poll()[0]
+        assert row.result is None
+        assert row.error
+
+    def test_shouldWaitForCompleteLines(self, tmp_path) -> None:
+        """No debe procesar una línea a medio escribir."""
+        log = tmp_path / "events.log"
+        _append(log, "A001,pc1,20,100\nB002,pc1,1")
+        watcher = GradebookWatcher(str(log))
+
+        assert [row.student_id for row in watcher.poll()] == ["A001"]
+        _append(log, "5,100\n")
+        rows = watcher.poll()
+        assert rows[0].student_id == "B002"
+        assert rows[0].result["final_grade"] == 15.0
+
+    def test_shouldCountMalformedEvents(self, tmp_path) -> None:
+        """Debe ignorar y contar eventos malformados."""
+        log = tmp_path / "events.log"
+        _append(log, "student_id,evaluation_id,grade,weight\n")
+        _append(log, "A001,pc1\nA001,pc1,x,100\n")
+        watcher = GradebookWatcher(str(log))
+        assert watcher.poll() == []
+        assert watcher.malformed_events == 2
+
+    def test_shouldReplayOnlyEventsAfterSnapshot(self, tmp_path) -> None:
+        """Al reiniciar, debe continuar desde el offset del snapshot."""
+        log = tmp_path / "events.log"
+        snapshot = tmp_path / "events.snapshot"
+        _append(log, "A001,pc1,15,50\nA001,ex1,18,50\n")
+        watcher = GradebookWatcher(str(log), str(snapshot), snapshot_interval=1)
+        watcher.poll()
+        processed = watcher.offset
+
+        _append(log, "B002,pc1,11,100\n")
+        restarted = GradebookWatcher(str(log), str(snapshot))
+        assert restarted.offset == processed
+        assert restarted.grade_student("A001").result["final_grade"] == 16.5
+        assert [row.student_id for row in restarted.poll()] == ["B002"]
+
+    def test_shouldRebuildStateWhenLogIsTruncated(self, tmp_path) -> None:
+        """Debe reiniciar el estado si el log se reemplaza por uno más corto."""
+        log = tmp_path / "events.log"
+        _append(log, "A001,pc1,15,100\nA002,pc1,15,100\n")
+        watcher = GradebookWatcher(str(log))
+        watcher.poll()
+
+        log.write_text("C003,pc1,9,100\n", encoding="utf-8")
+        assert [row.student_id for row in watcher.poll()] == ["C003"]
+        assert watcher.student_count == 1
+
+    def test_shouldRunUntilStopped(self, tmp_path) -> None:
+        """run() debe emitir actualizaciones y guardar el snapshot al detenerse."""
+        log = tmp_path / "events.log"
+        snapshot = tmp_path / "events.snapshot"
+        _append(log, "A001,pc1,20,100\n")
+        watcher = GradebookWatcher(str(log), str(snapshot))
+        stop = threading.Event()
+        emitted = []
+
+        def emit(row) -> None:
+            emitted.append(row)
+            stop.set()
+
+        watcher.run(emit, poll_interval=0.01, stop_event=stop)
+        assert [row.student_id for row in emitted] == ["A001"]
+        assert snapshot.exists()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requiere inotify")
+    def test_shouldEmitAppendedEventWithoutWaitingForInterval(self, tmp_path) -> None:
+        """Con inotify un evento nuevo debe procesarse sin esperar el intervalo."""
+        log = tmp_path / "events.log"
+        _append(log, "")
+        watcher = GradebookWatcher(str(log))
+        stop = threading.Event()
+        emitted = []
+
+        def emit(row) -> None:
+            emitted.append(time.perf_counter())
+            stop.set()
+
+        runner = threading.Thread(target=watcher.run, args=(emit, 5.0, stop))
+        runner.start()
+        time.sleep(0.2)
+        appended = time.perf_counter()
+        _append(log, "A001,pc1,20,100\n")
+        runner.join(timeout=10)
+
+        assert emitted and emitted[0] - appended < 1.0
+
+    def test_shouldReturnNothingWhenLogDoesNotExist(self, tmp_path) -> None:
+        """Debe esperar a que el log exista."""
+        assert GradebookWatcher(str(tmp_path / "missing.log")).poll() == []
@@ -0,0 +1,101 @@
+"""Tests unitarios para el generador de carga del flujo interactivo."""
+
+import random
+import sys
+
+from benchmarks.interactive_load import (
+    PROMPT_WEIGHT,
+    STEP_EVALUATIONS,
+    STEP_RESULT,
+    STEP_SESSION,
+    STEP_START,
+    SessionResult,
+    build_script,
+    percentile,
+    run_load,
+    run_session,
+    summarize,
+)
+
+
+class TestBuildScript:
+    """Tests para la función build_script."""
+
+    def test_shouldBuildReproducibleScripts(self) -> None:
+        """La misma semilla debe producir la misma sesión."""
+        first = build_script(random.Random(3), "A1", typo_rate=0.5)
+        second = build_script(random.Random(3), "A1", typo_rate=0.5)
+
+        assert first == second
+        assert first.exchanges[0].answer == "A1"
+
+    def test_shouldUseWeightsThatSumToHundred(self) -> None:
+        """Los pesos válidos de cada sesión deben sumar 100."""
+        rng = random.Random(0)
+        for index in range(50):
+            script = build_script(rng, f"A{index}")
+            weights = [
+                int(exchange.answer)
+                for exchange in script.exchanges
+                if exchange.prompt == PROMPT_WEIGHT
+            ]
+            assert sum(weights) == 100
+            assert script.expected.startswith("NOTA FINAL: ")
+
+
+class TestRunSession:
+    """Tests para run_session y run_load."""
+
+    def test_shouldDriveRealInteractiveSessions(self) -> None:
+        """Debe completar sesiones reales del CLI con el resultado esperado."""
+        results = run_load(2, concurrency=2, seed=1, typo_rate=0.3, timeout=20)
+
+        assert [result.failed_step for result in results] == [None, None]
+        steps = {step for result in results for step, _ in result.timings}
+        assert {STEP_START, STEP_EVALUATIONS, STEP_RESULT} <= steps
+
+    def test_shouldReportMismatchedResult(self) -> None:
+        """Debe fallar en el paso resultado si la nota impresa es distinta."""
+        script = build_script(random.Random(0), "A1")
+        script = script._replace(expected="NOTA FINAL: 99.99\n")
+
+        result = run_session(script, timeout=20)
+
+        assert result.failed_step == STEP_RESULT
+
+    def test_shouldReportProcessThatExitsEarly(self) -> None:
+        """Debe fallar en el primer paso si el proceso termina sin preguntar."""
+        script = build_script(random.Random(0), "A1")
+
+        result = run_session(script, timeout=5, command=[sys.executable, "-c", "pass"])
+
+        assert result.failed_step == STEP_START
+        assert "terminó" in (result.error or "")
+
+
+class TestSummarize:
+    """Tests para summarize y percentile."""
+
+    def test_shouldComputeNearestRankPercentiles(self) -> None:
+        """Debe usar el percentil por rango más cercano."""
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    def test_shouldCountFailuresPerStep(self) -> None:
+        """Debe contar las fallas en su paso y en la sesión."""
+        results = [
+            SessionResult("A1", [(STEP_START, 0.2), (STEP_RESULT, 0.01)], 0.3, None, None),
+            SessionResult("A2", [(STEP_START, 0.4)], 0.5, STEP_RESULT, "distinto"),
+        ]
+
+        stats = {item.step: item for item in summarize(results)}
+
+        assert stats[STEP_START].samples == 2
+        assert stats[STEP_START].maximum == 0.4
+        assert stats[STEP_RESULT].failures == 1
+        assert stats[STEP_SESSION].samples == 1
+        assert stats[STEP_SESSION].failures == 1
+        assert STEP_EVALUATIONS not in stats
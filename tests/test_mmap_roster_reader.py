@@ -0,0 +1,153 @@
+"""Tests unitarios para la lectura de rosters con mmap."""
+
+import gzip
+
+import pytest
+
+from src.batch.mmap_roster_reader import (
+    RosterStream,
+    open_roster,
+    read_roster_chunks,
+    read_roster_mmap,
+)
+from src.batch.roster_columns import RosterColumns, write_roster_binary
+from src.batch.roster_reader import ROSTER_HEADER, read_roster_csv
+from src.exceptions import InvalidRosterError
+
+ROSTER_TEXT = (
+    ROSTER_HEADER
+    + "\n# comentario\n\n"
+    + "A001,n,45,ss,1.5,15:30;18:40;12:30\n"
+    + "Ñandú 02, s ,0,,0,\r\n"
+    + "A003,s,10.25,sN,2, 20:50 ; 11.5:50 "
+)
+
+
+def _fields(record) -> tuple:
+    """Retorna los campos comparables de un registro."""
+    return (
+        record.student_id,
+        record.grades,
+        record.weights,
+        record.has_reached_minimum,
+        record.tardiness_percentage,
+        record.all_years_teachers,
+        record.extra_points,
+    )
+
+
+class TestMmapRosterReader:
+    """Tests para read_roster_mmap y open_roster."""
+
+    def test_shouldMatchTextReader(self, tmp_path) -> None:
+        """Debe producir los mismos registros que el lector de texto."""
+        roster = tmp_path / "roster.csv"
+        roster.write_bytes(ROSTER_TEXT.encode("utf-8"))
+
+        expected = [_fields(record) for record in read_roster_csv(str(roster))]
+        columns = read_roster_mmap(str(roster))
+        assert [_fields(record) for record in columns.records()] == expected
+        assert len(columns) == 3
+
+    def test_shouldReturnEmptyRosterForEmptyFile(self, tmp_path) -> None:
+        """Debe aceptar un archivo vacío."""
+        roster = tmp_path / "empty.csv"
+        roster.write_bytes(b"")
+        assert len(read_roster_mmap(str(roster))) == 0
+
+    def test_shouldRaiseErrorWithLineNumber(self, tmp_path) -> None:
+        """Debe reportar el número de línea de la fila inválida."""
+        roster = tmp_path / "roster.csv"
+        roster.write_bytes(b"A001,s,0,s,0,20:100\nA002,s,0,s,0,20-100\n")
+        with pytest.raises(InvalidRosterError, match="Línea 2"):
+            read_roster_mmap(str(roster))
+
+    def test_shouldRaiseErrorWhenFieldCountIsWrong(self, tmp_path) -> None:
+        """Debe lanzar error cuando la fila no tiene 6 campos."""
+        roster = tmp_path / "roster.csv"
+        roster.write_bytes(b"A001,s,0,s,0,20:100,extra\n")
+        with pytest.raises(InvalidRosterError):
+            read_roster_mmap(str(roster))
+
+    def test_shouldOpenCsvAndBinaryRosters(self, tmp_path) -> None:
+        """open_roster debe detectar el formato del archivo."""
+        csv_roster = tmp_path / "roster.csv"
+        csv_roster.write_bytes(ROSTER_TEXT.encode("utf-8"))
+        binary_roster = tmp_path / "roster.grr"
+        write_roster_binary(read_roster_mmap(str(csv_roster)), str(binary_roster))
+
+        with open_roster(str(csv_roster)) as from_csv, open_roster(
+            str(binary_roster)
+        ) as from_binary:
+            assert isinstance(from_binary, RosterColumns)
+            assert [_fields(r) for r in from_binary.records()] == [
+                _fields(r) for r in from_csv.records()
+            ]
+
+    def test_shouldOpenGzipRosterLikeCsv(self, tmp_path) -> None:
+        """open_roster debe leer un roster gzip sin descomprimirlo a disco."""
+        csv_roster = tmp_path / "roster.csv"
+        csv_roster.write_bytes(ROSTER_TEXT.encode("utf-8"))
+        gzip_roster = tmp_path / "roster.csv.gz"
+        gzip_roster.write_bytes(gzip.compress(ROSTER_TEXT.encode("utf-8")))
+
+        with open_roster(str(gzip_roster)) as from_gzip:
+            assert [_fields(r) for r in from_gzip.records()] == [
+                _fields(r) for r in read_roster_mmap(str(csv_roster)).records()
+            ]
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "roster.csv",
+            "roster.csv.gz",
+        ]
+
+    def test_shouldJoinLinesSplitAcrossChunks(self) -> None:
+        """Las líneas partidas entre bloques deben leerse completas."""
+        data = ROSTER_TEXT.encode("utf-8")
+        chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+
+        columns = read_roster_chunks(chunks)
+
+        assert [r.student_id for r in columns.records()] == ["A001", "Ñandú 02", "A003"]
+
+    def test_shouldNumberLinesAcrossChunks(self) -> None:
+        """El número de línea de un error debe contar las líneas de bloques previos."""
+        chunks = [b"A001,s,0,s,0,20:100\nA002,s,0,s,0,", b"20:100\nA003,s,0,s,0,20-100\n"]
+
+        with pytest.raises(InvalidRosterError, match="Línea 3"):
+            read_roster_chunks(chunks)
+
+    def test_shouldStreamRosterInBlocks(self, tmp_path) -> None:
+        """RosterStream debe leer por bloques las mismas filas que el mmap."""
+        lines = [f"S{index:03d},s,0,s,0,{index % 21}:100" for index in range(50)]
+        text = ("\n".join(lines) + "\n").encode("utf-8")
+        csv_roster = tmp_path / "roster.csv"
+        csv_roster.write_bytes(text)
+        gzip_roster = tmp_path / "roster.csv.gz"
+        gzip_roster.write_bytes(gzip.compress(text))
+        expected = [_fields(r) for r in read_roster_mmap(str(csv_roster)).records()]
+
+        for path in (csv_roster, gzip_roster):
+            with RosterStream(str(path), block_rows=8, chunk_size=64) as stream:
+                assert len(stream.head()) < 50
+                assert [_fields(r) for r in stream.records()] == expected
+                with pytest.raises(ValueError):
+                    stream.head()
+            with RosterStream(str(path), block_rows=8, chunk_size=64) as stream:
+                assert [_fields(r) for r in stream.records(23)] == expected[23:]
+
+    def test_shouldEstimateRowsFromFirstBlock(self, tmp_path) -> None:
+        """estimated_rows debe proyectar el primer bloque al tamaño del archivo."""
+        lines = [f"S{index:03d},s,0,s,0,{index % 21}:100" for index in range(200)]
+        text = ("\n".join(lines) + "\n").encode("utf-8")
+        csv_roster = tmp_path / "roster.csv"
+        csv_roster.write_bytes(text)
+        gzip_roster = tmp_path / "roster.csv.gz"
+        gzip_roster.write_bytes(gzip.compress(text))
+
+        with RosterStream(str(csv_roster), block_rows=8, chunk_size=64) as stream:
+            assert len(stream.head()) < 200
+            assert 190 <= stream.estimated_rows() <= 210
+        with RosterStream(str(gzip_roster), block_rows=8, chunk_size=64) as stream:
+            assert len(stream.head()) <= stream.estimated_rows() <= 200
+        with RosterStream(str(gzip_roster), block_rows=1000) as stream:
+            assert stream.estimated_rows() == 200
@@ -0,0 +1,108 @@
+"""Tests unitarios para el cálculo por lotes con hilos."""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.batch.batch_grader import BatchGrader
+from src.batch.parallel import grade_batch_processes, grade_batch_threaded
+from src.batch.synthetic import generate_records
+from src.models.student_record import StudentRecord
+
+
+class TestGradeBatchThreaded:
+    """Tests para grade_batch_threaded."""
+
+    def test_shouldMatchSequentialResultForAnyWorkerAndChunkCount(self) -> None:
+        """Debe producir el mismo resultado y orden que BatchGrader.grade."""
+        records = generate_records(500, seed=3)
+        expected = list(BatchGrader.grade(records))
+        for max_workers, chunk_size in ((1, 1024), (2, 7), (4, 64), (8, 1)):
+            assert grade_batch_threaded(records, max_workers, chunk_size) == expected
+
+    def test_shouldKeepErrorsInTheirRows(self) -> None:
+        """Debe reportar el error en la fila inválida sin alterar las demás."""
+        records = [
+            StudentRecord("A001", [15.0], [100.0], True, 0.0, [], 0.0),
+            StudentRecord("A002", [15.0], [70.0], True, 0.0, [], 0.0),
+            StudentRecord("A003", [12.0], [100.0], True, 0.0, [], 0.0),
+        ]
+        rows = grade_batch_threaded(records, max_workers=3, chunk_size=1)
+        assert [row.student_id for row in rows] == ["A001", "A002", "A003"]
+        assert rows[1].result is None and rows[1].error
+        assert rows[2].result["final_grade"] == 12.0
+
+    def test_shouldUseProvidedExecutor(self) -> None:
+        """Debe usar el pool del servidor anfitrión sin cerrarlo."""
+        records = generate_records(100, seed=1)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            rows = grade_batch_threaded(records, chunk_size=10, executor=pool)
+            assert pool.submit(len, records).result() == 100
+        assert rows == list(BatchGrader.grade(records))
+
+    def test_shouldReturnEmptyListForEmptyInput(self) -> None:
+        """Debe retornar una lista vacía si no hay registros."""
+        assert grade_batch_threaded([], max_workers=4) == []
+
+    def test_shouldRejectNonPositiveChunkSize(self) -> None:
+        """Debe rechazar bloques de tamaño menor a 1."""
+        with pytest.raises(ValueError):
+            grade_batch_threaded(generate_records(3), chunk_size=0)
+
+    def test_shouldStayDeterministicUnderConcurrentCallers(self) -> None:
+        """Debe dar resultados idénticos con muchos hilos llamando a la vez."""
+        records = generate_records(300, seed=7)
+        expected = list(BatchGrader.grade(records))
+        barrier = threading.Barrier(8)
+        outcomes = []
+
+        def caller() -> None:
+            barrier.wait()
+            for _ in range(3):
+                outcomes.append(
+                    grade_batch_threaded(records, max_workers=4, chunk_size=16)
+                    == expected
+                )
+
+        threads = [threading.Thread(target=caller) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert outcomes == [True] * 24
+
+
+class TestGradeBatchProcesses:
+    """Tests para grade_batch_processes."""
+
+    def test_shouldMatchSequentialResult(self) -> None:
+        """Debe producir el mismo resultado y orden que BatchGrader.grade."""
+        records = generate_records(200, seed=4)
+        rows = grade_batch_processes(records, max_workers=2, chunk_size=50)
+        assert rows == list(BatchGrader.grade(records))
+
+    def test_shouldReuseGivenProcessPool(self) -> None:
+        """Debe calcular varios lotes con el mismo pool de procesos."""
+        first = generate_records(120, seed=6)
+        second = generate_records(80, seed=7)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            rows = grade_batch_processes(first, chunk_size=50, executor=pool)
+            rows += grade_batch_processes(second, chunk_size=50, executor=pool)
+        assert rows == list(BatchGrader.grade(first + second))
+
+
+class TestGenerateRecords:
+    """Tests para generate_records."""
+
+    def test_shouldBeReproducibleForSameSeed(self) -> None:
+        """Debe generar los mismos registros con la misma semilla."""
+        first = list(BatchGrader.grade(generate_records(50, seed=5)))
+        second = list(BatchGrader.grade(generate_records(50, seed=5)))
+        assert first == second
+
+    def test_shouldGenerateValidRecords(self) -> None:
+        """Debe generar registros que se califican sin errores."""
+        rows = list(BatchGrader.grade(generate_records(200)))
+        assert len(rows) == 200
+        assert all(row.error is None for row in rows)
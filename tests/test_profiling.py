@@ -0,0 +1,121 @@
+"""Tests unitarios para el perfilado de ejecuciones."""
+
+import os
+import pstats
+import signal
+import threading
+import time
+import tracemalloc
+
+import src.batch.mmap_roster_reader as mmap_roster_reader
+import src.batch.pipeline as pipeline
+import src.calculator.grade_calculator as grade_calculator
+import src.models.weight_scheme as weight_scheme
+from src.batch.batch_grader import BatchGrader
+from src.batch.pipeline import run_batch
+from src.batch.roster_reader import ROSTER_HEADER, format_roster_line
+from src.batch.synthetic import generate_records
+from src.diagnostics.profiling import (
+    STAGE_COMPUTE,
+    STAGE_PARSE,
+    STAGE_VALIDATE,
+    STAGE_WRITE,
+    RunProfiler,
+    StageSampler,
+    format_report,
+    stage_of_file,
+)
+
+
+def _write_roster(tmp_path, count: int) -> str:
+    """Escribe un roster sintético y retorna su ruta."""
+    roster = tmp_path / "roster.csv"
+    lines = [format_roster_line(record) for record in generate_records(count)]
+    roster.write_text(ROSTER_HEADER + "\n" + "\n".join(lines) + "\n", encoding="utf-8")
+    return str(roster)
+
+
+def _grade_for(seconds: float) -> None:
+    """Calcula registros hasta consumir los segundos de CPU indicados."""
+    records = generate_records(500)
+    deadline = time.process_time() + seconds
+    while time.process_time() < deadline:
+        for _ in BatchGrader.grade(records):
+            pass
+
+
+class TestStageOfFile:
+    """Tests para la atribución de módulos a etapas."""
+
+    def test_shouldMapProjectModulesToStages(self) -> None:
+        """Debe asignar cada módulo del pipeline a su etapa."""
+        assert stage_of_file(mmap_roster_reader.__file__) == STAGE_PARSE
+        assert stage_of_file(weight_scheme.__file__) == STAGE_VALIDATE
+        assert stage_of_file(grade_calculator.__file__) == STAGE_COMPUTE
+        assert stage_of_file(pipeline.__file__) == STAGE_WRITE
+
+    def test_shouldIgnoreFilesOutsideTheProject(self) -> None:
+        """Debe retornar None para módulos ajenos al proyecto."""
+        assert stage_of_file(os.__file__) is None
+
+
+class TestRunProfiler:
+    """Tests para la clase RunProfiler."""
+
+    def test_shouldWritePstatsAndTextSummary(self, tmp_path) -> None:
+        """Debe guardar el perfil de cProfile y su resumen de texto."""
+        stats_path = str(tmp_path / "run.pstats")
+        with RunProfiler(profile_path=stats_path, top=5) as profiler:
+            list(BatchGrader.grade(generate_records(50)))
+
+        report = profiler.report
+        assert report.summary_path == str(tmp_path / "run.txt")
+        assert "cumulative" in open(report.summary_path, encoding="utf-8").read()
+        assert pstats.Stats(stats_path).total_calls > 0
+
+    def test_shouldAttributeSamplesToStages(self) -> None:
+        """Debe atribuir las muestras de pila a las etapas del cálculo."""
+        with RunProfiler(sample=True, sample_interval=0.001) as profiler:
+            _grade_for(0.3)
+
+        report = profiler.report
+        stages = {stage.stage: stage.samples for stage in report.stages}
+        assert report.total_samples > 0
+        assert stages.get(STAGE_COMPUTE, 0) + stages.get(STAGE_VALIDATE, 0) > 0
+        assert report.top_functions
+
+    def test_shouldRestoreSignalHandlerAfterSampling(self) -> None:
+        """Debe restaurar el manejador de SIGPROF al terminar."""
+        previous = signal.getsignal(signal.SIGPROF)
+        with RunProfiler(sample=True):
+            pass
+        assert signal.getsignal(signal.SIGPROF) == previous
+        assert signal.getitimer(signal.ITIMER_PROF) == (0.0, 0.0)
+
+    def test_shouldReportPeakMemoryPerStage(self, tmp_path) -> None:
+        """Debe reportar la memoria pico total y por etapa del lote."""
+        roster = _write_roster(tmp_path, 2000)
+        with RunProfiler(trace_memory=True) as profiler:
+            run_batch(roster, str(tmp_path / "results.csv"))
+
+        report = profiler.report
+        assert not tracemalloc.is_tracing()
+        assert report.peak_bytes > 0
+        assert any(stage.peak_bytes > 0 for stage in report.stages)
+        lines = format_report(report)
+        assert any(line.startswith("Memoria pico:") for line in lines)
+
+    def test_shouldBeDisabledWithoutModes(self) -> None:
+        """Debe indicar que no perfila si no se activó ningún modo."""
+        assert not RunProfiler().enabled
+        assert RunProfiler(sample=True).enabled
+
+
+class TestStageSampler:
+    """Tests para la clase StageSampler."""
+
+    def test_shouldSampleAnotherThreadOnDemand(self) -> None:
+        """Debe muestrear la pila del hilo indicado al llamar a sample."""
+        sampler = StageSampler(thread_id=threading.get_ident())
+        sampler.sample()
+        assert sum(sampler.samples.values()) == 1
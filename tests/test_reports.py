@@ -0,0 +1,115 @@
+"""Tests unitarios para los reportes por estudiante."""
+
+import pytest
+
+from src.batch.batch_grader import GradedRow
+from src.batch.reports import (
+    render_report,
+    safe_filename,
+    write_report_files,
+    write_reports_file,
+)
+from src.exceptions import ReportFileCollisionError
+from src.models.grade_result import GradeResult
+
+ROWS = [
+    GradedRow("A001", GradeResult(17.5, 16.5, 0.0, 1.0), None),
+    GradedRow("<b>A002</b>", None, "Pesos & notas inválidos"),
+    GradedRow("A003", GradeResult(14.85, 16.5, 1.65, 0.0), None),
+]
+
+
+class TestRenderReport:
+    """Tests para la función render_report."""
+
+    def test_shouldRenderSameLinesAsInteractiveMode(self) -> None:
+        """El reporte de texto debe mostrar el detalle como el modo interactivo."""
+        lines = render_report(ROWS[2]).splitlines()
+
+        assert "Estudiante: A003" in lines
+        assert "Promedio Ponderado: 16.5" in lines
+        assert "Penalización Aplicada: 1.65" in lines
+        assert "Puntos Extra Aplicados: 0.0" in lines
+        assert "NOTA FINAL: 14.85" in lines
+
+    def test_shouldEscapeHtml(self) -> None:
+        """El HTML debe escapar el identificador y el mensaje de error."""
+        section = render_report(ROWS[1], "html")
+
+        assert "&lt;b&gt;A002&lt;/b&gt;" in section
+        assert "Pesos &amp; notas inválidos" in section
+        assert "<b>" not in section
+
+    def test_shouldRejectUnknownFormat(self) -> None:
+        """Debe lanzar ValueError con un formato desconocido."""
+        with pytest.raises(ValueError):
+            render_report(ROWS[0], "pdf")
+
+
+class TestWriteReports:
+    """Tests para write_reports_file y write_report_files."""
+
+    def test_shouldStreamAllReportsIntoOneFile(self, tmp_path) -> None:
+        """Debe escribir un documento HTML con una sección por estudiante."""
+        output = tmp_path / "reportes.html"
+
+        summary = write_reports_file(ROWS, str(output), "html")
+
+        content = output.read_text(encoding="utf-8")
+        assert summary == (3, 1, 1)
+        assert content.startswith("<!DOCTYPE html>")
+        assert content.count('<section class="report') == 3
+        assert content.endswith("</html>\n")
+
+    def test_shouldWriteOneFilePerStudent(self, tmp_path) -> None:
+        """Debe escribir un archivo por estudiante con nombres seguros."""
+        directory = tmp_path / "reportes"
+        rows = ROWS * 1 + [
+            GradedRow(f"B{index:03d}", GradeResult(12.0, 12.0, 0.0, 0.0), None)
+            for index in range(20)
+        ]
+
+        summary = write_report_files(rows, str(directory), workers=3, group_size=4)
+
+        assert summary == (23, 1, 23)
+        assert len(list(directory.iterdir())) == 23
+        assert "NOTA FINAL: 17.5" in (directory / "A001.txt").read_text(encoding="utf-8")
+        assert (directory / (safe_filename("<b>A002</b>") + ".txt")).exists()
+
+    def test_shouldDisambiguateCollidingFilenames(self, tmp_path) -> None:
+        """IDs distintos que se sanean igual deben ir a archivos distintos."""
+        directory = tmp_path / "reportes"
+        result = GradeResult(12.0, 12.0, 0.0, 0.0)
+        rows = [GradedRow(student_id, result, None) for student_id in ("A/1", "A_1", "A 1")]
+
+        summary = write_report_files(rows, str(directory), group_size=1)
+
+        assert summary == (3, 0, 3)
+        assert len(list(directory.iterdir())) == 3
+        assert (directory / "A_1.txt").exists()
+
+    def test_shouldRejectDuplicateStudentIds(self, tmp_path) -> None:
+        """Un student_id repetido no debe sobrescribir el reporte anterior."""
+        result = GradeResult(12.0, 12.0, 0.0, 0.0)
+        rows = [GradedRow("A001", result, None), GradedRow("".join(["A", "001"]), result, None)]
+
+        with pytest.raises(ReportFileCollisionError):
+            write_report_files(rows, str(tmp_path / "reportes"))
+
+    def test_shouldPropagateWriteErrors(self, tmp_path) -> None:
+        """Un error al escribir un archivo debe llegar al llamador."""
+        directory = tmp_path / "reportes"
+        directory.mkdir()
+        (directory / "A001.txt").mkdir()
+
+        with pytest.raises(OSError):
+            write_report_files(ROWS, str(directory), group_size=1)
+
+    def test_shouldSanitizeFilenames(self) -> None:
+        """Debe quitar separadores de ruta y nombres especiales."""
+        assert safe_filename("A001") == "A001"
+        assert safe_filename("Ñandú-02.b") == "Ñandú-02.b"
+        assert safe_filename("../etc/passwd").startswith(".._etc_passwd-")
+        assert safe_filename("..").startswith("_..-")
+        assert safe_filename("Ñandú 02").startswith("Ñandú_02-")
+        assert safe_filename("A/1") != safe_filename("A 1")
@@ -0,0 +1,136 @@
+"""Tests unitarios para la comparación de archivos de resultados."""
+
+import pytest
+
+from src.batch.batch_grader import GradedRow
+from src.batch.pipeline import write_results_csv
+from src.batch.result_diff import (
+    CHANGE_ADDED,
+    CHANGE_CHANGED,
+    CHANGE_REMOVED,
+    DIFF_HEADER,
+    ResultChange,
+    diff_results,
+    write_result_diff,
+)
+from src.batch.result_format import write_results_binary
+from src.exceptions import InvalidResultFileError
+
+
+def _row(student_id: str, final_grade: float) -> GradedRow:
+    """Crea una fila calificada con la nota final indicada."""
+    result = {
+        "final_grade": final_grade,
+        "weighted_average": final_grade,
+        "penalty_applied": 0.0,
+        "extra_points_applied": 0.0,
+    }
+    return GradedRow(student_id, result, None)
+
+
+def _rows(count: int) -> list:
+    """Crea count filas con notas distintas."""
+    return [_row(f"A{index:05d}", float(index % 20)) for index in range(count)]
+
+
+def _write(rows, path, binary: bool) -> str:
+    """Escribe las filas en CSV o binario y retorna la ruta."""
+    if binary:
+        write_results_binary(rows, str(path))
+    else:
+        with open(path, "w", encoding="utf-8") as output:
+            write_results_csv(rows, output)
+    return str(path)
+
+
+def _diff(old_path: str, new_path: str, **kwargs):
+    """Ejecuta diff_results y retorna (resumen, cambios)."""
+    changes = []
+    summary = diff_results(old_path, new_path, changes.append, **kwargs)
+    return summary, changes
+
+
+class TestDiffResults:
+    """Tests para la función diff_results."""
+
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_shouldSkipIdenticalBlocks(self, tmp_path, binary: bool) -> None:
+        """Debe revisar fila por fila solo los bloques con hash distinto."""
+        old_rows = _rows(1000)
+        new_rows = list(old_rows)
+        new_rows[250] = _row("A00250", 19.5)
+        new_rows[900] = GradedRow("A00900", None, "Nota inválida")
+        old_path = _write(old_rows, tmp_path / "old", binary)
+        new_path = _write(new_rows, tmp_path / "new", binary)
+
+        summary, changes = _diff(old_path, new_path, block_size=100)
+
+        assert summary.aligned
+        assert summary.skipped_blocks == 8
+        assert summary.total_blocks == 10
+        assert (summary.unchanged, summary.changed) == (998, 2)
+        assert changes == [
+            ResultChange("A00250", CHANGE_CHANGED, 10.0, 19.5),
+            ResultChange("A00900", CHANGE_CHANGED, 0.0, None),
+        ]
+        assert changes[0].delta == 9.5
+        assert changes[1].delta is None
+
+    def test_shouldMergeJoinWhenRowsAreNotAligned(self, tmp_path) -> None:
+        """Debe detectar filas agregadas y quitadas aunque cambie el orden."""
+        old_rows = [_row("A3", 12.0), _row("A1", 10.0), _row("A2", 11.0)]
+        new_rows = [_row("A4", 14.0), _row("A2", 11.0), _row("A1", 15.0)]
+        old_path = _write(old_rows, tmp_path / "old.csv", binary=False)
+        new_path = _write(new_rows, tmp_path / "new.bin", binary=True)
+
+        summary, changes = _diff(old_path, new_path, max_in_memory=1)
+
+        assert not summary.aligned
+        assert (summary.old_rows, summary.new_rows) == (3, 3)
+        assert (summary.unchanged, summary.changed) == (1, 1)
+        assert (summary.added, summary.removed) == (1, 1)
+        assert changes == [
+            ResultChange("A1", CHANGE_CHANGED, 10.0, 15.0),
+            ResultChange("A3", CHANGE_REMOVED, 12.0, None),
+            ResultChange("A4", CHANGE_ADDED, None, 14.0),
+        ]
+
+    def test_shouldTreatErrorRowsAsEqual(self, tmp_path) -> None:
+        """Una fila con error en ambos lados no debe contarse como cambio."""
+        rows = [GradedRow("A1", None, "uno"), _row("A2", 10.0)]
+        changed_error = [GradedRow("A1", None, "otro"), _row("A2", 10.0)]
+        old_path = _write(rows, tmp_path / "old.csv", binary=False)
+        new_path = _write(changed_error, tmp_path / "new.csv", binary=False)
+
+        summary, changes = _diff(old_path, new_path)
+
+        assert summary.differences == 0
+        assert changes == []
+
+    def test_shouldRejectInvalidGrades(self, tmp_path) -> None:
+        """Debe lanzar InvalidResultFileError si una nota no es numérica."""
+        old_path = tmp_path / "old.csv"
+        old_path.write_text("student_id,final_grade\nA1,abc\n", encoding="utf-8")
+        new_path = tmp_path / "new.csv"
+        new_path.write_text("student_id,final_grade\nA2,10.0\n", encoding="utf-8")
+
+        with pytest.raises(InvalidResultFileError):
+            _diff(str(old_path), str(new_path))
+
+
+class TestWriteResultDiff:
+    """Tests para la función write_result_diff."""
+
+    def test_shouldWriteOnlyChangedRows(self, tmp_path) -> None:
+        """Debe escribir el encabezado y una fila por cambio."""
+        old_path = _write([_row("A1", 10.0), _row("A2", 11.0)], tmp_path / "o.csv", False)
+        new_path = _write([_row("A1", 10.0), _row("A2", 12.5)], tmp_path / "n.csv", False)
+        output = tmp_path / "cambios.csv"
+
+        summary = write_result_diff(old_path, new_path, str(output))
+
+        assert summary.changed == 1
+        assert output.read_text(encoding="utf-8").splitlines() == [
+            DIFF_HEADER,
+            "A2,changed,11.0,12.5,1.5",
+        ]
@@ -0,0 +1,108 @@
+"""Tests unitarios para el formato binario de resultados."""
+
+import math
+
+import pytest
+
+from src.batch.batch_grader import GradedRow
+from src.batch.result_format import (
+    ResultReader,
+    ResultWriter,
+    is_result_binary,
+    write_results_binary,
+)
+from src.exceptions import InvalidResultFileError
+
+
+def _ok(student_id: str, final_grade: float) -> GradedRow:
+    """Crea una fila calculada."""
+    return GradedRow(
+        student_id,
+        {
+            "final_grade": final_grade,
+            "weighted_average": final_grade,
+            "penalty_applied": 0.0,
+            "extra_points_applied": 0.0,
+        },
+        None,
+    )
+
+
+ROWS = [
+    _ok("A001", 15.3),
+    GradedRow("A002", None, "La suma de los pesos debe ser 100.0%"),
+    _ok("Ñ003", 20.0),
+]
+
+
+class TestResultFormat:
+    """Tests para ResultWriter y ResultReader."""
+
+    def test_shouldRoundTripRows(self, tmp_path) -> None:
+        """Debe leer exactamente las filas escritas, incluidas las de error."""
+        path = tmp_path / "results.grs"
+        assert write_results_binary(ROWS, str(path)) == (3, 1)
+
+        assert is_result_binary(str(path))
+        with ResultReader(str(path)) as reader:
+            assert len(reader) == 3
+            assert list(reader.rows()) == ROWS
+
+    def test_shouldReadSingleColumn(self, tmp_path) -> None:
+        """Debe exponer cada columna numérica de forma independiente."""
+        path = tmp_path / "results.grs"
+        write_results_binary(ROWS, str(path))
+
+        with ResultReader(str(path)) as reader:
+            final_grades = reader.column("final_grade")
+            assert final_grades[0] == 15.3
+            assert math.isnan(final_grades[1])
+            assert list(reader.column("status")) == [0, 1, 0]
+            with pytest.raises(KeyError):
+                reader.column("unknown")
+
+    def test_shouldStreamAcrossSeveralBlocks(self, tmp_path) -> None:
+        """Debe producir el mismo archivo sin importar el tamaño de bloque."""
+        rows = [_ok(f"S{i:05d}", i % 21) for i in range(1000)]
+        small = tmp_path / "small.grs"
+        large = tmp_path / "large.grs"
+        with ResultWriter(str(small), block_size=7) as writer:
+            writer.write_rows(rows)
+        write_results_binary(rows, str(large))
+
+        assert small.read_bytes() == large.read_bytes()
+        with ResultReader(str(small)) as reader:
+            assert reader.student_ids[999] == "S00999"
+            assert reader.row(500) == rows[500]
+
+    def test_shouldNotPublishFileWhenWriterFails(self, tmp_path) -> None:
+        """No debe dejar un archivo parcial si la escritura falla."""
+        path = tmp_path / "results.grs"
+        with pytest.raises(RuntimeError):
+            with ResultWriter(str(path)) as writer:
+                writer.write(ROWS[0])
+                raise RuntimeError("fallo")
+        assert not path.exists()
+
+    def test_shouldRejectInvalidFiles(self, tmp_path) -> None:
+        """Debe rechazar archivos truncados o con otro formato."""
+        path = tmp_path / "results.grs"
+        write_results_binary(ROWS, str(path))
+        truncated = tmp_path / "truncated.grs"
+        truncated.write_bytes(path.read_bytes()[:-1])
+        garbage = tmp_path / "garbage.grs"
+        garbage.write_bytes(b"x" * 64)
+
+        with pytest.raises(InvalidResultFileError):
+            ResultReader(str(truncated))
+        with pytest.raises(InvalidResultFileError):
+            ResultReader(str(garbage))
+        assert not is_result_binary(str(garbage))
+
+    def test_shouldHandleEmptyResults(self, tmp_path) -> None:
+        """Debe soportar un archivo sin filas."""
+        path = tmp_path / "empty.grs"
+        write_results_binary([], str(path))
+        with ResultReader(str(path)) as reader:
+            assert len(reader) == 0
+            assert list(reader.rows()) == []
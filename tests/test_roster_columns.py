@@ -0,0 +1,98 @@
+"""Tests unitarios para el roster columnar y su formato binario."""
+
+import struct
+
+import pytest
+
+from src.batch.roster_columns import (
+    ROSTER_HEADER,
+    RosterColumns,
+    is_roster_binary,
+    read_roster_binary,
+    write_roster_binary,
+)
+from src.exceptions import InvalidRosterError
+from src.models.student_record import StudentRecord
+
+RECORDS = [
+    StudentRecord("A001", [15.0, 18.0], [50.0, 50.0], True, 0.0, [True, True], 1.0),
+    StudentRecord("B-é", [], [], False, 45.5, [], 0.0),
+    StudentRecord("C003", [20.0], [100.0], False, 10.0, [True, False], 3.0),
+]
+
+
+class TestRosterColumns:
+    """Tests para la clase RosterColumns."""
+
+    def test_shouldMaterializeRecordsFromColumns(self) -> None:
+        """Debe reconstruir cada registro desde las columnas."""
+        columns = RosterColumns.from_records(RECORDS)
+        assert len(columns) == 3
+        record = columns.record(2)
+        assert record.student_id == "C003"
+        assert record.grades == (20.0,)
+        assert record.all_years_teachers == (True, False)
+        assert columns.record(1).grades == ()
+
+    def test_shouldRoundTripBinaryFormat(self, tmp_path) -> None:
+        """Debe leer del binario exactamente lo que se escribió."""
+        path = tmp_path / "roster.grr"
+        write_roster_binary(RosterColumns.from_records(RECORDS), str(path))
+
+        assert is_roster_binary(str(path))
+        with read_roster_binary(str(path)) as columns:
+            assert list(columns.student_ids) == ["A001", "B-é", "C003"]
+            assert list(columns.grades) == [15.0, 18.0, 20.0]
+            assert list(columns.tardiness_percentages) == [0.0, 45.5, 10.0]
+            assert columns.record(0).all_years_teachers == (True, True)
+            assert columns.record(2).extra_points == 3.0
+
+    def test_shouldRoundTripEmptyRoster(self, tmp_path) -> None:
+        """Debe soportar un roster sin filas."""
+        path = tmp_path / "empty.grr"
+        write_roster_binary(RosterColumns.from_records([]), str(path))
+        with read_roster_binary(str(path)) as columns:
+            assert len(columns) == 0
+
+    def test_shouldRejectInvalidBinaryFile(self, tmp_path) -> None:
+        """Debe rechazar archivos truncados o sin el magic correcto."""
+        path = tmp_path / "roster.grr"
+        write_roster_binary(RosterColumns.from_records(RECORDS), str(path))
+        truncated = tmp_path / "truncated.grr"
+        truncated.write_bytes(path.read_bytes()[:-1])
+        garbage = tmp_path / "garbage.grr"
+        garbage.write_bytes(b"x" * 64)
+
+        with pytest.raises(InvalidRosterError):
+            read_roster_binary(str(truncated))
+        with pytest.raises(InvalidRosterError):
+            read_roster_binary(str(garbage))
+        assert not is_roster_binary(str(garbage))
+
+    def test_shouldRejectCorruptOffsets(self, tmp_path) -> None:
+        """Debe rechazar offsets fuera de rango, decrecientes o sin empezar en 0."""
+        path = tmp_path / "roster.grr"
+        write_roster_binary(RosterColumns.from_records(RECORDS), str(path))
+        original = path.read_bytes()
+        id_offsets = ROSTER_HEADER.size
+        eval_offsets = id_offsets + 8 * (len(RECORDS) + 1)
+        vote_offsets = eval_offsets + 8 * (len(RECORDS) + 1)
+
+        for position, value in (
+            (id_offsets + 8, 1 << 40),
+            (eval_offsets + 8, 3),
+            (vote_offsets, 1),
+            (vote_offsets + 8 * len(RECORDS), 3),
+        ):
+            corrupt = bytearray(original)
+            struct.pack_into("<q", corrupt, position, value)
+            path.write_bytes(bytes(corrupt))
+            with pytest.raises(InvalidRosterError, match="Offsets"):
+                read_roster_binary(str(path))
+
+    def test_shouldRejectMismatchedGradesAndWeights(self) -> None:
+        """Debe rechazar filas con distinta cantidad de notas y pesos."""
+        with pytest.raises(InvalidRosterError):
+            RosterColumns.from_records(
+                [StudentRecord("A001", [15.0, 18.0], [100.0], True, 0.0, [], 0.0)]
+            )
@@ -0,0 +1,73 @@
+"""Tests unitarios para la lectura de rosters CSV."""
+
+import pytest
+
+from src.batch.roster_reader import (
+    ROSTER_HEADER,
+    format_roster_line,
+    parse_roster_line,
+    parse_roster_lines,
+    read_roster_csv,
+)
+from src.exceptions import InvalidRosterError
+
+
+class TestRosterReader:
+    """Tests para las funciones de lectura de rosters."""
+
+    def test_shouldParseCompleteRow(self) -> None:
+        """Debe convertir una fila completa en un registro."""
+        record = parse_roster_line("A001,n,45,ss,1.5,15:30;18:40;12:30")
+        assert record.student_id == "A001"
+        assert record.has_reached_minimum is False
+        assert record.tardiness_percentage == 45.0
+        assert record.all_years_teachers == (True, True)
+        assert record.extra_points == 1.5
+        assert record.grades == (15.0, 18.0, 12.0)
+        assert record.weights == (30.0, 40.0, 30.0)
+
+    def test_shouldParseRowWithoutVotesOrEvaluations(self) -> None:
+        """Debe aceptar votos y evaluaciones vacíos."""
+        record = parse_roster_line("A002,s,0,,0,")
+        assert record.all_years_teachers == ()
+        assert record.grades == ()
+
+    def test_shouldSkipHeaderCommentsAndBlankLines(self) -> None:
+        """Debe ignorar cabecera, comentarios y líneas vacías."""
+        lines = [ROSTER_HEADER + "\n", "# comentario\n", "\n", "A001,s,0,s,0,20:100\n"]
+        records = list(parse_roster_lines(lines))
+        assert len(records) == 1
+        assert records[0].student_id == "A001"
+
+    def test_shouldRaiseErrorWhenFieldCountIsWrong(self) -> None:
+        """Debe lanzar error cuando la fila no tiene 6 campos."""
+        with pytest.raises(InvalidRosterError):
+            parse_roster_line("A001,s,0,s", line_number=3)
+
+    def test_shouldRaiseErrorWhenValuesAreMalformed(self) -> None:
+        """Debe lanzar error con valores no numéricos o flags inválidos."""
+        with pytest.raises(InvalidRosterError):
+            parse_roster_line("A001,x,0,s,0,20:100")
+        with pytest.raises(InvalidRosterError):
+            parse_roster_line("A001,s,abc,s,0,20:100")
+        with pytest.raises(InvalidRosterError):
+            parse_roster_line("A001,s,0,s,0,20-100")
+
+    def test_shouldRoundTripFormattedLine(self) -> None:
+        """Debe reconstruir el mismo registro a partir de la fila formateada."""
+        original = parse_roster_line("A001,n,45.5,sn,2,15.25:30;18:70")
+        parsed = parse_roster_line(format_roster_line(original))
+        assert parsed.grades == original.grades
+        assert parsed.weights == original.weights
+        assert parsed.all_years_teachers == original.all_years_teachers
+        assert parsed.tardiness_percentage == original.tardiness_percentage
+
+    def test_shouldReadRosterFile(self, tmp_path) -> None:
+        """Debe leer todos los registros de un archivo."""
+        roster = tmp_path / "roster.csv"
+        roster.write_text(
+            ROSTER_HEADER + "\nA001,s,0,s,0,20:100\nA002,s,0,s,0,10:100\n",
+            encoding="utf-8",
+        )
+        records = list(read_roster_csv(str(roster)))
+        assert [record.student_id for record in records] == ["A001", "A002"]
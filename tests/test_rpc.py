@@ -0,0 +1,129 @@
+"""Tests unitarios para el modo RPC por JSON Lines."""
+
+import io
+import json
+
+from src.service.rpc import handle_line, handle_request, serve
+
+PARAMS = {
+    "grades": [15.0, 18.0],
+    "weights": [50.0, 50.0],
+    "has_reached_minimum": True,
+    "all_years_teachers": [True],
+    "extra_points": 1.0,
+}
+
+
+def _decode(line: bytes):
+    """Decodifica una línea de respuesta."""
+    assert line.endswith(b"\n")
+    return json.loads(line)
+
+
+class TestHandleRequest:
+    """Tests para la función handle_request."""
+
+    def test_shouldCalculateFinalGrade(self) -> None:
+        """Debe calcular la nota y repetir id y student_id."""
+        response = handle_request(
+            {"id": 7, "method": "calculate", "params": dict(PARAMS, student_id="A001")}
+        )
+
+        assert response == {
+            "id": 7,
+            "result": {
+                "final_grade": 17.5,
+                "weighted_average": 16.5,
+                "penalty_applied": 0.0,
+                "extra_points_applied": 1.0,
+            },
+            "student_id": "A001",
+        }
+
+    def test_shouldReportCalculatorErrorsByType(self) -> None:
+        """Debe reportar la excepción de GradeCalculatorError por su nombre."""
+        response = handle_request({"id": 1, "params": dict(PARAMS, weights=[50.0, 40.0])})
+
+        assert response["id"] == 1
+        assert response["error"]["type"] == "InvalidWeightError"
+        assert "100" in response["error"]["message"]
+
+    def test_shouldRejectMalformedRequests(self) -> None:
+        """Debe responder InvalidRpcRequestError ante solicitudes mal formadas."""
+        malformed = [
+            {"id": 1, "method": "borrar"},
+            {"id": 2},
+            {"id": 3, "params": dict(PARAMS, grades="15")},
+            {"id": 4, "params": dict(PARAMS, grades=[15.0])},
+            {"id": 5, "params": dict(PARAMS, has_reached_minimum="s")},
+            {"id": 6, "params": dict(PARAMS, extra_points=True)},
+            "calculate",
+        ]
+
+        for request in malformed:
+            error = handle_request(request)["error"]
+            assert error["type"] == "InvalidRpcRequestError", request
+
+    def test_shouldRejectNonFiniteNumbers(self) -> None:
+        """Debe rechazar números que no caben en un float finito."""
+        for grade in (10**400, float("inf"), float("nan")):
+            error = handle_request({"id": 1, "params": dict(PARAMS, grades=[grade, 15.0])})
+            assert error["error"]["type"] == "InvalidRpcRequestError"
+
+        response = handle_request({"id": float("inf"), "method": "ping"})
+        assert response["id"] is None
+        assert response["error"]["type"] == "InvalidRpcRequestError"
+
+    def test_shouldAnswerPing(self) -> None:
+        """Debe responder pong al método ping."""
+        assert handle_request({"id": "x", "method": "ping"}) == {"id": "x", "result": "pong"}
+
+
+class TestHandleLine:
+    """Tests para la función handle_line."""
+
+    def test_shouldAnswerBatchInOrder(self) -> None:
+        """Un arreglo de solicitudes debe responderse con un arreglo en orden."""
+        line = json.dumps([{"id": 1, "params": PARAMS}, {"id": 2, "method": "ping"}])
+
+        responses = _decode(handle_line(line.encode("utf-8")))
+
+        assert [response["id"] for response in responses] == [1, 2]
+        assert responses[0]["result"]["final_grade"] == 17.5
+
+    def test_shouldReportInvalidJson(self) -> None:
+        """Una línea que no es JSON debe responderse con un error sin id."""
+        response = _decode(handle_line(b"{no es json"))
+
+        assert response["id"] is None
+        assert response["error"]["type"] == "InvalidRpcRequestError"
+
+    def test_shouldRejectNonStandardJson(self) -> None:
+        """NaN, Infinity, 1e400 y el anidamiento excesivo deben responderse con error."""
+        lines = [
+            b'{"id":1,"method":"ping","x":NaN}',
+            b'{"id":-Infinity,"method":"ping"}',
+            b'{"id":1e400,"method":"ping"}',
+            b"[" * 100000,
+        ]
+
+        for line in lines:
+            response = _decode(handle_line(line))
+            assert response["error"]["type"] == "InvalidRpcRequestError", line
+            assert response["id"] is None
+
+
+class TestServe:
+    """Tests para la función serve."""
+
+    def test_shouldAnswerEveryLineUntilEndOfInput(self) -> None:
+        """Debe responder una línea por solicitud, incluida la última sin salto."""
+        requests = [json.dumps({"id": index, "params": PARAMS}) for index in range(3)]
+        source = io.BytesIO(("\n".join(requests) + "\n\n" + '{"id":9,"method":"ping"}').encode())
+        output = io.BytesIO()
+
+        handled = serve(source, output)
+
+        lines = output.getvalue().splitlines()
+        assert handled == 4
+        assert [json.loads(line)["id"] for line in lines] == [0, 1, 2, 9]
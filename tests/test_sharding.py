@@ -0,0 +1,142 @@
+"""Tests unitarios para el cálculo por lotes particionado."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.batch.pipeline import run_batch
+from src.batch.sharding import (
+    MANIFEST_NAME,
+    STATUS_DONE,
+    STATUS_FAILED,
+    ShardManifest,
+    merge_shards,
+    run_shards,
+    partition_roster,
+    run_sharded_batch,
+    run_shard_worker,
+    shard_for,
+)
+from src.exceptions import ShardingError
+
+
+def _write_roster(tmp_path, rows: int = 40) -> str:
+    """Escribe un roster de prueba y retorna su ruta."""
+    lines = [
+        f"S{index:04d},{'s' if index % 4 else 'n'},{index % 90},s,{index % 3},"
+        f"{index % 21}:50;{(index * 3) % 21}:50"
+        for index in range(rows)
+    ]
+    roster = tmp_path / "roster.csv"
+    roster.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(roster)
+
+
+class TestSharding:
+    """Tests para la partición, ejecución y combinación de fragmentos."""
+
+    def test_shouldAssignStableShards(self) -> None:
+        """El fragmento de un estudiante no debe depender del proceso."""
+        assert shard_for("S0001", 8) == shard_for("S0001", 8)
+        assert 0 <= shard_for("S0001", 8) < 8
+        assert len({shard_for(f"S{index}", 4) for index in range(100)}) == 4
+
+    def test_shouldPartitionEveryRowExactlyOnce(self, tmp_path) -> None:
+        """Cada fila debe quedar en un único fragmento."""
+        manifest = partition_roster(_write_roster(tmp_path), str(tmp_path / "work"), 3)
+        assert sum(shard["rows"] for shard in manifest.shards) == 40
+        assert ShardManifest.load(manifest.path).data == manifest.data
+
+    def test_shouldMergeInRosterOrderLikeSingleRun(self, tmp_path) -> None:
+        """La salida combinada debe ser idéntica a la de un lote sin particionar."""
+        roster = _write_roster(tmp_path)
+        expected = tmp_path / "expected.csv"
+        single = run_batch(roster, str(expected))
+
+        manifest = partition_roster(roster, str(tmp_path / "work"), 3)
+        for index in range(3):
+            run_shard_worker(manifest.path, index)
+            manifest.shards[index]["status"] = STATUS_DONE
+        output = tmp_path / "merged.csv"
+        statistics = merge_shards(manifest, str(output))
+
+        assert output.read_bytes() == expected.read_bytes()
+        assert statistics.total_rows == single.statistics.total_rows
+        assert statistics.passed == single.statistics.passed
+        assert statistics.mean == pytest.approx(single.statistics.mean)
+
+    def test_shouldRefuseToMergePendingShards(self, tmp_path) -> None:
+        """No debe combinar si algún fragmento no terminó."""
+        manifest = partition_roster(_write_roster(tmp_path), str(tmp_path / "work"), 2)
+        with pytest.raises(ShardingError):
+            merge_shards(manifest, str(tmp_path / "merged.csv"))
+
+    def test_shouldRunShardsAsProcessesAndRerunSingleFailedShard(self, tmp_path) -> None:
+        """Debe ejecutar procesos por fragmento y reprocesar solo el fallido."""
+        roster = _write_roster(tmp_path)
+        expected = tmp_path / "expected.csv"
+        run_batch(roster, str(expected))
+        output = tmp_path / "merged.csv"
+        work_dir = tmp_path / "work"
+
+        summary = run_sharded_batch(roster, str(output), 3, work_dir=str(work_dir))
+        assert summary.failed_shards == []
+        assert output.read_bytes() == expected.read_bytes()
+
+        # Simula la falla de un nodo: se pierde la salida del fragmento 1
+        manifest = ShardManifest.load(os.path.join(str(work_dir), MANIFEST_NAME))
+        os.remove(manifest.shards[1]["output"])
+        manifest.shards[1]["status"] = STATUS_FAILED
+        manifest.save()
+        output.unlink()
+
+        summary = run_sharded_batch(
+            roster, str(output), 3, work_dir=str(work_dir), only=1
+        )
+        assert summary.failed_shards == []
+        assert output.read_bytes() == expected.read_bytes()
+
+    def test_shouldRefillSlotWhenAnyShardFinishes(self, tmp_path) -> None:
+        """Un fragmento lento no debe bloquear el lanzamiento de los siguientes."""
+        manifest = partition_roster(_write_roster(tmp_path), str(tmp_path / "work"), 3)
+        launched = []
+
+        class _FakeProcess:
+            """Proceso simulado que registra su lanzamiento."""
+
+            def __init__(self, command, **kwargs) -> None:
+                """Registra el índice del fragmento lanzado."""
+                self.index = int(command[-1])
+                launched.append(self.index)
+
+            def poll(self):
+                """Retorna el código de salida, o None si sigue corriendo."""
+                # El fragmento 0 termina solo después de lanzado el 2
+                if self.index == 0 and 2 not in launched:
+                    return None
+                return 0
+
+        with patch("src.batch.sharding.subprocess.Popen", _FakeProcess):
+            assert run_shards(manifest, [0, 1, 2], max_parallel=2) == []
+
+        assert launched == [0, 1, 2]
+        assert manifest.pending_shards() == []
+
+    def test_shouldRepartitionWhenDedupOptionChanges(self, tmp_path) -> None:
+        """Un manifiesto creado sin --dedup no debe reutilizarse con --dedup."""
+        roster = _write_roster(tmp_path)
+        output = tmp_path / "merged.csv"
+        work_dir = str(tmp_path / "work")
+        run_sharded_batch(roster, str(output), 2, work_dir=work_dir)
+
+        run_sharded_batch(roster, str(output), 2, work_dir=work_dir, deduplicate=True)
+        manifest = ShardManifest.load(os.path.join(work_dir, MANIFEST_NAME))
+        assert manifest.data["deduplicate"] is True
+
+    def test_shouldRejectUnknownShardIndex(self, tmp_path) -> None:
+        """Debe rechazar un índice de fragmento fuera de rango."""
+        with pytest.raises(ShardingError):
+            run_sharded_batch(
+                _write_roster(tmp_path), str(tmp_path / "out.csv"), 2, only=5
+            )
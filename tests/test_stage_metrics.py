@@ -0,0 +1,93 @@
+"""Tests unitarios para los contadores por etapa del pipeline."""
+
+import io
+import threading
+import time
+
+from src.diagnostics.stage_metrics import (
+    STAGE_COMPUTE,
+    STAGE_PARSE,
+    STAGE_WRITE,
+    PipelineTracer,
+    StageQueue,
+    format_progress,
+    format_summary,
+)
+
+
+def _slow(items, seconds: float):
+    """Produce los elementos esperando antes de cada uno."""
+    for item in items:
+        time.sleep(seconds)
+        yield item
+
+
+class TestPipelineTracer:
+    """Tests para la clase PipelineTracer."""
+
+    def test_shouldAttributeExclusiveTimeToEachStage(self) -> None:
+        """Cada etapa debe medir solo su propio tiempo, no el de sus fuentes."""
+        tracer = PipelineTracer()
+        records = tracer.iterate(STAGE_PARSE, _slow(range(5), 0.02))
+        rows = tracer.iterate(STAGE_COMPUTE, (value * 2 for value in records))
+
+        assert list(tracer.count(STAGE_WRITE, rows)) == [0, 2, 4, 6, 8]
+        parse = tracer.timers[STAGE_PARSE]
+        compute = tracer.timers[STAGE_COMPUTE]
+        assert parse.rows == compute.rows == tracer.timers[STAGE_WRITE].rows == 5
+        assert parse.wall_seconds >= 0.09
+        assert compute.wall_seconds < parse.wall_seconds / 4
+
+    def test_shouldCountSleepAsBlockedTime(self) -> None:
+        """El tiempo sin CPU debe contarse como bloqueado."""
+        tracer = PipelineTracer()
+        list(tracer.iterate(STAGE_PARSE, _slow(range(3), 0.02)))
+
+        parse = tracer.timers[STAGE_PARSE]
+        assert parse.blocked_seconds >= 0.05
+        assert parse.cpu_seconds < parse.wall_seconds
+
+    def test_shouldPrintProgressLines(self) -> None:
+        """Debe imprimir líneas de progreso con el intervalo indicado."""
+        stream = io.StringIO()
+        tracer = PipelineTracer(progress_interval=0.0, stream=stream, total_rows=4096)
+        for _ in tracer.iterate(STAGE_PARSE, range(4096)):
+            pass
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 4
+        assert "filas/s" in lines[0] and "parse" in lines[0]
+
+    def test_shouldFormatSummaryPerStage(self) -> None:
+        """El resumen debe tener una línea por etapa."""
+        tracer = PipelineTracer()
+        list(tracer.iterate(STAGE_PARSE, range(10)))
+
+        lines = format_summary(tracer.report())
+        assert any(line.startswith("parse") and " 10 " in line for line in lines)
+        assert len(lines) == 2 + 3
+
+
+class TestStageQueue:
+    """Tests para la clase StageQueue."""
+
+    def test_shouldDeliverRowsInOrderAndMeasureOccupancy(self) -> None:
+        """Debe entregar las filas en orden y registrar la ocupación."""
+        tracer = PipelineTracer()
+        stage_queue = StageQueue(2, tracer)
+        received = []
+        consumer = threading.Thread(
+            target=lambda: received.extend(_slow(stage_queue.rows(), 0.001))
+        )
+        consumer.start()
+        for start in range(0, 30, 3):
+            stage_queue.put([start, start + 1, start + 2], consumer)
+        stage_queue.close(consumer)
+        consumer.join()
+
+        assert received == list(range(30))
+        (stats,) = tracer.report().queues
+        assert stats.puts == 10
+        assert stats.max_occupancy <= 2
+        assert stats.put_wait_seconds > 0
+        assert "cola compute->write" in format_progress(tracer.report())
@@ -0,0 +1,89 @@
+"""Tests unitarios para las estadísticas incrementales."""
+
+import statistics as reference
+
+import pytest
+
+from src.batch.batch_grader import GradedRow
+from src.batch.statistics import GradeStatistics
+
+
+def _row(final_grade: float, penalty: float = 0.0, extra: float = 0.0) -> GradedRow:
+    """Crea una fila calculada."""
+    return GradedRow(
+        "S",
+        {
+            "final_grade": final_grade,
+            "weighted_average": final_grade,
+            "penalty_applied": penalty,
+            "extra_points_applied": extra,
+        },
+        None,
+    )
+
+
+GRADES = [15.3, 8.0, 10.5, 20.0, 12.25, 0.0, 17.75]
+
+
+class TestGradeStatistics:
+    """Tests para la clase GradeStatistics."""
+
+    def test_shouldAccumulateCountsAndMoments(self) -> None:
+        """Debe calcular conteos, media, varianza y extremos."""
+        statistics = GradeStatistics(passing_grade=10.5)
+        for grade in GRADES:
+            statistics.add(_row(grade))
+        statistics.add(_row(14.0, penalty=1.5, extra=1.0))
+        statistics.add(GradedRow("S", None, "error"))
+
+        values = GRADES + [14.0]
+        assert statistics.total_rows == 9
+        assert statistics.error_rows == 1
+        assert statistics.graded_rows == 8
+        assert statistics.mean == pytest.approx(reference.fmean(values))
+        assert statistics.variance == pytest.approx(reference.pvariance(values))
+        assert statistics.minimum == 0.0
+        assert statistics.maximum == 20.0
+        assert statistics.passed == 6
+        assert statistics.penalized == 1
+        assert statistics.with_extra_points == 1
+
+    def test_shouldMergePartialAccumulators(self) -> None:
+        """La combinación de acumuladores parciales debe igualar al total."""
+        total = GradeStatistics()
+        first = GradeStatistics()
+        second = GradeStatistics()
+        for index, grade in enumerate(GRADES):
+            total.add(_row(grade))
+            (first if index < 3 else second).add(_row(grade))
+
+        first.merge(second)
+        assert first.total_rows == total.total_rows
+        assert first.mean == pytest.approx(total.mean)
+        assert first.variance == pytest.approx(total.variance)
+        assert (first.minimum, first.maximum) == (total.minimum, total.maximum)
+
+    def test_shouldCountPassedOnlyWithPassingGrade(self) -> None:
+        """Sin nota aprobatoria no debe contar aprobados."""
+        statistics = GradeStatistics()
+        statistics.add(_row(20.0))
+
+        assert statistics.passed == 0
+        with pytest.raises(ValueError):
+            statistics.merge(GradeStatistics(passing_grade=10.5))
+
+    def test_shouldMergeEmptyAccumulator(self) -> None:
+        """Combinar con un acumulador vacío no debe alterar el estado."""
+        statistics = GradeStatistics()
+        statistics.add(_row(12.0))
+        before = statistics.to_dict()
+        statistics.merge(GradeStatistics())
+        assert statistics.to_dict() == before
+
+    def test_shouldRoundTripSerializedState(self) -> None:
+        """Debe restaurar exactamente el estado serializado."""
+        statistics = GradeStatistics(passing_grade=11.0)
+        for grade in GRADES:
+            statistics.add(_row(grade))
+        assert GradeStatistics.from_dict(statistics.to_dict()) == statistics
+        assert GradeStatistics.from_dict(GradeStatistics().to_dict()) == GradeStatistics()
@@ -0,0 +1,108 @@
+"""Tests unitarios para la clase WeightScheme."""
+
+import pytest
+
+from src.batch.synthetic import generate_records
+from src.calculator.grade_calculator import GradeCalculator
+from src.exceptions import (
+    GradeCalculatorError,
+    InvalidEvaluationError,
+    InvalidWeightError,
+)
+from src.models.evaluation import Evaluation
+from src.models.weight_scheme import WeightScheme
+
+
+def _calculate_with_evaluations(grades, weights, *arguments):
+    """Calcula por el camino tradicional, retornando resultado o error."""
+    try:
+        evaluations = [Evaluation(g, w) for g, w in zip(grades, weights)]
+        return GradeCalculator.calculate_result(evaluations, *arguments).to_dict()
+    except GradeCalculatorError as e:
+        return type(e), str(e)
+
+
+def _calculate_with_scheme(grades, weights, *arguments):
+    """Calcula con el esquema internado, retornando resultado o error."""
+    try:
+        scheme = WeightScheme.intern(weights)
+        return GradeCalculator.calculate_with_scheme(
+            grades, scheme, *arguments
+        ).to_dict()
+    except GradeCalculatorError as e:
+        return type(e), str(e)
+
+
+class TestWeightScheme:
+    """Tests para la clase WeightScheme."""
+
+    def test_shouldReturnSameInstanceForSameWeights(self) -> None:
+        """Debe compartir una sola instancia y tupla por esquema de pesos."""
+        first = WeightScheme.intern([20.0, 30.0, 50.0])
+        second = WeightScheme.intern((20.0, 30.0, 50.0))
+        assert first is second
+        assert first.weights is second.weights
+        assert WeightScheme.get(first.scheme_id) is first
+
+    def test_shouldValidateOnceAtCreation(self) -> None:
+        """Debe registrar la validez del esquema al crearlo."""
+        assert WeightScheme.intern([40.0, 60.0]).is_valid
+        invalid_sum = WeightScheme.intern([40.0, 50.0])
+        assert not invalid_sum.is_valid
+        with pytest.raises(InvalidWeightError):
+            invalid_sum.raise_error()
+        negative = WeightScheme.intern([40.0, -10.0, 70.0])
+        assert negative.invalid_weight_index == 1
+        with pytest.raises(InvalidEvaluationError):
+            negative.raise_error()
+
+    def test_shouldNotRevalidateWeightsForSharedScheme(self) -> None:
+        """Debe omitir _validate_weights_sum al calcular con un esquema."""
+        scheme = WeightScheme.intern([30.0, 70.0])
+        with pytest.MonkeyPatch.context() as patcher:
+            patcher.setattr(
+                GradeCalculator,
+                "_validate_weights_sum",
+                staticmethod(lambda evaluations: pytest.fail("validó la suma")),
+            )
+            result = GradeCalculator.calculate_with_scheme(
+                [10.0, 20.0], scheme, True, 0.0, [], 0.0
+            )
+        assert result.final_grade == 17.0
+
+    def test_shouldMatchEvaluationPathIncludingErrors(self) -> None:
+        """Debe producir el mismo resultado o error que con Evaluation."""
+        cases = [
+            ([15.0, 18.0], [40.0, 60.0]),
+            ([], []),
+            ([25.0, 18.0], [40.0, 60.0]),
+            ([15.0, 18.0], [40.0, 0.0]),
+            ([15.0, 21.0], [40.0, -5.0]),
+            ([15.0, 18.0], [40.0, 50.0]),
+            ([10.0] * 11, [100.0 / 11] * 11),
+            ([10.0] * 11, [5.0] * 11),
+        ]
+        for tardiness in (0.0, 50.0, 150.0):
+            for grades, weights in cases:
+                arguments = (False, tardiness, [True], 1.0)
+                assert _calculate_with_scheme(
+                    grades, weights, *arguments
+                ) == _calculate_with_evaluations(grades, weights, *arguments)
+
+        for record in generate_records(300, seed=9):
+            arguments = (
+                record.has_reached_minimum,
+                record.tardiness_percentage,
+                list(record.all_years_teachers),
+                record.extra_points,
+            )
+            assert _calculate_with_scheme(
+                record.grades, record.weights, *arguments
+            ) == _calculate_with_evaluations(record.grades, record.weights, *arguments)
+
+    def test_shouldRejectGradeCountDifferentFromScheme(self) -> None:
+        """Debe rechazar una cantidad de notas distinta a la del esquema."""
+        with pytest.raises(ValueError):
+            GradeCalculator.calculate_with_scheme(
+                [15.0], WeightScheme.intern([40.0, 60.0]), True, 0.0, [], 0.0
+            )